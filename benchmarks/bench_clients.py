@@ -0,0 +1,155 @@
+"""
+Benchmark every sub-client against a local KDX stub server.
+
+Each ``*_raw`` endpoint method and its typed, ``_df`` and ``_arrow`` variants
+are called through a client backed by kythera_kdx.stub.StubServer, which
+serves synthetic payloads shaped like the openapi-v1.2.json schemas. Reports
+rows/sec, response MB/sec, p50/p99 latency and the process peak RSS after
+each variant, so runs before and after an upgrade can be compared.
+
+Usage:
+    python benchmarks/bench_clients.py [--rows 10000] [--repeat 5]
+        [--clients trades,prices] [--variants raw,typed,df] [--async]
+        [--json results.json]
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import statistics
+import sys
+import time
+import typing
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kythera_kdx import AsyncKytheraKdx, KytheraKdx  # noqa: E402
+from kythera_kdx.stub import StubServer, stub_client  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore
+
+VARIANTS = {"raw": "_raw", "typed": "", "df": "_df", "arrow": "_arrow"}
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1e6 if sys.platform == "darwin" else 1e3)
+
+
+def sample_arguments(method: Callable[..., Any]) -> List[Any]:
+    """Values for the required parameters of an endpoint method."""
+    args = []
+    for parameter in inspect.signature(method).parameters.values():
+        if parameter.default is not inspect.Parameter.empty:
+            continue
+        hint = parameter.annotation
+        if hint is int:
+            args.append(1)
+        elif hint is str:
+            args.append("CLOSE")
+        elif hint == typing.List[str]:
+            args.append(["Total"])
+        else:
+            args.append(date(2024, 1, 2))
+    return args
+
+
+def endpoints(kdx: Any, selected: Optional[List[str]]) -> Iterator[Tuple[str, str]]:
+    """(sub-client property, method base name) of every ``*_raw`` method."""
+    for name, attr in vars(KytheraKdx).items():
+        if not isinstance(attr, property) or (selected and name not in selected):
+            continue
+        sub_client = getattr(kdx, name)
+        for method in sorted(vars(type(sub_client))):
+            if method.endswith("_raw") and not method.startswith(("_", "iter_")):
+                yield name, method[: -len("_raw")]
+
+
+def bench(
+    call: Callable[[], Any], server: StubServer, repeat: int
+) -> Dict[str, Any]:
+    call()  # warm up: generates and caches the stub payload
+    served = server.get_stats()["bytes"]
+    latencies = []
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = call()
+        latencies.append(time.perf_counter() - started)
+        rows = len(result)
+    total = sum(latencies)
+    size = (server.get_stats()["bytes"] - served) / repeat
+    return {
+        "rows": rows,
+        "bytes": size,
+        "rows_per_sec": rows * repeat / total if total else 0.0,
+        "mb_per_sec": size * repeat / total / 1e6 if total else 0.0,
+        "p50_ms": statistics.median(latencies) * 1e3,
+        "p99_ms": sorted(latencies)[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+        * 1e3,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--clients", help="Comma-separated sub-clients, e.g. trades,prices")
+    parser.add_argument("--variants", default="raw,typed,df", help="raw,typed,df,arrow")
+    parser.add_argument("--spec", help="OpenAPI document (default: openapi-v1.2.json)")
+    parser.add_argument("--async", dest="asynchronous", action="store_true")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    server = StubServer(spec=args.spec, rows=args.rows)
+    client_class = AsyncKytheraKdx if args.asynchronous else KytheraKdx
+    kdx = stub_client(server, client_class, metrics=False)
+    loop = asyncio.new_event_loop() if args.asynchronous else None
+    selected = args.clients.split(",") if args.clients else None
+    variants = args.variants.split(",")
+
+    results = []
+    print(
+        f"{'method':<52}{'rows':>8}{'rows/s':>12}{'MB/s':>9}"
+        f"{'p50 ms':>9}{'p99 ms':>9}{'RSS MB':>9}"
+    )
+    for name, base in endpoints(kdx, selected):
+        sub_client = getattr(kdx, name)
+        for variant in variants:
+            method = getattr(sub_client, base + VARIANTS[variant], None)
+            if method is None:
+                continue
+            call_args = sample_arguments(method)
+            if loop is not None:
+                call = lambda: loop.run_until_complete(method(*call_args))  # noqa: E731
+            else:
+                call = lambda: method(*call_args)  # noqa: E731
+            result = bench(call, server, args.repeat)
+            label = f"{name}.{base}{VARIANTS[variant]}"
+            results.append({"method": label, **result})
+            rss = result["peak_rss_mb"]
+            print(
+                f"{label:<52}{result['rows']:>8}{result['rows_per_sec']:>12,.0f}"
+                f"{result['mb_per_sec']:>9.1f}{result['p50_ms']:>9.2f}"
+                f"{result['p99_ms']:>9.2f}{rss if rss is not None else float('nan'):>9.0f}"
+            )
+    if loop is not None:
+        loop.close()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark DataFrame construction for the ``*_df`` methods.
+
+Compares ``pd.DataFrame(records)`` (row-wise dtype inference) with the
+schema-driven columnar builder used by the sub-clients, reporting build time
+and the memory held by the resulting frame.
+
+Usage:
+    python benchmarks/bench_frames.py [--rows 50000] [--repeat 3]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+from payloads import make_records
+
+from kythera_kdx.frames import build_frame
+from kythera_kdx.models_v1 import IntradayPnlEntryDto, PositionDto, TradeDto
+
+MODELS = [PositionDto, TradeDto, IntradayPnlEntryDto]
+
+
+def bench(fn: Callable[[], pd.DataFrame], repeat: int) -> Dict[str, Any]:
+    frame = fn()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return {"seconds": best, "mb": frame.memory_usage(deep=True).sum() / 1e6}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'model':<22}{'builder':<16}{'seconds':>10}{'MB':>10}")
+    for model in MODELS:
+        records: List[Dict[str, Any]] = make_records(model, args.rows)
+        results = {
+            "pd.DataFrame": bench(lambda: pd.DataFrame(records), args.repeat),
+            "build_frame": bench(lambda: build_frame(records, model), args.repeat),
+        }
+        for name, result in results.items():
+            print(
+                f"{model.__name__:<22}{name:<16}"
+                f"{result['seconds']:>10.3f}{result['mb']:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark typed decoding of intraday PnL payloads.
+
+Compares the previous path (stdlib json.loads, then ``Dto(**item)`` per row)
+with validating the response bytes in one pass through a cached TypeAdapter,
+and with the unvalidated ``validate=False`` mode (orjson plus trusted_builder).
+
+Usage:
+    python benchmarks/bench_validation.py [--rows 20000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from payloads import make_records
+
+from kythera_kdx.codec import get_json_codec, list_adapter, trusted_builder  # noqa: E402
+from kythera_kdx.models_v1 import IntradayPnlEntryDto  # noqa: E402
+
+
+def make_payload(rows: int) -> bytes:
+    return json.dumps(make_records(IntradayPnlEntryDto, rows)).encode("utf-8")
+
+
+def per_item(content: bytes) -> List[IntradayPnlEntryDto]:
+    return [IntradayPnlEntryDto(**item) for item in json.loads(content)]
+
+
+def type_adapter(content: bytes) -> List[IntradayPnlEntryDto]:
+    return list_adapter(IntradayPnlEntryDto).validate_json(content)
+
+
+def trusted(content: bytes) -> List[IntradayPnlEntryDto]:
+    build = trusted_builder(IntradayPnlEntryDto)
+    return [build(item) for item in get_json_codec().loads(content)]
+
+
+def bench(fn: Callable[[bytes], list], content: bytes, rows: int, repeat: int) -> float:
+    fn(content)  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - started)
+    return rows / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = make_payload(args.rows)
+    fields = len(IntradayPnlEntryDto.model_fields)
+    print(f"IntradayPnlEntryDto: {fields} fields, {args.rows} rows, {len(content) / 1e6:.1f} MB")
+    before = bench(per_item, content, args.rows, args.repeat)
+    after = bench(type_adapter, content, args.rows, args.repeat)
+    unvalidated = bench(trusted, content, args.rows, args.repeat)
+    print(f"{'json.loads + Dto(**item)':<28}{before:>14,.0f} rows/s")
+    print(f"{'TypeAdapter.validate_json':<28}{after:>14,.0f} rows/s  ({after / before:.2f}x)")
+    print(f"{'validate=False':<28}{unvalidated:>14,.0f} rows/s  ({unvalidated / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Write seeded synthetic KDX datasets to disk for load and scale testing.
+
+Rows follow the component schemas of openapi-v1.2.json (or the models_v1
+DTOs) and are streamed as one JSON array per file, so memory stays flat at
+any volume. The same seed always produces the same file.
+
+Usage:
+    python benchmarks/generate_data.py IntradayPnlEntryDto:5000000 TradeDto:2000000
+        [--out data/] [--seed 42] [--cardinality instrument=50000] [--gzip]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kythera_kdx.synthetic import SyntheticData  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("datasets", nargs="+", help="Schema:rows, e.g. TradeDto:2000000")
+    parser.add_argument("--out", default=".", help="Output directory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spec", help="OpenAPI document (default: openapi-v1.2.json)")
+    parser.add_argument(
+        "--cardinality",
+        action="append",
+        default=[],
+        metavar="ENTITY=N",
+        help="Distinct values of an entity, e.g. fund=25 (repeatable)",
+    )
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent, 0 for uniform")
+    parser.add_argument("--gzip", action="store_true", help="Write .json.gz files")
+    args = parser.parse_args()
+
+    cardinalities = {}
+    for item in args.cardinality:
+        entity, count = item.split("=", 1)
+        cardinalities[entity] = int(count)
+    data = SyntheticData(
+        spec=args.spec, seed=args.seed, cardinalities=cardinalities, skew=args.skew
+    )
+    os.makedirs(args.out, exist_ok=True)
+
+    for dataset in args.datasets:
+        schema, _, rows = dataset.partition(":")
+        path = os.path.join(args.out, f"{schema}.json" + (".gz" if args.gzip else ""))
+        started = time.perf_counter()
+        size = data.write_json(schema, int(rows or 1000), path)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{path}: {int(rows or 1000):,} rows, {size / 1e6:,.1f} MB of JSON "
+            f"in {elapsed:.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
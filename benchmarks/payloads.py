@@ -0,0 +1,40 @@
+"""
+Synthetic records shaped like the models_v1 DTOs, for the benchmark scripts.
+
+String fields cycle through a small set of values so that name columns are
+as repetitive as in real fund/instrument data.
+"""
+
+import os
+import sys
+import typing
+from datetime import date, timedelta
+from typing import Any, Dict, List, Type
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pydantic import BaseModel  # noqa: E402
+
+
+def sample_value(annotation: Any, row: int, column: int) -> Any:
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    kind = args[0] if args else annotation
+    if kind is float:
+        return row * 1.25 + column
+    if kind is bool:
+        return (row + column) % 2 == 0
+    if kind is int:
+        return row + column
+    if kind is date:
+        return (date(2024, 1, 1) + timedelta(days=row % 365)).isoformat()
+    if kind is str:
+        return f"value-{column}-{row % 50}"
+    return None
+
+
+def make_records(model: Type[BaseModel], rows: int) -> List[Dict[str, Any]]:
+    fields = list(model.model_fields.items())
+    return [
+        {name: sample_value(f.annotation, row, i) for i, (name, f) in enumerate(fields)}
+        for row in range(rows)
+    ]
@@ -10,7 +10,19 @@ __email__ = "your.email@example.com"
 
 from .authenticated_client import AuthenticatedClient
 from .kythera_kdx import KytheraKdx
+from .aio import AsyncAuthenticatedClient, AsyncKytheraKdx
+from .cache import ResponseCache
+from .disk_cache import DiskCache
+from .circuit_breaker import CircuitBreaker
+from .hedge import HedgePolicy
+from .metrics import ClientMetrics, prometheus_text
+from .tracing import OpenTelemetryTracer, Tracer
+from .hooks import EventHooks
+from .fanout import DateRangeResult
+from .codec import JsonCodec
 from .exceptions import KytheraError, KytheraAPIError, KytheraAuthError
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
 from .addin import AddInClient
 from .funds import FundsClient
 from .globals import GlobalsClient
@@ -28,9 +40,24 @@ from .issuers import IssuersClient
 
 __all__ = [
     "AuthenticatedClient",
+    "AsyncAuthenticatedClient",
+    "AsyncKytheraKdx",
     "KytheraError",
     "KytheraAPIError",
     "KytheraAuthError",
+    "RetryPolicy",
+    "RateLimiter",
+    "JsonCodec",
+    "ResponseCache",
+    "DiskCache",
+    "CircuitBreaker",
+    "HedgePolicy",
+    "ClientMetrics",
+    "prometheus_text",
+    "Tracer",
+    "OpenTelemetryTracer",
+    "EventHooks",
+    "DateRangeResult",
     "AddInClient",
     "FundsClient",
     "GlobalsClient",
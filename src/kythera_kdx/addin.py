@@ -1,7 +1,9 @@
 from typing import Iterator
 from .authenticated_client import AuthenticatedClient
+from .tracing import traced
 
 
+@traced
 class AddInClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
@@ -0,0 +1,48 @@
+"""
+Asynchronous clients for the Kythera API built on httpx.AsyncClient.
+
+Every sub-client mirrors its synchronous counterpart with awaitable
+``_raw``/typed/``_df`` methods.
+"""
+
+from .authenticated_client import AsyncAuthenticatedClient
+from .kythera_kdx import AsyncKytheraKdx
+from .addin import AsyncAddInClient
+from .funds import AsyncFundsClient
+from .globals import AsyncGlobalsClient
+from .indexes import AsyncIndexesClient
+from .instrument_groups import AsyncInstrumentGroupsClient
+from .instrument_parameters import AsyncInstrumentParametersClient
+from .instruments import AsyncInstrumentsClient
+from .intraday import AsyncIntradayClient
+from .issuers import AsyncIssuersClient
+from .pnl import AsyncPnlClient
+from .portfolios import AsyncPortfoliosClient
+from .positions import AsyncPositionsClient
+from .price_models import AsyncPriceModelsClient
+from .prices import AsyncPricesClient
+from .risk_factors import AsyncRiskFactorsClient
+from .subclasses import AsyncSubclassesClient
+from .trades import AsyncTradesClient
+
+__all__ = [
+    "AsyncAuthenticatedClient",
+    "AsyncKytheraKdx",
+    "AsyncAddInClient",
+    "AsyncFundsClient",
+    "AsyncGlobalsClient",
+    "AsyncIndexesClient",
+    "AsyncInstrumentGroupsClient",
+    "AsyncInstrumentParametersClient",
+    "AsyncInstrumentsClient",
+    "AsyncIntradayClient",
+    "AsyncIssuersClient",
+    "AsyncPnlClient",
+    "AsyncPortfoliosClient",
+    "AsyncPositionsClient",
+    "AsyncPriceModelsClient",
+    "AsyncPricesClient",
+    "AsyncRiskFactorsClient",
+    "AsyncSubclassesClient",
+    "AsyncTradesClient",
+]
@@ -0,0 +1,31 @@
+from typing import AsyncIterator
+from .authenticated_client import AsyncAuthenticatedClient
+from ..tracing import traced
+
+
+@traced
+class AsyncAddInClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def get_add_in(self) -> AsyncIterator[bytes]:
+        """
+        GET /add-in
+        Fetches add-in information.
+        """
+        return (await self._client.get("/add-in")).aiter_bytes()
+
+    async def get_add_in_core(self, version: str) -> AsyncIterator[bytes]:
+        """
+        GET /add-in/core?version={version}
+        Fetches core add-in information for a specific version.
+        """
+        params = {"version": version}
+        return (await self._client.get("/add-in/core", params=params)).aiter_bytes()
+
+    async def get_add_in_version(self) -> str:
+        """
+        GET /add-in/version
+        Fetches current add-in version.
+        """
+        return (await self._client.get("/add-in/version")).text
@@ -0,0 +1,427 @@
+"""
+Asynchronous authenticated client for the Kythera API.
+
+This module mirrors AuthenticatedClient on top of httpx.AsyncClient so that many
+endpoint calls can be awaited concurrently (e.g. with asyncio.gather) over a
+single connection pool. Token acquisition is shared with the sync client through
+BaseAuthenticatedClient and KytheraAuth; the blocking MSAL calls run in the
+default executor.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional, Dict, Any, List, Union, AsyncIterator, Callable, TypeVar
+from urllib.parse import urljoin
+
+import httpx
+
+from ..authenticated_client import BaseAuthenticatedClient
+from ..codec import JsonCodec
+from ..exceptions import KytheraAuthError, KytheraCircuitOpenError
+from ..rate_limit import RateLimiter
+from ..retry import RetryPolicy
+from ..hooks import EventHooks
+from ..tracing import Tracer
+from ..metrics import ClientMetrics
+from ..hedge import HedgePolicy
+from ..circuit_breaker import CircuitBreaker
+from ..cache import ResponseCache, params_key
+from ..disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncAuthenticatedClient(BaseAuthenticatedClient):
+    """
+    Asynchronous authenticated client for interacting with the Kythera API.
+
+    Supports the same authentication flows as AuthenticatedClient. All request
+    methods are coroutines and share one httpx.AsyncClient connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        timeout: Union[int, float, httpx.Timeout] = 30,
+        scopes: Optional[List[str]] = None,
+        cache_location: Optional[str] = None,
+        x_api_key: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        validate: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Union[ClientMetrics, bool] = True,
+        tracer: Optional[Tracer] = None,
+        event_hooks: Optional[EventHooks] = None,
+        access_token: Optional[str] = None,
+    ):
+        """
+        Initialize the asynchronous authenticated Kythera client.
+
+        Args:
+            base_url: The base URL for the Kythera API
+            tenant_id: Azure AD tenant ID
+            client_id: Azure AD application client ID
+            client_secret: Azure AD application client secret (for service principal auth)
+            timeout: Request timeout in seconds, or an httpx.Timeout with separate
+                connect/read/write/pool timeouts
+            scopes: List of OAuth scopes to request
+            cache_location: Custom location for token cache (optional)
+            limits: Connection pool limits (max connections, max keep-alive
+                connections, keep-alive expiry); httpx defaults when omitted
+            http2: Enable HTTP/2 multiplexing (requires the ``http2`` extra)
+            http_client: Shared httpx.AsyncClient to send requests through; it is
+                not closed by aclose()
+            transport: Custom httpx async transport for the client created here
+            retry_policy: Retry policy for transient failures (429, 502-504,
+                connection resets, timeouts)
+            rate_limiter: Client-side rate limiter; the same instance can be
+                shared with sync clients running in other threads
+            json_codec: JSON backend for response and request bodies ("orjson",
+                "msgspec", "json" or a JsonCodec); the fastest installed one
+                is used when omitted
+            validate: Validate typed results with pydantic (default). Pass False
+                for trusted payloads to build models with model_construct,
+                skipping validation
+            response_cache: In-memory TTL/LRU cache for GET responses (reference
+                data endpoints by default); disabled when omitted
+            disk_cache: Persistent SQLite cache for immutable historical data (past
+                prices, risk factor values, NAVs, index values); disabled when omitted
+            coalesce_requests: Let concurrent identical GET requests share one
+                network call and one decoded body
+            circuit_breaker: Per-endpoint circuit breaker failing fast with
+                KytheraCircuitOpenError while an endpoint is unhealthy; disabled when omitted
+            hedge_policy: HedgePolicy sending a second GET when the first is slower
+                than its endpoint's latency percentile; disabled when omitted
+            metrics: Collect per-endpoint latency, size and conversion metrics
+                into self.metrics; pass a ClientMetrics to share one between clients
+                or False to disable
+            tracer: Tracer receiving spans for sub-client calls, token acquisition,
+                HTTP attempts, decoding, validation and frame builds (e.g.
+                OpenTelemetryTracer); no-op when omitted
+            event_hooks: EventHooks called on request start, response headers and
+                completion, retries, token refreshes and decoding; none when omitted
+            access_token: Bearer token to send instead of acquiring one from Azure
+                AD (e.g. a token obtained elsewhere, or any string for a local stub);
+                MSAL and the token cache are not used when given
+        """
+        super().__init__(
+            base_url=base_url,
+            tenant_id=tenant_id,
+            client_id=client_id,
+            client_secret=client_secret,
+            timeout=timeout,
+            scopes=scopes,
+            cache_location=cache_location,
+            x_api_key=x_api_key,
+            limits=limits,
+            http2=http2,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            validate=validate,
+            response_cache=response_cache,
+            disk_cache=disk_cache,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            metrics=metrics,
+            tracer=tracer,
+            event_hooks=event_hooks,
+            access_token=access_token,
+        )
+
+        if http_client is not None and transport is not None:
+            raise ValueError("Provide either http_client or transport, not both")
+
+        # Initialize HTTP client; an injected client is shared, not owned
+        self._owns_session = http_client is None
+        if http_client is not None:
+            self.session = http_client
+        else:
+            self.session = httpx.AsyncClient(
+                transport=transport, **self._http_client_options()
+            )
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Make a request to the Kythera API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint
+            data: Request data for POST/PUT requests
+            params: Query parameters
+
+        Returns:
+            API response
+
+        Raises:
+            KytheraAPIError: When API returns an error
+            KytheraAuthError: When authentication fails
+            KytheraConnectionError: When connection fails
+            KytheraTimeoutError: When request times out
+        """
+        cached = await self._cached_response(method, endpoint, params)
+        if cached is not None:
+            return cached
+        try:
+            if self.coalescer is not None and method == "GET":
+                return await self.coalescer.do_async(
+                    (method, endpoint, params_key(params)),
+                    lambda: self._hedged_fetch(method, endpoint, data, params),
+                )
+            return await self._hedged_fetch(method, endpoint, data, params)
+        except KytheraCircuitOpenError:
+            fallback = self._last_known_good(method, endpoint, params)
+            if fallback is None:
+                raise
+            return fallback
+
+    async def _off_loop(self, func: Callable[..., T], *args: Any) -> T:
+        """Run blocking work in the default executor, in the caller's tracing context."""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, context.run, func, *args)
+
+    async def _cached_response(  # type: ignore[override]
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[httpx.Response]:
+        """Serve a request from the response caches; SQLite and zlib work runs off the loop."""
+        if self.response_cache is not None:
+            response = self.response_cache.lookup(method, endpoint, params)
+            if response is not None:
+                return response
+        if not self._uses_disk_cache(method, endpoint, params):
+            return None
+        return await self._off_loop(self._disk_cached_response, method, endpoint, params)
+
+    async def _cache_response(  # type: ignore[override]
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+    ) -> None:
+        """Offer a fully read response to the caches; the disk write runs off the loop."""
+        self._cache_in_memory(method, endpoint, params, response)
+        if response.status_code == 200 and self._uses_disk_cache(method, endpoint, params):
+            await self._off_loop(
+                self.disk_cache.store,  # type: ignore[union-attr]
+                method,
+                endpoint,
+                params,
+                response,
+                self.base_url,
+            )
+
+    async def _hedged_fetch(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Fetch a response, hedging slow GETs when a hedge policy is configured."""
+        policy = self.hedge_policy
+        key = policy.endpoint_key(method, endpoint) if policy is not None else None
+        if policy is None or key is None:
+            return await self._fetch_response(method, endpoint, data, params)
+        return await policy.run_async(
+            key, lambda: self._fetch_response(method, endpoint, data, params)
+        )
+
+    async def _fetch_response(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Send a request, revalidating a stale cached response and caching the result."""
+        stale, headers = self._revalidation(method, endpoint, params)
+        async with self._request(
+            method, endpoint, data, params, stream=False, headers=headers
+        ) as response:
+            if stale is not None and response.status_code == 304:
+                return self.response_cache.not_modified(  # type: ignore[union-attr]
+                    method, endpoint, params, stale, response
+                )
+            await self._cache_response(method, endpoint, params, response)
+            return response
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Make a request whose body is read lazily, e.g. with response.aiter_bytes().
+
+        Retries, rate limiting and error handling match _make_request; transport
+        errors raised while the body is being consumed are translated into
+        Kythera exceptions but not retried. The response is closed on exit.
+        """
+        async with self._request(
+            method, endpoint, data, params, stream=True
+        ) as response:
+            try:
+                yield response
+            except httpx.RequestError as e:
+                raise self._transport_error(e) from e
+            finally:
+                self._stream_closed(endpoint, response)
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        stream: bool,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Run the retry loop and hold the rate limiter slot while the response is open."""
+        url = urljoin(self.base_url, endpoint)
+        retry = self.retry_policy.start(method, self.retry_stats)
+
+        while True:
+            async with AsyncExitStack() as stack:
+                attempt = stack.enter_context(self._circuit_attempt(endpoint))
+                if self.rate_limiter is not None:
+                    await stack.enter_async_context(
+                        self.rate_limiter.limit_async(endpoint)
+                    )
+                # Time the call itself, not the wait for the rate limiter
+                attempt.start()
+                try:
+                    response = await self._send(
+                        method, endpoint, url, data, params, stream, headers
+                    )
+                except httpx.RequestError as e:
+                    attempt.failed()
+                    delay = retry.delay_for_exception(e)
+                    if delay is None:
+                        raise self._transport_error(e) from e
+                    self._retrying(method, endpoint, retry.retries, delay, error=e)
+                else:
+                    attempt.completed(response.status_code)
+                    stack.push_async_callback(response.aclose)
+                    ok = response.is_success or (
+                        headers is not None and response.status_code == 304
+                    )
+                    delay = None if ok else retry.delay_for_response(response)
+                    if delay is None:
+                        if not ok:
+                            await response.aread()
+                            self._raise_for_status(response)
+                        yield response
+                        return
+                    self._retrying(
+                        method, endpoint, retry.retries, delay, response.status_code
+                    )
+            await asyncio.sleep(delay)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Send a single authenticated attempt; KytheraAuth refreshes the token once on 401."""
+        request = self.session.build_request(
+            method=method, url=url, params=params, **self._request_body(data)
+        )
+        if headers:
+            request.headers.update(headers)
+        self._request_started(method, endpoint, url, params, request)
+        with self.tracer.start_span(
+            f"HTTP {method}",
+            self._http_span_attributes(method, endpoint, url, params),
+        ) as span:
+            started = time.perf_counter()
+            # Always stream so that the time to the headers can be told from the download
+            response = await self.session.send(request, auth=self.auth, stream=True)
+            headers_at = time.perf_counter()
+            span.set_attribute("http.response.status_code", response.status_code)
+            self._headers_received(endpoint, response, headers_at - started)
+
+            if response.status_code == 401:
+                await response.aclose()
+                raise KytheraAuthError("Authentication failed after token refresh")
+
+            if not stream:
+                try:
+                    await response.aread()
+                except BaseException:
+                    await response.aclose()
+                    raise
+                span.set_attribute("http.response.body.size", len(response.content))
+        self._observe_response(endpoint, response, started, headers_at, stream)
+        return response
+
+    async def get(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """Make a GET request to the API."""
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def post(
+        self, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """Make a POST request to the API."""
+        return await self._make_request("POST", endpoint, data=data)
+
+    async def put(
+        self, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """Make a PUT request to the API."""
+        return await self._make_request("PUT", endpoint, data=data)
+
+    async def delete(self, endpoint: str) -> httpx.Response:
+        """Make a DELETE request to the API."""
+        return await self._make_request("DELETE", endpoint)
+
+    async def aclose(self) -> None:
+        """Close the HTTP session unless it was injected by the caller."""
+        if self._owns_session:
+            await self.session.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
@@ -0,0 +1,109 @@
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import httpx
+import pandas as pd
+from datetime import date
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import IndexDto, IndexValueDto
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
+class AsyncIndexesClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_indexes(self, include_characteristics: bool = False) -> httpx.Response:
+        params = {"include-characteristics": include_characteristics}
+        return await self._client.get("/v1/indexes", params=params)
+
+    async def get_indexes_raw(self, include_characteristics: bool = False) -> List[Dict[str, Any]]:
+        """
+        GET /v1/indexes
+        Fetches all indexes (raw JSON).
+        """
+        response = await self._fetch_indexes(include_characteristics)
+        return decode_json(response, self._client)
+
+    async def get_indexes(self, include_characteristics: bool = False) -> List[IndexDto]:
+        """
+        GET /v1/indexes
+        Fetches all indexes (typed models).
+        """
+        response = await self._fetch_indexes(include_characteristics)
+        return decode_models(response, IndexDto, self._client)
+
+    async def get_indexes_df(self, include_characteristics: bool = False) -> pd.DataFrame:
+        """
+        GET /v1/indexes
+        Fetches all indexes (DataFrame).
+        """
+        data = await self.get_indexes_raw(include_characteristics)
+        return build_frame(data, IndexDto, self._client, "/v1/indexes")
+
+    async def get_indexes_arrow(self, include_characteristics: bool = False) -> "pa.Table":
+        """
+        GET /v1/indexes
+        Fetches all indexes (Arrow Table).
+        """
+        data = await self.get_indexes_raw(include_characteristics)
+        return build_table(data, IndexDto, self._client, "/v1/indexes")
+
+    async def _fetch_index_values(
+        self,
+        session_date: Optional[date] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> httpx.Response:
+        params: Dict[str, Any] = {}
+        if session_date:
+            params["session-date"] = session_date.isoformat()
+        if from_date:
+            params["from-date"] = from_date.isoformat()
+        if to_date:
+            params["to-date"] = to_date.isoformat()
+        return await self._client.get("/v1/indexes/values", params=params)
+
+    async def get_index_values_raw(
+        self,
+        session_date: Optional[date] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/indexes/values
+        Fetches index values by session-date or from-date/to-date (raw JSON).
+        """
+        response = await self._fetch_index_values(session_date, from_date, to_date)
+        return decode_json(response, self._client)
+
+    async def get_index_values(
+        self,
+        session_date: Optional[date] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> List[IndexValueDto]:
+        response = await self._fetch_index_values(session_date, from_date, to_date)
+        return decode_models(response, IndexValueDto, self._client)
+
+    async def get_index_values_df(
+        self,
+        session_date: Optional[date] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> pd.DataFrame:
+        data = await self.get_index_values_raw(session_date, from_date, to_date)
+        return build_frame(data, IndexValueDto, self._client, "/v1/indexes/values")
+
+    async def get_index_values_arrow(
+        self,
+        session_date: Optional[date] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> "pa.Table":
+        data = await self.get_index_values_raw(session_date, from_date, to_date)
+        return build_table(data, IndexValueDto, self._client, "/v1/indexes/values")
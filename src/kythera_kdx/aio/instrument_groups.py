@@ -0,0 +1,82 @@
+from typing import List, Dict, Any, TYPE_CHECKING
+
+import httpx
+import pandas as pd
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import InstrumentGroupDto
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
+class AsyncInstrumentGroupsClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_instrument_groups(
+        self,
+        fetch_characteristics: bool = True,
+        fetch_nomenclatures: bool = True,
+    ) -> httpx.Response:
+        params = {
+            "fetchCharacteristics": fetch_characteristics,
+            "fetchNomenclatures": fetch_nomenclatures,
+        }
+        return await self._client.get("/v1/instrument-groups", params=params)
+
+    async def get_instrument_groups_raw(
+        self,
+        fetch_characteristics: bool = True,
+        fetch_nomenclatures: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/instrument-groups
+        Fetches all available instrument groups and returns raw JSON data.
+        """
+        response = await self._fetch_instrument_groups(fetch_characteristics, fetch_nomenclatures)
+        return decode_json(response, self._client)
+
+    async def get_instrument_groups(
+        self,
+        fetch_characteristics: bool = True,
+        fetch_nomenclatures: bool = True,
+    ) -> List[InstrumentGroupDto]:
+        """
+        GET /v1/instrument-groups
+        Fetches all available instrument groups and returns typed models.
+        """
+        response = await self._fetch_instrument_groups(fetch_characteristics, fetch_nomenclatures)
+        return decode_models(response, InstrumentGroupDto, self._client)
+
+    async def get_instrument_groups_df(
+        self,
+        fetch_characteristics: bool = True,
+        fetch_nomenclatures: bool = True,
+    ) -> pd.DataFrame:
+        """
+        GET /v1/instrument-groups
+        Fetches all available instrument groups and returns a pandas DataFrame.
+        """
+        data = await self.get_instrument_groups_raw(fetch_characteristics, fetch_nomenclatures)
+        return build_frame(
+            data, InstrumentGroupDto, self._client, "/v1/instrument-groups"
+        )
+
+    async def get_instrument_groups_arrow(
+        self,
+        fetch_characteristics: bool = True,
+        fetch_nomenclatures: bool = True,
+    ) -> "pa.Table":
+        """
+        GET /v1/instrument-groups
+        Fetches all available instrument groups and returns a pyarrow Table.
+        """
+        data = await self.get_instrument_groups_raw(fetch_characteristics, fetch_nomenclatures)
+        return build_table(
+            data, InstrumentGroupDto, self._client, "/v1/instrument-groups"
+        )
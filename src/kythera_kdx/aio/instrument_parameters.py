@@ -0,0 +1,58 @@
+from typing import List, Dict, Any, TYPE_CHECKING
+
+import httpx
+import pandas as pd
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import InstrumentParameterDto
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
+class AsyncInstrumentParametersClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_instrument_parameters(self) -> httpx.Response:
+        return await self._client.get("/v1/instruments/parameters")
+
+    async def get_instrument_parameters_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/instruments/parameters
+        Fetches all available instrument parameters used in characteristics and returns raw JSON data.
+        """
+        response = await self._fetch_instrument_parameters()
+        return decode_json(response, self._client)
+
+    async def get_instrument_parameters(self) -> List[InstrumentParameterDto]:
+        """
+        GET /v1/instruments/parameters
+        Fetches all available instrument parameters used in characteristics and returns typed models.
+        """
+        response = await self._fetch_instrument_parameters()
+        return decode_models(response, InstrumentParameterDto, self._client)
+
+    async def get_instrument_parameters_df(self) -> pd.DataFrame:
+        """
+        GET /v1/instruments/parameters
+        Fetches all available instrument parameters used in characteristics and returns a pandas DataFrame.
+        """
+        data = await self.get_instrument_parameters_raw()
+        return build_frame(
+            data, InstrumentParameterDto, self._client, "/v1/instruments/parameters"
+        )
+
+    async def get_instrument_parameters_arrow(self) -> "pa.Table":
+        """
+        GET /v1/instruments/parameters
+        Fetches all available instrument parameters used in characteristics and returns a pyarrow Table.
+        """
+        data = await self.get_instrument_parameters_raw()
+        return build_table(
+            data, InstrumentParameterDto, self._client, "/v1/instruments/parameters"
+        )
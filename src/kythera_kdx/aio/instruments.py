@@ -0,0 +1,226 @@
+from typing import List, Dict, Any, AsyncIterator, TYPE_CHECKING
+
+import httpx
+import pandas as pd
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models, model_factory
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import InstrumentDto, InstrumentEventDto
+from ..streaming import aiter_json_array
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+@traced
+class AsyncInstrumentsClient:
+    """Client for instrument-related endpoints."""
+    
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_instruments(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> httpx.Response:
+        params = {
+            "enabled-only": enabled_only,
+            "fetch-characteristics": fetch_characteristics,
+            "fetch-baskets": fetch_baskets,
+            "fetch-issuers": fetch_issuers,
+            "fetch-cash-flows": fetch_cash_flows,
+            "fetch-nomenclatures": fetch_nomenclatures,
+        }
+        return await self._client.get("/v1/instruments", params=params)
+
+    async def get_instruments_raw(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/instruments
+        Fetches all available instruments and returns raw JSON data.
+        """
+        response = await self._fetch_instruments(enabled_only, fetch_characteristics, fetch_baskets, fetch_issuers, fetch_cash_flows, fetch_nomenclatures)
+        return decode_json(response, self._client)
+
+    async def get_instruments(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> List[InstrumentDto]:
+        """
+        GET /v1/instruments
+        Fetches all available instruments and returns typed models.
+        """
+        response = await self._fetch_instruments(
+            enabled_only,
+            fetch_characteristics,
+            fetch_baskets,
+            fetch_issuers,
+            fetch_cash_flows,
+            fetch_nomenclatures,
+        )
+        return decode_models(response, InstrumentDto, self._client)
+
+    async def get_instruments_df(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> pd.DataFrame:
+        """
+        GET /v1/instruments
+        Fetches all available instruments and returns a pandas DataFrame.
+        """
+        data = await self.get_instruments_raw(
+            enabled_only,
+            fetch_characteristics,
+            fetch_baskets,
+            fetch_issuers,
+            fetch_cash_flows,
+            fetch_nomenclatures,
+        )
+        return build_frame(data, InstrumentDto, self._client, "/v1/instruments")
+
+    async def get_instruments_arrow(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> "pa.Table":
+        """
+        GET /v1/instruments
+        Fetches all available instruments and returns a pyarrow Table.
+        """
+        data = await self.get_instruments_raw(
+            enabled_only,
+            fetch_characteristics,
+            fetch_baskets,
+            fetch_issuers,
+            fetch_cash_flows,
+            fetch_nomenclatures,
+        )
+        return build_table(data, InstrumentDto, self._client, "/v1/instruments")
+
+    async def iter_instruments_raw(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        GET /v1/instruments
+        Streams instruments as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params = {
+            "enabled-only": enabled_only,
+            "fetch-characteristics": fetch_characteristics,
+            "fetch-baskets": fetch_baskets,
+            "fetch-issuers": fetch_issuers,
+            "fetch-cash-flows": fetch_cash_flows,
+            "fetch-nomenclatures": fetch_nomenclatures,
+        }
+        async with self._client.stream("GET", "/v1/instruments", params=params) as response:
+            async for item in aiter_json_array(response.aiter_bytes()):
+                yield item
+
+    async def iter_instruments(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> AsyncIterator[InstrumentDto]:
+        """
+        GET /v1/instruments
+        Streams instruments as typed models.
+        """
+        build = model_factory(InstrumentDto, self._client)
+        async for item in self.iter_instruments_raw(
+            enabled_only,
+            fetch_characteristics,
+            fetch_baskets,
+            fetch_issuers,
+            fetch_cash_flows,
+            fetch_nomenclatures,
+        ):
+            yield build(item)
+
+    async def create_instruments(self, instruments_data: List[Dict[str, Any]]) -> None:
+        """
+        POST /v1/instruments
+        Creates new instruments.
+        """
+        body = instruments_data
+        response = await self._client.post("/v1/instruments", data=body)  # type: ignore
+        response.raise_for_status()
+
+    async def _fetch_instrument_events(self, event_date) -> httpx.Response:
+        params = {"event-date": event_date.isoformat()}
+        return await self._client.get("/v1/instruments/events", params=params)
+
+    async def get_instrument_events_raw(self, event_date) -> List[Dict[str, Any]]:
+        """
+        GET /v1/instruments/events
+        Fetches instrument events by date (raw JSON).
+        """
+        response = await self._fetch_instrument_events(event_date)
+        return decode_json(response, self._client)
+
+    async def get_instrument_events(self, event_date) -> List[InstrumentEventDto]:
+        """
+        GET /v1/instruments/events
+        Fetches instrument events by date (typed models).
+        """
+        response = await self._fetch_instrument_events(event_date)
+        return decode_models(response, InstrumentEventDto, self._client)
+
+    async def get_instrument_events_df(self, event_date) -> pd.DataFrame:
+        """
+        GET /v1/instruments/events
+        Fetches instrument events by date (DataFrame).
+        """
+        data = await self.get_instrument_events_raw(event_date)
+        return build_frame(
+            data, InstrumentEventDto, self._client, "/v1/instruments/events"
+        )
+
+    async def get_instrument_events_arrow(self, event_date) -> "pa.Table":
+        """
+        GET /v1/instruments/events
+        Fetches instrument events by date (Arrow Table).
+        """
+        data = await self.get_instrument_events_raw(event_date)
+        return build_table(
+            data, InstrumentEventDto, self._client, "/v1/instruments/events"
+        )
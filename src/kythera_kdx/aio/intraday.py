@@ -0,0 +1,100 @@
+from typing import List, Dict, Any, TYPE_CHECKING
+import httpx
+import pandas as pd
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import IntradayPriceDto, IntradayRiskFactorValueDto
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+@traced
+class AsyncIntradayClient:
+    """Client for intraday data endpoints."""
+    
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_intraday_prices(self) -> httpx.Response:
+        return await self._client.get("/v1/intraday-prices")
+
+    async def get_intraday_prices_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/intraday-prices
+        Fetches all current instrument prices and returns raw JSON data.
+        """
+        response = await self._fetch_intraday_prices()
+        return decode_json(response, self._client)
+
+    async def get_intraday_prices(self) -> List[IntradayPriceDto]:
+        """
+        GET /v1/intraday-prices
+        Fetches all current instrument prices and returns typed models.
+        """
+        response = await self._fetch_intraday_prices()
+        return decode_models(response, IntradayPriceDto, self._client)
+
+    async def get_intraday_prices_df(self) -> pd.DataFrame:
+        """
+        GET /v1/intraday-prices
+        Fetches all current instrument prices and returns as pandas DataFrame.
+        """
+        data = await self.get_intraday_prices_raw()
+        return build_frame(data, IntradayPriceDto, self._client, "/v1/intraday-prices")
+
+    async def get_intraday_prices_arrow(self) -> "pa.Table":
+        """
+        GET /v1/intraday-prices
+        Fetches all current instrument prices and returns as pyarrow Table.
+        """
+        data = await self.get_intraday_prices_raw()
+        return build_table(data, IntradayPriceDto, self._client, "/v1/intraday-prices")
+
+    async def _fetch_intraday_risk_factor_values(self) -> httpx.Response:
+        return await self._client.get("/v1/intraday-risk-factor-values")
+
+    async def get_intraday_risk_factor_values_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/intraday-risk-factor-values
+        Fetches current risk factor values and returns raw JSON data.
+        """
+        response = await self._fetch_intraday_risk_factor_values()
+        return decode_json(response, self._client)
+
+    async def get_intraday_risk_factor_values(self) -> List[IntradayRiskFactorValueDto]:
+        """
+        GET /v1/intraday-risk-factor-values
+        Fetches current risk factor values and returns typed models.
+        """
+        response = await self._fetch_intraday_risk_factor_values()
+        return decode_models(response, IntradayRiskFactorValueDto, self._client)
+
+    async def get_intraday_risk_factor_values_df(self) -> pd.DataFrame:
+        """
+        GET /v1/intraday-risk-factor-values
+        Fetches current risk factor values and returns as pandas DataFrame.
+        """
+        data = await self.get_intraday_risk_factor_values_raw()
+        return build_frame(
+            data,
+            IntradayRiskFactorValueDto,
+            self._client,
+            "/v1/intraday-risk-factor-values",
+        )
+
+    async def get_intraday_risk_factor_values_arrow(self) -> "pa.Table":
+        """
+        GET /v1/intraday-risk-factor-values
+        Fetches current risk factor values and returns as pyarrow Table.
+        """
+        data = await self.get_intraday_risk_factor_values_raw()
+        return build_table(
+            data,
+            IntradayRiskFactorValueDto,
+            self._client,
+            "/v1/intraday-risk-factor-values",
+        )
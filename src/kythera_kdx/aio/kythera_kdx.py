@@ -0,0 +1,280 @@
+"""
+AsyncKytheraKdx - Unified asynchronous client class for the Kythera API
+
+This module provides a unified client that inherits from AsyncAuthenticatedClient
+and provides convenient access to all asynchronous client modules through properties.
+"""
+
+from typing import Optional, List, Union
+
+import httpx
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import JsonCodec
+from ..rate_limit import RateLimiter
+from ..retry import RetryPolicy
+from ..hooks import EventHooks
+from ..tracing import Tracer
+from ..metrics import ClientMetrics
+from ..hedge import HedgePolicy
+from ..circuit_breaker import CircuitBreaker
+from ..cache import ResponseCache
+from ..disk_cache import DiskCache
+from .addin import AsyncAddInClient
+from .funds import AsyncFundsClient
+from .globals import AsyncGlobalsClient
+from .instrument_groups import AsyncInstrumentGroupsClient
+from .instrument_parameters import AsyncInstrumentParametersClient
+from .instruments import AsyncInstrumentsClient
+from .intraday import AsyncIntradayClient
+from .pnl import AsyncPnlClient
+from .positions import AsyncPositionsClient
+from .prices import AsyncPricesClient
+from .risk_factors import AsyncRiskFactorsClient
+from .trades import AsyncTradesClient
+from .subclasses import AsyncSubclassesClient
+from .indexes import AsyncIndexesClient
+from .price_models import AsyncPriceModelsClient
+from .portfolios import AsyncPortfoliosClient
+from .issuers import AsyncIssuersClient
+
+
+class AsyncKytheraKdx(AsyncAuthenticatedClient):
+    """
+    Unified asynchronous Kythera API client with access to all API modules.
+
+    This class inherits from AsyncAuthenticatedClient and mirrors KytheraKdx: every
+    sub-client method is a coroutine, so independent calls can be gathered and
+    share one connection pool.
+
+    Example usage:
+        async with AsyncKytheraKdx(
+            client_id="your-client-id",
+            client_secret="your-client-secret",
+            tenant_id="your-tenant-id"
+        ) as kdx:
+            positions, prices = await asyncio.gather(
+                kdx.positions.get_positions(),
+                kdx.prices.get_all_prices(price_date=date.today(), price_type_name="CLOSE"),
+            )
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        timeout: Union[int, float, httpx.Timeout] = 30,
+        scopes: Optional[List[str]] = None,
+        x_api_key: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        validate: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Union[ClientMetrics, bool] = True,
+        tracer: Optional[Tracer] = None,
+        event_hooks: Optional[EventHooks] = None,
+        access_token: Optional[str] = None,
+    ):
+        """
+        Initialize the unified asynchronous Kythera client.
+
+        Args:
+            base_url: The base URL for the Kythera API
+            tenant_id: Azure AD tenant ID
+            client_id: Azure AD application client ID
+            client_secret: Azure AD application client secret (for service principal auth)
+            timeout: Request timeout in seconds, or an httpx.Timeout
+            scopes: List of OAuth scopes to request
+            limits: Connection pool limits (httpx.Limits)
+            http2: Enable HTTP/2 multiplexing (requires the ``http2`` extra)
+            http_client: Shared httpx client whose connections are reused
+            transport: Custom httpx transport for the client created here
+            retry_policy: Retry policy for transient failures
+            rate_limiter: Client-side rate limiter, shareable across clients
+            json_codec: JSON backend name or JsonCodec; auto-detected when omitted
+            validate: Set to False to skip pydantic validation of typed results
+            response_cache: ResponseCache for GET responses; disabled when omitted
+            disk_cache: DiskCache for closed historical dates; disabled when omitted
+            coalesce_requests: Share one call between concurrent identical GETs
+            circuit_breaker: CircuitBreaker failing fast on degraded endpoints; disabled when omitted
+            hedge_policy: HedgePolicy for tail-latency-sensitive GETs; disabled when omitted
+            metrics: Per-endpoint metrics (True, False or a shared ClientMetrics)
+            tracer: Tracer for call, HTTP and conversion spans; no-op when omitted
+            event_hooks: EventHooks for request lifecycle callbacks; none when omitted
+            access_token: Static bearer token used instead of Azure AD
+        """
+        super().__init__(
+            base_url=base_url,
+            tenant_id=tenant_id,
+            client_id=client_id,
+            client_secret=client_secret,
+            timeout=timeout,
+            scopes=scopes,
+            x_api_key=x_api_key,
+            limits=limits,
+            http2=http2,
+            http_client=http_client,
+            transport=transport,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            validate=validate,
+            response_cache=response_cache,
+            disk_cache=disk_cache,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            metrics=metrics,
+            tracer=tracer,
+            event_hooks=event_hooks,
+            access_token=access_token,
+        )
+
+        # Initialize all client modules lazily
+        self._addin_client: Optional[AsyncAddInClient] = None
+        self._funds_client: Optional[AsyncFundsClient] = None
+        self._globals_client: Optional[AsyncGlobalsClient] = None
+        self._instrument_groups_client: Optional[AsyncInstrumentGroupsClient] = None
+        self._instrument_parameters_client: Optional[AsyncInstrumentParametersClient] = None
+        self._instruments_client: Optional[AsyncInstrumentsClient] = None
+        self._intraday_client: Optional[AsyncIntradayClient] = None
+        self._pnl_client: Optional[AsyncPnlClient] = None
+        self._positions_client: Optional[AsyncPositionsClient] = None
+        self._prices_client: Optional[AsyncPricesClient] = None
+        self._risk_factors_client: Optional[AsyncRiskFactorsClient] = None
+        self._trades_client: Optional[AsyncTradesClient] = None
+        self._portfolios_client: Optional[AsyncPortfoliosClient] = None
+        self._subclasses_client: Optional[AsyncSubclassesClient] = None
+        self._indexes_client: Optional[AsyncIndexesClient] = None
+        self._price_models_client: Optional[AsyncPriceModelsClient] = None
+        self._issuers_client: Optional[AsyncIssuersClient] = None
+
+    @property
+    def addin(self) -> AsyncAddInClient:
+        """Access to AddIn endpoints."""
+        if self._addin_client is None:
+            self._addin_client = AsyncAddInClient(self)
+        return self._addin_client
+
+    @property
+    def funds(self) -> AsyncFundsClient:
+        """Access to Funds endpoints."""
+        if self._funds_client is None:
+            self._funds_client = AsyncFundsClient(self)
+        return self._funds_client
+
+    @property
+    def globals(self) -> AsyncGlobalsClient:
+        """Access to Globals (reference data) endpoints."""
+        if self._globals_client is None:
+            self._globals_client = AsyncGlobalsClient(self)
+        return self._globals_client
+
+    @property
+    def instrument_groups(self) -> AsyncInstrumentGroupsClient:
+        """Access to Instrument Groups endpoints."""
+        if self._instrument_groups_client is None:
+            self._instrument_groups_client = AsyncInstrumentGroupsClient(self)
+        return self._instrument_groups_client
+
+    @property
+    def instrument_parameters(self) -> AsyncInstrumentParametersClient:
+        """Access to Instrument Parameters endpoints."""
+        if self._instrument_parameters_client is None:
+            self._instrument_parameters_client = AsyncInstrumentParametersClient(self)
+        return self._instrument_parameters_client
+
+    @property
+    def instruments(self) -> AsyncInstrumentsClient:
+        """Access to Instruments endpoints."""
+        if self._instruments_client is None:
+            self._instruments_client = AsyncInstrumentsClient(self)
+        return self._instruments_client
+
+    @property
+    def intraday(self) -> AsyncIntradayClient:
+        """Access to Intraday endpoints."""
+        if self._intraday_client is None:
+            self._intraday_client = AsyncIntradayClient(self)
+        return self._intraday_client
+
+    @property
+    def pnl(self) -> AsyncPnlClient:
+        """Access to P&L endpoints."""
+        if self._pnl_client is None:
+            self._pnl_client = AsyncPnlClient(self)
+        return self._pnl_client
+
+    @property
+    def positions(self) -> AsyncPositionsClient:
+        """Access to Positions endpoints."""
+        if self._positions_client is None:
+            self._positions_client = AsyncPositionsClient(self)
+        return self._positions_client
+
+    @property
+    def prices(self) -> AsyncPricesClient:
+        """Access to Prices endpoints."""
+        if self._prices_client is None:
+            self._prices_client = AsyncPricesClient(self)
+        return self._prices_client
+
+    @property
+    def risk_factors(self) -> AsyncRiskFactorsClient:
+        """Access to Risk Factors endpoints."""
+        if self._risk_factors_client is None:
+            self._risk_factors_client = AsyncRiskFactorsClient(self)
+        return self._risk_factors_client
+
+    @property
+    def trades(self) -> AsyncTradesClient:
+        """Access to Trades endpoints."""
+        if self._trades_client is None:
+            self._trades_client = AsyncTradesClient(self)
+        return self._trades_client
+
+    @property
+    def portfolios(self) -> AsyncPortfoliosClient:
+        """Access to Portfolios endpoints."""
+        if self._portfolios_client is None:
+            self._portfolios_client = AsyncPortfoliosClient(self)
+        return self._portfolios_client
+
+    @property
+    def subclasses(self) -> AsyncSubclassesClient:
+        """Access to Subclasses endpoints."""
+        if self._subclasses_client is None:
+            self._subclasses_client = AsyncSubclassesClient(self)
+        return self._subclasses_client
+
+    @property
+    def indexes(self) -> AsyncIndexesClient:
+        """Access to Indexes endpoints."""
+        if self._indexes_client is None:
+            self._indexes_client = AsyncIndexesClient(self)
+        return self._indexes_client
+
+    @property
+    def price_models(self) -> AsyncPriceModelsClient:
+        """Access to Price Models endpoints."""
+        if self._price_models_client is None:
+            self._price_models_client = AsyncPriceModelsClient(self)
+        return self._price_models_client
+
+    @property
+    def issuers(self) -> AsyncIssuersClient:
+        """Access to Issuers endpoints."""
+        if self._issuers_client is None:
+            self._issuers_client = AsyncIssuersClient(self)
+        return self._issuers_client
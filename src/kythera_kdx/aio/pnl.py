@@ -0,0 +1,121 @@
+from typing import List, Dict, Any, AsyncIterator, TYPE_CHECKING
+
+import httpx
+import pandas as pd
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models, model_factory
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import IntradayPnlEntryDto, PnlExplainDto
+from ..streaming import aiter_json_array
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+@traced
+class AsyncPnlClient:
+    """Client for PnL (Profit and Loss) related endpoints."""
+    
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_intraday_pnl(self) -> httpx.Response:
+        return await self._client.get("/v1/pnl/intraday")
+
+    async def get_intraday_pnl_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/pnl/intraday
+        Fetches current intraday PnL and returns raw JSON data.
+        """
+        response = await self._fetch_intraday_pnl()
+        return decode_json(response, self._client)
+
+    async def get_intraday_pnl(self) -> List[IntradayPnlEntryDto]:
+        """
+        GET /v1/pnl/intraday
+        Fetches current intraday PnL and returns typed models.
+        """
+        response = await self._fetch_intraday_pnl()
+        return decode_models(response, IntradayPnlEntryDto, self._client)
+
+    async def get_intraday_pnl_df(self) -> pd.DataFrame:
+        """
+        GET /v1/pnl/intraday
+        Fetches current intraday PnL and returns a pandas DataFrame.
+        """
+        data = await self.get_intraday_pnl_raw()
+        return build_frame(data, IntradayPnlEntryDto, self._client, "/v1/pnl/intraday")
+
+    async def get_intraday_pnl_arrow(self) -> "pa.Table":
+        """
+        GET /v1/pnl/intraday
+        Fetches current intraday PnL and returns a pyarrow Table.
+        """
+        data = await self.get_intraday_pnl_raw()
+        return build_table(data, IntradayPnlEntryDto, self._client, "/v1/pnl/intraday")
+
+    async def iter_intraday_pnl_raw(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        GET /v1/pnl/intraday
+        Streams current intraday PnL entries as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        async with self._client.stream("GET", "/v1/pnl/intraday") as response:
+            async for item in aiter_json_array(response.aiter_bytes()):
+                yield item
+
+    async def iter_intraday_pnl(self) -> AsyncIterator[IntradayPnlEntryDto]:
+        """
+        GET /v1/pnl/intraday
+        Streams current intraday PnL entries as typed models.
+        """
+        build = model_factory(IntradayPnlEntryDto, self._client)
+        async for item in self.iter_intraday_pnl_raw():
+            yield build(item)
+
+    async def _fetch_pnl_explain(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> httpx.Response:
+        params = {
+            "start-date": start_date.isoformat(),
+            "end-date": end_date.isoformat(),
+            "fund-family": fund_family,
+        }
+        # Repeat the query param to send an array in query string
+        for d in discriminators:
+            params.setdefault("discriminator", [])
+            params["discriminator"].append(d)
+        return await self._client.get("/v1/pnl/explain", params=params)
+
+    async def get_pnl_explain_raw(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> List[Dict[str, Any]]:
+        """
+        GET /v1/pnl/explain
+        Retrieves PnL explain entries for the given range, fund family and discriminators (raw JSON).
+        """
+        response = await self._fetch_pnl_explain(start_date, end_date, fund_family, discriminators)
+        return decode_json(response, self._client)
+
+    async def get_pnl_explain(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> List[PnlExplainDto]:
+        """
+        GET /v1/pnl/explain
+        Retrieves PnL explain entries for the given range, fund family and discriminators (typed models).
+        """
+        response = await self._fetch_pnl_explain(start_date, end_date, fund_family, discriminators)
+        return decode_models(response, PnlExplainDto, self._client)
+
+    async def get_pnl_explain_df(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> pd.DataFrame:
+        """
+        GET /v1/pnl/explain
+        Retrieves PnL explain entries for the given range, fund family and discriminators (DataFrame).
+        """
+        data = await self.get_pnl_explain_raw(start_date, end_date, fund_family, discriminators)
+        return build_frame(data, PnlExplainDto, self._client, "/v1/pnl/explain")
+
+    async def get_pnl_explain_arrow(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> "pa.Table":
+        """
+        GET /v1/pnl/explain
+        Retrieves PnL explain entries for the given range, fund family and discriminators (Arrow Table).
+        """
+        data = await self.get_pnl_explain_raw(start_date, end_date, fund_family, discriminators)
+        return build_table(data, PnlExplainDto, self._client, "/v1/pnl/explain")
@@ -0,0 +1,53 @@
+from typing import List, Dict, Any, TYPE_CHECKING
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import PortfolioDto
+from ..tracing import traced
+import httpx
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
+class AsyncPortfoliosClient:
+    """Client for Portfolios endpoints."""
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_portfolios(self) -> httpx.Response:
+        return await self._client.get("/v1/portfolios")
+
+    async def get_portfolios_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/portfolios
+        Fetches all available portfolios (raw JSON).
+        """
+        response = await self._fetch_portfolios()
+        return decode_json(response, self._client)
+
+    async def get_portfolios(self) -> List[PortfolioDto]:
+        """
+        GET /v1/portfolios
+        Fetches all available portfolios (typed models).
+        """
+        response = await self._fetch_portfolios()
+        return decode_models(response, PortfolioDto, self._client)
+
+    async def get_portfolios_df(self) -> pd.DataFrame:
+        """
+        GET /v1/portfolios
+        Fetches all available portfolios and returns a pandas DataFrame.
+        """
+        data = await self.get_portfolios_raw()
+        return build_frame(data, PortfolioDto, self._client, "/v1/portfolios")
+
+    async def get_portfolios_arrow(self) -> "pa.Table":
+        """
+        GET /v1/portfolios
+        Fetches all available portfolios and returns a pyarrow Table.
+        """
+        data = await self.get_portfolios_raw()
+        return build_table(data, PortfolioDto, self._client, "/v1/portfolios")
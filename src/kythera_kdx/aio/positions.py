@@ -0,0 +1,112 @@
+from datetime import date
+from typing import List, Optional, Dict, Any, AsyncIterator, TYPE_CHECKING
+
+import httpx
+import pandas as pd
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models, model_factory
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import PositionDto
+from ..streaming import aiter_json_array
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+@traced
+class AsyncPositionsClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_positions(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> httpx.Response:
+        params: dict = {}
+        if position_date:
+            params["positionDate"] = position_date.isoformat()
+        params["isOpen"] = is_open
+        return await self._client.get("/v1/positions", params=params)
+
+    async def get_positions_raw(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/positions
+        Fetches all position entries for a given date and returns raw JSON data.
+        """
+        response = await self._fetch_positions(position_date, is_open)
+        return decode_json(response, self._client)
+
+    async def get_positions(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> List[PositionDto]:
+        """
+        GET /v1/positions
+        Fetches all position entries for a given date and returns typed models.
+        """
+        response = await self._fetch_positions(position_date, is_open)
+        return decode_models(response, PositionDto, self._client)
+
+    async def get_positions_df(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> pd.DataFrame:
+        """
+        GET /v1/positions
+        Fetches all position entries for a given date and returns a pandas DataFrame.
+        """
+        data = await self.get_positions_raw(position_date, is_open)
+        return build_frame(data, PositionDto, self._client, "/v1/positions")
+
+    async def get_positions_arrow(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> "pa.Table":
+        """
+        GET /v1/positions
+        Fetches all position entries for a given date and returns a pyarrow Table.
+        """
+        data = await self.get_positions_raw(position_date, is_open)
+        return build_table(data, PositionDto, self._client, "/v1/positions")
+
+    async def iter_positions_raw(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        GET /v1/positions
+        Streams position entries for a given date as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params: dict = {}
+        if position_date:
+            params["positionDate"] = position_date.isoformat()
+        params["isOpen"] = is_open
+        async with self._client.stream("GET", "/v1/positions", params=params) as response:
+            async for item in aiter_json_array(response.aiter_bytes()):
+                yield item
+
+    async def iter_positions(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> AsyncIterator[PositionDto]:
+        """
+        GET /v1/positions
+        Streams position entries for a given date as typed models.
+        """
+        build = model_factory(PositionDto, self._client)
+        async for item in self.iter_positions_raw(position_date, is_open):
+            yield build(item)
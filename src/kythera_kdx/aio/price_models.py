@@ -0,0 +1,138 @@
+from typing import List, Dict, Any, TYPE_CHECKING
+import httpx
+import pandas as pd
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import PriceModelDto, InstrumentPriceModelDto, InstrumentGroupPriceModelDto
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
+class AsyncPriceModelsClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_price_models(self) -> httpx.Response:
+        return await self._client.get("/v1/price-models")
+
+    async def get_price_models_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/price-models
+        Fetches all price models (raw JSON).
+        """
+        response = await self._fetch_price_models()
+        return decode_json(response, self._client)
+
+    async def get_price_models(self) -> List[PriceModelDto]:
+        """
+        GET /v1/price-models
+        Fetches all price models (typed models).
+        """
+        response = await self._fetch_price_models()
+        return decode_models(response, PriceModelDto, self._client)
+
+    async def get_price_models_df(self) -> pd.DataFrame:
+        """
+        GET /v1/price-models
+        Fetches all price models (DataFrame).
+        """
+        data = await self.get_price_models_raw()
+        return build_frame(data, PriceModelDto, self._client, "/v1/price-models")
+
+    async def get_price_models_arrow(self) -> "pa.Table":
+        """
+        GET /v1/price-models
+        Fetches all price models (Arrow Table).
+        """
+        data = await self.get_price_models_raw()
+        return build_table(data, PriceModelDto, self._client, "/v1/price-models")
+
+    async def _fetch_price_model_instruments(self, include_action_risk_factors: bool = False) -> httpx.Response:
+        params = {"include-action-risk-factors": include_action_risk_factors}
+        return await self._client.get("/v1/price-models/instruments", params=params)
+
+    async def get_price_model_instruments_raw(self, include_action_risk_factors: bool = False) -> List[Dict[str, Any]]:
+        """
+        GET /v1/price-models/instruments
+        Fetches instrument price models (raw JSON).
+        """
+        response = await self._fetch_price_model_instruments(include_action_risk_factors)
+        return decode_json(response, self._client)
+
+    async def get_price_model_instruments(self, include_action_risk_factors: bool = False) -> List[InstrumentPriceModelDto]:
+        """
+        GET /v1/price-models/instruments
+        Fetches instrument price models (typed models).
+        """
+        response = await self._fetch_price_model_instruments(include_action_risk_factors)
+        return decode_models(response, InstrumentPriceModelDto, self._client)
+
+    async def get_price_model_instruments_df(self, include_action_risk_factors: bool = False) -> pd.DataFrame:
+        """
+        GET /v1/price-models/instruments
+        Fetches instrument price models (DataFrame).
+        """
+        data = await self.get_price_model_instruments_raw(include_action_risk_factors)
+        return build_frame(
+            data, InstrumentPriceModelDto, self._client, "/v1/price-models/instruments"
+        )
+
+    async def get_price_model_instruments_arrow(self, include_action_risk_factors: bool = False) -> "pa.Table":
+        """
+        GET /v1/price-models/instruments
+        Fetches instrument price models (Arrow Table).
+        """
+        data = await self.get_price_model_instruments_raw(include_action_risk_factors)
+        return build_table(
+            data, InstrumentPriceModelDto, self._client, "/v1/price-models/instruments"
+        )
+
+    async def _fetch_price_model_instrument_groups(self, include_action_risk_factors: bool = False) -> httpx.Response:
+        params = {"include-action-risk-factors": include_action_risk_factors}
+        return await self._client.get("/v1/price-models/instrument-groups", params=params)
+
+    async def get_price_model_instrument_groups_raw(self, include_action_risk_factors: bool = False) -> List[Dict[str, Any]]:
+        """
+        GET /v1/price-models/instrument-groups
+        Fetches instrument group price models (raw JSON).
+        """
+        response = await self._fetch_price_model_instrument_groups(include_action_risk_factors)
+        return decode_json(response, self._client)
+
+    async def get_price_model_instrument_groups(self, include_action_risk_factors: bool = False) -> List[InstrumentGroupPriceModelDto]:
+        """
+        GET /v1/price-models/instrument-groups
+        Fetches instrument group price models (typed models).
+        """
+        response = await self._fetch_price_model_instrument_groups(include_action_risk_factors)
+        return decode_models(response, InstrumentGroupPriceModelDto, self._client)
+
+    async def get_price_model_instrument_groups_df(self, include_action_risk_factors: bool = False) -> pd.DataFrame:
+        """
+        GET /v1/price-models/instrument-groups
+        Fetches instrument group price models (DataFrame).
+        """
+        data = await self.get_price_model_instrument_groups_raw(include_action_risk_factors)
+        return build_frame(
+            data,
+            InstrumentGroupPriceModelDto,
+            self._client,
+            "/v1/price-models/instrument-groups",
+        )
+
+    async def get_price_model_instrument_groups_arrow(self, include_action_risk_factors: bool = False) -> "pa.Table":
+        """
+        GET /v1/price-models/instrument-groups
+        Fetches instrument group price models (Arrow Table).
+        """
+        data = await self.get_price_model_instrument_groups_raw(include_action_risk_factors)
+        return build_table(
+            data,
+            InstrumentGroupPriceModelDto,
+            self._client,
+            "/v1/price-models/instrument-groups",
+        )
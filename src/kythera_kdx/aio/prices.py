@@ -0,0 +1,327 @@
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterable, TYPE_CHECKING
+from datetime import date
+
+import httpx
+import pandas as pd
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models, model_factory
+from ..arrow import build_table
+from ..fanout import DateRangeResult, business_days, fetch_dates_async, in_date_order
+from ..frames import build_frame
+from ..models_v1 import PriceDto, OverrideInstrumentPriceRequest, PriceTypeDto
+from ..prices import _dated, _price_range_frame, _price_range_table
+from ..streaming import aiter_json_array
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+@traced
+class AsyncPricesClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_all_prices(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> httpx.Response:
+        params = {"priceDate": price_date.isoformat(), "priceTypeName": price_type_name}
+        response = await self._client.get("/v1/prices", params=params)
+        response.raise_for_status()
+        return response
+
+    async def get_all_prices_raw(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/prices
+        Fetches all prices for a given date and type, returns raw JSON data.
+        """
+        response = await self._fetch_all_prices(price_date, price_type_name)
+        return decode_json(response, self._client)
+
+    async def get_all_prices(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> List[PriceDto]:
+        """
+        GET /v1/prices
+        Fetches all prices for a given date and type.
+        """
+        response = await self._fetch_all_prices(price_date, price_type_name)
+        return decode_models(response, PriceDto, self._client)
+
+    async def get_all_prices_df(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> pd.DataFrame:
+        """
+        GET /v1/prices
+        Fetches all prices for a given date and type, returns as pandas DataFrame.
+        """
+        data = await self.get_all_prices_raw(price_date, price_type_name)
+        return build_frame(data, PriceDto, self._client, "/v1/prices")
+
+    async def get_all_prices_arrow(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> "pa.Table":
+        """
+        GET /v1/prices
+        Fetches all prices for a given date and type, returns as pyarrow Table.
+        """
+        data = await self.get_all_prices_raw(price_date, price_type_name)
+        return build_table(data, PriceDto, self._client, "/v1/prices")
+
+    async def iter_all_prices_raw(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        GET /v1/prices
+        Streams all prices for a given date and type as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params = {"priceDate": price_date.isoformat(), "priceTypeName": price_type_name}
+        async with self._client.stream("GET", "/v1/prices", params=params) as response:
+            async for item in aiter_json_array(response.aiter_bytes()):
+                yield item
+
+    async def iter_all_prices(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> AsyncIterator[PriceDto]:
+        """
+        GET /v1/prices
+        Streams all prices for a given date and type as typed models.
+        """
+        build = model_factory(PriceDto, self._client)
+        async for item in self.iter_all_prices_raw(price_date, price_type_name):
+            yield build(item)
+
+    async def _fetch_prices_range(
+        self,
+        fetch: Any,
+        start: date,
+        end: date,
+        max_concurrency: int,
+        holidays: Optional[Iterable[date]],
+    ) -> DateRangeResult[List[Any]]:
+        dates = business_days(start, end, holidays)
+
+        async def fetch_date(day: date) -> List[Any]:
+            return _dated(await fetch(day), day)
+
+        results, failures = await fetch_dates_async(fetch_date, dates, max_concurrency)
+        return DateRangeResult(in_date_order(results, dates), dates, failures)
+
+    async def get_prices_range_raw(
+        self,
+        start: date,
+        end: date,
+        price_type_name: str,
+        max_concurrency: int = 8,
+        holidays: Optional[Iterable[date]] = None,
+    ) -> DateRangeResult[List[Dict[str, Any]]]:
+        """
+        GET /v1/prices for every business day from start to end
+        Fetches the dates concurrently, returns raw JSON data in date order.
+
+        Args:
+            start: First date of the range
+            end: Last date of the range (included)
+            price_type_name: Price type, e.g. "CLOSE"
+            max_concurrency: Dates fetched at the same time
+            holidays: Dates to skip besides weekends
+
+        Returns:
+            DateRangeResult whose data holds the prices of the dates that
+            succeeded and whose failures maps the other dates to their error
+        """
+        return await self._fetch_prices_range(
+            lambda day: self.get_all_prices_raw(day, price_type_name),
+            start,
+            end,
+            max_concurrency,
+            holidays,
+        )
+
+    async def get_prices_range(
+        self,
+        start: date,
+        end: date,
+        price_type_name: str,
+        max_concurrency: int = 8,
+        holidays: Optional[Iterable[date]] = None,
+    ) -> DateRangeResult[List[PriceDto]]:
+        """
+        GET /v1/prices for every business day from start to end
+        Fetches the dates concurrently, returns typed models in date order.
+        """
+        return await self._fetch_prices_range(
+            lambda day: self.get_all_prices(day, price_type_name),
+            start,
+            end,
+            max_concurrency,
+            holidays,
+        )
+
+    async def get_prices_range_df(
+        self,
+        start: date,
+        end: date,
+        price_type_name: str,
+        max_concurrency: int = 8,
+        holidays: Optional[Iterable[date]] = None,
+    ) -> DateRangeResult[pd.DataFrame]:
+        """
+        GET /v1/prices for every business day from start to end
+        Fetches the dates concurrently, returns one pandas DataFrame indexed
+        by (date, instrumentId).
+        """
+        result = await self.get_prices_range_raw(
+            start, end, price_type_name, max_concurrency, holidays
+        )
+        frame = build_frame(result.data, PriceDto, self._client, "/v1/prices")
+        return DateRangeResult(_price_range_frame(frame), result.dates, result.failures)
+
+    async def get_prices_range_arrow(
+        self,
+        start: date,
+        end: date,
+        price_type_name: str,
+        max_concurrency: int = 8,
+        holidays: Optional[Iterable[date]] = None,
+    ) -> DateRangeResult["pa.Table"]:
+        """
+        GET /v1/prices for every business day from start to end
+        Fetches the dates concurrently, returns one pyarrow Table sorted by
+        date and instrumentId.
+        """
+        result = await self.get_prices_range_raw(
+            start, end, price_type_name, max_concurrency, holidays
+        )
+        table = build_table(result.data, PriceDto, self._client, "/v1/prices")
+        return DateRangeResult(_price_range_table(table), result.dates, result.failures)
+
+    async def _fetch_prices_by_instrument(
+        self,
+        instrument_id: int,
+        price_date: date,
+        price_type_name: str,
+    ) -> httpx.Response:
+        params = {"priceDate": price_date.isoformat(), "priceTypeName": price_type_name}
+        response = await self._client.get(f"/v1/prices/{instrument_id}", params=params)
+        response.raise_for_status()
+        return response
+
+    async def get_prices_by_instrument_raw(
+        self,
+        instrument_id: int,
+        price_date: date,
+        price_type_name: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/prices/{instrumentId}
+        Fetches prices for a given date, type and instrument, returns raw JSON data.
+        """
+        response = await self._fetch_prices_by_instrument(instrument_id, price_date, price_type_name)
+        return decode_json(response, self._client)
+
+    async def get_prices_by_instrument(
+        self,
+        instrument_id: int,
+        price_date: date,
+        price_type_name: str,
+    ) -> List[PriceDto]:
+        """
+        GET /v1/prices/{instrumentId}
+        Fetches prices for a given date, type and instrument.
+        """
+        response = await self._fetch_prices_by_instrument(instrument_id, price_date, price_type_name)
+        return decode_models(response, PriceDto, self._client)
+
+    async def get_prices_by_instrument_df(
+        self,
+        instrument_id: int,
+        price_date: date,
+        price_type_name: str,
+    ) -> pd.DataFrame:        
+        """
+        GET /v1/prices/{instrumentId}
+        Fetches prices for a given date, type and instrument, returns as pandas DataFrame.
+        """
+        data = await self.get_prices_by_instrument_raw(instrument_id, price_date, price_type_name)
+        return build_frame(data, PriceDto, self._client, "/v1/prices/{instrumentId}")
+
+    async def get_prices_by_instrument_arrow(
+        self,
+        instrument_id: int,
+        price_date: date,
+        price_type_name: str,
+    ) -> "pa.Table":
+        """
+        GET /v1/prices/{instrumentId}
+        Fetches prices for a given date, type and instrument, returns as pyarrow Table.
+        """
+        data = await self.get_prices_by_instrument_raw(instrument_id, price_date, price_type_name)
+        return build_table(data, PriceDto, self._client, "/v1/prices/{instrumentId}")
+
+    async def post_prices(
+        self,
+        requests: List[OverrideInstrumentPriceRequest],
+    ) -> None:
+        """
+        POST /v1/prices
+        Publishes instrument prices.
+        """
+        body = [req.dict() for req in requests]
+        response = await self._client.post("/v1/prices", data=body)  # type: ignore
+        response.raise_for_status()
+
+    async def _fetch_price_types(self) -> httpx.Response:
+        response = await self._client.get("/v1/prices/price-types")
+        response.raise_for_status()
+        return response
+
+    async def get_price_types_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/prices/price-types
+        Fetches all price types, returns raw JSON data.
+        """
+        response = await self._fetch_price_types()
+        return decode_json(response, self._client)
+
+    async def get_price_types(self) -> List[PriceTypeDto]:
+        """
+        GET /v1/prices/price-types
+        Fetches all price types.
+        """
+        response = await self._fetch_price_types()
+        return decode_models(response, PriceTypeDto, self._client)
+
+    async def get_price_types_df(self) -> pd.DataFrame:
+        """
+        GET /v1/prices/price-types
+        Fetches all price types, returns as pandas DataFrame.
+        """
+        data = await self.get_price_types_raw()
+        return build_frame(data, PriceTypeDto, self._client, "/v1/prices/price-types")
+
+    async def get_price_types_arrow(self) -> "pa.Table":
+        """
+        GET /v1/prices/price-types
+        Fetches all price types, returns as pyarrow Table.
+        """
+        data = await self.get_price_types_raw()
+        return build_table(data, PriceTypeDto, self._client, "/v1/prices/price-types")
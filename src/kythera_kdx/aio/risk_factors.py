@@ -0,0 +1,235 @@
+from datetime import date
+from typing import List, Dict, Any, AsyncIterator, TYPE_CHECKING
+
+import httpx
+import pandas as pd
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models, model_factory
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import (
+    RiskFactorDto,
+    RiskFactorValueDto,
+    OverrideRiskFactorValueRequest,
+    RiskValueTypeDto,
+    RiskFactorParameterDto,
+)
+from ..streaming import aiter_json_array
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+@traced
+class AsyncRiskFactorsClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_risk_factors(self, include_characteristics: bool = False) -> httpx.Response:
+        params = {"include-characteristics": include_characteristics}
+        return await self._client.get("/v1/risk-factors", params=params)
+
+    async def get_risk_factors_raw(self, include_characteristics: bool = False) -> List[Dict[str, Any]]:
+        """
+        GET /v1/risk-factors
+        Fetches all risk factors and returns raw JSON data.
+        """
+        response = await self._fetch_risk_factors(include_characteristics)
+        return decode_json(response, self._client)
+
+    async def get_risk_factors(self, include_characteristics: bool = False) -> List[RiskFactorDto]:
+        """
+        GET /v1/risk-factors
+        Fetches all risk factors and returns typed models.
+        """
+        response = await self._fetch_risk_factors(include_characteristics)
+        return decode_models(response, RiskFactorDto, self._client)
+
+    async def get_risk_factors_df(self, include_characteristics: bool = False) -> pd.DataFrame:
+        """
+        GET /v1/risk-factors
+        Fetches all risk factors and returns a pandas DataFrame.
+        """
+        data = await self.get_risk_factors_raw(include_characteristics)
+        return build_frame(data, RiskFactorDto, self._client, "/v1/risk-factors")
+
+    async def get_risk_factors_arrow(self, include_characteristics: bool = False) -> "pa.Table":
+        """
+        GET /v1/risk-factors
+        Fetches all risk factors and returns a pyarrow Table.
+        """
+        data = await self.get_risk_factors_raw(include_characteristics)
+        return build_table(data, RiskFactorDto, self._client, "/v1/risk-factors")
+
+    async def _fetch_risk_factor_parameters(self) -> httpx.Response:
+        return await self._client.get("/v1/risk-factors/parameters")
+
+    async def get_risk_factor_parameters_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/risk-factors/parameters
+        Fetches all risk factor parameters (raw JSON).
+        """
+        response = await self._fetch_risk_factor_parameters()
+        return decode_json(response, self._client)
+
+    async def get_risk_factor_parameters(self) -> List[RiskFactorParameterDto]:
+        """
+        GET /v1/risk-factors/parameters
+        Fetches all risk factor parameters (typed models).
+        """
+        response = await self._fetch_risk_factor_parameters()
+        return decode_models(response, RiskFactorParameterDto, self._client)
+
+    async def get_risk_factor_parameters_df(self) -> pd.DataFrame:
+        """
+        GET /v1/risk-factors/parameters
+        Fetches all risk factor parameters (DataFrame).
+        """
+        data = await self.get_risk_factor_parameters_raw()
+        return build_frame(
+            data, RiskFactorParameterDto, self._client, "/v1/risk-factors/parameters"
+        )
+
+    async def get_risk_factor_parameters_arrow(self) -> "pa.Table":
+        """
+        GET /v1/risk-factors/parameters
+        Fetches all risk factor parameters (Arrow Table).
+        """
+        data = await self.get_risk_factor_parameters_raw()
+        return build_table(
+            data, RiskFactorParameterDto, self._client, "/v1/risk-factors/parameters"
+        )
+
+    async def _fetch_risk_factor_values(
+        self,
+        valuation_date: date,
+    ) -> httpx.Response:
+        params = {"valuation-date": valuation_date.isoformat()}
+        return await self._client.get("/v1/risk-factor-values", params=params)
+
+    async def get_risk_factor_values_raw(
+        self,
+        valuation_date: date,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/risk-factor-values
+        Fetches all risk factor values for a given date and returns raw JSON data.
+        """
+        response = await self._fetch_risk_factor_values(valuation_date)
+        return decode_json(response, self._client)
+
+    async def get_risk_factor_values(
+        self,
+        valuation_date: date,
+    ) -> List[RiskFactorValueDto]:
+        """
+        GET /v1/risk-factor-values
+        Fetches all risk factor values for a given date and returns typed models.
+        """
+        response = await self._fetch_risk_factor_values(valuation_date)
+        return decode_models(response, RiskFactorValueDto, self._client)
+
+    async def get_risk_factor_values_df(
+        self,
+        valuation_date: date,
+    ) -> pd.DataFrame:
+        """
+        GET /v1/risk-factor-values
+        Fetches all risk factor values for a given date and returns a pandas DataFrame.
+        """
+        data = await self.get_risk_factor_values_raw(valuation_date)
+        return build_frame(
+            data, RiskFactorValueDto, self._client, "/v1/risk-factor-values"
+        )
+
+    async def get_risk_factor_values_arrow(
+        self,
+        valuation_date: date,
+    ) -> "pa.Table":
+        """
+        GET /v1/risk-factor-values
+        Fetches all risk factor values for a given date and returns a pyarrow Table.
+        """
+        data = await self.get_risk_factor_values_raw(valuation_date)
+        return build_table(
+            data, RiskFactorValueDto, self._client, "/v1/risk-factor-values"
+        )
+
+    async def iter_risk_factor_values_raw(
+        self,
+        valuation_date: date,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        GET /v1/risk-factor-values
+        Streams risk factor values for a given date as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params = {"valuation-date": valuation_date.isoformat()}
+        async with self._client.stream("GET", "/v1/risk-factor-values", params=params) as response:
+            async for item in aiter_json_array(response.aiter_bytes()):
+                yield item
+
+    async def iter_risk_factor_values(
+        self,
+        valuation_date: date,
+    ) -> AsyncIterator[RiskFactorValueDto]:
+        """
+        GET /v1/risk-factor-values
+        Streams risk factor values for a given date as typed models.
+        """
+        build = model_factory(RiskFactorValueDto, self._client)
+        async for item in self.iter_risk_factor_values_raw(valuation_date):
+            yield build(item)
+
+    async def post_risk_factor_values(
+        self,
+        requests: List[OverrideRiskFactorValueRequest],
+    ) -> None:
+        """
+        POST /v1/risk-factor-values
+        Publishes risk factor values.
+        """
+        body = [req.dict() for req in requests]
+        response = await self._client.post("/v1/risk-factor-values", data=body)  # type: ignore
+        response.raise_for_status()
+
+    async def _fetch_risk_factor_value_types(self) -> httpx.Response:
+        return await self._client.get("/v1/risk-factor-values/types")
+
+    async def get_risk_factor_value_types_raw(self) -> List[Dict[str, Any]]:
+        """
+        GET /v1/risk-factor-values/types
+        Fetches all risk factor value types and returns raw JSON data.
+        """
+        response = await self._fetch_risk_factor_value_types()
+        return decode_json(response, self._client)
+
+    async def get_risk_factor_value_types(self) -> List[RiskValueTypeDto]:
+        """
+        GET /v1/risk-factor-values/types
+        Fetches all risk factor value types and returns typed models.
+        """
+        response = await self._fetch_risk_factor_value_types()
+        return decode_models(response, RiskValueTypeDto, self._client)
+
+    async def get_risk_factor_value_types_df(self) -> pd.DataFrame:
+        """
+        GET /v1/risk-factor-values/types
+        Fetches all risk factor value types and returns a pandas DataFrame.
+        """
+        data = await self.get_risk_factor_value_types_raw()
+        return build_frame(
+            data, RiskValueTypeDto, self._client, "/v1/risk-factor-values/types"
+        )
+
+    async def get_risk_factor_value_types_arrow(self) -> "pa.Table":
+        """
+        GET /v1/risk-factor-values/types
+        Fetches all risk factor value types and returns a pyarrow Table.
+        """
+        data = await self.get_risk_factor_value_types_raw()
+        return build_table(
+            data, RiskValueTypeDto, self._client, "/v1/risk-factor-values/types"
+        )
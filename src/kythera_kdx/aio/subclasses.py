@@ -0,0 +1,125 @@
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from datetime import date
+import httpx
+import pandas as pd
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import SubclassNavDto, SubclassDto
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
+class AsyncSubclassesClient:
+    """Client for Subclasses endpoints."""
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_subclass_navs(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> httpx.Response:
+        params = {}
+        if date:
+            params["date"] = date.isoformat()
+        if start_date:
+            params["start-date"] = start_date.isoformat()
+        if end_date:
+            params["end-date"] = end_date.isoformat()
+        return await self._client.get("/v1/subclasses/navs", params=params)
+
+    async def get_subclass_navs_raw(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/subclasses/navs
+        Fetches subclass NAVs for a given date or range (raw JSON).
+        """
+        response = await self._fetch_subclass_navs(date, start_date, end_date)
+        return decode_json(response, self._client)
+
+    async def get_subclass_navs(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[SubclassNavDto]:
+        """
+        GET /v1/subclasses/navs
+        Fetches subclass NAVs for a given date or range (typed models).
+        """
+        response = await self._fetch_subclass_navs(date, start_date, end_date)
+        return decode_models(response, SubclassNavDto, self._client)
+
+    async def get_subclass_navs_df(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> pd.DataFrame:
+        """
+        GET /v1/subclasses/navs
+        Fetches subclass NAVs for a given date or range (DataFrame).
+        """
+        data = await self.get_subclass_navs_raw(date, start_date, end_date)
+        return build_frame(data, SubclassNavDto, self._client, "/v1/subclasses/navs")
+
+    async def get_subclass_navs_arrow(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> "pa.Table":
+        """
+        GET /v1/subclasses/navs
+        Fetches subclass NAVs for a given date or range (Arrow Table).
+        """
+        data = await self.get_subclass_navs_raw(date, start_date, end_date)
+        return build_table(data, SubclassNavDto, self._client, "/v1/subclasses/navs")
+
+    async def _fetch_subclasses(self, include_characteristics: bool = False, enabled_only: bool = True) -> httpx.Response:
+        params = {
+            "include-characteristics": include_characteristics,
+            "enabled-only": enabled_only,
+        }
+        return await self._client.get("/v1/subclasses", params=params)
+
+    async def get_subclasses_raw(self, include_characteristics: bool = False, enabled_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        GET /v1/subclasses
+        Fetches all subclasses (raw JSON).
+        """
+        response = await self._fetch_subclasses(include_characteristics, enabled_only)
+        return decode_json(response, self._client)
+
+    async def get_subclasses(self, include_characteristics: bool = False, enabled_only: bool = True) -> List[SubclassDto]:
+        """
+        GET /v1/subclasses
+        Fetches all subclasses (typed models).
+        """
+        response = await self._fetch_subclasses(include_characteristics, enabled_only)
+        return decode_models(response, SubclassDto, self._client)
+
+    async def get_subclasses_df(self, include_characteristics: bool = False, enabled_only: bool = True) -> pd.DataFrame:
+        """
+        GET /v1/subclasses
+        Fetches all subclasses (DataFrame).
+        """
+        data = await self.get_subclasses_raw(include_characteristics, enabled_only)
+        return build_frame(data, SubclassDto, self._client, "/v1/subclasses")
+
+    async def get_subclasses_arrow(self, include_characteristics: bool = False, enabled_only: bool = True) -> "pa.Table":
+        """
+        GET /v1/subclasses
+        Fetches all subclasses (Arrow Table).
+        """
+        data = await self.get_subclasses_raw(include_characteristics, enabled_only)
+        return build_table(data, SubclassDto, self._client, "/v1/subclasses")
@@ -0,0 +1,174 @@
+from datetime import date
+from typing import List, Optional, Dict, Any, AsyncIterator, TYPE_CHECKING
+
+import httpx
+import pandas as pd
+
+from .authenticated_client import AsyncAuthenticatedClient
+from ..codec import decode_json, decode_models, model_factory
+from ..arrow import build_table
+from ..frames import build_frame
+from ..models_v1 import TradeDto, TradeFeeDto, TradeInternalDto
+from ..streaming import aiter_json_array
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
+class AsyncTradesClient:
+    def __init__(self, client: AsyncAuthenticatedClient):
+        self._client = client
+
+    async def _fetch_trades(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> httpx.Response:
+        params: dict = {}
+        if effective_date:
+            params["effectiveDate"] = effective_date.isoformat()
+        return await self._client.get("/v1/trades", params=params)
+
+    async def get_trades_raw(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/trades
+        Fetches all trades for a given effective date and returns raw JSON data.
+        """
+        response = await self._fetch_trades(effective_date)
+        return decode_json(response, self._client)
+
+    async def get_trades(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> List[TradeDto]:
+        """
+        GET /v1/trades
+        Fetches all trades for a given effective date and returns typed models.
+        """
+        response = await self._fetch_trades(effective_date)
+        return decode_models(response, TradeDto, self._client)
+
+    async def get_trades_df(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> pd.DataFrame:
+        """
+        GET /v1/trades
+        Fetches all trades for a given effective date and returns a pandas DataFrame.
+        """
+        data = await self.get_trades_raw(effective_date)
+        return build_frame(data, TradeDto, self._client, "/v1/trades")
+
+    async def get_trades_arrow(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> "pa.Table":
+        """
+        GET /v1/trades
+        Fetches all trades for a given effective date and returns a pyarrow Table.
+        """
+        data = await self.get_trades_raw(effective_date)
+        return build_table(data, TradeDto, self._client, "/v1/trades")
+
+    async def iter_trades_raw(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        GET /v1/trades
+        Streams trades for a given effective date as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params: dict = {}
+        if effective_date:
+            params["effectiveDate"] = effective_date.isoformat()
+        async with self._client.stream("GET", "/v1/trades", params=params) as response:
+            async for item in aiter_json_array(response.aiter_bytes()):
+                yield item
+
+    async def iter_trades(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> AsyncIterator[TradeDto]:
+        """
+        GET /v1/trades
+        Streams trades for a given effective date as typed models.
+        """
+        build = model_factory(TradeDto, self._client)
+        async for item in self.iter_trades_raw(effective_date):
+            yield build(item)
+
+    async def _fetch_trade_fees(self, effective_date: date) -> httpx.Response:
+        params = {"effective-date": effective_date.isoformat()}
+        return await self._client.get("/v1/trades/fees", params=params)
+
+    async def get_trade_fees_raw(self, effective_date: date) -> List[Dict[str, Any]]:
+        """
+        GET /v1/trades/fees
+        Fetches trade fees for the provided effective date (raw JSON).
+        """
+        response = await self._fetch_trade_fees(effective_date)
+        return decode_json(response, self._client)
+
+    async def get_trade_fees(self, effective_date: date) -> List[TradeFeeDto]:
+        """
+        GET /v1/trades/fees
+        Fetches trade fees for the provided effective date (typed models).
+        """
+        response = await self._fetch_trade_fees(effective_date)
+        return decode_models(response, TradeFeeDto, self._client)
+
+    async def get_trade_fees_df(self, effective_date: date) -> pd.DataFrame:
+        """
+        GET /v1/trades/fees
+        Fetches trade fees for the provided effective date (DataFrame).
+        """
+        data = await self.get_trade_fees_raw(effective_date)
+        return build_frame(data, TradeFeeDto, self._client, "/v1/trades/fees")
+
+    async def get_trade_fees_arrow(self, effective_date: date) -> "pa.Table":
+        """
+        GET /v1/trades/fees
+        Fetches trade fees for the provided effective date (Arrow Table).
+        """
+        data = await self.get_trade_fees_raw(effective_date)
+        return build_table(data, TradeFeeDto, self._client, "/v1/trades/fees")
+
+    async def _fetch_trade_internals(self, effective_date: date) -> httpx.Response:
+        params = {"effective-date": effective_date.isoformat()}
+        return await self._client.get("/v1/trades/internals", params=params)
+
+    async def get_trade_internals_raw(self, effective_date: date) -> List[Dict[str, Any]]:
+        """
+        GET /v1/trades/internals
+        Fetches internal trades for the provided effective date (raw JSON).
+        """
+        response = await self._fetch_trade_internals(effective_date)
+        return decode_json(response, self._client)
+
+    async def get_trade_internals(self, effective_date: date) -> List[TradeInternalDto]:
+        """
+        GET /v1/trades/internals
+        Fetches internal trades for the provided effective date (typed models).
+        """
+        response = await self._fetch_trade_internals(effective_date)
+        return decode_models(response, TradeInternalDto, self._client)
+
+    async def get_trade_internals_df(self, effective_date: date) -> pd.DataFrame:
+        """
+        GET /v1/trades/internals
+        Fetches internal trades for the provided effective date (DataFrame).
+        """
+        data = await self.get_trade_internals_raw(effective_date)
+        return build_frame(data, TradeInternalDto, self._client, "/v1/trades/internals")
+
+    async def get_trade_internals_arrow(self, effective_date: date) -> "pa.Table":
+        """
+        GET /v1/trades/internals
+        Fetches internal trades for the provided effective date (Arrow Table).
+        """
+        data = await self.get_trade_internals_raw(effective_date)
+        return build_table(data, TradeInternalDto, self._client, "/v1/trades/internals")
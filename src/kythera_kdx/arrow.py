@@ -0,0 +1,154 @@
+"""
+Apache Arrow table construction for the ``*_arrow`` methods.
+
+build_table turns decoded records into a pyarrow Table without going through
+pandas, with the column types derived from the models_v1 annotations:
+
+- ``date`` fields become ``date32``, ``datetime`` fields ``timestamp[us]``
+  and ``time`` fields ``time64[us]``
+- ``int``, ``float`` and ``bool`` fields become ``int64``, ``float64`` and
+  ``bool`` (missing values as nulls)
+- ``str`` fields with repeated values (fund, instrument, currency names...)
+  are dictionary encoded
+- other fields, and keys not declared on the model, are inferred by pyarrow
+
+The tables can be handed to polars (``pl.from_arrow``) or DuckDB without
+copying; ``table.to_pandas()`` converts them when a DataFrame is needed.
+pyarrow is an optional dependency (the ``arrow`` extra).
+"""
+
+import datetime
+import functools
+import typing
+from typing import Any, Dict, Optional, Sequence, Type, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+from .frames import _instrumented_build, _is_repetitive, _transpose
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None  # type: ignore
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for the *_arrow methods; "
+            'install it with pip install "kythera-kdx[arrow]"'
+        )
+
+
+def _arrow_type(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    # datetime is a subclass of date, so it is checked first
+    if annotation is datetime.datetime:
+        return pa.timestamp("us")
+    if annotation is datetime.date:
+        return pa.date32()
+    if annotation is datetime.time:
+        return pa.time64("us")
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    if annotation is str:
+        return pa.string()
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def arrow_types(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Arrow type for each field of a model (None when it is inferred)."""
+    _require_pyarrow()
+    return {
+        name: _arrow_type(field.annotation)
+        for name, field in model.model_fields.items()
+    }
+
+
+def _parse_temporal(values: np.ndarray, arrow_type: Any) -> Any:
+    strings = pa.array(values, type=pa.string())
+    try:
+        return strings.cast(arrow_type)
+    except pa.ArrowInvalid:
+        # Dates sent with a time component ("2024-01-02T00:00:00")
+        if arrow_type != pa.date32():
+            raise
+        return strings.cast(pa.timestamp("us")).cast(arrow_type)
+
+
+def _array(values: np.ndarray, arrow_type: Any) -> Any:
+    """Convert one object column; unexpected values fall back to pyarrow inference."""
+    if arrow_type is not None:
+        try:
+            if pa.types.is_temporal(arrow_type) and all(
+                value is None or isinstance(value, str) for value in values
+            ):
+                return _parse_temporal(values, arrow_type)
+            array = pa.array(values, type=arrow_type)
+            if pa.types.is_string(arrow_type) and len(values) and _is_repetitive(values):
+                return array.dictionary_encode()
+            return array
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+    return pa.array(values.tolist())
+
+
+def build_table(
+    records: Sequence[Dict[str, Any]],
+    model: Optional[Type[BaseModel]] = None,
+    client: Any = None,
+    endpoint: Optional[str] = None,
+) -> "pa.Table":
+    """
+    Build a pyarrow Table from decoded JSON records.
+
+    Args:
+        records: List of dictionaries as returned by the ``*_raw`` methods
+        model: models_v1 class describing the records; columns not declared on
+            the model keep pyarrow's inferred type
+        client: Client whose metrics, tracer and event hooks record the build
+            time under endpoint
+        endpoint: Endpoint the records were fetched from
+
+    Returns:
+        Table with one column per key found in the records (the model fields
+        when there are no records)
+
+    Raises:
+        ImportError: When pyarrow is not installed
+    """
+    return _instrumented_build("table", _build_table, records, model, client, endpoint)
+
+
+def _build_table(
+    records: Sequence[Dict[str, Any]], model: Optional[Type[BaseModel]]
+) -> "pa.Table":
+    _require_pyarrow()
+    types = arrow_types(model) if model is not None else {}
+    if not records:
+        schema = pa.schema(
+            [
+                (name, pa.null() if arrow_type is None else arrow_type)
+                for name, arrow_type in types.items()
+            ]
+        )
+        return schema.empty_table()
+    if not isinstance(records[0], dict):
+        return pa.table({"value": pa.array(list(records))})
+
+    columns, table = _transpose(records)
+    arrays = [
+        _array(table[:, index], types.get(name))
+        for index, name in enumerate(columns)
+    ]
+    return pa.Table.from_arrays(arrays, names=columns)
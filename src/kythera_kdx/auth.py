@@ -0,0 +1,67 @@
+"""
+httpx authentication flow backed by the client's MSAL token handling.
+
+KytheraAuth attaches the bearer token and API key to each request instead of
+mutating shared session headers, and replays a request once with a refreshed
+token when the API answers 401. Token acquisition is single-flight: see
+BaseAuthenticatedClient._token_for_request.
+"""
+
+import asyncio
+import contextvars
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, Optional
+
+import httpx
+
+from .exceptions import KytheraAuthError
+
+if TYPE_CHECKING:
+    from .authenticated_client import BaseAuthenticatedClient
+
+
+class KytheraAuth(httpx.Auth):
+    """httpx.Auth implementation used by AuthenticatedClient and AsyncAuthenticatedClient."""
+
+    def __init__(self, client: "BaseAuthenticatedClient"):
+        self._client = client
+
+    def _token(self, stale_token: Optional[str] = None) -> str:
+        try:
+            return self._client._token_for_request(stale_token)
+        except Exception as e:
+            raise KytheraAuthError(f"Failed to authenticate: {e}")
+
+    async def _token_async(self, stale_token: Optional[str] = None) -> str:
+        if stale_token is None:
+            token = self._client._valid_cached_token()
+            if token is not None:
+                return token
+        # MSAL is blocking; keep it off the event loop (in the caller's tracing context)
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, context.run, self._token, stale_token)
+
+    def sync_auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        token = self._token()
+        request.headers.update(self._client._auth_headers(token))
+        response = yield request
+
+        if response.status_code == 401:
+            # Refresh once; concurrent 401s for the same token share one refresh
+            token = self._token(stale_token=token)
+            request.headers.update(self._client._auth_headers(token))
+            yield request
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        token = await self._token_async()
+        request.headers.update(self._client._auth_headers(token))
+        response = yield request
+
+        if response.status_code == 401:
+            token = await self._token_async(stale_token=token)
+            request.headers.update(self._client._auth_headers(token))
+            yield request
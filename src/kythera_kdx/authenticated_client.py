@@ -6,9 +6,11 @@ supporting both confidential client (service principal) and public client (devic
 """
 
 import os
+import threading
 import time
 import logging
-from typing import Optional, Dict, Any, List, Union
+from contextlib import ExitStack, contextmanager, nullcontext
+from typing import Optional, Dict, Any, ContextManager, Iterator, List, Tuple, Union
 from urllib.parse import urljoin
 import httpx
 from msal import ConfidentialClientApplication, PublicClientApplication
@@ -18,12 +20,26 @@ from msal_extensions import (
     build_encrypted_persistence,
 )
 
+from .auth import KytheraAuth
+from .codec import JsonCodec, get_json_codec
 from .exceptions import (
+    KytheraError,
     KytheraAPIError,
     KytheraAuthError,
+    KytheraCircuitOpenError,
     KytheraConnectionError,
     KytheraTimeoutError,
 )
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, RetryStats
+from .hooks import TIMING_EXTENSION, EventHooks
+from .tracing import NOOP_TRACER, Tracer, params_attribute
+from .metrics import ENDPOINT_EXTENSION, ClientMetrics
+from .hedge import HedgePolicy
+from .circuit_breaker import Attempt, CircuitBreaker
+from .coalesce import RequestCoalescer
+from .cache import ResponseCache, params_key
+from .disk_cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
@@ -41,13 +57,13 @@ def _get_default_cache_location() -> str:
     return os.path.join(cache_dir, "token_cache.bin")
 
 
-class AuthenticatedClient:
+class BaseAuthenticatedClient:
     """
-    Authenticated client for interacting with the Kythera API.
+    Configuration and MSAL token handling shared by the sync and async clients.
 
-    This class provides unified authentication and API request capabilities,
-    supporting both service principal authentication (with client_secret) and
-    interactive device flow authentication (without client_secret).
+    This class owns the Azure AD configuration, the persisted token cache and the
+    token acquisition flows. It does not perform any HTTP requests itself; see
+    AuthenticatedClient and AsyncAuthenticatedClient for the transport layers.
     """
 
     def __init__(
@@ -56,22 +72,72 @@ class AuthenticatedClient:
         tenant_id: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
-        timeout: int = 30,
+        timeout: Union[int, float, httpx.Timeout] = 30,
         scopes: Optional[List[str]] = None,
         cache_location: Optional[str] = None,
         x_api_key: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        validate: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Union[ClientMetrics, bool] = True,
+        tracer: Optional[Tracer] = None,
+        event_hooks: Optional[EventHooks] = None,
+        access_token: Optional[str] = None,
     ):
         """
-        Initialize the authenticated Kythera client.
+        Initialize the authentication configuration.
 
         Args:
             base_url: The base URL for the Kythera API
             tenant_id: Azure AD tenant ID
             client_id: Azure AD application client ID
             client_secret: Azure AD application client secret (for service principal auth)
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds, or an httpx.Timeout with separate
+                connect/read/write/pool timeouts
             scopes: List of OAuth scopes to request
             cache_location: Custom location for token cache (optional)
+            limits: Connection pool limits (max connections, max keep-alive
+                connections, keep-alive expiry); httpx defaults when omitted
+            http2: Enable HTTP/2 multiplexing (requires the ``http2`` extra)
+            retry_policy: Retry policy for transient failures; a default
+                RetryPolicy() is used when omitted
+            rate_limiter: Client-side rate limiter; may be shared between
+                several sync and async clients
+            json_codec: JSON backend for response and request bodies ("orjson",
+                "msgspec", "json" or a JsonCodec); the fastest installed one
+                is used when omitted
+            validate: Validate typed results with pydantic (default). Pass False
+                for trusted payloads to build models with model_construct,
+                skipping validation
+            response_cache: In-memory TTL/LRU cache for GET responses (reference
+                data endpoints by default); disabled when omitted
+            disk_cache: Persistent SQLite cache for immutable historical data (past
+                prices, risk factor values, NAVs, index values); disabled when omitted
+            coalesce_requests: Let concurrent identical GET requests share one
+                network call and one decoded body
+            circuit_breaker: Per-endpoint circuit breaker failing fast with
+                KytheraCircuitOpenError while an endpoint is unhealthy; disabled when omitted
+            hedge_policy: HedgePolicy sending a second GET when the first is slower
+                than its endpoint's latency percentile; disabled when omitted
+            metrics: Collect per-endpoint latency, size and conversion metrics
+                into self.metrics; pass a ClientMetrics to share one between clients
+                or False to disable
+            tracer: Tracer receiving spans for sub-client calls, token acquisition,
+                HTTP attempts, decoding, validation and frame builds (e.g.
+                OpenTelemetryTracer); no-op when omitted
+            event_hooks: EventHooks called on request start, response headers and
+                completion, retries, token refreshes and decoding; none when omitted
+            access_token: Bearer token to send instead of acquiring one from Azure
+                AD (e.g. a token obtained elsewhere, or any string for a local stub);
+                MSAL and the token cache are not used when given
         """
         # Load configuration from environment if not provided
         self.base_url = (
@@ -85,6 +151,25 @@ class AuthenticatedClient:
         )
         self.client_secret = client_secret or os.getenv("KYTHERA_CLIENT_SECRET")
         self.timeout = timeout
+        self.limits = limits
+        self.http2 = http2
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.json_codec = get_json_codec(json_codec)
+        self.validate = validate
+        self.response_cache = response_cache
+        self.disk_cache = disk_cache
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        self.metrics: Optional[ClientMetrics] = (
+            (ClientMetrics() if metrics else None)
+            if isinstance(metrics, bool)
+            else metrics
+        )
+        self.tracer: Tracer = tracer if tracer is not None else NOOP_TRACER
+        self.event_hooks = event_hooks
         self.scopes = scopes or [
             os.getenv("KYTHERA_SCOPES", f"{self.client_id}/.default")
         ]
@@ -98,7 +183,8 @@ class AuthenticatedClient:
 
         # Set up token cache
         self.cache_location = cache_location or _get_default_cache_location()
-        self._token_cache = self._create_token_cache()
+        self._static_token = access_token
+        self._token_cache = None if access_token else self._create_token_cache()
 
         # Authentication state
         self._cached_token: Optional[str] = None
@@ -107,13 +193,23 @@ class AuthenticatedClient:
             Union[ConfidentialClientApplication, PublicClientApplication]
         ] = None
 
-        # Initialize HTTP client
-        self.session = httpx.Client(timeout=self.timeout)
-        self.session.headers.update(
-            {"Content-Type": "application/json"}
-        )  # Initialize MSAL application
+        # Token refresh coordination: one thread refreshes while others wait, and
+        # service principal tokens are refreshed in the background once they are
+        # within token_refresh_ahead seconds of expiry
+        self._token_lock = threading.Lock()
+        self._background_refresh_lock = threading.Lock()
+        self._background_refresh_running = False
+        self._last_background_refresh = 0.0
+        self.token_refresh_ahead = 600
+        self.auth = KytheraAuth(self)
+
+        # Initialize MSAL application
         self.x_api_key = x_api_key or os.getenv("KYTHERA_X_API_KEY")
-        self._initialize_app()
+        if access_token:
+            self._cached_token = access_token
+            self._token_expires_at = float("inf")
+        else:
+            self._initialize_app()
 
     def _create_token_cache(self) -> PersistedTokenCache:
         """Create a persisted token cache."""
@@ -280,6 +376,13 @@ class AuthenticatedClient:
         Raises:
             KytheraAuthError: If token acquisition fails
         """
+        if self._static_token:
+            if force_refresh:
+                raise KytheraAuthError("The static access token was rejected")
+            self._cached_token = self._static_token
+            self._token_expires_at = float("inf")
+            return self._static_token
+
         if not self._app:
             raise KytheraAuthError("MSAL application not initialized")
 
@@ -290,18 +393,559 @@ class AuthenticatedClient:
             # Interactive - use device code flow
             return self._acquire_token_for_device_flow(force_refresh)
 
-    def _ensure_authenticated(self, force_refresh: bool = False) -> None:
-        """Ensure we have a valid access token and update the session headers."""
+    def _valid_cached_token(self) -> Optional[str]:
+        """Return the cached token if still valid, without blocking on MSAL."""
+        token = self._cached_token
+        if token and not self._is_token_expired():
+            self._maybe_refresh_in_background()
+            return token
+        return None
+
+    def _token_for_request(self, stale_token: Optional[str] = None) -> str:
+        """
+        Get a token for an outgoing request.
+
+        Only one thread acquires a token at a time; threads waiting on the lock
+        reuse the token it obtained. Passing the token rejected by the API as
+        stale_token forces a refresh unless another thread already replaced it.
+        """
+        if stale_token is None:
+            token = self._valid_cached_token()
+            if token is not None:
+                return token
+
+        with self._token_lock:
+            token = self._cached_token
+            if token and token != stale_token and not self._is_token_expired():
+                return token
+            return self._refresh_token(force_refresh=stale_token is not None)
+
+    def _refresh_token(self, force_refresh: bool, background: bool = False) -> str:
+        """Acquire a token from MSAL, reporting it to the tracer and event hooks."""
+        started = time.perf_counter()
+        error: Optional[Exception] = None
         try:
-            access_token = self._get_access_token(force_refresh)
-            self.session.headers.update(
+            with self.tracer.start_span(
+                "kythera.auth", {"kythera.auth.force_refresh": force_refresh}
+            ):
+                return self._get_access_token(force_refresh=force_refresh)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            hooks = self.event_hooks
+            if hooks is not None and hooks.on_token_refresh:
+                hooks.emit(
+                    "on_token_refresh",
+                    {
+                        "force_refresh": force_refresh,
+                        "background": background,
+                        "elapsed": time.perf_counter() - started,
+                        "error": error,
+                    },
+                )
+
+    def _maybe_refresh_in_background(self) -> None:
+        """Start a background refresh when a service principal token nears expiry."""
+        if not self.client_secret or self._token_expires_at is None:
+            return
+        now = time.time()
+        if now < self._token_expires_at - self.token_refresh_ahead:
+            return
+
+        with self._background_refresh_lock:
+            if self._background_refresh_running:
+                return
+            # Avoid hammering MSAL when its cache keeps returning the same token
+            if now - self._last_background_refresh < 30:
+                return
+            self._background_refresh_running = True
+            self._last_background_refresh = now
+
+        threading.Thread(
+            target=self._background_refresh, name="kythera-token-refresh", daemon=True
+        ).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._token_lock:
+                expires_at = self._token_expires_at
+                if expires_at and time.time() < expires_at - self.token_refresh_ahead:
+                    return
+                self._refresh_token(force_refresh=True, background=True)
+                logger.info("Refreshed access token in the background")
+        except Exception as e:
+            logger.warning(f"Background token refresh failed: {e}")
+        finally:
+            with self._background_refresh_lock:
+                self._background_refresh_running = False
+
+    def _http_client_options(self) -> Dict[str, Any]:
+        """Keyword arguments used to build the underlying httpx client."""
+        options: Dict[str, Any] = {
+            "timeout": self.timeout,
+            "http2": self.http2,
+            "headers": {"Content-Type": "application/json"},
+        }
+        if self.limits is not None:
+            options["limits"] = self.limits
+        return options
+
+    def _auth_headers(self, access_token: str) -> Dict[str, str]:
+        """Build the authentication headers sent with every API request."""
+        return {
+            "Authorization": f"Bearer {access_token}",
+            "X-Api-Key": self.x_api_key or "",
+        }
+
+    def _http_span_attributes(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """Attributes of an HTTP attempt span; None (not built) when tracing is off."""
+        if not self.tracer.enabled:
+            return None
+        return {
+            "http.request.method": method,
+            "url.full": url,
+            "kythera.endpoint": endpoint,
+            "kythera.params": params_attribute(params),
+        }
+
+    def _request_body(self, data: Optional[Any]) -> Dict[str, Any]:
+        """Encode a request body with the client's JSON codec."""
+        if data is None:
+            return {}
+        return {
+            "content": self.json_codec.dumps(data),
+            "headers": {"Content-Type": "application/json"},
+        }
+
+    def _cached_response(
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[httpx.Response]:
+        """Serve a request from the in-memory or on-disk response cache, if possible."""
+        if self.response_cache is not None:
+            response = self.response_cache.lookup(method, endpoint, params)
+            if response is not None:
+                return response
+        if self.disk_cache is not None:
+            return self._disk_cached_response(method, endpoint, params)
+        return None
+
+    def _uses_disk_cache(
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Whether a request can be served from or stored in the on-disk cache."""
+        return (
+            self.disk_cache is not None
+            and method == "GET"
+            and self.disk_cache.is_immutable(endpoint, params)
+        )
+
+    def _disk_cached_response(
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[httpx.Response]:
+        """Look a request up in the on-disk cache, promoting a hit to the in-memory cache."""
+        response = self.disk_cache.lookup(  # type: ignore[union-attr]
+            method, endpoint, params, scope=self.base_url
+        )
+        if response is not None:
+            response.extensions[ENDPOINT_EXTENSION] = endpoint
+            if self.response_cache is not None:
+                self.response_cache.store(method, endpoint, params, response)
+        return response
+
+    def _revalidation(
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[httpx.Response], Optional[Dict[str, str]]]:
+        """Stale cached response and the If-None-Match/If-Modified-Since headers to send."""
+        if self.response_cache is None:
+            return None, None
+        stale, headers = self.response_cache.revalidation(method, endpoint, params)
+        return stale, headers or None
+
+    def _last_known_good(
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[httpx.Response]:
+        """Last successful response to serve while the endpoint's circuit is open."""
+        if self.circuit_breaker is None:
+            return None
+        response = self.circuit_breaker.last_known_good(method, endpoint, params)
+        if response is not None:
+            logger.warning(f"{method} {endpoint} circuit is open, serving last known good data")
+        return response
+
+    def _circuit_attempt(self, endpoint: str) -> ContextManager[Attempt]:
+        """Circuit breaker guard for one request attempt (no-op without a breaker)."""
+        if self.circuit_breaker is None:
+            return nullcontext(Attempt())
+        return self.circuit_breaker.attempt(endpoint)
+
+    def _cache_response(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+    ) -> None:
+        """Offer a fully read response to the configured caches."""
+        self._cache_in_memory(method, endpoint, params, response)
+        if self.disk_cache is not None:
+            self.disk_cache.store(method, endpoint, params, response, scope=self.base_url)
+
+    def _cache_in_memory(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+    ) -> None:
+        """Offer a fully read response to the circuit breaker and in-memory cache."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.remember(method, endpoint, params, response)
+        if self.response_cache is not None:
+            self.response_cache.store(method, endpoint, params, response)
+
+    def _request_started(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        request: httpx.Request,
+    ) -> None:
+        """Emit on_request_start for an attempt about to be sent."""
+        hooks = self.event_hooks
+        if hooks is not None and hooks.on_request_start:
+            hooks.emit(
+                "on_request_start",
                 {
-                    "Authorization": f"Bearer {access_token}",
-                    "X-Api-Key": self.x_api_key or "",
-                }
+                    "method": method,
+                    "endpoint": endpoint,
+                    "url": url,
+                    "params": params,
+                    "request": request,
+                },
+            )
+
+    def _headers_received(
+        self, endpoint: str, response: httpx.Response, ttfb: float
+    ) -> None:
+        """Emit on_response_headers once the response headers arrived."""
+        hooks = self.event_hooks
+        if hooks is not None and hooks.on_response_headers:
+            hooks.emit(
+                "on_response_headers",
+                {
+                    "method": response.request.method,
+                    "endpoint": endpoint,
+                    "request": response.request,
+                    "status_code": response.status_code,
+                    "headers": response.headers,
+                    "ttfb": ttfb,
+                },
+            )
+
+    def _observe_response(
+        self,
+        endpoint: str,
+        response: httpx.Response,
+        started: float,
+        headers_at: float,
+        stream: bool,
+    ) -> None:
+        """Tag a response with its endpoint and record its timings in the metrics and hooks."""
+        response.extensions[ENDPOINT_EXTENSION] = endpoint
+        if stream:
+            response.extensions[TIMING_EXTENSION] = (started, headers_at)
+            if self.metrics is not None:
+                self.metrics.observe_response(
+                    endpoint, response.status_code, headers_at - started
+                )
+            return
+        completed_at = time.perf_counter()
+        if self.metrics is not None:
+            self.metrics.observe_response(
+                endpoint,
+                response.status_code,
+                headers_at - started,
+                completed_at - headers_at,
+                len(response.content),
+            )
+        self._response_completed(
+            endpoint, response, started, headers_at, completed_at, len(response.content)
+        )
+
+    def _response_completed(
+        self,
+        endpoint: str,
+        response: httpx.Response,
+        started: float,
+        headers_at: float,
+        completed_at: float,
+        size: int,
+    ) -> None:
+        """Emit on_response_complete once the response body was read."""
+        hooks = self.event_hooks
+        if hooks is not None and hooks.on_response_complete:
+            hooks.emit(
+                "on_response_complete",
+                {
+                    "method": response.request.method,
+                    "endpoint": endpoint,
+                    "request": response.request,
+                    "status_code": response.status_code,
+                    "ttfb": headers_at - started,
+                    "download": completed_at - headers_at,
+                    "elapsed": completed_at - started,
+                    "bytes": size,
+                },
+            )
+
+    def _stream_closed(self, endpoint: str, response: httpx.Response) -> None:
+        """Emit on_response_complete when a streamed response is closed."""
+        timing = response.extensions.get(TIMING_EXTENSION)
+        if timing is not None:
+            started, headers_at = timing
+            self._response_completed(
+                endpoint,
+                response,
+                started,
+                headers_at,
+                time.perf_counter(),
+                response.num_bytes_downloaded,
+            )
+
+    def _retrying(
+        self,
+        method: str,
+        endpoint: str,
+        retry: int,
+        delay: float,
+        status_code: Optional[int] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Log an attempt being retried and emit on_retry."""
+        if error is not None:
+            logger.warning(
+                f"{method} {endpoint} failed with {type(error).__name__}, "
+                f"retrying in {delay:.2f}s"
+            )
+        else:
+            logger.warning(
+                f"{method} {endpoint} returned {status_code}, retrying in {delay:.2f}s"
+            )
+        hooks = self.event_hooks
+        if hooks is not None and hooks.on_retry:
+            hooks.emit(
+                "on_retry",
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "retry": retry,
+                    "delay": delay,
+                    "reason": type(error).__name__ if error is not None else str(status_code),
+                    "status_code": status_code,
+                    "error": error,
+                },
+            )
+
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        """Raise KytheraAPIError when the API returned an unsuccessful response."""
+        if response.is_success:
+            return
+
+        try:
+            error_data = self.json_codec.loads(response.content)
+        except ValueError:
+            error_data = {}
+
+        raise KytheraAPIError(
+            f"API request failed with status {response.status_code}",
+            status_code=response.status_code,
+            response_data=error_data,
+        )
+
+    def _transport_error(self, exc: httpx.RequestError) -> KytheraError:
+        """Translate an httpx transport error into the matching Kythera exception."""
+        if isinstance(exc, httpx.TimeoutException):
+            return KytheraTimeoutError(
+                f"Request timed out ({type(exc).__name__}, timeout={self.timeout})"
+            )
+        if isinstance(exc, httpx.ConnectError):
+            return KytheraConnectionError(f"Failed to connect to Kythera API: {exc}")
+        return KytheraAPIError(f"Request failed: {exc}")
+
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """
+        Get retry counters accumulated by this client.
+
+        Returns:
+            Dictionary with request, retry, exhausted and budget counters
+        """
+        return self.retry_stats.snapshot()
+
+    def clear_token_cache(self) -> None:
+        """Clear the token cache."""
+        self._cached_token = None
+        self._token_expires_at = None
+        logger.info("Token cache cleared")
+
+    def is_authenticated(self) -> bool:
+        """Check if we have a valid, non-expired token."""
+        return bool(self._cached_token and not self._is_token_expired())
+
+    def get_token_info(self) -> Dict[str, Any]:
+        """
+        Get information about the current token.
+
+        Returns:
+            Dictionary with token information
+        """
+        return {
+            "has_token": bool(self._cached_token),
+            "is_expired": self._is_token_expired(),
+            "expires_at": self._token_expires_at,
+            "time_to_expiry": (
+                self._token_expires_at - time.time() if self._token_expires_at else None
+            ),
+            "auth_type": (
+                "static_token"
+                if self._static_token
+                else "service_principal" if self.client_secret else "device_flow"
+            ),
+        }
+
+
+class AuthenticatedClient(BaseAuthenticatedClient):
+    """
+    Authenticated client for interacting with the Kythera API.
+
+    This class provides unified authentication and API request capabilities,
+    supporting both service principal authentication (with client_secret) and
+    interactive device flow authentication (without client_secret).
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        timeout: Union[int, float, httpx.Timeout] = 30,
+        scopes: Optional[List[str]] = None,
+        cache_location: Optional[str] = None,
+        x_api_key: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.Client] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        validate: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Union[ClientMetrics, bool] = True,
+        tracer: Optional[Tracer] = None,
+        event_hooks: Optional[EventHooks] = None,
+        access_token: Optional[str] = None,
+    ):
+        """
+        Initialize the authenticated Kythera client.
+
+        Args:
+            base_url: The base URL for the Kythera API
+            tenant_id: Azure AD tenant ID
+            client_id: Azure AD application client ID
+            client_secret: Azure AD application client secret (for service principal auth)
+            timeout: Request timeout in seconds, or an httpx.Timeout with separate
+                connect/read/write/pool timeouts
+            scopes: List of OAuth scopes to request
+            cache_location: Custom location for token cache (optional)
+            limits: Connection pool limits (max connections, max keep-alive
+                connections, keep-alive expiry); httpx defaults when omitted
+            http2: Enable HTTP/2 multiplexing (requires the ``http2`` extra)
+            http_client: Shared httpx.Client to send requests through. Several
+                clients can reuse the same warm connections; it is not closed
+                by close()
+            transport: Custom httpx transport for the client created here
+            retry_policy: Retry policy for transient failures (429, 502-504,
+                connection resets, timeouts)
+            rate_limiter: Client-side rate limiter (requests/sec, in-flight cap,
+                optional per-endpoint limits)
+            json_codec: JSON backend for response and request bodies ("orjson",
+                "msgspec", "json" or a JsonCodec); the fastest installed one
+                is used when omitted
+            validate: Validate typed results with pydantic (default). Pass False
+                for trusted payloads to build models with model_construct,
+                skipping validation
+            response_cache: In-memory TTL/LRU cache for GET responses (reference
+                data endpoints by default); disabled when omitted
+            disk_cache: Persistent SQLite cache for immutable historical data (past
+                prices, risk factor values, NAVs, index values); disabled when omitted
+            coalesce_requests: Let concurrent identical GET requests share one
+                network call and one decoded body
+            circuit_breaker: Per-endpoint circuit breaker failing fast with
+                KytheraCircuitOpenError while an endpoint is unhealthy; disabled when omitted
+            hedge_policy: HedgePolicy sending a second GET when the first is slower
+                than its endpoint's latency percentile; disabled when omitted
+            metrics: Collect per-endpoint latency, size and conversion metrics
+                into self.metrics; pass a ClientMetrics to share one between clients
+                or False to disable
+            tracer: Tracer receiving spans for sub-client calls, token acquisition,
+                HTTP attempts, decoding, validation and frame builds (e.g.
+                OpenTelemetryTracer); no-op when omitted
+            event_hooks: EventHooks called on request start, response headers and
+                completion, retries, token refreshes and decoding; none when omitted
+            access_token: Bearer token to send instead of acquiring one from Azure
+                AD (e.g. a token obtained elsewhere, or any string for a local stub);
+                MSAL and the token cache are not used when given
+        """
+        super().__init__(
+            base_url=base_url,
+            tenant_id=tenant_id,
+            client_id=client_id,
+            client_secret=client_secret,
+            timeout=timeout,
+            scopes=scopes,
+            cache_location=cache_location,
+            x_api_key=x_api_key,
+            limits=limits,
+            http2=http2,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            validate=validate,
+            response_cache=response_cache,
+            disk_cache=disk_cache,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            metrics=metrics,
+            tracer=tracer,
+            event_hooks=event_hooks,
+            access_token=access_token,
+        )
+
+        if http_client is not None and transport is not None:
+            raise ValueError("Provide either http_client or transport, not both")
+
+        # Initialize HTTP client; an injected client is shared, not owned
+        self._owns_session = http_client is None
+        if http_client is not None:
+            self.session = http_client
+        else:
+            self.session = httpx.Client(
+                transport=transport, **self._http_client_options()
             )
-        except Exception as e:
-            raise KytheraAuthError(f"Failed to authenticate: {e}")
 
     def _make_request(
         self,
@@ -328,53 +972,170 @@ class AuthenticatedClient:
             KytheraConnectionError: When connection fails
             KytheraTimeoutError: When request times out
         """
-        url = urljoin(self.base_url, endpoint)
-
+        cached = self._cached_response(method, endpoint, params)
+        if cached is not None:
+            return cached
         try:
-            # Ensure we have valid authentication
-            self._ensure_authenticated()
+            if self.coalescer is not None and method == "GET":
+                return self.coalescer.do(
+                    (method, endpoint, params_key(params)),
+                    lambda: self._hedged_fetch(method, endpoint, data, params),
+                )
+            return self._hedged_fetch(method, endpoint, data, params)
+        except KytheraCircuitOpenError:
+            fallback = self._last_known_good(method, endpoint, params)
+            if fallback is None:
+                raise
+            return fallback
+
+    def _hedged_fetch(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Fetch a response, hedging slow GETs when a hedge policy is configured."""
+        policy = self.hedge_policy
+        key = policy.endpoint_key(method, endpoint) if policy is not None else None
+        if policy is None or key is None:
+            return self._fetch_response(method, endpoint, data, params)
+        return policy.run(
+            key, lambda: self._fetch_response(method, endpoint, data, params)
+        )
 
-            response = self.session.request(
-                method=method, url=url, json=data, params=params
-            )
+    def _fetch_response(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Send a request, revalidating a stale cached response and caching the result."""
+        stale, headers = self._revalidation(method, endpoint, params)
+        with self._request(
+            method, endpoint, data, params, stream=False, headers=headers
+        ) as response:
+            if stale is not None and response.status_code == 304:
+                return self.response_cache.not_modified(  # type: ignore[union-attr]
+                    method, endpoint, params, stale, response
+                )
+            self._cache_response(method, endpoint, params, response)
+            return response
 
-            if response.status_code == 401:
-                # Try to refresh token once
-                try:
-                    self._ensure_authenticated(force_refresh=True)
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Make a request whose body is read lazily, e.g. with response.iter_bytes().
 
-                    # Retry the request with new token
-                    response = self.session.request(
-                        method=method, url=url, json=data, params=params
+        Retries, rate limiting and error handling match _make_request; transport
+        errors raised while the body is being consumed are translated into
+        Kythera exceptions but not retried. The response is closed on exit.
+        """
+        with self._request(method, endpoint, data, params, stream=True) as response:
+            try:
+                yield response
+            except httpx.RequestError as e:
+                raise self._transport_error(e) from e
+            finally:
+                self._stream_closed(endpoint, response)
+
+    @contextmanager
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        stream: bool,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[httpx.Response]:
+        """Run the retry loop and hold the rate limiter slot while the response is open."""
+        url = urljoin(self.base_url, endpoint)
+        retry = self.retry_policy.start(method, self.retry_stats)
+
+        while True:
+            with ExitStack() as stack:
+                attempt = stack.enter_context(self._circuit_attempt(endpoint))
+                if self.rate_limiter is not None:
+                    stack.enter_context(self.rate_limiter.limit(endpoint))
+                # Time the call itself, not the wait for the rate limiter
+                attempt.start()
+                try:
+                    response = self._send(
+                        method, endpoint, url, data, params, stream, headers
                     )
+                except httpx.RequestError as e:
+                    attempt.failed()
+                    delay = retry.delay_for_exception(e)
+                    if delay is None:
+                        raise self._transport_error(e) from e
+                    self._retrying(method, endpoint, retry.retries, delay, error=e)
+                else:
+                    attempt.completed(response.status_code)
+                    stack.callback(response.close)
+                    ok = response.is_success or (
+                        headers is not None and response.status_code == 304
+                    )
+                    delay = None if ok else retry.delay_for_response(response)
+                    if delay is None:
+                        if not ok:
+                            response.read()
+                            self._raise_for_status(response)
+                        yield response
+                        return
+                    self._retrying(
+                        method, endpoint, retry.retries, delay, response.status_code
+                    )
+            time.sleep(delay)
 
-                    if response.status_code == 401:
-                        raise KytheraAuthError(
-                            "Authentication failed after token refresh"
-                        )
-                except Exception as e:
-                    raise KytheraAuthError(f"Authentication failed: {e}")
-
-            if not response.is_success:
-                try:
-                    error_data = response.json()
-                except ValueError:
-                    error_data = {}
-
-                raise KytheraAPIError(
-                    f"API request failed with status {response.status_code}",
-                    status_code=response.status_code,
-                    response_data=error_data,
-                )
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Send a single authenticated attempt; KytheraAuth refreshes the token once on 401."""
+        request = self.session.build_request(
+            method=method, url=url, params=params, **self._request_body(data)
+        )
+        if headers:
+            request.headers.update(headers)
+        self._request_started(method, endpoint, url, params, request)
+        with self.tracer.start_span(
+            f"HTTP {method}",
+            self._http_span_attributes(method, endpoint, url, params),
+        ) as span:
+            started = time.perf_counter()
+            # Always stream so that the time to the headers can be told from the download
+            response = self.session.send(request, auth=self.auth, stream=True)
+            headers_at = time.perf_counter()
+            span.set_attribute("http.response.status_code", response.status_code)
+            self._headers_received(endpoint, response, headers_at - started)
 
-            return response
+            if response.status_code == 401:
+                response.close()
+                raise KytheraAuthError("Authentication failed after token refresh")
 
-        except httpx.TimeoutException:
-            raise KytheraTimeoutError(f"Request timed out after {self.timeout} seconds")
-        except httpx.ConnectError as e:
-            raise KytheraConnectionError(f"Failed to connect to Kythera API: {e}")
-        except httpx.RequestError as e:
-            raise KytheraAPIError(f"Request failed: {e}")
+            if not stream:
+                try:
+                    response.read()
+                except BaseException:
+                    response.close()
+                    raise
+                span.set_attribute("http.response.body.size", len(response.content))
+        self._observe_response(endpoint, response, started, headers_at, stream)
+        return response
 
     def get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
@@ -398,36 +1159,10 @@ class AuthenticatedClient:
         """Make a DELETE request to the API."""
         return self._make_request("DELETE", endpoint)
 
-    def clear_token_cache(self) -> None:
-        """Clear the token cache."""
-        self._cached_token = None
-        self._token_expires_at = None
-        logger.info("Token cache cleared")
-
-    def is_authenticated(self) -> bool:
-        """Check if we have a valid, non-expired token."""
-        return bool(self._cached_token and not self._is_token_expired())
-
-    def get_token_info(self) -> Dict[str, Any]:
-        """
-        Get information about the current token.
-
-        Returns:
-            Dictionary with token information
-        """
-        return {
-            "has_token": bool(self._cached_token),
-            "is_expired": self._is_token_expired(),
-            "expires_at": self._token_expires_at,
-            "time_to_expiry": (
-                self._token_expires_at - time.time() if self._token_expires_at else None
-            ),
-            "auth_type": "service_principal" if self.client_secret else "device_flow",
-        }
-
     def close(self) -> None:
-        """Close the HTTP session."""
-        self.session.close()
+        """Close the HTTP session unless it was injected by the caller."""
+        if self._owns_session:
+            self.session.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,402 @@
+"""
+Concurrency sweep load test for the KDX clients (the ``kdx-bench`` command).
+
+A workload is a list of endpoint calls, e.g. ``/v1/prices`` over the last 30
+business days or ``/v1/prices/{instrumentId}`` for 5,000 instruments. LoadTest
+runs it through the sync client (one call at a time), a sync client shared by
+a thread pool and the async client, at each concurrency level, against a
+kythera_kdx.stub.StubServer or an archive recorded with
+kythera_kdx.replay.RecordingTransport. Each run gets a fresh client whose
+connection pool is sized to the level, and reports requests/sec, rows/sec,
+MB/sec, p50/p95/p99 latency and errors, to help choose pool sizes and rate
+limits:
+
+    kdx-bench --workload prices-by-date:30 --workload prices-by-instrument:5000 \\
+        --concurrency 1,4,16,64 --latency 0.05
+    kdx-bench --replay morning.zip --simulate-latency --modes threads,async
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, List, Sequence, Tuple, Union
+
+import httpx
+
+from .exceptions import KytheraError
+from .fanout import business_days
+from .hooks import EventHooks
+from .rate_limit import RateLimiter
+from .replay import replay_client
+from .stub import StubServer, stub_client
+
+# (sub-client property, method base name, arguments)
+Call = Tuple[str, str, Tuple[Any, ...]]
+
+MODES = ("sync", "threads", "async")
+VARIANTS = {"raw": "_raw", "typed": "", "df": "_df", "arrow": "_arrow"}
+
+
+def _last_business_days(end: date, count: int) -> List[date]:
+    """The count business days up to and including end, oldest first."""
+    return business_days(end - timedelta(days=2 * count + 7), end)[-count:]
+
+
+def _prices_by_date(count: int, end: date, price_type_name: str) -> List[Call]:
+    return [
+        ("prices", "get_all_prices", (day, price_type_name))
+        for day in _last_business_days(end, count)
+    ]
+
+
+def _prices_by_instrument(count: int, end: date, price_type_name: str) -> List[Call]:
+    return [
+        ("prices", "get_prices_by_instrument", (instrument_id, end, price_type_name))
+        for instrument_id in range(1, count + 1)
+    ]
+
+
+def _trades_by_date(count: int, end: date, price_type_name: str) -> List[Call]:
+    return [("trades", "get_trades", (day,)) for day in _last_business_days(end, count)]
+
+
+# Workload name -> builder of its calls from (count, end date, price type)
+WORKLOADS: Dict[str, Callable[[int, date, str], List[Call]]] = {
+    "prices-by-date": _prices_by_date,
+    "prices-by-instrument": _prices_by_instrument,
+    "trades-by-date": _trades_by_date,
+}
+
+
+def workload_calls(
+    workloads: Sequence[str], end: date, price_type_name: str = "CLOSE"
+) -> List[Call]:
+    """
+    Calls of workloads given as ``name:count``.
+
+    Args:
+        workloads: e.g. ``["prices-by-date:30", "prices-by-instrument:5000"]``
+        end: Last date of date workloads and the date of instrument workloads
+        price_type_name: Price type of the price workloads
+
+    Raises:
+        ValueError: When a workload is unknown
+    """
+    calls: List[Call] = []
+    for workload in workloads:
+        name, _, count = workload.partition(":")
+        if name not in WORKLOADS:
+            raise ValueError(
+                f"Unknown workload {name!r}; choose from {', '.join(WORKLOADS)}"
+            )
+        calls.extend(WORKLOADS[name](int(count or 30), end, price_type_name))
+    return calls
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of values (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class _Run:
+    """Counters of one run, fed by the calls and an on_response_complete hook."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.rows = 0
+        self.errors = 0
+        self.bytes = 0
+        self.hooks = EventHooks(on_response_complete=self._response_complete)
+
+    def _response_complete(self, event: Dict[str, Any]) -> None:
+        with self.lock:
+            self.bytes += event["bytes"]
+
+    def record(self, elapsed: float, result: Any, error: bool) -> None:
+        with self.lock:
+            self.latencies.append(elapsed)
+            if error:
+                self.errors += 1
+            else:
+                self.rows += len(result)
+
+
+class LoadTest:
+    """
+    Runs a workload at several concurrency levels and collects the results.
+
+    Example:
+        calls = workload_calls(["prices-by-date:30"], date(2024, 6, 28))
+        test = LoadTest(calls, server=StubServer(rows=5000, latency=0.05))
+        results = test.sweep(["threads", "async"], [1, 8, 32])
+        print(format_table(results))
+    """
+
+    def __init__(
+        self,
+        calls: List[Call],
+        variant: str = "raw",
+        server: Optional[StubServer] = None,
+        archive: Union[str, Path, None] = None,
+        simulate_latency: bool = False,
+        speed: float = 1.0,
+        requests_per_second: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        client_options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            calls: Endpoint calls of the workload (see workload_calls)
+            variant: Method variant called: "raw", "typed", "df" or "arrow"
+            server: Stub serving the calls; one with the default spec when
+                neither server nor archive is given
+            archive: Archive written by RecordingTransport to replay instead
+            simulate_latency: Replay the recorded latency of the archive
+            speed: Divisor of the replayed latency
+            requests_per_second: Rate limit of each run's client
+            max_in_flight: Concurrency limit of each run's client
+            client_options: Other client options, e.g. ``{"coalesce_requests": True}``;
+                ``http2`` is rejected, as the stub and replay transports run
+                in-process and never negotiate HTTP/2
+        """
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown variant {variant!r}; choose from {', '.join(VARIANTS)}")
+        if server is not None and archive is not None:
+            raise ValueError("Provide either server or archive, not both")
+        if (client_options or {}).get("http2"):
+            raise ValueError("http2 has no effect on the stub and replay transports")
+        self.calls = calls
+        self.variant = variant
+        self.server = server if server is not None or archive is not None else StubServer()
+        self.archive = archive
+        self.simulate_latency = simulate_latency
+        self.speed = speed
+        self.requests_per_second = requests_per_second
+        self.max_in_flight = max_in_flight
+        self.client_options = dict(client_options or {})
+
+    def _client(self, client_class: Optional[type], concurrency: int, run: _Run) -> Any:
+        options: Dict[str, Any] = {
+            "limits": httpx.Limits(
+                max_connections=concurrency, max_keepalive_connections=concurrency
+            ),
+            "metrics": False,
+            "event_hooks": run.hooks,
+            **self.client_options,
+        }
+        if self.requests_per_second or self.max_in_flight:
+            options["rate_limiter"] = RateLimiter(
+                requests_per_second=self.requests_per_second,
+                max_concurrency=self.max_in_flight,
+            )
+        if self.archive is not None:
+            return replay_client(
+                self.archive,
+                client_class,
+                simulate_latency=self.simulate_latency,
+                speed=self.speed,
+                **options,
+            )
+        return stub_client(self.server, client_class, **options)
+
+    def _method(self, kdx: Any, call: Call) -> Callable[..., Any]:
+        sub_client, base, _ = call
+        return getattr(getattr(kdx, sub_client), base + VARIANTS[self.variant])
+
+    def _call(self, kdx: Any, call: Call, run: _Run) -> None:
+        started = time.perf_counter()
+        try:
+            result = self._method(kdx, call)(*call[2])
+        except KytheraError:
+            run.record(time.perf_counter() - started, None, error=True)
+        else:
+            run.record(time.perf_counter() - started, result, error=False)
+
+    async def _acall(self, kdx: Any, call: Call, run: _Run, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await self._method(kdx, call)(*call[2])
+            except KytheraError:
+                run.record(time.perf_counter() - started, None, error=True)
+            else:
+                run.record(time.perf_counter() - started, result, error=False)
+
+    async def _run_async(self, concurrency: int, run: _Run) -> float:
+        from .aio import AsyncKytheraKdx
+
+        kdx = self._client(AsyncKytheraKdx, concurrency, run)
+        semaphore = asyncio.Semaphore(concurrency)
+        async with kdx:
+            started = time.perf_counter()
+            await asyncio.gather(*(self._acall(kdx, call, run, semaphore) for call in self.calls))
+            return time.perf_counter() - started
+
+    def run(self, mode: str, concurrency: int = 1) -> Dict[str, Any]:
+        """
+        Run the workload once.
+
+        Args:
+            mode: "sync" (one call at a time), "threads" (a sync client shared
+                by a thread pool) or "async" (the async client)
+            concurrency: Calls in flight at a time, and connection pool size
+
+        Returns:
+            Dictionary with the mode, concurrency, requests, errors, rows,
+            bytes, wall time, requests/sec, rows/sec, MB/sec and p50/p95/p99
+            latency in milliseconds
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}; choose from {', '.join(MODES)}")
+        if mode == "sync":
+            concurrency = 1
+        run = _Run()
+        if mode == "async":
+            wall = asyncio.run(self._run_async(concurrency, run))
+        else:
+            with self._client(None, concurrency, run) as kdx:
+                started = time.perf_counter()
+                if mode == "sync":
+                    for call in self.calls:
+                        self._call(kdx, call, run)
+                else:
+                    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                        list(pool.map(lambda call: self._call(kdx, call, run), self.calls))
+                wall = time.perf_counter() - started
+        requests = len(run.latencies)
+        return {
+            "mode": mode,
+            "concurrency": concurrency,
+            "requests": requests,
+            "errors": run.errors,
+            "rows": run.rows,
+            "bytes": run.bytes,
+            "wall_seconds": wall,
+            "requests_per_sec": requests / wall if wall else 0.0,
+            "rows_per_sec": run.rows / wall if wall else 0.0,
+            "mb_per_sec": run.bytes / wall / 1e6 if wall else 0.0,
+            "p50_ms": percentile(run.latencies, 0.50) * 1e3,
+            "p95_ms": percentile(run.latencies, 0.95) * 1e3,
+            "p99_ms": percentile(run.latencies, 0.99) * 1e3,
+        }
+
+    def sweep(self, modes: Sequence[str], levels: Sequence[int]) -> List[Dict[str, Any]]:
+        """Run every mode at every level; the sync mode runs once, at level 1."""
+        results = []
+        for mode in modes:
+            for level in [1] if mode == "sync" else levels:
+                results.append(self.run(mode, level))
+        return results
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    """Render sweep results as a fixed-width text table."""
+    lines = [
+        f"{'mode':<8}{'conc':>6}{'requests':>10}{'errors':>8}{'req/s':>10}"
+        f"{'rows/s':>12}{'MB/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['mode']:<8}{result['concurrency']:>6}{result['requests']:>10}"
+            f"{result['errors']:>8}{result['requests_per_sec']:>10,.1f}"
+            f"{result['rows_per_sec']:>12,.0f}{result['mb_per_sec']:>8.1f}"
+            f"{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entry point of the ``kdx-bench`` command."""
+    parser = argparse.ArgumentParser(
+        prog="kdx-bench", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        "--workload",
+        action="append",
+        metavar="NAME:COUNT",
+        help=f"Calls to make, repeatable ({', '.join(WORKLOADS)}); "
+        "default prices-by-date:30",
+    )
+    parser.add_argument(
+        "--date",
+        type=date.fromisoformat,
+        default=date(2024, 6, 28),
+        help="Last date of the workloads (YYYY-MM-DD)",
+    )
+    parser.add_argument("--price-type", default="CLOSE")
+    parser.add_argument("--variant", choices=list(VARIANTS), default="raw")
+    parser.add_argument("--modes", default="sync,threads,async", help="sync,threads,async")
+    parser.add_argument("--concurrency", default="1,4,16,64", help="Comma-separated levels")
+    parser.add_argument(
+        "--replay",
+        metavar="ARCHIVE",
+        help="Replay an archive recorded with RecordingTransport instead of the stub",
+    )
+    parser.add_argument(
+        "--simulate-latency",
+        action="store_true",
+        help="Replay the recorded latency of the archive",
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="Divisor of the replayed latency")
+    parser.add_argument(
+        "--spec", help="OpenAPI document of the stub (default: the packaged openapi-v1.2.json)"
+    )
+    parser.add_argument("--rows", type=int, default=5000, help="Rows per stub response")
+    parser.add_argument(
+        "--instrument-rows",
+        type=int,
+        default=1,
+        help="Rows per stub response of /v1/prices/{instrumentId}",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Seconds each stub response is delayed by"
+    )
+    parser.add_argument("--rps", type=float, help="Client rate limit, requests per second")
+    parser.add_argument("--max-in-flight", type=int, help="Client concurrency limit")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    calls = workload_calls(args.workload or ["prices-by-date:30"], args.date, args.price_type)
+    server = None
+    if args.replay is None:
+        server = StubServer(
+            spec=args.spec,
+            rows=args.rows,
+            rows_by_path={"/v1/prices/{instrumentId}": args.instrument_rows},
+            latency=args.latency,
+        )
+    test = LoadTest(
+        calls,
+        variant=args.variant,
+        server=server,
+        archive=args.replay,
+        simulate_latency=args.simulate_latency,
+        speed=args.speed,
+        requests_per_second=args.rps,
+        max_in_flight=args.max_in_flight,
+    )
+    levels = [int(level) for level in args.concurrency.split(",")]
+    results = []
+    header, = format_table([]).splitlines()
+    print(header)
+    for mode in args.modes.split(","):
+        for level in [1] if mode == "sync" else levels:
+            result = test.run(mode, level)
+            results.append(result)
+            print(format_table([result]).splitlines()[1], flush=True)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
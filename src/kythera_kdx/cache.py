@@ -0,0 +1,287 @@
+"""
+In-memory response cache for the Kythera clients.
+
+ResponseCache keeps successful GET responses keyed by (method, path, params)
+for a time-to-live configured per endpoint path template, evicting the least
+recently used entries once the entry or byte limits are reached. By default
+reference data that changes about once a day (calendars, currencies,
+countries, price types, risk factor value types, portfolios and fund
+families) is cached for an hour.
+
+Expired entries whose response carried an ETag or Last-Modified header are
+kept for revalidation: the next request is sent with If-None-Match /
+If-Modified-Since and a 304 Not Modified reuses the cached body, including its
+already decoded JSON. Endpoints with a TTL of 0 (by default the large
+instrument and risk factor listings) are revalidated on every call.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, Pattern, Hashable
+
+import httpx
+
+from .codec import share_response
+from .rate_limit import compile_path_template
+
+REFERENCE_DATA_TTLS: Dict[str, float] = {
+    "/v1/globals/calendars": 3600,
+    "/v1/globals/countries": 3600,
+    "/v1/globals/currencies": 3600,
+    "/v1/prices/price-types": 3600,
+    "/v1/risk-factor-values/types": 3600,
+    "/v1/portfolios": 3600,
+    "/v1/fund-families": 3600,
+}
+
+REVALIDATED_ENDPOINTS: Dict[str, float] = {
+    "/v1/instruments": 0,
+    "/v1/risk-factors": 0,
+}
+
+DEFAULT_TTLS: Dict[str, float] = {**REFERENCE_DATA_TTLS, **REVALIDATED_ENDPOINTS}
+
+
+def params_key(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    """Hashable, order-independent form of query parameters."""
+    if not params:
+        return ()
+    return tuple(sorted((str(key), str(value)) for key, value in params.items()))
+
+
+class _Entry:
+    __slots__ = ("response", "path", "expires_at", "size", "validators")
+
+    def __init__(self, response: httpx.Response, path: str, expires_at: float):
+        self.response = response
+        self.path = path
+        self.expires_at = expires_at
+        self.size = len(response.content)
+        self.validators = _validators(response.headers)
+
+
+def _validators(headers: httpx.Headers) -> Dict[str, str]:
+    """Conditional request headers revalidating a response with these headers."""
+    validators = {}
+    if "ETag" in headers:
+        validators["If-None-Match"] = headers["ETag"]
+    if "Last-Modified" in headers:
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    return validators
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL/LRU cache of GET responses.
+
+    A cache belongs to one client (base URL and credentials); it can be used by
+    both the sync and the async client.
+
+    Example:
+        cache = ResponseCache(
+            ttls={**DEFAULT_TTLS, "/v1/instruments": 300},
+            max_entries=512,
+        )
+        kdx = KytheraKdx(response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        max_entries: int = 256,
+        max_bytes: Optional[int] = 128 * 1024 * 1024,
+    ):
+        """
+        Args:
+            ttls: Seconds to keep responses for each endpoint path template
+                (e.g. ``/v1/prices/{instrumentId}``); 0 revalidates on every
+                call. DEFAULT_TTLS when omitted
+            default_ttl: Seconds to keep responses of endpoints not listed in
+                ttls; those are not cached when None
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached response bodies; unlimited
+                when None
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._ttls: List[Tuple[str, Pattern[str], float]] = [
+            (template, compile_path_template(template), ttl)
+            for template, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()
+        ]
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._revalidated = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Time-to-live for responses of path, or None if it is not cached."""
+        path = path.split("?", 1)[0]
+        for _, pattern, ttl in self._ttls:
+            if pattern.match(path):
+                return ttl
+        return self.default_ttl
+
+    def lookup(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[httpx.Response]:
+        """Return the cached response for a request, or None on a miss."""
+        if method != "GET" or self.ttl_for(path) is None:
+            return None
+        key = (method, path, params_key(params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                # Stale entries with validators stay around for revalidation
+                if not entry.validators:
+                    self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.response
+
+    def store(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+    ) -> bool:
+        """Cache a fully read response if its endpoint is cacheable."""
+        ttl = self.ttl_for(path)
+        if method != "GET" or ttl is None or not response.is_success:
+            return False
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return False
+        entry = _Entry(response, path, time.monotonic() + ttl)
+        if ttl <= 0 and not entry.validators:
+            return False
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return False
+        share_response(response)
+        self._insert((method, path, params_key(params)), entry)
+        return True
+
+    def revalidation(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[httpx.Response], Dict[str, str]]:
+        """
+        Stale response for a request and the conditional headers revalidating it.
+
+        Returns:
+            (None, {}) when there is no stale entry with an ETag or Last-Modified
+        """
+        if method != "GET":
+            return None, {}
+        key = (method, path, params_key(params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.validators:
+                return None, {}
+            return entry.response, dict(entry.validators)
+
+    def not_modified(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        stale: httpx.Response,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """
+        Handle a 304 answer to a revalidation: the stale response is fresh again.
+
+        Args:
+            stale: Response returned by revalidation()
+            response: The 304 Not Modified response
+
+        Returns:
+            The cached response, to be used in place of the 304
+        """
+        ttl = self.ttl_for(path) or 0
+        entry = _Entry(stale, path, time.monotonic() + ttl)
+        # A 304 may carry updated validators
+        entry.validators.update(_validators(response.headers))
+        self._insert((method, path, params_key(params)), entry)
+        with self._lock:
+            self._revalidated += 1
+        return stale
+
+    def _insert(self, key: Hashable, entry: _Entry) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """
+        Drop cached responses.
+
+        Args:
+            path: Endpoint path or path template (e.g. ``/v1/globals/calendars``);
+                every entry is dropped when None
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if path is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return removed
+            pattern = compile_path_template(path)
+            keys = [
+                key for key, entry in self._entries.items() if pattern.match(entry.path)
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self.invalidate()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, hit ratio, evictions, expirations,
+            responses revalidated with a 304, and the current number of
+            entries and cached bytes
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "revalidated": self._revalidated,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
@@ -0,0 +1,296 @@
+"""
+Per-endpoint circuit breaker for the Kythera clients.
+
+Each endpoint path template has its own circuit. While closed, the outcome of
+every attempt is recorded in a sliding window; once the window holds enough
+calls and the failure rate (5xx responses, connection errors, timeouts) or the
+slow call rate crosses its threshold, the circuit opens and requests fail fast
+with KytheraCircuitOpenError instead of tying up threads on a degraded
+endpoint. After ``open_seconds`` the circuit is half-open: a few trial requests
+are let through, and it closes again when they succeed or reopens when one
+fails. Optionally the last successful response of each GET is served while the
+circuit is open.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Tuple, Pattern, Iterator, Deque, Hashable
+
+import httpx
+
+from .cache import params_key
+from .codec import share_response
+from .exceptions import KytheraCircuitOpenError
+from .rate_limit import compile_path_template
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    """State of one endpoint template; guarded by the breaker lock."""
+
+    def __init__(self, window_size: int) -> None:
+        self.state = CLOSED
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.trials = 0
+        self.trial_successes = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+
+class Attempt:
+    """Outcome of one request attempt, reported to the breaker on exit."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.outcome: Optional[Tuple[bool, float]] = None
+
+    def start(self) -> None:
+        """Restart the clock when the request is sent (after any rate limiter wait)."""
+        self.started = time.monotonic()
+
+    def completed(self, status_code: int) -> None:
+        """Record a response; 5xx responses count as failures."""
+        self.outcome = (status_code >= 500, time.monotonic() - self.started)
+
+    def failed(self) -> None:
+        """Record a transport error (connection failure, timeout...)."""
+        self.outcome = (True, time.monotonic() - self.started)
+
+
+class CircuitBreaker:
+    """
+    Circuit breakers keyed by endpoint path template.
+
+    Example:
+        breaker = CircuitBreaker(
+            failure_rate_threshold=0.5,
+            slow_call_seconds=10,
+            open_seconds=30,
+            endpoints=["/v1/prices/{instrumentId}"],
+            serve_last_known_good=True,
+        )
+        kdx = KytheraKdx(circuit_breaker=breaker)
+        breaker.get_state("/v1/pnl/intraday")  # "closed", "open" or "half_open"
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 2,
+        endpoints: Optional[List[str]] = None,
+        serve_last_known_good: bool = False,
+        max_last_known_good: int = 128,
+    ):
+        """
+        Args:
+            failure_rate_threshold: Fraction of failed calls in the window that
+                opens the circuit
+            slow_call_seconds: Calls taking longer than this are slow; latency
+                is not considered when None
+            slow_call_rate_threshold: Fraction of slow calls in the window that
+                opens the circuit
+            window_size: Number of recent calls per endpoint used for the rates
+            min_calls: Calls needed in the window before the circuit can open
+            open_seconds: Time the circuit stays open before trial requests
+            half_open_calls: Successful trial requests needed to close again
+            endpoints: Path templates grouping concrete paths into one circuit
+                (e.g. ``/v1/prices/{instrumentId}``); other paths get a circuit
+                of their own
+            serve_last_known_good: Return the last successful response of a GET
+                instead of raising while its circuit is open
+            max_last_known_good: Number of GET responses kept for that purpose
+        """
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("rate thresholds must be in (0, 1]")
+        if min_calls < 1 or window_size < min_calls:
+            raise ValueError("window_size must be at least min_calls, which must be positive")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = max(1, half_open_calls)
+        self.serve_last_known_good = serve_last_known_good
+        self.max_last_known_good = max_last_known_good
+        self._templates: List[Tuple[str, Pattern[str]]] = [
+            (template, compile_path_template(template)) for template in endpoints or []
+        ]
+        self._circuits: Dict[str, _Circuit] = {}
+        self._last_known_good: "OrderedDict[Hashable, httpx.Response]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def endpoint_key(self, path: str) -> str:
+        """Template the path belongs to, or the path itself."""
+        path = path.split("?", 1)[0]
+        for template, pattern in self._templates:
+            if pattern.match(path):
+                return template
+        return path
+
+    def _circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit(self.window_size)
+        return circuit
+
+    def _open(self, circuit: _Circuit, now: float) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.times_opened += 1
+        circuit.outcomes.clear()
+
+    @contextmanager
+    def attempt(self, path: str) -> Iterator[Attempt]:
+        """
+        Guard one request attempt to path.
+
+        Raises:
+            KytheraCircuitOpenError: When the circuit is open, or half-open with
+                all trial requests already in flight
+        """
+        key = self.endpoint_key(path)
+        with self._lock:
+            circuit = self._circuit(key)
+            now = time.monotonic()
+            if circuit.state == OPEN and now - circuit.opened_at >= self.open_seconds:
+                circuit.state = HALF_OPEN
+                circuit.trials = 0
+                circuit.trial_successes = 0
+            if circuit.state == OPEN or (
+                circuit.state == HALF_OPEN and circuit.trials >= self.half_open_calls
+            ):
+                circuit.rejected += 1
+                retry_after = max(0.0, circuit.opened_at + self.open_seconds - now)
+                raise KytheraCircuitOpenError(
+                    f"Circuit breaker for {key} is {circuit.state}; request not sent",
+                    endpoint=key,
+                    retry_after=retry_after,
+                )
+            trial = circuit.state == HALF_OPEN
+            if trial:
+                circuit.trials += 1
+
+        attempt = Attempt()
+        try:
+            yield attempt
+        finally:
+            self._record(circuit, attempt, trial)
+
+    def _record(self, circuit: _Circuit, attempt: Attempt, trial: bool) -> None:
+        with self._lock:
+            if attempt.outcome is None:
+                # Neither a response nor a transport error (e.g. auth failure)
+                if trial and circuit.state == HALF_OPEN:
+                    circuit.trials -= 1
+                return
+            failed, elapsed = attempt.outcome
+            slow = self.slow_call_seconds is not None and elapsed > self.slow_call_seconds
+            now = time.monotonic()
+
+            if circuit.state == HALF_OPEN:
+                if not trial:
+                    return
+                if failed or slow:
+                    self._open(circuit, now)
+                else:
+                    circuit.trial_successes += 1
+                    if circuit.trial_successes >= self.half_open_calls:
+                        circuit.state = CLOSED
+                        circuit.outcomes.clear()
+                return
+            if circuit.state == OPEN:
+                return
+
+            circuit.outcomes.append((failed, slow))
+            calls = len(circuit.outcomes)
+            if calls < self.min_calls:
+                return
+            failures = sum(1 for failed, _ in circuit.outcomes if failed)
+            slow_calls = sum(1 for _, slow in circuit.outcomes if slow)
+            if (
+                failures / calls >= self.failure_rate_threshold
+                or slow_calls / calls >= self.slow_call_rate_threshold
+            ):
+                self._open(circuit, now)
+
+    def remember(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+    ) -> None:
+        """Keep a successful GET response to serve while the circuit is open."""
+        if not self.serve_last_known_good or method != "GET" or not response.is_success:
+            return
+        key = (path, params_key(params))
+        with self._lock:
+            self._last_known_good[key] = response
+            self._last_known_good.move_to_end(key)
+            while len(self._last_known_good) > self.max_last_known_good:
+                self._last_known_good.popitem(last=False)
+
+    def last_known_good(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[httpx.Response]:
+        """Last successful response of a GET, if one is kept."""
+        if not self.serve_last_known_good or method != "GET":
+            return None
+        with self._lock:
+            response = self._last_known_good.get((path, params_key(params)))
+        if response is not None:
+            share_response(response)
+        return response
+
+    def get_state(self, path: str) -> str:
+        """State of the circuit for a path or template: closed, open or half_open."""
+        key = self.endpoint_key(path)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and (
+                time.monotonic() - circuit.opened_at >= self.open_seconds
+            ):
+                return HALF_OPEN
+            return circuit.state
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every circuit.
+
+        Returns:
+            Dictionary keyed by endpoint with state, calls and failure/slow call
+            rates in the current window, rejected requests and times opened
+        """
+        with self._lock:
+            keys = list(self._circuits)
+        stats = {}
+        for key in keys:
+            state = self.get_state(key)
+            with self._lock:
+                circuit = self._circuits[key]
+                calls = len(circuit.outcomes)
+                failures = sum(1 for failed, _ in circuit.outcomes if failed)
+                slow_calls = sum(1 for _, slow in circuit.outcomes if slow)
+                stats[key] = {
+                    "state": state,
+                    "calls": calls,
+                    "failure_rate": failures / calls if calls else 0.0,
+                    "slow_call_rate": slow_calls / calls if calls else 0.0,
+                    "rejected": circuit.rejected,
+                    "times_opened": circuit.times_opened,
+                }
+        return stats
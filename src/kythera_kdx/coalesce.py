@@ -0,0 +1,128 @@
+"""
+Single-flight coalescing of identical concurrent GET requests.
+
+When several threads (sync client) or tasks (async client) issue the same GET
+while a previous identical request is still in flight, RequestCoalescer lets
+only the first one reach the network; the others wait for it and receive the
+same response, whose JSON body is then decoded only once (see decode_json).
+Errors are propagated to every waiter.
+"""
+
+import asyncio
+import threading
+from typing import Optional, Dict, Any, Awaitable, Callable, Hashable
+
+import httpx
+
+from .codec import share_response
+
+
+class _Call:
+    __slots__ = ("done", "response", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """In-flight deduplication of identical requests for one client."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Hashable, "asyncio.Future[httpx.Response]"] = {}
+        self._async_waiters: Dict[Hashable, int] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Run send() unless an identical request is in flight, then share its response."""
+        with self._lock:
+            self._requests += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.response  # type: ignore[return-value]
+
+        try:
+            call.response = send()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters and call.response is not None:
+                share_response(call.response)
+            call.done.set()
+        return call.response
+
+    async def do_async(
+        self, key: Hashable, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """
+        Awaitable counterpart of do() for tasks on one event loop.
+
+        A cancelled caller leaves the shared request running for the others;
+        once every caller awaiting it has been cancelled, it is cancelled too.
+        """
+        self._requests += 1
+        future = self._async_calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run_async(key, send))
+            # Retrieve the exception even when every caller was cancelled
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._async_calls[key] = future
+            self._async_waiters[key] = 0
+        else:
+            self._coalesced += 1
+        self._async_waiters[key] += 1
+        try:
+            # Shielded so that a cancelled caller does not cancel the shared request
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.done():
+                self._async_waiters[key] -= 1
+                if not self._async_waiters[key]:
+                    future.cancel()
+            raise
+
+    async def _run_async(
+        self, key: Hashable, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        try:
+            response = await send()
+        finally:
+            # Callers still awaiting the response
+            waiters = self._async_waiters.pop(key)
+            del self._async_calls[key]
+        if waiters > 1:
+            share_response(response)
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dictionary with the number of requests seen, requests that shared
+            an in-flight call, and calls currently in flight
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls) + len(self._async_calls),
+            }
@@ -0,0 +1,293 @@
+"""
+Persistent on-disk cache for immutable historical data.
+
+Prices for a past date, risk factor values for a closed valuation date, fund
+and subclass NAVs and index values for past sessions never change once the
+day is closed. DiskCache keeps those GET responses in a SQLite database
+(bodies compressed with zlib) so repeated historical pulls, e.g. from
+backtests, are served locally across processes and runs. Only requests whose
+date parameters are all at least ``min_age_days`` in the past are cached;
+the least recently used entries are evicted beyond ``max_bytes``.
+"""
+
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional, Dict, Any, List, Tuple, Pattern, Sequence
+
+import httpx
+
+from .rate_limit import compile_path_template
+
+# Date parameters that pin each historical endpoint to closed days. Every entry
+# lists alternative groups of parameters; a request is immutable when all the
+# parameters of one group are present and every date it sends is in the past
+# (a start date without an end date runs up to today and is never cached).
+IMMUTABLE_ENDPOINTS: Dict[str, Sequence[Tuple[str, ...]]] = {
+    "/v1/prices": (("priceDate",),),
+    "/v1/prices/{instrumentId}": (("priceDate",),),
+    "/v1/risk-factor-values": (("valuation-date",),),
+    "/v1/funds/navs": (("date",), ("startDate", "endDate")),
+    "/v1/subclasses/navs": (("date",), ("start-date", "end-date")),
+    "/v1/indexes/values": (("session-date",), ("from-date", "to-date")),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    body BLOB NOT NULL,
+    content_type TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def _parse_date(value: Any) -> Optional[datetime.date]:
+    if isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class DiskCache:
+    """
+    SQLite-backed cache of GET responses for closed historical dates.
+
+    One database can be shared by several clients and processes; responses
+    are keyed by base URL, method, path and query parameters.
+
+    Example:
+        cache = DiskCache("~/.cache/kythera-kdx/history.sqlite", max_bytes=2 * 1024**3)
+        kdx = KytheraKdx(disk_cache=cache)
+        kdx.prices.get_all_prices_df(date(2024, 3, 28), "CLOSE")  # network, then disk
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = 1024 * 1024 * 1024,
+        min_age_days: int = 1,
+        endpoints: Optional[Dict[str, Sequence[Tuple[str, ...]]]] = None,
+        compression_level: int = 6,
+    ):
+        """
+        Args:
+            path: SQLite database file; created if missing
+            max_bytes: Maximum total size of the compressed bodies; unlimited
+                when None
+            min_age_days: Minimum age of every requested date, in days before
+                today, for a response to be considered immutable
+            endpoints: Endpoint path templates mapped to their date parameter
+                groups; IMMUTABLE_ENDPOINTS when omitted
+            compression_level: zlib level used for stored bodies (0-9)
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.min_age_days = min_age_days
+        self.compression_level = compression_level
+        self._rules: List[Tuple[str, Pattern[str], Sequence[Tuple[str, ...]]]] = [
+            (template, compile_path_template(template), groups)
+            for template, groups in (
+                IMMUTABLE_ENDPOINTS if endpoints is None else endpoints
+            ).items()
+        ]
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def is_immutable(self, path: str, params: Optional[Dict[str, Any]]) -> bool:
+        """Whether the response to a GET of path with params can no longer change."""
+        params = params or {}
+        path = path.split("?", 1)[0]
+        for _, pattern, groups in self._rules:
+            if not pattern.match(path):
+                continue
+            if not any(all(name in params for name in group) for group in groups):
+                return False
+            cutoff = datetime.date.today() - datetime.timedelta(days=self.min_age_days)
+            for name in {name for group in groups for name in group}:
+                if name in params:
+                    value = _parse_date(params[name])
+                    if value is None or value > cutoff:
+                        return False
+            return True
+        return False
+
+    @staticmethod
+    def _key(scope: str, method: str, path: str, params: Optional[Dict[str, Any]]) -> str:
+        items = sorted((str(key), str(value)) for key, value in (params or {}).items())
+        return json.dumps([scope, method, path, items], separators=(",", ":"))
+
+    def lookup(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        scope: str = "",
+    ) -> Optional[httpx.Response]:
+        """
+        Return the stored response for a request, or None on a miss.
+
+        Args:
+            method: HTTP method; only GET requests are cached
+            path: Endpoint path
+            params: Query parameters
+            scope: Namespace separating APIs, usually the client's base URL
+        """
+        if method != "GET" or not self.is_immutable(path, params):
+            return None
+        key = self._key(scope, method, path, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, content_type FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            self._hits += 1
+        body, content_type = row
+        headers = {"Content-Type": content_type} if content_type else {}
+        return httpx.Response(
+            200,
+            content=zlib.decompress(body),
+            headers=headers,
+            request=httpx.Request(method, path, params=params),
+        )
+
+    def store(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+        scope: str = "",
+    ) -> bool:
+        """Persist a fully read response if it is immutable historical data."""
+        if (
+            method != "GET"
+            or response.status_code != 200
+            or not self.is_immutable(path, params)
+        ):
+            return False
+        body = zlib.compress(response.content, self.compression_level)
+        if self.max_bytes is not None and len(body) > self.max_bytes:
+            return False
+
+        key = self._key(scope, method, path, params)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    path,
+                    body,
+                    response.headers.get("Content-Type"),
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._stores += 1
+            self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the size cap is met."""
+        if self.max_bytes is None:
+            return
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        victims = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._evictions += len(victims)
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """
+        Delete stored responses.
+
+        Args:
+            path: Endpoint path or path template (e.g. ``/v1/prices/{instrumentId}``);
+                every entry is deleted when None
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._conn:
+            if path is None:
+                return self._conn.execute("DELETE FROM responses").rowcount
+            pattern = compile_path_template(path)
+            keys = [
+                (key,)
+                for key, stored_path in self._conn.execute("SELECT key, path FROM responses")
+                if pattern.match(stored_path)
+            ]
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        self.invalidate()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, stores and evictions of this instance,
+            and the number of entries and compressed bytes in the database
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "stores": self._stores,
+                "evictions": self._evictions,
+                "entries": entries,
+                "bytes": size,
+            }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -34,6 +34,15 @@ class KytheraTimeoutError(KytheraError):
     pass
 
 
+class KytheraCircuitOpenError(KytheraError):
+    """Exception raised without sending a request while an endpoint's circuit breaker is open."""
+
+    def __init__(self, message: str, endpoint: Optional[str] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
 class KytheraValidationError(KytheraError):
     """Exception raised when request/response validation fails."""
     
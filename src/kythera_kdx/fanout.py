@@ -0,0 +1,152 @@
+"""
+Concurrent fan-out of a per-date endpoint over a range of dates.
+
+Endpoints such as ``/v1/prices`` take a single date, so a history is one call
+per business day. fetch_dates runs those calls on a thread pool sharing the
+client (and fetch_dates_async on the event loop), at most max_concurrency at
+a time. A date that fails, whatever the exception, is reported in
+DateRangeResult.failures instead of aborting the range; cancellation and
+interrupts still propagate.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import (
+    Optional,
+    Dict,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+import pandas as pd
+
+T = TypeVar("T")
+
+
+def business_days(
+    start: date, end: date, holidays: Optional[Iterable[date]] = None
+) -> List[date]:
+    """
+    Weekdays from start to end (both included), oldest first.
+
+    Args:
+        start: First date of the range
+        end: Last date of the range
+        holidays: Dates to skip besides weekends
+    """
+    skipped = set(holidays or ())
+    return [
+        day.date()
+        for day in pd.bdate_range(start, end)
+        if day.date() not in skipped
+    ]
+
+
+class DateRangeResult(Generic[T]):
+    """
+    Data fetched for a range of dates, with the dates that failed.
+
+    Attributes:
+        data: Combined result of the dates that succeeded
+        dates: Dates requested (business days of the range)
+        failures: Exception raised for each date that failed
+    """
+
+    def __init__(self, data: T, dates: List[date], failures: Dict[date, Exception]):
+        self.data = data
+        self.dates = dates
+        self.failures = failures
+
+    @property
+    def ok(self) -> bool:
+        """True when every date succeeded."""
+        return not self.failures
+
+    def raise_for_failures(self) -> None:
+        """Raise the exception of the first failed date, if any."""
+        if self.failures:
+            raise self.failures[min(self.failures)]
+
+    def __len__(self) -> int:
+        return len(self.data)  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return (
+            f"DateRangeResult(dates={len(self.dates)}, "
+            f"failures={sorted(day.isoformat() for day in self.failures)})"
+        )
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+def fetch_dates(
+    fetch: Callable[[date], T], dates: List[date], max_concurrency: int
+) -> Tuple[Dict[date, T], Dict[date, Exception]]:
+    """
+    Call fetch for every date on a thread pool.
+
+    Returns:
+        Results and exceptions by date
+    """
+    _check_concurrency(max_concurrency)
+    results: Dict[date, T] = {}
+    failures: Dict[date, Exception] = {}
+
+    def run(day: date) -> None:
+        try:
+            results[day] = fetch(day)
+        except Exception as e:  # CancelledError and KeyboardInterrupt propagate
+            failures[day] = e
+
+    if len(dates) <= 1 or max_concurrency == 1:
+        for day in dates:
+            run(day)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(dates)),
+            thread_name_prefix="kythera-fanout",
+        ) as executor:
+            list(executor.map(run, dates))
+    return results, failures
+
+
+async def fetch_dates_async(
+    fetch: Callable[[date], Awaitable[T]], dates: List[date], max_concurrency: int
+) -> Tuple[Dict[date, T], Dict[date, Exception]]:
+    """
+    Await fetch for every date, at most max_concurrency at a time.
+
+    Returns:
+        Results and exceptions by date
+    """
+    _check_concurrency(max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results: Dict[date, T] = {}
+    failures: Dict[date, Exception] = {}
+
+    async def run(day: date) -> None:
+        async with semaphore:
+            try:
+                results[day] = await fetch(day)
+            except Exception as e:  # CancelledError and KeyboardInterrupt propagate
+                failures[day] = e
+
+    await asyncio.gather(*(run(day) for day in dates))
+    return results, failures
+
+
+def in_date_order(results: Dict[date, List[T]], dates: List[date]) -> List[T]:
+    """Concatenate the per-date lists of results, oldest date first."""
+    combined: List[T] = []
+    for day in dates:
+        combined.extend(results.get(day, ()))
+    return combined
@@ -0,0 +1,216 @@
+"""
+Columnar DataFrame construction for the ``*_df`` methods.
+
+build_frame transposes decoded records into column arrays in one pass and
+applies dtypes derived from the models_v1 annotations, instead of letting
+pandas infer them row by row:
+
+- ``date``/``datetime`` fields become ``datetime64`` columns
+- ``Optional[int]`` becomes the nullable ``Int64`` dtype, ``bool`` becomes ``boolean``
+- ``float`` fields become ``float64`` (missing values as NaN)
+- ``str`` fields with repeated values (fund, instrument, currency names...)
+  become ``category``
+- other fields, and keys not declared on the model, are inferred by pandas
+"""
+
+import datetime
+import functools
+import time
+import typing
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from .hooks import client_hooks, emit_decode
+from .metrics import client_metrics
+from .tracing import client_tracer
+
+# A string column is stored as category when it has at most this many
+# distinct values per row
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+CATEGORY_SAMPLE_SIZE = 1000
+
+
+def _field_kind(annotation: Any) -> str:
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return "object"
+        annotation = args[0]
+    if annotation in (datetime.date, datetime.datetime):
+        return "datetime"
+    if annotation is bool:
+        return "boolean"
+    if annotation is int:
+        return "Int64"
+    if annotation is float:
+        return "float64"
+    if annotation is str:
+        return "string"
+    return "object"
+
+
+@functools.lru_cache(maxsize=None)
+def column_kinds(model: Type[BaseModel]) -> Dict[str, str]:
+    """Column kind for each field of a model, derived from its annotations."""
+    return {
+        name: _field_kind(field.annotation)
+        for name, field in model.model_fields.items()
+    }
+
+
+def _is_repetitive(values: np.ndarray) -> bool:
+    """Cheap cardinality check on a sample before factorizing the whole column."""
+    sample = values[:CATEGORY_SAMPLE_SIZE]
+    return len(set(sample)) <= len(sample) * CATEGORY_MAX_UNIQUE_RATIO
+
+
+def _masked_array(values: np.ndarray, kind: str) -> Any:
+    """
+    Nullable Int64/boolean array, casting with numpy when the values allow it.
+
+    pd.array converts object arrays value by value; a column that pandas infers
+    as plain integers/booleans is cast in one step and masked where missing.
+    """
+    if kind == "Int64":
+        inferred, dtype = "integer", np.int64
+    else:
+        inferred, dtype = "boolean", np.bool_
+    infer_dtype = pd.api.types.infer_dtype
+    if infer_dtype(values, skipna=False) == inferred:
+        mask = np.zeros(len(values), dtype=np.bool_)
+    elif infer_dtype(values, skipna=True) == inferred:
+        mask = pd.isna(values)
+        values = np.where(mask, dtype(0), values)
+    else:
+        return pd.array(values, dtype=kind)
+    try:
+        data = values.astype(dtype)
+    except OverflowError:
+        return pd.array(values, dtype=kind)
+    if kind == "Int64":
+        return pd.arrays.IntegerArray(data, mask)
+    return pd.arrays.BooleanArray(data, mask)
+
+
+def _column(values: np.ndarray, kind: Optional[str]) -> Any:
+    """Convert one object column; unexpected values fall back to pandas inference."""
+    try:
+        if kind == "float64":
+            try:
+                return values.astype(np.float64)
+            except TypeError:  # None values
+                return pd.array(values, dtype="Float64").to_numpy(
+                    np.float64, na_value=np.nan
+                )
+        if kind == "datetime":
+            return pd.to_datetime(values, format="ISO8601")
+        if kind in ("Int64", "boolean"):
+            return _masked_array(values, kind)
+        if kind == "string" and len(values) and _is_repetitive(values):
+            codes, uniques = pd.factorize(values)
+            if len(uniques) <= len(values) * CATEGORY_MAX_UNIQUE_RATIO:
+                return pd.Categorical.from_codes(codes, uniques)
+    except (TypeError, ValueError):
+        pass
+    return values.tolist()
+
+
+def _transpose(records: Sequence[Dict[str, Any]]) -> Tuple[List[str], np.ndarray]:
+    """Column names and a 2-D object array of the records (missing keys as None)."""
+    columns = list(records[0])
+    try:
+        # Fast path: every record has exactly the keys of the first one
+        if not columns or len(set(map(len, records))) != 1:
+            raise KeyError
+        rows = list(map(itemgetter(*columns), records))
+        if len(columns) == 1:
+            rows = [(value,) for value in rows]
+    except KeyError:
+        columns = list(dict.fromkeys(chain.from_iterable(records)))
+        rows = [tuple(map(record.get, columns)) for record in records]
+
+    table = np.array(rows, dtype=object)
+    if table.ndim != 2:
+        # Equal-length list values were expanded into extra dimensions
+        table = np.empty((len(rows), len(columns)), dtype=object)
+        for index in range(len(columns)):
+            table[:, index] = np.fromiter(
+                (row[index] for row in rows), dtype=object, count=len(rows)
+            )
+    return columns, table
+
+
+def build_frame(
+    records: Sequence[Dict[str, Any]],
+    model: Optional[Type[BaseModel]] = None,
+    client: Any = None,
+    endpoint: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from decoded JSON records.
+
+    Args:
+        records: List of dictionaries as returned by the ``*_raw`` methods
+        model: models_v1 class describing the records; columns not declared on
+            the model keep pandas' inferred dtype
+        client: Client whose metrics, tracer and event hooks record the build
+            time under endpoint
+        endpoint: Endpoint the records were fetched from
+
+    Returns:
+        DataFrame with one column per key found in the records (the model
+        fields when there are no records)
+    """
+    return _instrumented_build("frame", _build_frame, records, model, client, endpoint)
+
+
+def _instrumented_build(
+    kind: str,
+    build: Callable[[Sequence[Dict[str, Any]], Optional[Type[BaseModel]]], Any],
+    records: Sequence[Dict[str, Any]],
+    model: Optional[Type[BaseModel]],
+    client: Any,
+    endpoint: Optional[str],
+) -> Any:
+    """Run a frame or table build, reporting it to the client's metrics, tracer and hooks."""
+    metrics = client_metrics(client)
+    tracer = client_tracer(client)
+    hooks = client_hooks(client)
+    if endpoint is None or (metrics is None and hooks is None and not tracer.enabled):
+        return build(records, model)
+    attributes = {
+        "kythera.endpoint": endpoint,
+        "kythera.model": model.__name__ if model is not None else None,
+        "kythera.rows": len(records),
+    }
+    with tracer.start_span(f"kythera.build_{kind}", attributes):
+        started = time.perf_counter()
+        result = build(records, model)
+        elapsed = time.perf_counter() - started
+    if metrics is not None:
+        metrics.observe(endpoint, f"{kind}_seconds", elapsed)
+    emit_decode(hooks, endpoint, kind, model, len(records), elapsed)
+    return result
+
+
+def _build_frame(
+    records: Sequence[Dict[str, Any]], model: Optional[Type[BaseModel]]
+) -> pd.DataFrame:
+    kinds = column_kinds(model) if model is not None else {}
+    if not records:
+        empty = np.empty(0, dtype=object)
+        return pd.DataFrame({name: _column(empty, kind) for name, kind in kinds.items()})
+    if not isinstance(records[0], dict):
+        return pd.DataFrame(records)
+
+    columns, table = _transpose(records)
+    data = {
+        name: _column(table[:, index], kinds.get(name))
+        for index, name in enumerate(columns)
+    }
+    return pd.DataFrame(data, copy=False)
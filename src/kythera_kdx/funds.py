@@ -1,15 +1,35 @@
 from datetime import date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import FundDto, FundNavDto, FundCounterpartyMarginDto, FundRiskMeasureDto, FundFamilyDto, FundFamilyRelationDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class FundsClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_funds(
+        self,
+        enabled_only: Optional[bool] = True,
+        fetch_characteristics: Optional[bool] = True,
+    ) -> httpx.Response:
+        params = {
+            "enabledOnly": enabled_only,
+            "fetchCharacteristics": fetch_characteristics,
+        }
+        return self._client.get("/v1/funds", params=params)
+
     def get_funds_raw(
         self,
         enabled_only: Optional[bool] = True,
@@ -19,12 +39,8 @@ class FundsClient:
         GET /v1/funds
         Fetches all available funds and returns raw JSON data.
         """
-        params = {
-            "enabledOnly": enabled_only,
-            "fetchCharacteristics": fetch_characteristics,
-        }
-        response = self._client.get("/v1/funds", params=params)
-        return response.json()
+        response = self._fetch_funds(enabled_only, fetch_characteristics)
+        return decode_json(response, self._client)
 
     def get_funds(
         self,
@@ -35,8 +51,8 @@ class FundsClient:
         GET /v1/funds
         Fetches all available funds and returns typed models.
         """
-        data = self.get_funds_raw(enabled_only, fetch_characteristics)
-        return [FundDto(**item) for item in data]
+        response = self._fetch_funds(enabled_only, fetch_characteristics)
+        return decode_models(response, FundDto, self._client)
 
     def get_funds_df(
         self,
@@ -48,19 +64,27 @@ class FundsClient:
         Fetches all available funds and returns a pandas DataFrame.
         """
         data = self.get_funds_raw(enabled_only, fetch_characteristics)
-        return pd.DataFrame(data)
+        return build_frame(data, FundDto, self._client, "/v1/funds")
 
-    def get_fund_navs_raw(
+    def get_funds_arrow(
+        self,
+        enabled_only: Optional[bool] = True,
+        fetch_characteristics: Optional[bool] = True,
+    ) -> "pa.Table":
+        """
+        GET /v1/funds
+        Fetches all available funds and returns a pyarrow Table.
+        """
+        data = self.get_funds_raw(enabled_only, fetch_characteristics)
+        return build_table(data, FundDto, self._client, "/v1/funds")
+
+    def _fetch_fund_navs(
         self,
         date: Optional[date] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         fund_id: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """
-        GET /v1/funds/navs
-        Fetches all available fund NAV entries for a given date or period and returns raw JSON data.
-        """
+    ) -> httpx.Response:
         params = {}
         if date:
             params["date"] = date.isoformat()
@@ -70,8 +94,21 @@ class FundsClient:
             params["endDate"] = end_date.isoformat()
         if fund_id is not None:
             params["fundId"] = fund_id
-        response = self._client.get("/v1/funds/navs", params=params)
-        return response.json()
+        return self._client.get("/v1/funds/navs", params=params)
+
+    def get_fund_navs_raw(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        fund_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/funds/navs
+        Fetches all available fund NAV entries for a given date or period and returns raw JSON data.
+        """
+        response = self._fetch_fund_navs(date, start_date, end_date, fund_id)
+        return decode_json(response, self._client)
 
     def get_fund_navs(
         self,
@@ -84,8 +121,8 @@ class FundsClient:
         GET /v1/funds/navs
         Fetches all available fund NAV entries for a given date or period and returns typed models.
         """
-        data = self.get_fund_navs_raw(date, start_date, end_date, fund_id)
-        return [FundNavDto(**item) for item in data]
+        response = self._fetch_fund_navs(date, start_date, end_date, fund_id)
+        return decode_models(response, FundNavDto, self._client)
 
     def get_fund_navs_df(
         self,
@@ -99,24 +136,41 @@ class FundsClient:
         Fetches all available fund NAV entries for a given date or period and returns a pandas DataFrame.
         """
         data = self.get_fund_navs_raw(date, start_date, end_date, fund_id)
-        return pd.DataFrame(data)
+        return build_frame(data, FundNavDto, self._client, "/v1/funds/navs")
+
+    def get_fund_navs_arrow(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        fund_id: Optional[int] = None,
+    ) -> "pa.Table":
+        """
+        GET /v1/funds/navs
+        Fetches all available fund NAV entries for a given date or period and returns a pyarrow Table.
+        """
+        data = self.get_fund_navs_raw(date, start_date, end_date, fund_id)
+        return build_table(data, FundNavDto, self._client, "/v1/funds/navs")
+
+    def _fetch_fund_counterparty_margins(self, session_date: date) -> httpx.Response:
+        params = {"session-date": session_date.isoformat()}
+        return self._client.get("/v1/fund-counterparty-margins", params=params)
 
     def get_fund_counterparty_margins_raw(self, session_date: date) -> List[Dict[str, Any]]:
         """
         GET /v1/fund-counterparty-margins
         Fetches all fund counterparty margins for a specified session date (raw JSON).
         """
-        params = {"session-date": session_date.isoformat()}
-        response = self._client.get("/v1/fund-counterparty-margins", params=params)
-        return response.json()
+        response = self._fetch_fund_counterparty_margins(session_date)
+        return decode_json(response, self._client)
 
     def get_fund_counterparty_margins(self, session_date: date) -> List[FundCounterpartyMarginDto]:
         """
         GET /v1/fund-counterparty-margins
         Fetches all fund counterparty margins for a specified session date (typed models).
         """
-        data = self.get_fund_counterparty_margins_raw(session_date)
-        return [FundCounterpartyMarginDto(**item) for item in data]
+        response = self._fetch_fund_counterparty_margins(session_date)
+        return decode_models(response, FundCounterpartyMarginDto, self._client)
 
     def get_fund_counterparty_margins_df(self, session_date: date) -> pd.DataFrame:
         """
@@ -124,26 +178,47 @@ class FundsClient:
         Fetches all fund counterparty margins for a specified session date (DataFrame).
         """
         data = self.get_fund_counterparty_margins_raw(session_date)
-        return pd.DataFrame(data)
+        return build_frame(
+            data,
+            FundCounterpartyMarginDto,
+            self._client,
+            "/v1/fund-counterparty-margins",
+        )
 
-    def get_fund_risk_measures_raw(self, effective_date: Optional[date] = None) -> List[Dict[str, Any]]:
+    def get_fund_counterparty_margins_arrow(self, session_date: date) -> "pa.Table":
         """
-        GET /v1/fund-risk-measures
-        Fetches all available risk measures for funds on a specified effective date (raw JSON).
+        GET /v1/fund-counterparty-margins
+        Fetches all fund counterparty margins for a specified session date (Arrow Table).
         """
+        data = self.get_fund_counterparty_margins_raw(session_date)
+        return build_table(
+            data,
+            FundCounterpartyMarginDto,
+            self._client,
+            "/v1/fund-counterparty-margins",
+        )
+
+    def _fetch_fund_risk_measures(self, effective_date: Optional[date] = None) -> httpx.Response:
         params = {}
         if effective_date:
             params["effective-date"] = effective_date.isoformat()
-        response = self._client.get("/v1/fund-risk-measures", params=params)
-        return response.json()
+        return self._client.get("/v1/fund-risk-measures", params=params)
+
+    def get_fund_risk_measures_raw(self, effective_date: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        GET /v1/fund-risk-measures
+        Fetches all available risk measures for funds on a specified effective date (raw JSON).
+        """
+        response = self._fetch_fund_risk_measures(effective_date)
+        return decode_json(response, self._client)
 
     def get_fund_risk_measures(self, effective_date: Optional[date] = None) -> List[FundRiskMeasureDto]:
         """
         GET /v1/fund-risk-measures
         Fetches all available risk measures for funds on a specified effective date (typed models).
         """
-        data = self.get_fund_risk_measures_raw(effective_date)
-        return [FundRiskMeasureDto(**item) for item in data]
+        response = self._fetch_fund_risk_measures(effective_date)
+        return decode_models(response, FundRiskMeasureDto, self._client)
 
     def get_fund_risk_measures_df(self, effective_date: Optional[date] = None) -> pd.DataFrame:
         """
@@ -151,23 +226,38 @@ class FundsClient:
         Fetches all available risk measures for funds on a specified effective date (DataFrame).
         """
         data = self.get_fund_risk_measures_raw(effective_date)
-        return pd.DataFrame(data)
+        return build_frame(
+            data, FundRiskMeasureDto, self._client, "/v1/fund-risk-measures"
+        )
+
+    def get_fund_risk_measures_arrow(self, effective_date: Optional[date] = None) -> "pa.Table":
+        """
+        GET /v1/fund-risk-measures
+        Fetches all available risk measures for funds on a specified effective date (Arrow Table).
+        """
+        data = self.get_fund_risk_measures_raw(effective_date)
+        return build_table(
+            data, FundRiskMeasureDto, self._client, "/v1/fund-risk-measures"
+        )
+
+    def _fetch_fund_families(self) -> httpx.Response:
+        return self._client.get("/v1/fund-families")
 
     def get_fund_families_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/fund-families
         Fetches all fund families (raw JSON).
         """
-        response = self._client.get("/v1/fund-families")
-        return response.json()
+        response = self._fetch_fund_families()
+        return decode_json(response, self._client)
 
     def get_fund_families(self) -> List[FundFamilyDto]:
         """
         GET /v1/fund-families
         Fetches all fund families (typed models).
         """
-        data = self.get_fund_families_raw()
-        return [FundFamilyDto(**item) for item in data]
+        response = self._fetch_fund_families()
+        return decode_models(response, FundFamilyDto, self._client)
 
     def get_fund_families_df(self) -> pd.DataFrame:
         """
@@ -175,28 +265,51 @@ class FundsClient:
         Fetches all fund families (DataFrame).
         """
         data = self.get_fund_families_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, FundFamilyDto, self._client, "/v1/fund-families")
+
+    def get_fund_families_arrow(self) -> "pa.Table":
+        """
+        GET /v1/fund-families
+        Fetches all fund families (Arrow Table).
+        """
+        data = self.get_fund_families_raw()
+        return build_table(data, FundFamilyDto, self._client, "/v1/fund-families")
+
+    def _fetch_fund_family_relations(self) -> httpx.Response:
+        return self._client.get("/v1/fund-families-relations")
 
     def get_fund_family_relations_raw(self) -> List[Dict[str, Any]]:
         """
-        GET /v1/fund-families/relations
+        GET /v1/fund-families-relations
         Fetches all fund family <-> funds relations maps (raw JSON).
         """
-        response = self._client.get("/v1/fund-families-relations")
-        return response.json()
+        response = self._fetch_fund_family_relations()
+        return decode_json(response, self._client)
 
     def get_fund_family_relations(self) -> List[FundFamilyRelationDto]:
         """
-        GET /v1/fund-families/relations
+        GET /v1/fund-families-relations
         Fetches all fund family <-> funds relations maps (typed models).
         """
-        data = self.get_fund_family_relations_raw()
-        return [FundFamilyRelationDto(**item) for item in data]
+        response = self._fetch_fund_family_relations()
+        return decode_models(response, FundFamilyRelationDto, self._client)
 
     def get_fund_family_relations_df(self) -> pd.DataFrame:
         """
-        GET /v1/fund-families/relations
+        GET /v1/fund-families-relations
         Fetches all fund family <-> funds relations maps (DataFrame).
         """
         data = self.get_fund_family_relations_raw()
-        return pd.DataFrame(data)
+        return build_frame(
+            data, FundFamilyRelationDto, self._client, "/v1/fund-families-relations"
+        )
+
+    def get_fund_family_relations_arrow(self) -> "pa.Table":
+        """
+        GET /v1/fund-families-relations
+        Fetches all fund family <-> funds relations maps (Arrow Table).
+        """
+        data = self.get_fund_family_relations_raw()
+        return build_table(
+            data, FundFamilyRelationDto, self._client, "/v1/fund-families-relations"
+        )
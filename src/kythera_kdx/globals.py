@@ -1,29 +1,41 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import CalendarDto, CountryDto, CurrencyDto, InstitutionDto, InstitutionTypeDto, IssuerDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class GlobalsClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_calendars(self) -> httpx.Response:
+        return self._client.get("/v1/globals/calendars")
+
     def get_calendars_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/globals/calendars
         Fetches all available calendars and returns raw JSON data.
         """
-        response = self._client.get("/v1/globals/calendars")
-        return response.json()
+        response = self._fetch_calendars()
+        return decode_json(response, self._client)
 
     def get_calendars(self) -> List[CalendarDto]:
         """
         GET /v1/globals/calendars
         Fetches all available calendars and returns typed models.
         """
-        data = self.get_calendars_raw()
-        return [CalendarDto(**item) for item in data]
+        response = self._fetch_calendars()
+        return decode_models(response, CalendarDto, self._client)
 
     def get_calendars_df(self) -> pd.DataFrame:
         """
@@ -31,23 +43,34 @@ class GlobalsClient:
         Fetches all available calendars and returns a pandas DataFrame.
         """
         data = self.get_calendars_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, CalendarDto, self._client, "/v1/globals/calendars")
+
+    def get_calendars_arrow(self) -> "pa.Table":
+        """
+        GET /v1/globals/calendars
+        Fetches all available calendars and returns a pyarrow Table.
+        """
+        data = self.get_calendars_raw()
+        return build_table(data, CalendarDto, self._client, "/v1/globals/calendars")
+
+    def _fetch_countries(self) -> httpx.Response:
+        return self._client.get("/v1/globals/countries")
 
     def get_countries_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/globals/countries
         Fetches all available countries and returns raw JSON data.
         """
-        response = self._client.get("/v1/globals/countries")
-        return response.json()
+        response = self._fetch_countries()
+        return decode_json(response, self._client)
 
     def get_countries(self) -> List[CountryDto]:
         """
         GET /v1/globals/countries
         Fetches all available countries and returns typed models.
         """
-        data = self.get_countries_raw()
-        return [CountryDto(**item) for item in data]
+        response = self._fetch_countries()
+        return decode_models(response, CountryDto, self._client)
 
     def get_countries_df(self) -> pd.DataFrame:
         """
@@ -55,23 +78,34 @@ class GlobalsClient:
         Fetches all available countries and returns a pandas DataFrame.
         """
         data = self.get_countries_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, CountryDto, self._client, "/v1/globals/countries")
+
+    def get_countries_arrow(self) -> "pa.Table":
+        """
+        GET /v1/globals/countries
+        Fetches all available countries and returns a pyarrow Table.
+        """
+        data = self.get_countries_raw()
+        return build_table(data, CountryDto, self._client, "/v1/globals/countries")
+
+    def _fetch_currencies(self) -> httpx.Response:
+        return self._client.get("/v1/globals/currencies")
 
     def get_currencies_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/globals/currencies
         Fetches all available currencies and returns raw JSON data.
         """
-        response = self._client.get("/v1/globals/currencies")
-        return response.json()
+        response = self._fetch_currencies()
+        return decode_json(response, self._client)
 
     def get_currencies(self) -> List[CurrencyDto]:
         """
         GET /v1/globals/currencies
         Fetches all available currencies and returns typed models.
         """
-        data = self.get_currencies_raw()
-        return [CurrencyDto(**item) for item in data]
+        response = self._fetch_currencies()
+        return decode_models(response, CurrencyDto, self._client)
 
     def get_currencies_df(self) -> pd.DataFrame:
         """
@@ -79,7 +113,26 @@ class GlobalsClient:
         Fetches all available currencies and returns a pandas DataFrame.
         """
         data = self.get_currencies_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, CurrencyDto, self._client, "/v1/globals/currencies")
+
+    def get_currencies_arrow(self) -> "pa.Table":
+        """
+        GET /v1/globals/currencies
+        Fetches all available currencies and returns a pyarrow Table.
+        """
+        data = self.get_currencies_raw()
+        return build_table(data, CurrencyDto, self._client, "/v1/globals/currencies")
+
+    def _fetch_institutions(
+        self,
+        fetch_characteristics: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> httpx.Response:
+        params = {
+            "fetchCharacteristics": fetch_characteristics,
+            "fetchNomenclatures": fetch_nomenclatures,
+        }
+        return self._client.get("/v1/globals/institutions", params=params)
 
     def get_institutions_raw(
         self,
@@ -90,12 +143,8 @@ class GlobalsClient:
         GET /v1/globals/institutions
         Fetches all available institutions and returns raw JSON data.
         """
-        params = {
-            "fetchCharacteristics": fetch_characteristics,
-            "fetchNomenclatures": fetch_nomenclatures,
-        }
-        response = self._client.get("/v1/globals/institutions", params=params)
-        return response.json()
+        response = self._fetch_institutions(fetch_characteristics, fetch_nomenclatures)
+        return decode_json(response, self._client)
 
     def get_institutions(
         self,
@@ -106,8 +155,8 @@ class GlobalsClient:
         GET /v1/globals/institutions
         Fetches all available institutions and returns typed models.
         """
-        data = self.get_institutions_raw(fetch_characteristics, fetch_nomenclatures)
-        return [InstitutionDto(**item) for item in data]
+        response = self._fetch_institutions(fetch_characteristics, fetch_nomenclatures)
+        return decode_models(response, InstitutionDto, self._client)
 
     def get_institutions_df(
         self,
@@ -119,23 +168,42 @@ class GlobalsClient:
         Fetches all available institutions and returns a pandas DataFrame.
         """
         data = self.get_institutions_raw(fetch_characteristics, fetch_nomenclatures)
-        return pd.DataFrame(data)
+        return build_frame(
+            data, InstitutionDto, self._client, "/v1/globals/institutions"
+        )
+
+    def get_institutions_arrow(
+        self,
+        fetch_characteristics: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> "pa.Table":
+        """
+        GET /v1/globals/institutions
+        Fetches all available institutions and returns a pyarrow Table.
+        """
+        data = self.get_institutions_raw(fetch_characteristics, fetch_nomenclatures)
+        return build_table(
+            data, InstitutionDto, self._client, "/v1/globals/institutions"
+        )
+
+    def _fetch_institution_types(self) -> httpx.Response:
+        return self._client.get("/v1/globals/institutions/types")
 
     def get_institution_types_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/globals/institutions/types
         Fetches all available institution types and returns raw JSON data.
         """
-        response = self._client.get("/v1/globals/institutions/types")
-        return response.json()
+        response = self._fetch_institution_types()
+        return decode_json(response, self._client)
 
     def get_institution_types(self) -> List[InstitutionTypeDto]:
         """
         GET /v1/globals/institutions/types
         Fetches all available institution types and returns typed models.
         """
-        data = self.get_institution_types_raw()
-        return [InstitutionTypeDto(**item) for item in data]
+        response = self._fetch_institution_types()
+        return decode_models(response, InstitutionTypeDto, self._client)
 
     def get_institution_types_df(self) -> pd.DataFrame:
         """
@@ -143,25 +211,40 @@ class GlobalsClient:
         Fetches all available institution types and returns a pandas DataFrame.
         """
         data = self.get_institution_types_raw()
-        return pd.DataFrame(data)
+        return build_frame(
+            data, InstitutionTypeDto, self._client, "/v1/globals/institutions/types"
+        )
+
+    def get_institution_types_arrow(self) -> "pa.Table":
+        """
+        GET /v1/globals/institutions/types
+        Fetches all available institution types and returns a pyarrow Table.
+        """
+        data = self.get_institution_types_raw()
+        return build_table(
+            data, InstitutionTypeDto, self._client, "/v1/globals/institutions/types"
+        )
 
     # Deprecated in v1.2: issuer endpoints moved from /v1/globals/* to /v1/issuers
+    def _fetch_issuers(self, fetch_characteristics: bool = False) -> httpx.Response:
+        params = {"fetchCharacteristics": fetch_characteristics}
+        return self._client.get("/v1/issuers", params=params)
+
     def get_issuers_raw(self, fetch_characteristics: bool = False) -> List[Dict[str, Any]]:
         """
         GET /v1/issuers (was /v1/globals/issuers)
         Fetches all available issuers and returns raw JSON data.
         """
-        params = {"fetchCharacteristics": fetch_characteristics}
-        response = self._client.get("/v1/issuers", params=params)
-        return response.json()
+        response = self._fetch_issuers(fetch_characteristics)
+        return decode_json(response, self._client)
 
     def get_issuers(self, fetch_characteristics: bool = False) -> List[IssuerDto]:
         """
         GET /v1/issuers (was /v1/globals/issuers)
         Fetches all available issuers and returns typed models.
         """
-        data = self.get_issuers_raw(fetch_characteristics)
-        return [IssuerDto(**item) for item in data]
+        response = self._fetch_issuers(fetch_characteristics)
+        return decode_models(response, IssuerDto, self._client)
 
     def get_issuers_df(self, fetch_characteristics: bool = False) -> pd.DataFrame:
         """
@@ -169,23 +252,34 @@ class GlobalsClient:
         Fetches all available issuers and returns a pandas DataFrame.
         """
         data = self.get_issuers_raw(fetch_characteristics)
-        return pd.DataFrame(data)
+        return build_frame(data, IssuerDto, self._client, "/v1/issuers")
+
+    def get_issuers_arrow(self, fetch_characteristics: bool = False) -> "pa.Table":
+        """
+        GET /v1/issuers (was /v1/globals/issuers)
+        Fetches all available issuers and returns a pyarrow Table.
+        """
+        data = self.get_issuers_raw(fetch_characteristics)
+        return build_table(data, IssuerDto, self._client, "/v1/issuers")
+
+    def _fetch_issuer_parameters(self) -> httpx.Response:
+        return self._client.get("/v1/issuers/parameters")
 
     def get_issuer_parameters_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/issuers/parameters
         Fetches all available issuer parameters and returns raw JSON data.
         """
-        response = self._client.get("/v1/issuers/parameters")
-        return response.json()
+        response = self._fetch_issuer_parameters()
+        return decode_json(response, self._client)
 
     def get_issuer_parameters(self) -> List[IssuerDto]:
         """
         GET /v1/issuers/parameters
         Fetches all available issuer parameters and returns typed models.
         """
-        data = self.get_issuer_parameters_raw()
-        return [IssuerDto(**item) for item in data]
+        response = self._fetch_issuer_parameters()
+        return decode_models(response, IssuerDto, self._client)
 
     def get_issuer_parameters_df(self) -> pd.DataFrame:
         """
@@ -193,4 +287,12 @@ class GlobalsClient:
         Fetches all available issuer parameters and returns a pandas DataFrame.
         """
         data = self.get_issuer_parameters_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, IssuerDto, self._client, "/v1/issuers/parameters")
+
+    def get_issuer_parameters_arrow(self) -> "pa.Table":
+        """
+        GET /v1/issuers/parameters
+        Fetches all available issuer parameters and returns a pyarrow Table.
+        """
+        data = self.get_issuer_parameters_raw()
+        return build_table(data, IssuerDto, self._client, "/v1/issuers/parameters")
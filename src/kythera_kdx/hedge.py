@@ -0,0 +1,247 @@
+"""
+Hedged GET requests for tail-latency-sensitive reads.
+
+When a GET has not completed after a delay (by default the observed latency
+percentile of its endpoint), HedgePolicy sends a second, identical request and
+returns whichever succeeds first. The extra load is capped by a budget: hedges
+never exceed a fixed fraction of the requests seen by the policy. Only GETs are
+hedged, since they are idempotent; each attempt goes through the client's full
+request path (retries, rate limiter, circuit breaker).
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    List,
+    Pattern,
+    Tuple,
+)
+
+import httpx
+
+from .rate_limit import compile_path_template
+
+
+def _close_response(future: "Future[httpx.Response]") -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+class HedgePolicy:
+    """
+    Configuration and state for hedging GET requests.
+
+    A policy can be shared by sync and async clients; its latency samples and
+    budget are then shared as well.
+
+    Example:
+        hedging = HedgePolicy(
+            percentile=0.9,
+            budget_ratio=0.05,
+            endpoints=["/v1/pnl/intraday", "/v1/intraday-risk-factor-values"],
+        )
+        kdx = KytheraKdx(hedge_policy=hedging)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        delay: Optional[float] = None,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        window_size: int = 200,
+        min_samples: int = 20,
+        budget_ratio: float = 0.05,
+        endpoints: Optional[List[str]] = None,
+        max_workers: int = 32,
+    ):
+        """
+        Args:
+            percentile: Latency percentile of an endpoint after which a hedge
+                is sent (e.g. 0.95 for the p95)
+            delay: Fixed hedging delay in seconds instead of the percentile
+            initial_delay: Delay used until an endpoint has min_samples latencies
+            min_delay: Lower bound for the percentile-based delay
+            window_size: Number of recent latencies kept per endpoint
+            min_samples: Latencies needed before the percentile is used
+            budget_ratio: Cap on hedges as a fraction of hedgeable requests
+            endpoints: Path templates (e.g. ``/v1/prices/{instrumentId}``) to
+                hedge; every GET is hedged when None
+            max_workers: Threads running the attempts of the sync client
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        if not 0 <= budget_ratio <= 1:
+            raise ValueError("budget_ratio must be in [0, 1]")
+        self.percentile = percentile
+        self.delay = delay
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.budget_ratio = budget_ratio
+        self.max_workers = max_workers
+        self._templates: Optional[List[Tuple[str, Pattern[str]]]] = (
+            None
+            if endpoints is None
+            else [(template, compile_path_template(template)) for template in endpoints]
+        )
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._budget_rejections = 0
+
+    def endpoint_key(self, method: str, path: str) -> Optional[str]:
+        """Template the request is hedged under, or None if it is not hedged."""
+        if method != "GET":
+            return None
+        path = path.split("?", 1)[0]
+        if self._templates is None:
+            return path
+        for template, pattern in self._templates:
+            if pattern.match(path):
+                return template
+        return None
+
+    def delay_for(self, key: str) -> float:
+        """Seconds to wait for the first attempt before sending a hedge."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        index = min(len(samples) - 1, int(self.percentile * len(samples)))
+        return max(self.min_delay, samples[index])
+
+    def _record_latency(self, key: str, seconds: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window_size)
+            latencies.append(seconds)
+
+    def _start(self) -> None:
+        with self._lock:
+            self._requests += 1
+
+    def _try_acquire_hedge(self) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self.budget_ratio * self._requests:
+                self._budget_rejections += 1
+                return False
+            self._hedges += 1
+            return True
+
+    def _record_hedge_win(self) -> None:
+        with self._lock:
+            self._hedge_wins += 1
+
+    def _timed(self, key: str, send: Callable[[], httpx.Response]) -> httpx.Response:
+        started = time.monotonic()
+        response = send()
+        self._record_latency(key, time.monotonic() - started)
+        return response
+
+    def _submit(self, key: str, send: Callable[[], httpx.Response]) -> "Future[httpx.Response]":
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="kythera-hedge"
+                )
+            executor = self._executor
+        # Run in a copy of the caller's context so that tracing spans nest
+        context = contextvars.copy_context()
+        return executor.submit(context.run, self._timed, key, send)
+
+    def run(self, key: str, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Run send(), hedging it with a second call if it is slow; the loser is closed."""
+        self._start()
+        primary = self._submit(key, send)
+        done, _ = wait([primary], timeout=self.delay_for(key))
+        if done or not self._try_acquire_hedge():
+            return primary.result()
+
+        hedge = self._submit(key, send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self._record_hedge_win()
+                    # Close the other response once that attempt is over
+                    loser = hedge if future is primary else primary
+                    loser.add_done_callback(_close_response)
+                    return future.result()
+        # Both attempts failed: report the original request's error
+        return primary.result()
+
+    async def _timed_async(
+        self, key: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        started = time.monotonic()
+        response = await send()
+        self._record_latency(key, time.monotonic() - started)
+        return response
+
+    async def run_async(
+        self, key: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Awaitable counterpart of run(); the losing attempt is cancelled."""
+        self._start()
+        primary = asyncio.ensure_future(self._timed_async(key, send))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay_for(key))
+            if done or not self._try_acquire_hedge():
+                return await primary
+
+            hedge = asyncio.ensure_future(self._timed_async(key, send))
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._record_hedge_win()
+                        return task.result()
+            return await primary
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging counters.
+
+        Returns:
+            Dictionary with hedgeable requests, hedges sent, hedges that
+            returned first, hedges refused by the budget, and the current
+            hedging delay of each endpoint
+        """
+        with self._lock:
+            keys = list(self._latencies)
+            stats: Dict[str, Any] = {
+                "requests": self._requests,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins,
+                "budget_rejections": self._budget_rejections,
+            }
+        stats["delays"] = {key: self.delay_for(key) for key in keys}
+        return stats
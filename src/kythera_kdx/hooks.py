@@ -0,0 +1,148 @@
+"""
+Request lifecycle event hooks for the Kythera clients.
+
+EventHooks holds callbacks that the clients call at each step of a request,
+each with a dictionary payload including timings in seconds. They are meant
+for sampling profilers, slow-call loggers or custom counters:
+
+- ``on_request_start``: an HTTP attempt is about to be sent. Keys: method,
+  endpoint, url, params, request (the httpx.Request)
+- ``on_response_headers``: the response headers arrived. Keys: method,
+  endpoint, request, status_code, headers, ttfb
+- ``on_response_complete``: the response body was read (or, for streamed
+  calls, the stream was closed). Keys: method, endpoint, request,
+  status_code, ttfb, download, elapsed, bytes
+- ``on_retry``: a failed attempt will be retried. Keys: method, endpoint,
+  retry (1 for the first retry), delay, reason (status code or exception
+  name), status_code, error
+- ``on_token_refresh``: an access token was acquired from MSAL. Keys:
+  force_refresh, background, elapsed, error (None on success)
+- ``on_decode_complete``: a response was converted. Keys: endpoint, kind
+  ("json", "models", "frame" or "table"), model, rows, elapsed
+
+Callbacks run synchronously on the thread (or event loop) making the request,
+so they should be quick; exceptions they raise are logged and ignored.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+EVENTS = (
+    "on_request_start",
+    "on_response_headers",
+    "on_response_complete",
+    "on_retry",
+    "on_token_refresh",
+    "on_decode_complete",
+)
+
+# Timings of a response, kept until a streamed body is closed
+TIMING_EXTENSION = "kythera_kdx.timing"
+
+Callback = Callable[[Dict[str, Any]], Any]
+Callbacks = Union[Callback, List[Callback], None]
+
+
+class EventHooks:
+    """
+    Callbacks for request lifecycle events.
+
+    Each event is a list attribute of the same name; the clients skip building
+    the payload of events without callbacks.
+
+    Example:
+        def log_slow(event):
+            if event["elapsed"] > 5:
+                logger.warning("%s took %.1fs", event["endpoint"], event["elapsed"])
+
+        hooks = EventHooks(on_response_complete=log_slow)
+        hooks.add("on_retry", lambda event: retries.inc())
+        kdx = KytheraKdx(event_hooks=hooks)
+    """
+
+    def __init__(
+        self,
+        on_request_start: Callbacks = None,
+        on_response_headers: Callbacks = None,
+        on_response_complete: Callbacks = None,
+        on_retry: Callbacks = None,
+        on_token_refresh: Callbacks = None,
+        on_decode_complete: Callbacks = None,
+    ):
+        """
+        Args:
+            on_request_start: Callback(s) for each HTTP attempt being sent
+            on_response_headers: Callback(s) for response headers received
+            on_response_complete: Callback(s) for response bodies read
+            on_retry: Callback(s) for attempts being retried
+            on_token_refresh: Callback(s) for tokens acquired from MSAL
+            on_decode_complete: Callback(s) for JSON decoding, model validation
+                and DataFrame/Arrow builds
+        """
+        self.on_request_start = _as_list(on_request_start)
+        self.on_response_headers = _as_list(on_response_headers)
+        self.on_response_complete = _as_list(on_response_complete)
+        self.on_retry = _as_list(on_retry)
+        self.on_token_refresh = _as_list(on_token_refresh)
+        self.on_decode_complete = _as_list(on_decode_complete)
+
+    def add(self, event: str, callback: Callback) -> None:
+        """
+        Register a callback.
+
+        Raises:
+            ValueError: When event is not one of EVENTS
+        """
+        if event not in EVENTS:
+            raise ValueError(f"Unknown event {event!r}; expected one of {list(EVENTS)}")
+        getattr(self, event).append(callback)
+
+    def remove(self, event: str, callback: Callback) -> None:
+        """Unregister a callback added for event."""
+        getattr(self, event).remove(callback)
+
+    def emit(self, event: str, payload: Dict[str, Any]) -> None:
+        """Call the callbacks of event with payload."""
+        for callback in getattr(self, event):
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception(f"Event hook for {event} failed")
+
+
+def _as_list(callbacks: Callbacks) -> List[Callback]:
+    if callbacks is None:
+        return []
+    if callable(callbacks):
+        return [callbacks]
+    return list(callbacks)
+
+
+def client_hooks(client: Any) -> Optional[EventHooks]:
+    """The event hooks of a client, or None when it has none."""
+    hooks = getattr(client, "event_hooks", None)
+    return hooks if isinstance(hooks, EventHooks) else None
+
+
+def emit_decode(
+    hooks: Optional[EventHooks],
+    endpoint: Optional[str],
+    kind: str,
+    model: Any,
+    rows: Optional[int],
+    elapsed: float,
+) -> None:
+    """Emit on_decode_complete when hooks has callbacks for it."""
+    if hooks is not None and hooks.on_decode_complete:
+        hooks.emit(
+            "on_decode_complete",
+            {
+                "endpoint": endpoint,
+                "kind": kind,
+                "model": model,
+                "rows": rows,
+                "elapsed": elapsed,
+            },
+        )
@@ -1,29 +1,41 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import httpx
 import pandas as pd
 from datetime import date
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import IndexDto, IndexValueDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class IndexesClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_indexes(self, include_characteristics: bool = False) -> httpx.Response:
+        params = {"include-characteristics": include_characteristics}
+        return self._client.get("/v1/indexes", params=params)
+
     def get_indexes_raw(self, include_characteristics: bool = False) -> List[Dict[str, Any]]:
         """
         GET /v1/indexes
         Fetches all indexes (raw JSON).
         """
-        params = {"include-characteristics": include_characteristics}
-        response = self._client.get("/v1/indexes", params=params)
-        return response.json()
+        response = self._fetch_indexes(include_characteristics)
+        return decode_json(response, self._client)
 
     def get_indexes(self, include_characteristics: bool = False) -> List[IndexDto]:
         """
         GET /v1/indexes
         Fetches all indexes (typed models).
         """
-        data = self.get_indexes_raw(include_characteristics)
-        return [IndexDto(**item) for item in data]
+        response = self._fetch_indexes(include_characteristics)
+        return decode_models(response, IndexDto, self._client)
 
     def get_indexes_df(self, include_characteristics: bool = False) -> pd.DataFrame:
         """
@@ -31,18 +43,22 @@ class IndexesClient:
         Fetches all indexes (DataFrame).
         """
         data = self.get_indexes_raw(include_characteristics)
-        return pd.DataFrame(data)
+        return build_frame(data, IndexDto, self._client, "/v1/indexes")
 
-    def get_index_values_raw(
+    def get_indexes_arrow(self, include_characteristics: bool = False) -> "pa.Table":
+        """
+        GET /v1/indexes
+        Fetches all indexes (Arrow Table).
+        """
+        data = self.get_indexes_raw(include_characteristics)
+        return build_table(data, IndexDto, self._client, "/v1/indexes")
+
+    def _fetch_index_values(
         self,
         session_date: Optional[date] = None,
         from_date: Optional[date] = None,
         to_date: Optional[date] = None,
-    ) -> List[Dict[str, Any]]:
-        """
-        GET /v1/indexes/values
-        Fetches index values by session-date or from-date/to-date (raw JSON).
-        """
+    ) -> httpx.Response:
         params: Dict[str, Any] = {}
         if session_date:
             params["session-date"] = session_date.isoformat()
@@ -50,8 +66,20 @@ class IndexesClient:
             params["from-date"] = from_date.isoformat()
         if to_date:
             params["to-date"] = to_date.isoformat()
-        response = self._client.get("/v1/indexes/values", params=params)
-        return response.json()
+        return self._client.get("/v1/indexes/values", params=params)
+
+    def get_index_values_raw(
+        self,
+        session_date: Optional[date] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/indexes/values
+        Fetches index values by session-date or from-date/to-date (raw JSON).
+        """
+        response = self._fetch_index_values(session_date, from_date, to_date)
+        return decode_json(response, self._client)
 
     def get_index_values(
         self,
@@ -59,8 +87,8 @@ class IndexesClient:
         from_date: Optional[date] = None,
         to_date: Optional[date] = None,
     ) -> List[IndexValueDto]:
-        data = self.get_index_values_raw(session_date, from_date, to_date)
-        return [IndexValueDto(**item) for item in data]
+        response = self._fetch_index_values(session_date, from_date, to_date)
+        return decode_models(response, IndexValueDto, self._client)
 
     def get_index_values_df(
         self,
@@ -69,4 +97,13 @@ class IndexesClient:
         to_date: Optional[date] = None,
     ) -> pd.DataFrame:
         data = self.get_index_values_raw(session_date, from_date, to_date)
-        return pd.DataFrame(data)
+        return build_frame(data, IndexValueDto, self._client, "/v1/indexes/values")
+
+    def get_index_values_arrow(
+        self,
+        session_date: Optional[date] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> "pa.Table":
+        data = self.get_index_values_raw(session_date, from_date, to_date)
+        return build_table(data, IndexValueDto, self._client, "/v1/indexes/values")
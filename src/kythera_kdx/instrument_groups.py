@@ -1,14 +1,34 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import InstrumentGroupDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class InstrumentGroupsClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_instrument_groups(
+        self,
+        fetch_characteristics: bool = True,
+        fetch_nomenclatures: bool = True,
+    ) -> httpx.Response:
+        params = {
+            "fetchCharacteristics": fetch_characteristics,
+            "fetchNomenclatures": fetch_nomenclatures,
+        }
+        return self._client.get("/v1/instrument-groups", params=params)
+
     def get_instrument_groups_raw(
         self,
         fetch_characteristics: bool = True,
@@ -18,12 +38,8 @@ class InstrumentGroupsClient:
         GET /v1/instrument-groups
         Fetches all available instrument groups and returns raw JSON data.
         """
-        params = {
-            "fetchCharacteristics": fetch_characteristics,
-            "fetchNomenclatures": fetch_nomenclatures,
-        }
-        response = self._client.get("/v1/instrument-groups", params=params)
-        return response.json()
+        response = self._fetch_instrument_groups(fetch_characteristics, fetch_nomenclatures)
+        return decode_json(response, self._client)
 
     def get_instrument_groups(
         self,
@@ -34,8 +50,8 @@ class InstrumentGroupsClient:
         GET /v1/instrument-groups
         Fetches all available instrument groups and returns typed models.
         """
-        data = self.get_instrument_groups_raw(fetch_characteristics, fetch_nomenclatures)
-        return [InstrumentGroupDto(**item) for item in data]
+        response = self._fetch_instrument_groups(fetch_characteristics, fetch_nomenclatures)
+        return decode_models(response, InstrumentGroupDto, self._client)
 
     def get_instrument_groups_df(
         self,
@@ -47,4 +63,20 @@ class InstrumentGroupsClient:
         Fetches all available instrument groups and returns a pandas DataFrame.
         """
         data = self.get_instrument_groups_raw(fetch_characteristics, fetch_nomenclatures)
-        return pd.DataFrame(data)
+        return build_frame(
+            data, InstrumentGroupDto, self._client, "/v1/instrument-groups"
+        )
+
+    def get_instrument_groups_arrow(
+        self,
+        fetch_characteristics: bool = True,
+        fetch_nomenclatures: bool = True,
+    ) -> "pa.Table":
+        """
+        GET /v1/instrument-groups
+        Fetches all available instrument groups and returns a pyarrow Table.
+        """
+        data = self.get_instrument_groups_raw(fetch_characteristics, fetch_nomenclatures)
+        return build_table(
+            data, InstrumentGroupDto, self._client, "/v1/instrument-groups"
+        )
@@ -1,29 +1,41 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import InstrumentParameterDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class InstrumentParametersClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_instrument_parameters(self) -> httpx.Response:
+        return self._client.get("/v1/instruments/parameters")
+
     def get_instrument_parameters_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/instruments/parameters
         Fetches all available instrument parameters used in characteristics and returns raw JSON data.
         """
-        response = self._client.get("/v1/instruments/parameters")
-        return response.json()
+        response = self._fetch_instrument_parameters()
+        return decode_json(response, self._client)
 
     def get_instrument_parameters(self) -> List[InstrumentParameterDto]:
         """
         GET /v1/instruments/parameters
         Fetches all available instrument parameters used in characteristics and returns typed models.
         """
-        data = self.get_instrument_parameters_raw()
-        return [InstrumentParameterDto(**item) for item in data]
+        response = self._fetch_instrument_parameters()
+        return decode_models(response, InstrumentParameterDto, self._client)
 
     def get_instrument_parameters_df(self) -> pd.DataFrame:
         """
@@ -31,4 +43,16 @@ class InstrumentParametersClient:
         Fetches all available instrument parameters used in characteristics and returns a pandas DataFrame.
         """
         data = self.get_instrument_parameters_raw()
-        return pd.DataFrame(data)
+        return build_frame(
+            data, InstrumentParameterDto, self._client, "/v1/instruments/parameters"
+        )
+
+    def get_instrument_parameters_arrow(self) -> "pa.Table":
+        """
+        GET /v1/instruments/parameters
+        Fetches all available instrument parameters used in characteristics and returns a pyarrow Table.
+        """
+        data = self.get_instrument_parameters_raw()
+        return build_table(
+            data, InstrumentParameterDto, self._client, "/v1/instruments/parameters"
+        )
@@ -1,18 +1,28 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models, model_factory
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import InstrumentDto, InstrumentEventDto
+from .streaming import iter_json_array
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
+
+@traced
 class InstrumentsClient:
     """Client for instrument-related endpoints."""
     
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
-    def get_instruments_raw(
+    def _fetch_instruments(
         self,
         enabled_only: bool = True,
         fetch_characteristics: bool = True,
@@ -20,11 +30,7 @@ class InstrumentsClient:
         fetch_issuers: bool = False,
         fetch_cash_flows: bool = False,
         fetch_nomenclatures: bool = False,
-    ) -> List[Dict[str, Any]]:
-        """
-        GET /v1/instruments
-        Fetches all available instruments and returns raw JSON data.
-        """
+    ) -> httpx.Response:
         params = {
             "enabled-only": enabled_only,
             "fetch-characteristics": fetch_characteristics,
@@ -33,8 +39,23 @@ class InstrumentsClient:
             "fetch-cash-flows": fetch_cash_flows,
             "fetch-nomenclatures": fetch_nomenclatures,
         }
-        response = self._client.get("/v1/instruments", params=params)
-        return response.json()
+        return self._client.get("/v1/instruments", params=params)
+
+    def get_instruments_raw(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/instruments
+        Fetches all available instruments and returns raw JSON data.
+        """
+        response = self._fetch_instruments(enabled_only, fetch_characteristics, fetch_baskets, fetch_issuers, fetch_cash_flows, fetch_nomenclatures)
+        return decode_json(response, self._client)
 
     def get_instruments(
         self,
@@ -49,7 +70,7 @@ class InstrumentsClient:
         GET /v1/instruments
         Fetches all available instruments and returns typed models.
         """
-        data = self.get_instruments_raw(
+        response = self._fetch_instruments(
             enabled_only,
             fetch_characteristics,
             fetch_baskets,
@@ -57,7 +78,7 @@ class InstrumentsClient:
             fetch_cash_flows,
             fetch_nomenclatures,
         )
-        return [InstrumentDto(**item) for item in data]
+        return decode_models(response, InstrumentDto, self._client)
 
     def get_instruments_df(
         self,
@@ -80,7 +101,79 @@ class InstrumentsClient:
             fetch_cash_flows,
             fetch_nomenclatures,
         )
-        return pd.DataFrame(data)
+        return build_frame(data, InstrumentDto, self._client, "/v1/instruments")
+
+    def get_instruments_arrow(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> "pa.Table":
+        """
+        GET /v1/instruments
+        Fetches all available instruments and returns a pyarrow Table.
+        """
+        data = self.get_instruments_raw(
+            enabled_only,
+            fetch_characteristics,
+            fetch_baskets,
+            fetch_issuers,
+            fetch_cash_flows,
+            fetch_nomenclatures,
+        )
+        return build_table(data, InstrumentDto, self._client, "/v1/instruments")
+
+    def iter_instruments_raw(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        GET /v1/instruments
+        Streams instruments as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params = {
+            "enabled-only": enabled_only,
+            "fetch-characteristics": fetch_characteristics,
+            "fetch-baskets": fetch_baskets,
+            "fetch-issuers": fetch_issuers,
+            "fetch-cash-flows": fetch_cash_flows,
+            "fetch-nomenclatures": fetch_nomenclatures,
+        }
+        with self._client.stream("GET", "/v1/instruments", params=params) as response:
+            yield from iter_json_array(response.iter_bytes())
+
+    def iter_instruments(
+        self,
+        enabled_only: bool = True,
+        fetch_characteristics: bool = True,
+        fetch_baskets: bool = False,
+        fetch_issuers: bool = False,
+        fetch_cash_flows: bool = False,
+        fetch_nomenclatures: bool = False,
+    ) -> Iterator[InstrumentDto]:
+        """
+        GET /v1/instruments
+        Streams instruments as typed models.
+        """
+        build = model_factory(InstrumentDto, self._client)
+        for item in self.iter_instruments_raw(
+            enabled_only,
+            fetch_characteristics,
+            fetch_baskets,
+            fetch_issuers,
+            fetch_cash_flows,
+            fetch_nomenclatures,
+        ):
+            yield build(item)
 
     def create_instruments(self, instruments_data: List[Dict[str, Any]]) -> None:
         """
@@ -91,22 +184,25 @@ class InstrumentsClient:
         response = self._client.post("/v1/instruments", data=body)  # type: ignore
         response.raise_for_status()
 
+    def _fetch_instrument_events(self, event_date) -> httpx.Response:
+        params = {"event-date": event_date.isoformat()}
+        return self._client.get("/v1/instruments/events", params=params)
+
     def get_instrument_events_raw(self, event_date) -> List[Dict[str, Any]]:
         """
         GET /v1/instruments/events
         Fetches instrument events by date (raw JSON).
         """
-        params = {"event-date": event_date.isoformat()}
-        response = self._client.get("/v1/instruments/events", params=params)
-        return response.json()
+        response = self._fetch_instrument_events(event_date)
+        return decode_json(response, self._client)
 
     def get_instrument_events(self, event_date) -> List[InstrumentEventDto]:
         """
         GET /v1/instruments/events
         Fetches instrument events by date (typed models).
         """
-        data = self.get_instrument_events_raw(event_date)
-        return [InstrumentEventDto(**item) for item in data]
+        response = self._fetch_instrument_events(event_date)
+        return decode_models(response, InstrumentEventDto, self._client)
 
     def get_instrument_events_df(self, event_date) -> pd.DataFrame:
         """
@@ -114,4 +210,16 @@ class InstrumentsClient:
         Fetches instrument events by date (DataFrame).
         """
         data = self.get_instrument_events_raw(event_date)
-        return pd.DataFrame(data)
+        return build_frame(
+            data, InstrumentEventDto, self._client, "/v1/instruments/events"
+        )
+
+    def get_instrument_events_arrow(self, event_date) -> "pa.Table":
+        """
+        GET /v1/instruments/events
+        Fetches instrument events by date (Arrow Table).
+        """
+        data = self.get_instrument_events_raw(event_date)
+        return build_table(
+            data, InstrumentEventDto, self._client, "/v1/instruments/events"
+        )
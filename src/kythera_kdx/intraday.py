@@ -1,30 +1,42 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
+import httpx
 import pandas as pd
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import IntradayPriceDto, IntradayRiskFactorValueDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
+
+@traced
 class IntradayClient:
     """Client for intraday data endpoints."""
     
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_intraday_prices(self) -> httpx.Response:
+        return self._client.get("/v1/intraday-prices")
+
     def get_intraday_prices_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/intraday-prices
         Fetches all current instrument prices and returns raw JSON data.
         """
-        response = self._client.get("/v1/intraday-prices")
-        return response.json()
+        response = self._fetch_intraday_prices()
+        return decode_json(response, self._client)
 
     def get_intraday_prices(self) -> List[IntradayPriceDto]:
         """
         GET /v1/intraday-prices
         Fetches all current instrument prices and returns typed models.
         """
-        data = self.get_intraday_prices_raw()
-        return [IntradayPriceDto(**item) for item in data]
+        response = self._fetch_intraday_prices()
+        return decode_models(response, IntradayPriceDto, self._client)
 
     def get_intraday_prices_df(self) -> pd.DataFrame:
         """
@@ -32,23 +44,34 @@ class IntradayClient:
         Fetches all current instrument prices and returns as pandas DataFrame.
         """
         data = self.get_intraday_prices_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, IntradayPriceDto, self._client, "/v1/intraday-prices")
+
+    def get_intraday_prices_arrow(self) -> "pa.Table":
+        """
+        GET /v1/intraday-prices
+        Fetches all current instrument prices and returns as pyarrow Table.
+        """
+        data = self.get_intraday_prices_raw()
+        return build_table(data, IntradayPriceDto, self._client, "/v1/intraday-prices")
+
+    def _fetch_intraday_risk_factor_values(self) -> httpx.Response:
+        return self._client.get("/v1/intraday-risk-factor-values")
 
     def get_intraday_risk_factor_values_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/intraday-risk-factor-values
         Fetches current risk factor values and returns raw JSON data.
         """
-        response = self._client.get("/v1/intraday-risk-factor-values")
-        return response.json()
+        response = self._fetch_intraday_risk_factor_values()
+        return decode_json(response, self._client)
 
     def get_intraday_risk_factor_values(self) -> List[IntradayRiskFactorValueDto]:
         """
         GET /v1/intraday-risk-factor-values
         Fetches current risk factor values and returns typed models.
         """
-        data = self.get_intraday_risk_factor_values_raw()
-        return [IntradayRiskFactorValueDto(**item) for item in data]
+        response = self._fetch_intraday_risk_factor_values()
+        return decode_models(response, IntradayRiskFactorValueDto, self._client)
 
     def get_intraday_risk_factor_values_df(self) -> pd.DataFrame:
         """
@@ -56,4 +79,22 @@ class IntradayClient:
         Fetches current risk factor values and returns as pandas DataFrame.
         """
         data = self.get_intraday_risk_factor_values_raw()
-        return pd.DataFrame(data)
+        return build_frame(
+            data,
+            IntradayRiskFactorValueDto,
+            self._client,
+            "/v1/intraday-risk-factor-values",
+        )
+
+    def get_intraday_risk_factor_values_arrow(self) -> "pa.Table":
+        """
+        GET /v1/intraday-risk-factor-values
+        Fetches current risk factor values and returns as pyarrow Table.
+        """
+        data = self.get_intraday_risk_factor_values_raw()
+        return build_table(
+            data,
+            IntradayRiskFactorValueDto,
+            self._client,
+            "/v1/intraday-risk-factor-values",
+        )
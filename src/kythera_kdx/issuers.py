@@ -1,30 +1,42 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import IssuerDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
+
+@traced
 class IssuersClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_issuers(self, fetch_characteristics: bool = False) -> httpx.Response:
+        params = {"fetchCharacteristics": fetch_characteristics}
+        return self._client.get("/v1/issuers", params=params)
+
     def get_issuers_raw(self, fetch_characteristics: bool = False) -> List[Dict[str, Any]]:
         """
         GET /v1/issuers
         Fetches all available issuers and returns raw JSON data.
         """
-        params = {"fetchCharacteristics": fetch_characteristics}
-        response = self._client.get("/v1/issuers", params=params)
-        return response.json()
+        response = self._fetch_issuers(fetch_characteristics)
+        return decode_json(response, self._client)
 
     def get_issuers(self, fetch_characteristics: bool = False) -> List[IssuerDto]:
         """
         GET /v1/issuers
         Fetches all available issuers and returns typed models.
         """
-        data = self.get_issuers_raw(fetch_characteristics)
-        return [IssuerDto(**item) for item in data]
+        response = self._fetch_issuers(fetch_characteristics)
+        return decode_models(response, IssuerDto, self._client)
 
     def get_issuers_df(self, fetch_characteristics: bool = False) -> pd.DataFrame:
         """
@@ -32,23 +44,34 @@ class IssuersClient:
         Fetches all available issuers and returns a pandas DataFrame.
         """
         data = self.get_issuers_raw(fetch_characteristics)
-        return pd.DataFrame(data)
+        return build_frame(data, IssuerDto, self._client, "/v1/issuers")
+
+    def get_issuers_arrow(self, fetch_characteristics: bool = False) -> "pa.Table":
+        """
+        GET /v1/issuers
+        Fetches all available issuers and returns a pyarrow Table.
+        """
+        data = self.get_issuers_raw(fetch_characteristics)
+        return build_table(data, IssuerDto, self._client, "/v1/issuers")
+
+    def _fetch_issuer_parameters(self) -> httpx.Response:
+        return self._client.get("/v1/issuers/parameters")
 
     def get_issuer_parameters_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/issuers/parameters
         Fetches all available issuer parameters and returns raw JSON data.
         """
-        response = self._client.get("/v1/issuers/parameters")
-        return response.json()
+        response = self._fetch_issuer_parameters()
+        return decode_json(response, self._client)
 
     def get_issuer_parameters(self) -> List[IssuerDto]:
         """
         GET /v1/issuers/parameters
         Fetches all available issuer parameters and returns typed models.
         """
-        data = self.get_issuer_parameters_raw()
-        return [IssuerDto(**item) for item in data]
+        response = self._fetch_issuer_parameters()
+        return decode_models(response, IssuerDto, self._client)
 
     def get_issuer_parameters_df(self) -> pd.DataFrame:
         """
@@ -56,4 +79,12 @@ class IssuersClient:
         Fetches all available issuer parameters and returns a pandas DataFrame.
         """
         data = self.get_issuer_parameters_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, IssuerDto, self._client, "/v1/issuers/parameters")
+
+    def get_issuer_parameters_arrow(self) -> "pa.Table":
+        """
+        GET /v1/issuers/parameters
+        Fetches all available issuer parameters and returns a pyarrow Table.
+        """
+        data = self.get_issuer_parameters_raw()
+        return build_table(data, IssuerDto, self._client, "/v1/issuers/parameters")
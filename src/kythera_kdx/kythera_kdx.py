@@ -5,9 +5,21 @@ This module provides a unified client that inherits from AuthenticatedClient
 and provides convenient access to all specialized client modules through properties.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Union
+
+import httpx
 
 from .authenticated_client import AuthenticatedClient
+from .codec import JsonCodec
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .hooks import EventHooks
+from .tracing import Tracer
+from .metrics import ClientMetrics
+from .hedge import HedgePolicy
+from .circuit_breaker import CircuitBreaker
+from .cache import ResponseCache
+from .disk_cache import DiskCache
 from .addin import AddInClient
 from .funds import FundsClient
 from .globals import GlobalsClient
@@ -62,9 +74,26 @@ class KytheraKdx(AuthenticatedClient):
         tenant_id: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
-        timeout: int = 30,
+        timeout: Union[int, float, httpx.Timeout] = 30,
         scopes: Optional[List[str]] = None,
         x_api_key: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.Client] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        validate: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Union[ClientMetrics, bool] = True,
+        tracer: Optional[Tracer] = None,
+        event_hooks: Optional[EventHooks] = None,
+        access_token: Optional[str] = None,
     ):
         """
         Initialize the unified Kythera client.
@@ -74,8 +103,25 @@ class KytheraKdx(AuthenticatedClient):
             tenant_id: Azure AD tenant ID
             client_id: Azure AD application client ID
             client_secret: Azure AD application client secret (for service principal auth)
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds, or an httpx.Timeout
             scopes: List of OAuth scopes to request
+            limits: Connection pool limits (httpx.Limits)
+            http2: Enable HTTP/2 multiplexing (requires the ``http2`` extra)
+            http_client: Shared httpx client whose connections are reused
+            transport: Custom httpx transport for the client created here
+            retry_policy: Retry policy for transient failures
+            rate_limiter: Client-side rate limiter, shareable across clients
+            json_codec: JSON backend name or JsonCodec; auto-detected when omitted
+            validate: Set to False to skip pydantic validation of typed results
+            response_cache: ResponseCache for GET responses; disabled when omitted
+            disk_cache: DiskCache for closed historical dates; disabled when omitted
+            coalesce_requests: Share one call between concurrent identical GETs
+            circuit_breaker: CircuitBreaker failing fast on degraded endpoints; disabled when omitted
+            hedge_policy: HedgePolicy for tail-latency-sensitive GETs; disabled when omitted
+            metrics: Per-endpoint metrics (True, False or a shared ClientMetrics)
+            tracer: Tracer for call, HTTP and conversion spans; no-op when omitted
+            event_hooks: EventHooks for request lifecycle callbacks; none when omitted
+            access_token: Static bearer token used instead of Azure AD
         """
         super().__init__(
             base_url=base_url,
@@ -85,6 +131,23 @@ class KytheraKdx(AuthenticatedClient):
             timeout=timeout,
             scopes=scopes,
             x_api_key=x_api_key,
+            limits=limits,
+            http2=http2,
+            http_client=http_client,
+            transport=transport,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            validate=validate,
+            response_cache=response_cache,
+            disk_cache=disk_cache,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            hedge_policy=hedge_policy,
+            metrics=metrics,
+            tracer=tracer,
+            event_hooks=event_hooks,
+            access_token=access_token,
         )
 
         # Initialize all client modules lazily
@@ -0,0 +1,304 @@
+"""
+Per-endpoint request and conversion metrics for the Kythera clients.
+
+ClientMetrics keeps histograms, per endpoint path template, of where the time
+of a call goes: time to the response headers, body download, JSON decode,
+model validation and DataFrame/Arrow construction, plus response sizes and
+row counts. The clients record into ``client.metrics``; ``snapshot()`` returns
+the current values and prometheus_text() renders them in the Prometheus text
+exposition format.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, List, Pattern, Sequence, Tuple
+
+import httpx
+
+from .rate_limit import compile_path_template
+
+SECONDS_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+BYTES_BUCKETS: Tuple[float, ...] = tuple(float(1024 * 4**i) for i in range(10))
+ROWS_BUCKETS: Tuple[float, ...] = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+METRICS: Dict[str, Tuple[str, Tuple[float, ...]]] = {
+    "ttfb_seconds": ("Time from sending a request to its headers", SECONDS_BUCKETS),
+    "download_seconds": ("Time reading a response body", SECONDS_BUCKETS),
+    "response_bytes": ("Size of a response body", BYTES_BUCKETS),
+    "decode_seconds": ("Time decoding a JSON response body", SECONDS_BUCKETS),
+    "validation_seconds": ("Time building typed models", SECONDS_BUCKETS),
+    "frame_seconds": ("Time building a pandas DataFrame", SECONDS_BUCKETS),
+    "table_seconds": ("Time building a pyarrow Table", SECONDS_BUCKETS),
+    "rows": ("Records in a decoded response", ROWS_BUCKETS),
+}
+
+# Paths with parameters, reported under their template; listed before any
+# template they would also match
+DEFAULT_ENDPOINTS: List[str] = [
+    "/v1/prices/price-types",
+    "/v1/prices/{instrumentId}",
+]
+
+# Endpoint a response was requested from, set by the clients
+ENDPOINT_EXTENSION = "kythera_kdx.endpoint"
+
+
+class Histogram:
+    """Bucketed distribution of observed values (not thread-safe)."""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = []
+        total = 0
+        for count in self.counts[:-1]:
+            total += count
+            cumulative.append(total)
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(self.bounds, cumulative)),
+        }
+
+
+class _EndpointMetrics:
+    __slots__ = ("histograms", "statuses")
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, Histogram] = {}
+        self.statuses: Dict[int, int] = {}
+
+
+class ClientMetrics:
+    """
+    Thread-safe per-endpoint metrics of one or more clients.
+
+    Example:
+        kdx = KytheraKdx()
+        kdx.trades.get_trades_df()
+        kdx.metrics.snapshot()["/v1/trades"]["decode_seconds"]["p95"]
+        print(prometheus_text(kdx.metrics))
+    """
+
+    def __init__(self, endpoints: Optional[List[str]] = None):
+        """
+        Args:
+            endpoints: Path templates grouping concrete paths (e.g.
+                ``/v1/prices/{instrumentId}``); DEFAULT_ENDPOINTS when omitted
+        """
+        self._templates: List[Tuple[str, Pattern[str]]] = [
+            (template, compile_path_template(template))
+            for template in (DEFAULT_ENDPOINTS if endpoints is None else endpoints)
+        ]
+        self._endpoints: Dict[str, _EndpointMetrics] = {}
+        self._keys: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def endpoint_key(self, path: str) -> str:
+        """Template the path is reported under, or the path itself."""
+        key = self._keys.get(path)
+        if key is None:
+            key = path.split("?", 1)[0]
+            for template, pattern in self._templates:
+                if pattern.match(key):
+                    key = template
+                    break
+            if len(self._keys) < 10_000:
+                self._keys[path] = key
+        return key
+
+    def _endpoint(self, path: str) -> _EndpointMetrics:
+        key = self.endpoint_key(path)
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = _EndpointMetrics()
+        return endpoint
+
+    def _observe(self, endpoint: _EndpointMetrics, name: str, value: float) -> None:
+        histogram = endpoint.histograms.get(name)
+        if histogram is None:
+            histogram = endpoint.histograms[name] = Histogram(METRICS[name][1])
+        histogram.observe(value)
+
+    def observe(self, path: str, name: str, value: float) -> None:
+        """
+        Record a value.
+
+        Args:
+            path: Endpoint path or template
+            name: One of the METRICS names, e.g. ``decode_seconds``
+            value: Observed value
+        """
+        with self._lock:
+            self._observe(self._endpoint(path), name, value)
+
+    def observe_response(
+        self,
+        path: str,
+        status_code: int,
+        ttfb: float,
+        download: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        """Record one HTTP attempt; download time and size are None for streamed bodies."""
+        with self._lock:
+            endpoint = self._endpoint(path)
+            endpoint.statuses[status_code] = endpoint.statuses.get(status_code, 0) + 1
+            self._observe(endpoint, "ttfb_seconds", ttfb)
+            if download is not None:
+                self._observe(endpoint, "download_seconds", download)
+            if size is not None:
+                self._observe(endpoint, "response_bytes", size)
+
+    @contextmanager
+    def timer(self, path: str, name: str) -> Iterator[None]:
+        """Record the duration of the block as ``name`` when it does not raise."""
+        started = time.perf_counter()
+        yield
+        self.observe(path, name, time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current metrics.
+
+        Returns:
+            Dictionary keyed by endpoint with the number of responses per status
+            code under ``requests`` and, for each recorded metric, its count,
+            sum, mean, max, estimated p50/p95/p99 and cumulative bucket counts
+        """
+        with self._lock:
+            return {
+                key: {
+                    "requests": dict(endpoint.statuses),
+                    **{
+                        name: histogram.snapshot()
+                        for name, histogram in endpoint.histograms.items()
+                    },
+                }
+                for key, endpoint in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def _export(self) -> List[Tuple[str, Dict[int, int], Dict[str, Histogram]]]:
+        """Copy of the raw state, for prometheus_text()."""
+        with self._lock:
+            result = []
+            for key, endpoint in sorted(self._endpoints.items()):
+                histograms = {}
+                for name, histogram in endpoint.histograms.items():
+                    copy = Histogram(histogram.bounds)
+                    copy.counts = list(histogram.counts)
+                    copy.count = histogram.count
+                    copy.sum = histogram.sum
+                    copy.max = histogram.max
+                    histograms[name] = copy
+                result.append((key, dict(endpoint.statuses), histograms))
+            return result
+
+
+def client_metrics(client: Any) -> Optional[ClientMetrics]:
+    """The metrics of a client, or None when it does not collect any."""
+    metrics = getattr(client, "metrics", None)
+    return metrics if isinstance(metrics, ClientMetrics) else None
+
+
+def response_endpoint(response: httpx.Response) -> Optional[str]:
+    """Endpoint a client response was requested from."""
+    return response.extensions.get(ENDPOINT_EXTENSION)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def prometheus_text(metrics: ClientMetrics, prefix: str = "kythera_kdx") -> str:
+    """
+    Render metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: Metrics to render, e.g. ``kdx.metrics``
+        prefix: Prefix of every metric name
+
+    Returns:
+        Text with a ``<prefix>_requests_total`` counter by endpoint and status
+        and one histogram per metric by endpoint
+    """
+    exported = metrics._export()
+    lines = [
+        f"# HELP {prefix}_requests_total HTTP responses received",
+        f"# TYPE {prefix}_requests_total counter",
+    ]
+    for key, statuses, _ in exported:
+        for status, count in sorted(statuses.items()):
+            labels = f'endpoint="{_label(key)}",status="{status}"'
+            lines.append(f"{prefix}_requests_total{{{labels}}} {count}")
+
+    for name, (description, _) in METRICS.items():
+        series = [
+            (key, histograms[name])
+            for key, _, histograms in exported
+            if name in histograms
+        ]
+        if not series:
+            continue
+        metric = f"{prefix}_{name}"
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} histogram")
+        for key, histogram in series:
+            endpoint = f'endpoint="{_label(key)}"'
+            total = 0
+            for bound, count in zip(histogram.bounds, histogram.counts):
+                total += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{metric}_bucket{{{endpoint},{le}}} {total}")
+            lines.append(f'{metric}_bucket{{{endpoint},le="+Inf"}} {histogram.count}')
+            lines.append(f"{metric}_sum{{{endpoint}}} {_number(histogram.sum)}")
+            lines.append(f"{metric}_count{{{endpoint}}} {histogram.count}")
+    return "\n".join(lines) + "\n"
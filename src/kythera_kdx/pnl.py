@@ -1,32 +1,45 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models, model_factory
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import IntradayPnlEntryDto, PnlExplainDto
+from .streaming import iter_json_array
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
+
+@traced
 class PnlClient:
     """Client for PnL (Profit and Loss) related endpoints."""
     
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_intraday_pnl(self) -> httpx.Response:
+        return self._client.get("/v1/pnl/intraday")
+
     def get_intraday_pnl_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/pnl/intraday
         Fetches current intraday PnL and returns raw JSON data.
         """
-        response = self._client.get("/v1/pnl/intraday")
-        return response.json()
+        response = self._fetch_intraday_pnl()
+        return decode_json(response, self._client)
 
     def get_intraday_pnl(self) -> List[IntradayPnlEntryDto]:
         """
         GET /v1/pnl/intraday
         Fetches current intraday PnL and returns typed models.
         """
-        data = self.get_intraday_pnl_raw()
-        return [IntradayPnlEntryDto(**item) for item in data]
+        response = self._fetch_intraday_pnl()
+        return decode_models(response, IntradayPnlEntryDto, self._client)
 
     def get_intraday_pnl_df(self) -> pd.DataFrame:
         """
@@ -34,13 +47,35 @@ class PnlClient:
         Fetches current intraday PnL and returns a pandas DataFrame.
         """
         data = self.get_intraday_pnl_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, IntradayPnlEntryDto, self._client, "/v1/pnl/intraday")
 
-    def get_pnl_explain_raw(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> List[Dict[str, Any]]:
+    def get_intraday_pnl_arrow(self) -> "pa.Table":
         """
-        GET /v1/pnl/explain
-        Retrieves PnL explain entries for the given range, fund family and discriminators (raw JSON).
+        GET /v1/pnl/intraday
+        Fetches current intraday PnL and returns a pyarrow Table.
         """
+        data = self.get_intraday_pnl_raw()
+        return build_table(data, IntradayPnlEntryDto, self._client, "/v1/pnl/intraday")
+
+    def iter_intraday_pnl_raw(self) -> Iterator[Dict[str, Any]]:
+        """
+        GET /v1/pnl/intraday
+        Streams current intraday PnL entries as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        with self._client.stream("GET", "/v1/pnl/intraday") as response:
+            yield from iter_json_array(response.iter_bytes())
+
+    def iter_intraday_pnl(self) -> Iterator[IntradayPnlEntryDto]:
+        """
+        GET /v1/pnl/intraday
+        Streams current intraday PnL entries as typed models.
+        """
+        build = model_factory(IntradayPnlEntryDto, self._client)
+        for item in self.iter_intraday_pnl_raw():
+            yield build(item)
+
+    def _fetch_pnl_explain(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> httpx.Response:
         params = {
             "start-date": start_date.isoformat(),
             "end-date": end_date.isoformat(),
@@ -50,16 +85,23 @@ class PnlClient:
         for d in discriminators:
             params.setdefault("discriminator", [])
             params["discriminator"].append(d)
-        response = self._client.get("/v1/pnl/explain", params=params)
-        return response.json()
+        return self._client.get("/v1/pnl/explain", params=params)
+
+    def get_pnl_explain_raw(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> List[Dict[str, Any]]:
+        """
+        GET /v1/pnl/explain
+        Retrieves PnL explain entries for the given range, fund family and discriminators (raw JSON).
+        """
+        response = self._fetch_pnl_explain(start_date, end_date, fund_family, discriminators)
+        return decode_json(response, self._client)
 
     def get_pnl_explain(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> List[PnlExplainDto]:
         """
         GET /v1/pnl/explain
         Retrieves PnL explain entries for the given range, fund family and discriminators (typed models).
         """
-        data = self.get_pnl_explain_raw(start_date, end_date, fund_family, discriminators)
-        return [PnlExplainDto(**item) for item in data]
+        response = self._fetch_pnl_explain(start_date, end_date, fund_family, discriminators)
+        return decode_models(response, PnlExplainDto, self._client)
 
     def get_pnl_explain_df(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> pd.DataFrame:
         """
@@ -67,4 +109,12 @@ class PnlClient:
         Retrieves PnL explain entries for the given range, fund family and discriminators (DataFrame).
         """
         data = self.get_pnl_explain_raw(start_date, end_date, fund_family, discriminators)
-        return pd.DataFrame(data)
+        return build_frame(data, PnlExplainDto, self._client, "/v1/pnl/explain")
+
+    def get_pnl_explain_arrow(self, start_date, end_date, fund_family: str, discriminators: List[str]) -> "pa.Table":
+        """
+        GET /v1/pnl/explain
+        Retrieves PnL explain entries for the given range, fund family and discriminators (Arrow Table).
+        """
+        data = self.get_pnl_explain_raw(start_date, end_date, fund_family, discriminators)
+        return build_table(data, PnlExplainDto, self._client, "/v1/pnl/explain")
@@ -1,28 +1,40 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import PortfolioDto
+from .tracing import traced
+import httpx
 import pandas as pd
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class PortfoliosClient:
     """Client for Portfolios endpoints."""
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_portfolios(self) -> httpx.Response:
+        return self._client.get("/v1/portfolios")
+
     def get_portfolios_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/portfolios
         Fetches all available portfolios (raw JSON).
         """
-        response = self._client.get("/v1/portfolios")
-        return response.json()
+        response = self._fetch_portfolios()
+        return decode_json(response, self._client)
 
     def get_portfolios(self) -> List[PortfolioDto]:
         """
         GET /v1/portfolios
         Fetches all available portfolios (typed models).
         """
-        data = self.get_portfolios_raw()
-        return [PortfolioDto(**item) for item in data]
+        response = self._fetch_portfolios()
+        return decode_models(response, PortfolioDto, self._client)
 
     def get_portfolios_df(self) -> pd.DataFrame:
         """
@@ -30,4 +42,12 @@ class PortfoliosClient:
         Fetches all available portfolios and returns a pandas DataFrame.
         """
         data = self.get_portfolios_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, PortfolioDto, self._client, "/v1/portfolios")
+
+    def get_portfolios_arrow(self) -> "pa.Table":
+        """
+        GET /v1/portfolios
+        Fetches all available portfolios and returns a pyarrow Table.
+        """
+        data = self.get_portfolios_raw()
+        return build_table(data, PortfolioDto, self._client, "/v1/portfolios")
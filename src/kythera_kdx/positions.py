@@ -1,16 +1,37 @@
 from datetime import date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models, model_factory
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import PositionDto
+from .streaming import iter_json_array
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
+
+@traced
 class PositionsClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_positions(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> httpx.Response:
+        params: dict = {}
+        if position_date:
+            params["positionDate"] = position_date.isoformat()
+        params["isOpen"] = is_open
+        return self._client.get("/v1/positions", params=params)
+
     def get_positions_raw(
         self,
         position_date: Optional[date] = None,
@@ -20,12 +41,8 @@ class PositionsClient:
         GET /v1/positions
         Fetches all position entries for a given date and returns raw JSON data.
         """
-        params: dict = {}
-        if position_date:
-            params["positionDate"] = position_date.isoformat()
-        params["isOpen"] = is_open
-        response = self._client.get("/v1/positions", params=params)
-        return response.json()
+        response = self._fetch_positions(position_date, is_open)
+        return decode_json(response, self._client)
 
     def get_positions(
         self,
@@ -36,8 +53,8 @@ class PositionsClient:
         GET /v1/positions
         Fetches all position entries for a given date and returns typed models.
         """
-        data = self.get_positions_raw(position_date, is_open)
-        return [PositionDto(**item) for item in data]
+        response = self._fetch_positions(position_date, is_open)
+        return decode_models(response, PositionDto, self._client)
 
     def get_positions_df(
         self,
@@ -49,4 +66,46 @@ class PositionsClient:
         Fetches all position entries for a given date and returns a pandas DataFrame.
         """
         data = self.get_positions_raw(position_date, is_open)
-        return pd.DataFrame(data)
+        return build_frame(data, PositionDto, self._client, "/v1/positions")
+
+    def get_positions_arrow(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> "pa.Table":
+        """
+        GET /v1/positions
+        Fetches all position entries for a given date and returns a pyarrow Table.
+        """
+        data = self.get_positions_raw(position_date, is_open)
+        return build_table(data, PositionDto, self._client, "/v1/positions")
+
+    def iter_positions_raw(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        GET /v1/positions
+        Streams position entries for a given date as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params: dict = {}
+        if position_date:
+            params["positionDate"] = position_date.isoformat()
+        params["isOpen"] = is_open
+        with self._client.stream("GET", "/v1/positions", params=params) as response:
+            yield from iter_json_array(response.iter_bytes())
+
+    def iter_positions(
+        self,
+        position_date: Optional[date] = None,
+        is_open: bool = True,
+    ) -> Iterator[PositionDto]:
+        """
+        GET /v1/positions
+        Streams position entries for a given date as typed models.
+        """
+        build = model_factory(PositionDto, self._client)
+        for item in self.iter_positions_raw(position_date, is_open):
+            yield build(item)
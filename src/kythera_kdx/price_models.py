@@ -1,27 +1,39 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
+import httpx
 import pandas as pd
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import PriceModelDto, InstrumentPriceModelDto, InstrumentGroupPriceModelDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class PriceModelsClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_price_models(self) -> httpx.Response:
+        return self._client.get("/v1/price-models")
+
     def get_price_models_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/price-models
         Fetches all price models (raw JSON).
         """
-        response = self._client.get("/v1/price-models")
-        return response.json()
+        response = self._fetch_price_models()
+        return decode_json(response, self._client)
 
     def get_price_models(self) -> List[PriceModelDto]:
         """
         GET /v1/price-models
         Fetches all price models (typed models).
         """
-        data = self.get_price_models_raw()
-        return [PriceModelDto(**item) for item in data]
+        response = self._fetch_price_models()
+        return decode_models(response, PriceModelDto, self._client)
 
     def get_price_models_df(self) -> pd.DataFrame:
         """
@@ -29,24 +41,35 @@ class PriceModelsClient:
         Fetches all price models (DataFrame).
         """
         data = self.get_price_models_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, PriceModelDto, self._client, "/v1/price-models")
+
+    def get_price_models_arrow(self) -> "pa.Table":
+        """
+        GET /v1/price-models
+        Fetches all price models (Arrow Table).
+        """
+        data = self.get_price_models_raw()
+        return build_table(data, PriceModelDto, self._client, "/v1/price-models")
+
+    def _fetch_price_model_instruments(self, include_action_risk_factors: bool = False) -> httpx.Response:
+        params = {"include-action-risk-factors": include_action_risk_factors}
+        return self._client.get("/v1/price-models/instruments", params=params)
 
     def get_price_model_instruments_raw(self, include_action_risk_factors: bool = False) -> List[Dict[str, Any]]:
         """
         GET /v1/price-models/instruments
         Fetches instrument price models (raw JSON).
         """
-        params = {"include-action-risk-factors": include_action_risk_factors}
-        response = self._client.get("/v1/price-models/instruments", params=params)
-        return response.json()
+        response = self._fetch_price_model_instruments(include_action_risk_factors)
+        return decode_json(response, self._client)
 
     def get_price_model_instruments(self, include_action_risk_factors: bool = False) -> List[InstrumentPriceModelDto]:
         """
         GET /v1/price-models/instruments
         Fetches instrument price models (typed models).
         """
-        data = self.get_price_model_instruments_raw(include_action_risk_factors)
-        return [InstrumentPriceModelDto(**item) for item in data]
+        response = self._fetch_price_model_instruments(include_action_risk_factors)
+        return decode_models(response, InstrumentPriceModelDto, self._client)
 
     def get_price_model_instruments_df(self, include_action_risk_factors: bool = False) -> pd.DataFrame:
         """
@@ -54,24 +77,39 @@ class PriceModelsClient:
         Fetches instrument price models (DataFrame).
         """
         data = self.get_price_model_instruments_raw(include_action_risk_factors)
-        return pd.DataFrame(data)
+        return build_frame(
+            data, InstrumentPriceModelDto, self._client, "/v1/price-models/instruments"
+        )
+
+    def get_price_model_instruments_arrow(self, include_action_risk_factors: bool = False) -> "pa.Table":
+        """
+        GET /v1/price-models/instruments
+        Fetches instrument price models (Arrow Table).
+        """
+        data = self.get_price_model_instruments_raw(include_action_risk_factors)
+        return build_table(
+            data, InstrumentPriceModelDto, self._client, "/v1/price-models/instruments"
+        )
+
+    def _fetch_price_model_instrument_groups(self, include_action_risk_factors: bool = False) -> httpx.Response:
+        params = {"include-action-risk-factors": include_action_risk_factors}
+        return self._client.get("/v1/price-models/instrument-groups", params=params)
 
     def get_price_model_instrument_groups_raw(self, include_action_risk_factors: bool = False) -> List[Dict[str, Any]]:
         """
         GET /v1/price-models/instrument-groups
         Fetches instrument group price models (raw JSON).
         """
-        params = {"include-action-risk-factors": include_action_risk_factors}
-        response = self._client.get("/v1/price-models/instrument-groups", params=params)
-        return response.json()
+        response = self._fetch_price_model_instrument_groups(include_action_risk_factors)
+        return decode_json(response, self._client)
 
     def get_price_model_instrument_groups(self, include_action_risk_factors: bool = False) -> List[InstrumentGroupPriceModelDto]:
         """
         GET /v1/price-models/instrument-groups
         Fetches instrument group price models (typed models).
         """
-        data = self.get_price_model_instrument_groups_raw(include_action_risk_factors)
-        return [InstrumentGroupPriceModelDto(**item) for item in data]
+        response = self._fetch_price_model_instrument_groups(include_action_risk_factors)
+        return decode_models(response, InstrumentGroupPriceModelDto, self._client)
 
     def get_price_model_instrument_groups_df(self, include_action_risk_factors: bool = False) -> pd.DataFrame:
         """
@@ -79,4 +117,22 @@ class PriceModelsClient:
         Fetches instrument group price models (DataFrame).
         """
         data = self.get_price_model_instrument_groups_raw(include_action_risk_factors)
-        return pd.DataFrame(data)
+        return build_frame(
+            data,
+            InstrumentGroupPriceModelDto,
+            self._client,
+            "/v1/price-models/instrument-groups",
+        )
+
+    def get_price_model_instrument_groups_arrow(self, include_action_risk_factors: bool = False) -> "pa.Table":
+        """
+        GET /v1/price-models/instrument-groups
+        Fetches instrument group price models (Arrow Table).
+        """
+        data = self.get_price_model_instrument_groups_raw(include_action_risk_factors)
+        return build_table(
+            data,
+            InstrumentGroupPriceModelDto,
+            self._client,
+            "/v1/price-models/instrument-groups",
+        )
@@ -1,16 +1,63 @@
-from typing import List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, TYPE_CHECKING
 from datetime import date
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models, model_factory
+from .arrow import build_table
+from .fanout import DateRangeResult, business_days, fetch_dates, in_date_order
+from .frames import build_frame
 from .models_v1 import PriceDto, OverrideInstrumentPriceRequest, PriceTypeDto
+from .streaming import iter_json_array
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
+# Index of the get_prices_range_df frames and sort order of the Arrow tables
+PRICE_RANGE_KEYS = ["date", "instrumentId"]
+
+
+def _dated(records: List[Any], price_date: date) -> List[Any]:
+    """Copies of the prices, with the date filled in where it is missing."""
+    dated = []
+    for record in records:
+        if isinstance(record, dict):
+            if record.get("date") is None:
+                record = {**record, "date": price_date.isoformat()}
+        elif record.date is None:
+            record = record.model_copy(update={"date": price_date})
+        dated.append(record)
+    return dated
+
+
+def _price_range_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    keys = [key for key in PRICE_RANGE_KEYS if key in frame.columns]
+    return frame.set_index(keys).sort_index() if keys else frame
+
+
+def _price_range_table(table: "pa.Table") -> "pa.Table":
+    keys = [key for key in PRICE_RANGE_KEYS if key in table.column_names]
+    return table.sort_by([(key, "ascending") for key in keys]) if keys else table
+
+
+@traced
 class PricesClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_all_prices(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> httpx.Response:
+        params = {"priceDate": price_date.isoformat(), "priceTypeName": price_type_name}
+        response = self._client.get("/v1/prices", params=params)
+        response.raise_for_status()
+        return response
+
     def get_all_prices_raw(
         self,
         price_date: date,
@@ -20,10 +67,8 @@ class PricesClient:
         GET /v1/prices
         Fetches all prices for a given date and type, returns raw JSON data.
         """
-        params = {"priceDate": price_date.isoformat(), "priceTypeName": price_type_name}
-        response = self._client.get("/v1/prices", params=params)
-        response.raise_for_status()
-        return response.json()
+        response = self._fetch_all_prices(price_date, price_type_name)
+        return decode_json(response, self._client)
 
     def get_all_prices(
         self,
@@ -34,8 +79,8 @@ class PricesClient:
         GET /v1/prices
         Fetches all prices for a given date and type.
         """
-        data = self.get_all_prices_raw(price_date, price_type_name)
-        return [PriceDto(**item) for item in data]
+        response = self._fetch_all_prices(price_date, price_type_name)
+        return decode_models(response, PriceDto, self._client)
 
     def get_all_prices_df(
         self,
@@ -47,7 +92,160 @@ class PricesClient:
         Fetches all prices for a given date and type, returns as pandas DataFrame.
         """
         data = self.get_all_prices_raw(price_date, price_type_name)
-        return pd.DataFrame(data)
+        return build_frame(data, PriceDto, self._client, "/v1/prices")
+
+    def get_all_prices_arrow(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> "pa.Table":
+        """
+        GET /v1/prices
+        Fetches all prices for a given date and type, returns as pyarrow Table.
+        """
+        data = self.get_all_prices_raw(price_date, price_type_name)
+        return build_table(data, PriceDto, self._client, "/v1/prices")
+
+    def iter_all_prices_raw(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        GET /v1/prices
+        Streams all prices for a given date and type as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params = {"priceDate": price_date.isoformat(), "priceTypeName": price_type_name}
+        with self._client.stream("GET", "/v1/prices", params=params) as response:
+            yield from iter_json_array(response.iter_bytes())
+
+    def iter_all_prices(
+        self,
+        price_date: date,
+        price_type_name: str,
+    ) -> Iterator[PriceDto]:
+        """
+        GET /v1/prices
+        Streams all prices for a given date and type as typed models.
+        """
+        build = model_factory(PriceDto, self._client)
+        for item in self.iter_all_prices_raw(price_date, price_type_name):
+            yield build(item)
+
+    def _fetch_prices_range(
+        self,
+        fetch: Any,
+        start: date,
+        end: date,
+        max_concurrency: int,
+        holidays: Optional[Iterable[date]],
+    ) -> DateRangeResult[List[Any]]:
+        dates = business_days(start, end, holidays)
+        results, failures = fetch_dates(
+            lambda day: _dated(fetch(day), day), dates, max_concurrency
+        )
+        return DateRangeResult(in_date_order(results, dates), dates, failures)
+
+    def get_prices_range_raw(
+        self,
+        start: date,
+        end: date,
+        price_type_name: str,
+        max_concurrency: int = 8,
+        holidays: Optional[Iterable[date]] = None,
+    ) -> DateRangeResult[List[Dict[str, Any]]]:
+        """
+        GET /v1/prices for every business day from start to end
+        Fetches the dates concurrently, returns raw JSON data in date order.
+
+        Args:
+            start: First date of the range
+            end: Last date of the range (included)
+            price_type_name: Price type, e.g. "CLOSE"
+            max_concurrency: Dates fetched at the same time
+            holidays: Dates to skip besides weekends
+
+        Returns:
+            DateRangeResult whose data holds the prices of the dates that
+            succeeded and whose failures maps the other dates to their error
+        """
+        return self._fetch_prices_range(
+            lambda day: self.get_all_prices_raw(day, price_type_name),
+            start,
+            end,
+            max_concurrency,
+            holidays,
+        )
+
+    def get_prices_range(
+        self,
+        start: date,
+        end: date,
+        price_type_name: str,
+        max_concurrency: int = 8,
+        holidays: Optional[Iterable[date]] = None,
+    ) -> DateRangeResult[List[PriceDto]]:
+        """
+        GET /v1/prices for every business day from start to end
+        Fetches the dates concurrently, returns typed models in date order.
+        """
+        return self._fetch_prices_range(
+            lambda day: self.get_all_prices(day, price_type_name),
+            start,
+            end,
+            max_concurrency,
+            holidays,
+        )
+
+    def get_prices_range_df(
+        self,
+        start: date,
+        end: date,
+        price_type_name: str,
+        max_concurrency: int = 8,
+        holidays: Optional[Iterable[date]] = None,
+    ) -> DateRangeResult[pd.DataFrame]:
+        """
+        GET /v1/prices for every business day from start to end
+        Fetches the dates concurrently, returns one pandas DataFrame indexed
+        by (date, instrumentId).
+        """
+        result = self.get_prices_range_raw(
+            start, end, price_type_name, max_concurrency, holidays
+        )
+        frame = build_frame(result.data, PriceDto, self._client, "/v1/prices")
+        return DateRangeResult(_price_range_frame(frame), result.dates, result.failures)
+
+    def get_prices_range_arrow(
+        self,
+        start: date,
+        end: date,
+        price_type_name: str,
+        max_concurrency: int = 8,
+        holidays: Optional[Iterable[date]] = None,
+    ) -> DateRangeResult["pa.Table"]:
+        """
+        GET /v1/prices for every business day from start to end
+        Fetches the dates concurrently, returns one pyarrow Table sorted by
+        date and instrumentId.
+        """
+        result = self.get_prices_range_raw(
+            start, end, price_type_name, max_concurrency, holidays
+        )
+        table = build_table(result.data, PriceDto, self._client, "/v1/prices")
+        return DateRangeResult(_price_range_table(table), result.dates, result.failures)
+
+    def _fetch_prices_by_instrument(
+        self,
+        instrument_id: int,
+        price_date: date,
+        price_type_name: str,
+    ) -> httpx.Response:
+        params = {"priceDate": price_date.isoformat(), "priceTypeName": price_type_name}
+        response = self._client.get(f"/v1/prices/{instrument_id}", params=params)
+        response.raise_for_status()
+        return response
 
     def get_prices_by_instrument_raw(
         self,
@@ -59,10 +257,8 @@ class PricesClient:
         GET /v1/prices/{instrumentId}
         Fetches prices for a given date, type and instrument, returns raw JSON data.
         """
-        params = {"priceDate": price_date.isoformat(), "priceTypeName": price_type_name}
-        response = self._client.get(f"/v1/prices/{instrument_id}", params=params)
-        response.raise_for_status()
-        return response.json()
+        response = self._fetch_prices_by_instrument(instrument_id, price_date, price_type_name)
+        return decode_json(response, self._client)
 
     def get_prices_by_instrument(
         self,
@@ -74,8 +270,8 @@ class PricesClient:
         GET /v1/prices/{instrumentId}
         Fetches prices for a given date, type and instrument.
         """
-        data = self.get_prices_by_instrument_raw(instrument_id, price_date, price_type_name)
-        return [PriceDto(**item) for item in data]
+        response = self._fetch_prices_by_instrument(instrument_id, price_date, price_type_name)
+        return decode_models(response, PriceDto, self._client)
 
     def get_prices_by_instrument_df(
         self,
@@ -88,7 +284,20 @@ class PricesClient:
         Fetches prices for a given date, type and instrument, returns as pandas DataFrame.
         """
         data = self.get_prices_by_instrument_raw(instrument_id, price_date, price_type_name)
-        return pd.DataFrame(data)
+        return build_frame(data, PriceDto, self._client, "/v1/prices/{instrumentId}")
+
+    def get_prices_by_instrument_arrow(
+        self,
+        instrument_id: int,
+        price_date: date,
+        price_type_name: str,
+    ) -> "pa.Table":
+        """
+        GET /v1/prices/{instrumentId}
+        Fetches prices for a given date, type and instrument, returns as pyarrow Table.
+        """
+        data = self.get_prices_by_instrument_raw(instrument_id, price_date, price_type_name)
+        return build_table(data, PriceDto, self._client, "/v1/prices/{instrumentId}")
 
     def post_prices(
         self,
@@ -102,22 +311,26 @@ class PricesClient:
         response = self._client.post("/v1/prices", data=body)  # type: ignore
         response.raise_for_status()
 
+    def _fetch_price_types(self) -> httpx.Response:
+        response = self._client.get("/v1/prices/price-types")
+        response.raise_for_status()
+        return response
+
     def get_price_types_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/prices/price-types
         Fetches all price types, returns raw JSON data.
         """
-        response = self._client.get("/v1/prices/price-types")
-        response.raise_for_status()
-        return response.json()
+        response = self._fetch_price_types()
+        return decode_json(response, self._client)
 
     def get_price_types(self) -> List[PriceTypeDto]:
         """
         GET /v1/prices/price-types
         Fetches all price types.
         """
-        data = self.get_price_types_raw()
-        return [PriceTypeDto(**item) for item in data]
+        response = self._fetch_price_types()
+        return decode_models(response, PriceTypeDto, self._client)
 
     def get_price_types_df(self) -> pd.DataFrame:
         """
@@ -125,4 +338,12 @@ class PricesClient:
         Fetches all price types, returns as pandas DataFrame.
         """
         data = self.get_price_types_raw()
-        return pd.DataFrame(data)
+        return build_frame(data, PriceTypeDto, self._client, "/v1/prices/price-types")
+
+    def get_price_types_arrow(self) -> "pa.Table":
+        """
+        GET /v1/prices/price-types
+        Fetches all price types, returns as pyarrow Table.
+        """
+        data = self.get_price_types_raw()
+        return build_table(data, PriceTypeDto, self._client, "/v1/prices/price-types")
@@ -0,0 +1,253 @@
+"""
+Client-side rate limiting for the Kythera clients.
+
+A RateLimiter combines a token bucket (requests per second with a burst size)
+and a cap on concurrent in-flight requests, optionally with tighter limits for
+specific endpoint path templates such as ``/v1/prices/{instrumentId}``. The same
+limiter instance can be shared by threads using the sync client and by tasks
+using the async client.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    List,
+    Tuple,
+    Pattern,
+    Iterator,
+    AsyncIterator,
+)
+
+
+def compile_path_template(template: str) -> Pattern[str]:
+    """Compile a path template like ``/v1/prices/{instrumentId}`` into a regex."""
+    parts = re.split(r"(\{[^/{}]+\})", template.rstrip("/"))
+    regex = "".join(
+        "[^/]+" if part.startswith("{") else re.escape(part) for part in parts
+    )
+    return re.compile(f"^{regex}/?$")
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out waits instead of blocking."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            # Tokens may go negative: later callers queue behind earlier ones
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class ConcurrencyLimiter:
+    """Caps in-flight requests across threads and event loops."""
+
+    def __init__(self, max_concurrency: int):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight < self.max_concurrency:
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """Block the current thread until a slot is free."""
+        with self._condition:
+            while not self._try_acquire():
+                self._condition.wait()
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a slot is free."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._try_acquire():
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self._condition:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+            waiters, self._async_waiters = self._async_waiters, []
+        # Wake async waiters so they retry; losers register again
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_resolve, waiter)
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RateLimiter:
+    """
+    Requests-per-second and concurrency limits, optionally per endpoint template.
+
+    Example:
+        limiter = RateLimiter(
+            requests_per_second=50,
+            max_concurrency=16,
+            endpoint_limits={
+                "/v1/prices/{instrumentId}": RateLimiter(requests_per_second=10),
+            },
+        )
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        endpoint_limits: Optional[Dict[str, "RateLimiter"]] = None,
+    ):
+        """
+        Args:
+            requests_per_second: Sustained request rate; unlimited when None
+            burst: Maximum number of requests sent back-to-back (bucket size);
+                defaults to one second worth of requests
+            max_concurrency: Maximum number of requests in flight; unlimited when None
+            endpoint_limits: Additional limits applied to paths matching each
+                template, on top of the limits of this limiter
+        """
+        self._bucket = (
+            TokenBucket(requests_per_second, burst) if requests_per_second else None
+        )
+        self._concurrency = (
+            ConcurrencyLimiter(max_concurrency) if max_concurrency else None
+        )
+        self._endpoint_limits = [
+            (template, compile_path_template(template), limiter)
+            for template, limiter in (endpoint_limits or {}).items()
+        ]
+        self._stats_lock = threading.Lock()
+        self._acquired = 0
+        self._delayed = 0
+        self._wait_seconds = 0.0
+
+    def _chain(self, path: str) -> List["RateLimiter"]:
+        """Limiters that apply to path: this one plus any matching endpoint limiters."""
+        chain = [self]
+        for _, pattern, limiter in self._endpoint_limits:
+            if pattern.match(path):
+                chain.extend(limiter._chain(path))
+        return chain
+
+    def _record(self, waited: float) -> None:
+        with self._stats_lock:
+            self._acquired += 1
+            if waited > 0:
+                self._delayed += 1
+                self._wait_seconds += waited
+
+    @staticmethod
+    def _reserve(chain: List["RateLimiter"]) -> List[float]:
+        """Take a token from every bucket in chain; returns each limiter's wait."""
+        return [
+            limiter._bucket.reserve() if limiter._bucket is not None else 0.0
+            for limiter in chain
+        ]
+
+    @contextmanager
+    def limit(self, path: str) -> Iterator[None]:
+        """Hold a rate and concurrency slot for one request (blocking)."""
+        chain = self._chain(path.split("?", 1)[0])
+        # Wait for every bucket before taking any concurrency slot, so a slot is
+        # never held while the request is throttled by another limiter
+        waits = self._reserve(chain)
+        if max(waits) > 0:
+            time.sleep(max(waits))
+        acquired: List[ConcurrencyLimiter] = []
+        try:
+            # Most specific limiter first: no shared slot is held while waiting
+            # for a slot of an endpoint limiter
+            for limiter, wait in reversed(list(zip(chain, waits))):
+                if limiter._concurrency is not None:
+                    started = time.monotonic()
+                    limiter._concurrency.acquire()
+                    acquired.append(limiter._concurrency)
+                    wait += time.monotonic() - started
+                limiter._record(wait)
+            yield
+        finally:
+            for concurrency in reversed(acquired):
+                concurrency.release()
+
+    @asynccontextmanager
+    async def limit_async(self, path: str) -> AsyncIterator[None]:
+        """Hold a rate and concurrency slot for one request (awaitable)."""
+        chain = self._chain(path.split("?", 1)[0])
+        waits = self._reserve(chain)
+        if max(waits) > 0:
+            await asyncio.sleep(max(waits))
+        acquired: List[ConcurrencyLimiter] = []
+        try:
+            for limiter, wait in reversed(list(zip(chain, waits))):
+                if limiter._concurrency is not None:
+                    started = time.monotonic()
+                    await limiter._concurrency.acquire_async()
+                    acquired.append(limiter._concurrency)
+                    wait += time.monotonic() - started
+                limiter._record(wait)
+            yield
+        finally:
+            for concurrency in reversed(acquired):
+                concurrency.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter counters, including per-endpoint limiters.
+
+        Returns:
+            Dictionary with acquired/delayed counts, total wait and in-flight requests
+        """
+        with self._stats_lock:
+            stats: Dict[str, Any] = {
+                "acquired": self._acquired,
+                "delayed": self._delayed,
+                "wait_seconds": self._wait_seconds,
+                "in_flight": self._concurrency.in_flight if self._concurrency else None,
+            }
+        stats["endpoints"] = {
+            template: limiter.get_stats()
+            for template, _, limiter in self._endpoint_limits
+        }
+        return stats
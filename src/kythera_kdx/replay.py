@@ -0,0 +1,372 @@
+"""
+Record and replay KDX traffic for reproducible offline performance runs.
+
+RecordingTransport wraps the transport of a client and saves every response
+(status, headers, body and timings) to a zip archive. Bodies are stored once
+per distinct content and compressed, and request credentials are never
+written. ReplayTransport serves an archive back, optionally with the recorded
+time to first byte and download time, so that a production run can be
+profiled locally without network access or credentials:
+
+    with KytheraKdx(transport=RecordingTransport("morning.zip")) as kdx:
+        run_morning_job(kdx)
+
+    kdx = replay_client("morning.zip", simulate_latency=True)
+    run_morning_job(kdx)
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+import zipfile
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Deque,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import httpx
+
+ClientT = TypeVar("ClientT")
+
+# Response headers that are not replayed
+_SKIPPED_HEADERS = {"set-cookie"}
+
+
+def request_key(request: httpx.Request) -> Tuple[str, str, str, str]:
+    """Method, path, sorted query string and body digest identifying a request."""
+    query = "&".join(sorted(request.url.query.decode("ascii").split("&")))
+    body = request.read()
+    digest = hashlib.sha256(body).hexdigest() if body else ""
+    return request.method, request.url.path, query, digest
+
+
+class _Recording:
+    """A response being recorded; written to the archive once its body is read."""
+
+    def __init__(
+        self,
+        archive: "RecordingTransport",
+        request: httpx.Request,
+        response: httpx.Response,
+        started: float,
+        headers_at: float,
+    ) -> None:
+        self.archive = archive
+        self.request = request
+        self.response = response
+        self.started = started
+        self.headers_at = headers_at
+        self.chunks: List[bytes] = []
+        self.complete = False
+
+    def finish(self) -> None:
+        if self.complete:
+            self.archive._write(self, time.perf_counter())
+
+
+class _RecordingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, recording: _Recording, stream: Any) -> None:
+        self._recording = recording
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._recording.chunks.append(chunk)
+            yield chunk
+        self._recording.complete = True
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._recording.chunks.append(chunk)
+            yield chunk
+        self._recording.complete = True
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._recording.finish()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._recording.finish()
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport saving the responses of another transport to a zip archive.
+
+    Works for sync and async clients. Only responses whose body was read to
+    the end are recorded. The archive is complete once the transport is closed,
+    which the client does on close().
+
+    Example:
+        recorder = RecordingTransport(
+            "morning.zip", transport=httpx.HTTPTransport(http2=True)
+        )
+        with KytheraKdx(transport=recorder) as kdx:
+            kdx.pnl.get_intraday_pnl_df()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        compression: int = zipfile.ZIP_DEFLATED,
+    ):
+        """
+        Args:
+            path: Archive to create (an existing file is overwritten)
+            transport: Transport doing the requests of sync clients; a default
+                httpx.HTTPTransport when omitted
+            async_transport: Transport doing the requests of async clients; a
+                default httpx.AsyncHTTPTransport when omitted
+            compression: zipfile compression method of the archive members
+        """
+        self.path = Path(path)
+        self._transport = transport
+        self._async_transport = async_transport
+        self._zip = zipfile.ZipFile(self.path, "w", compression=compression)
+        self._lock = threading.Lock()
+        self._bodies: Set[str] = set()
+        self._entries = 0
+        self._created = time.perf_counter()
+        self._closed = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        return self._wrap(request, response, started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._async_transport is None:
+            self._async_transport = httpx.AsyncHTTPTransport()
+        started = time.perf_counter()
+        response = await self._async_transport.handle_async_request(request)
+        return self._wrap(request, response, started)
+
+    def _wrap(
+        self, request: httpx.Request, response: httpx.Response, started: float
+    ) -> httpx.Response:
+        recording = _Recording(self, request, response, started, time.perf_counter())
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_RecordingStream(recording, response.stream),
+            extensions=response.extensions,
+            request=request,
+        )
+
+    def _write(self, recording: _Recording, completed_at: float) -> None:
+        body = b"".join(recording.chunks)
+        digest = hashlib.sha256(body).hexdigest()
+        method, path, query, request_digest = request_key(recording.request)
+        response = recording.response
+        entry = {
+            "method": method,
+            "path": path,
+            "query": query,
+            "request_body": request_digest,
+            "status_code": response.status_code,
+            "headers": [
+                [key.decode("latin-1"), value.decode("latin-1")]
+                for key, value in response.headers.raw
+                if key.decode("latin-1").lower() not in _SKIPPED_HEADERS
+            ],
+            "body": digest,
+            "offset": recording.started - self._created,
+            "ttfb": recording.headers_at - recording.started,
+            "download": completed_at - recording.headers_at,
+        }
+        with self._lock:
+            if self._closed:
+                return
+            if digest not in self._bodies:
+                self._bodies.add(digest)
+                self._zip.writestr(f"bodies/{digest}", body)
+            self._entries += 1
+            self._zip.writestr(f"entries/{self._entries:08d}.json", json.dumps(entry))
+
+    def _close_archive(self) -> None:
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._zip.close()
+
+    def close(self) -> None:
+        try:
+            if self._transport is not None:
+                self._transport.close()
+        finally:
+            self._close_archive()
+
+    async def aclose(self) -> None:
+        try:
+            if self._async_transport is not None:
+                await self._async_transport.aclose()
+        finally:
+            self._close_archive()
+
+
+class _ReplayStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, body: bytes, delay: float) -> None:
+        self._body = body
+        self._delay = delay
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._delay:
+            time.sleep(self._delay)
+        yield self._body
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        yield self._body
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport serving the responses of an archive made by RecordingTransport.
+
+    Requests are matched on method, path, query parameters (in any order) and
+    body. A request recorded several times gets its responses in recorded
+    order, starting over after the last one. Unrecorded requests get a 404.
+
+    Example:
+        kdx = KytheraKdx(transport=ReplayTransport("morning.zip", simulate_latency=True))
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        simulate_latency: bool = False,
+        speed: float = 1.0,
+    ):
+        """
+        Args:
+            path: Archive written by RecordingTransport
+            simulate_latency: Wait for the recorded time to first byte before
+                returning the headers and for the download time before the body
+            speed: Divisor of the simulated waits (2.0 replays twice as fast)
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.path = Path(path)
+        self.simulate_latency = simulate_latency
+        self.speed = speed
+        self._zip = zipfile.ZipFile(self.path, "r")
+        self._responses: Dict[Tuple[str, str, str, str], Deque[Dict[str, Any]]] = (
+            defaultdict(deque)
+        )
+        for name in sorted(self._zip.namelist()):
+            if name.startswith("entries/"):
+                entry = json.loads(self._zip.read(name))
+                key = (entry["method"], entry["path"], entry["query"], entry["request_body"])
+                self._responses[key].append(entry)
+        self._lock = threading.Lock()
+        self._misses = 0
+
+    @property
+    def entries(self) -> int:
+        """Number of recorded responses."""
+        return sum(len(responses) for responses in self._responses.values())
+
+    def _next(self, request: httpx.Request) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            responses = self._responses.get(request_key(request))
+            if not responses:
+                self._misses += 1
+                return None
+            entry = responses[0]
+            responses.rotate(-1)
+            return entry
+
+    def _response(self, request: httpx.Request, entry: Optional[Dict[str, Any]]) -> httpx.Response:
+        if entry is None:
+            return httpx.Response(
+                404,
+                json={"title": "Not recorded", "status": 404, "detail": str(request.url)},
+                request=request,
+            )
+        with self._lock:
+            body = self._zip.read(f"bodies/{entry['body']}")
+        delay = entry["download"] / self.speed if self.simulate_latency else 0.0
+        return httpx.Response(
+            status_code=entry["status_code"],
+            headers=[(key, value) for key, value in entry["headers"]],
+            stream=_ReplayStream(body, delay),
+            request=request,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self._next(request)
+        if entry is not None and self.simulate_latency:
+            time.sleep(entry["ttfb"] / self.speed)
+        return self._response(request, entry)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self._next(request)
+        if entry is not None and self.simulate_latency:
+            await asyncio.sleep(entry["ttfb"] / self.speed)
+        return self._response(request, entry)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get replay counters.
+
+        Returns:
+            Dictionary with the number of recorded responses and of requests
+            that matched none
+        """
+        with self._lock:
+            return {"entries": self.entries, "misses": self._misses}
+
+    def close(self) -> None:
+        self._zip.close()
+
+    async def aclose(self) -> None:
+        self._zip.close()
+
+
+def replay_client(
+    path: Union[str, Path],
+    client_class: Optional[Type[ClientT]] = None,
+    simulate_latency: bool = False,
+    speed: float = 1.0,
+    **kwargs: Any,
+) -> ClientT:
+    """
+    Create a client replaying an archive, without credentials or Azure AD.
+
+    Args:
+        path: Archive written by RecordingTransport
+        client_class: KytheraKdx (default), AsyncKytheraKdx or an authenticated
+            client class
+        simulate_latency: Reproduce the recorded time to first byte and
+            download time of each response
+        speed: Divisor of the simulated waits
+        **kwargs: Other client options, e.g. ``metrics=False``
+    """
+    from .stub import offline_client
+
+    transport = ReplayTransport(path, simulate_latency=simulate_latency, speed=speed)
+    return offline_client(client_class, transport=transport, **kwargs)
@@ -0,0 +1,203 @@
+"""
+Retry policy for requests made by the Kythera clients.
+
+RetryPolicy decides whether a failed attempt is retried and how long to wait
+before the next one (exponential backoff with full jitter, honoring Retry-After).
+RetryStats keeps per-client counters and enforces the client-wide retry budget.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, FrozenSet, Iterable
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Failures where the request never reached the server, so any method may be retried
+_NOT_SENT_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Failures that may happen after the server started processing the request
+_TRANSIENT_EXCEPTIONS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryStats:
+    """Thread-safe retry counters for one client, including its retry budget."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.budget_rejections = 0
+        self.backoff_seconds = 0.0
+        self.retries_by_reason: Dict[str, int] = {}
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def try_acquire_retry(self, policy: "RetryPolicy", reason: str, delay: float) -> bool:
+        """Reserve one retry against the client budget and record it."""
+        with self._lock:
+            allowed = policy.budget_min_retries + policy.budget_ratio * self.requests
+            if self.retries >= allowed:
+                self.budget_rejections += 1
+                return False
+            self.retries += 1
+            self.backoff_seconds += delay
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+            return True
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of the counters."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "budget_rejections": self.budget_rejections,
+                "backoff_seconds": self.backoff_seconds,
+                "retries_by_reason": dict(self.retries_by_reason),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.exhausted = 0
+            self.budget_rejections = 0
+            self.backoff_seconds = 0.0
+            self.retries_by_reason = {}
+
+
+class RetryPolicy:
+    """
+    Configuration for retrying transient failures.
+
+    Only idempotent methods are retried after the request may have reached the
+    server; connection failures that happen before sending are retried for any
+    method. Pass ``max_retries=0`` to disable retries.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_retry_time: float = 120.0,
+        retry_status_codes: Iterable[int] = RETRYABLE_STATUS_CODES,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        budget_ratio: float = 0.2,
+        budget_min_retries: int = 10,
+    ):
+        """
+        Args:
+            max_retries: Maximum number of retries per call
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Upper bound for a single backoff delay in seconds
+            max_retry_time: Total time budget per call, in seconds, after which
+                no further retries are attempted
+            retry_status_codes: HTTP status codes considered transient
+            retry_methods: Methods that are safe to retry after being sent
+            respect_retry_after: Use the Retry-After header when present
+            budget_ratio: Client-wide cap on retries as a fraction of requests
+            budget_min_retries: Retries always allowed regardless of the ratio
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_time = max_retry_time
+        self.retry_status_codes: FrozenSet[int] = frozenset(retry_status_codes)
+        self.retry_methods: FrozenSet[str] = frozenset(
+            m.upper() for m in retry_methods
+        )
+        self.respect_retry_after = respect_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_min_retries = budget_min_retries
+
+    def backoff(self, retry_number: int) -> float:
+        """Full-jitter exponential backoff for the given retry (starting at 0)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** retry_number))
+        return random.uniform(0, ceiling)
+
+    def start(self, method: str, stats: RetryStats) -> "RetryState":
+        """Begin tracking retries for a single call."""
+        stats.record_request()
+        return RetryState(self, method.upper(), stats)
+
+
+class RetryState:
+    """Retry bookkeeping for a single call to _make_request."""
+
+    def __init__(self, policy: RetryPolicy, method: str, stats: RetryStats):
+        self.policy = policy
+        self.method = method
+        self.stats = stats
+        self.retries = 0
+        self._started_at = time.monotonic()
+
+    def delay_for_response(self, response: httpx.Response) -> Optional[float]:
+        """Return the delay before retrying this response, or None to stop."""
+        if response.status_code not in self.policy.retry_status_codes:
+            return None
+        if self.method not in self.policy.retry_methods:
+            return None
+        retry_after = None
+        if self.policy.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return self._next_delay(str(response.status_code), retry_after)
+
+    def delay_for_exception(self, exc: Exception) -> Optional[float]:
+        """Return the delay before retrying after a transport error, or None."""
+        if isinstance(exc, _NOT_SENT_EXCEPTIONS):
+            pass
+        elif isinstance(exc, _TRANSIENT_EXCEPTIONS):
+            if self.method not in self.policy.retry_methods:
+                return None
+        else:
+            return None
+        return self._next_delay(type(exc).__name__, None)
+
+    def _next_delay(self, reason: str, retry_after: Optional[float]) -> Optional[float]:
+        if self.retries >= self.policy.max_retries:
+            self.stats.record_exhausted()
+            return None
+        delay = retry_after if retry_after is not None else self.policy.backoff(self.retries)
+        elapsed = time.monotonic() - self._started_at
+        if elapsed + delay > self.policy.max_retry_time:
+            self.stats.record_exhausted()
+            return None
+        if not self.stats.try_acquire_retry(self.policy, reason, delay):
+            return None
+        self.retries += 1
+        return delay
@@ -1,9 +1,13 @@
 from datetime import date
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models, model_factory
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import (
     RiskFactorDto,
     RiskFactorValueDto,
@@ -11,28 +15,37 @@ from .models_v1 import (
     RiskValueTypeDto,
     RiskFactorParameterDto,
 )
+from .streaming import iter_json_array
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
+
+@traced
 class RiskFactorsClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_risk_factors(self, include_characteristics: bool = False) -> httpx.Response:
+        params = {"include-characteristics": include_characteristics}
+        return self._client.get("/v1/risk-factors", params=params)
+
     def get_risk_factors_raw(self, include_characteristics: bool = False) -> List[Dict[str, Any]]:
         """
         GET /v1/risk-factors
         Fetches all risk factors and returns raw JSON data.
         """
-        params = {"include-characteristics": include_characteristics}
-        response = self._client.get("/v1/risk-factors", params=params)
-        return response.json()
+        response = self._fetch_risk_factors(include_characteristics)
+        return decode_json(response, self._client)
 
     def get_risk_factors(self, include_characteristics: bool = False) -> List[RiskFactorDto]:
         """
         GET /v1/risk-factors
         Fetches all risk factors and returns typed models.
         """
-        data = self.get_risk_factors_raw(include_characteristics)
-        return [RiskFactorDto(**item) for item in data]
+        response = self._fetch_risk_factors(include_characteristics)
+        return decode_models(response, RiskFactorDto, self._client)
 
     def get_risk_factors_df(self, include_characteristics: bool = False) -> pd.DataFrame:
         """
@@ -40,23 +53,34 @@ class RiskFactorsClient:
         Fetches all risk factors and returns a pandas DataFrame.
         """
         data = self.get_risk_factors_raw(include_characteristics)
-        return pd.DataFrame(data)
+        return build_frame(data, RiskFactorDto, self._client, "/v1/risk-factors")
+
+    def get_risk_factors_arrow(self, include_characteristics: bool = False) -> "pa.Table":
+        """
+        GET /v1/risk-factors
+        Fetches all risk factors and returns a pyarrow Table.
+        """
+        data = self.get_risk_factors_raw(include_characteristics)
+        return build_table(data, RiskFactorDto, self._client, "/v1/risk-factors")
+
+    def _fetch_risk_factor_parameters(self) -> httpx.Response:
+        return self._client.get("/v1/risk-factors/parameters")
 
     def get_risk_factor_parameters_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/risk-factors/parameters
         Fetches all risk factor parameters (raw JSON).
         """
-        response = self._client.get("/v1/risk-factors/parameters")
-        return response.json()
+        response = self._fetch_risk_factor_parameters()
+        return decode_json(response, self._client)
 
     def get_risk_factor_parameters(self) -> List[RiskFactorParameterDto]:
         """
         GET /v1/risk-factors/parameters
         Fetches all risk factor parameters (typed models).
         """
-        data = self.get_risk_factor_parameters_raw()
-        return [RiskFactorParameterDto(**item) for item in data]
+        response = self._fetch_risk_factor_parameters()
+        return decode_models(response, RiskFactorParameterDto, self._client)
 
     def get_risk_factor_parameters_df(self) -> pd.DataFrame:
         """
@@ -64,7 +88,26 @@ class RiskFactorsClient:
         Fetches all risk factor parameters (DataFrame).
         """
         data = self.get_risk_factor_parameters_raw()
-        return pd.DataFrame(data)
+        return build_frame(
+            data, RiskFactorParameterDto, self._client, "/v1/risk-factors/parameters"
+        )
+
+    def get_risk_factor_parameters_arrow(self) -> "pa.Table":
+        """
+        GET /v1/risk-factors/parameters
+        Fetches all risk factor parameters (Arrow Table).
+        """
+        data = self.get_risk_factor_parameters_raw()
+        return build_table(
+            data, RiskFactorParameterDto, self._client, "/v1/risk-factors/parameters"
+        )
+
+    def _fetch_risk_factor_values(
+        self,
+        valuation_date: date,
+    ) -> httpx.Response:
+        params = {"valuation-date": valuation_date.isoformat()}
+        return self._client.get("/v1/risk-factor-values", params=params)
 
     def get_risk_factor_values_raw(
         self,
@@ -74,9 +117,8 @@ class RiskFactorsClient:
         GET /v1/risk-factor-values
         Fetches all risk factor values for a given date and returns raw JSON data.
         """
-        params = {"valuation-date": valuation_date.isoformat()}
-        response = self._client.get("/v1/risk-factor-values", params=params)
-        return response.json()
+        response = self._fetch_risk_factor_values(valuation_date)
+        return decode_json(response, self._client)
 
     def get_risk_factor_values(
         self,
@@ -86,8 +128,8 @@ class RiskFactorsClient:
         GET /v1/risk-factor-values
         Fetches all risk factor values for a given date and returns typed models.
         """
-        data = self.get_risk_factor_values_raw(valuation_date)
-        return [RiskFactorValueDto(**item) for item in data]
+        response = self._fetch_risk_factor_values(valuation_date)
+        return decode_models(response, RiskFactorValueDto, self._client)
 
     def get_risk_factor_values_df(
         self,
@@ -98,7 +140,47 @@ class RiskFactorsClient:
         Fetches all risk factor values for a given date and returns a pandas DataFrame.
         """
         data = self.get_risk_factor_values_raw(valuation_date)
-        return pd.DataFrame(data)
+        return build_frame(
+            data, RiskFactorValueDto, self._client, "/v1/risk-factor-values"
+        )
+
+    def get_risk_factor_values_arrow(
+        self,
+        valuation_date: date,
+    ) -> "pa.Table":
+        """
+        GET /v1/risk-factor-values
+        Fetches all risk factor values for a given date and returns a pyarrow Table.
+        """
+        data = self.get_risk_factor_values_raw(valuation_date)
+        return build_table(
+            data, RiskFactorValueDto, self._client, "/v1/risk-factor-values"
+        )
+
+    def iter_risk_factor_values_raw(
+        self,
+        valuation_date: date,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        GET /v1/risk-factor-values
+        Streams risk factor values for a given date as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params = {"valuation-date": valuation_date.isoformat()}
+        with self._client.stream("GET", "/v1/risk-factor-values", params=params) as response:
+            yield from iter_json_array(response.iter_bytes())
+
+    def iter_risk_factor_values(
+        self,
+        valuation_date: date,
+    ) -> Iterator[RiskFactorValueDto]:
+        """
+        GET /v1/risk-factor-values
+        Streams risk factor values for a given date as typed models.
+        """
+        build = model_factory(RiskFactorValueDto, self._client)
+        for item in self.iter_risk_factor_values_raw(valuation_date):
+            yield build(item)
 
     def post_risk_factor_values(
         self,
@@ -112,21 +194,24 @@ class RiskFactorsClient:
         response = self._client.post("/v1/risk-factor-values", data=body)  # type: ignore
         response.raise_for_status()
 
+    def _fetch_risk_factor_value_types(self) -> httpx.Response:
+        return self._client.get("/v1/risk-factor-values/types")
+
     def get_risk_factor_value_types_raw(self) -> List[Dict[str, Any]]:
         """
         GET /v1/risk-factor-values/types
         Fetches all risk factor value types and returns raw JSON data.
         """
-        response = self._client.get("/v1/risk-factor-values/types")
-        return response.json()
+        response = self._fetch_risk_factor_value_types()
+        return decode_json(response, self._client)
 
     def get_risk_factor_value_types(self) -> List[RiskValueTypeDto]:
         """
         GET /v1/risk-factor-values/types
         Fetches all risk factor value types and returns typed models.
         """
-        data = self.get_risk_factor_value_types_raw()
-        return [RiskValueTypeDto(**item) for item in data]
+        response = self._fetch_risk_factor_value_types()
+        return decode_models(response, RiskValueTypeDto, self._client)
 
     def get_risk_factor_value_types_df(self) -> pd.DataFrame:
         """
@@ -134,4 +219,16 @@ class RiskFactorsClient:
         Fetches all risk factor value types and returns a pandas DataFrame.
         """
         data = self.get_risk_factor_value_types_raw()
-        return pd.DataFrame(data)
+        return build_frame(
+            data, RiskValueTypeDto, self._client, "/v1/risk-factor-values/types"
+        )
+
+    def get_risk_factor_value_types_arrow(self) -> "pa.Table":
+        """
+        GET /v1/risk-factor-values/types
+        Fetches all risk factor value types and returns a pyarrow Table.
+        """
+        data = self.get_risk_factor_value_types_raw()
+        return build_table(
+            data, RiskValueTypeDto, self._client, "/v1/risk-factor-values/types"
+        )
@@ -0,0 +1,138 @@
+"""
+Incremental decoding of top-level JSON arrays from a byte stream.
+
+The KDX list endpoints return one JSON array. JsonArrayParser decodes it
+element by element as chunks arrive, so only the current element (plus one
+network chunk) has to be held in memory instead of the whole payload.
+"""
+
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+from .exceptions import KytheraValidationError
+
+_WHITESPACE = " \t\n\r"
+# Characters a JSON number can continue with ("1" of "12", "1.5" or "1e3")
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class JsonArrayParser:
+    """Push parser yielding the elements of a top-level JSON array."""
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._expect_separator = False
+        self._after_comma = False
+        # Size the buffer must reach before retrying an incomplete element
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of bytes and return the elements completed by it."""
+        self._buffer += self._utf8.decode(chunk)
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """Signal the end of the stream and return any remaining elements."""
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._drain(final=True)
+        if not self._finished:
+            raise KytheraValidationError("Truncated JSON array in response body")
+        return items
+
+    def _skip_whitespace(self) -> None:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+    def _drain(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+        while not self._finished:
+            self._skip_whitespace()
+            if self._pos >= len(self._buffer):
+                break
+
+            char = self._buffer[self._pos]
+            if not self._started:
+                if char != "[":
+                    raise KytheraValidationError(
+                        "Expected a JSON array in response body"
+                    )
+                self._started = True
+                self._pos += 1
+                continue
+            if char == "]":
+                if self._after_comma:
+                    raise KytheraValidationError("Invalid JSON array in response body")
+                self._finished = True
+                self._pos += 1
+                break
+            if self._expect_separator:
+                if char != ",":
+                    raise KytheraValidationError("Invalid JSON array in response body")
+                self._expect_separator = False
+                self._after_comma = True
+                self._pos += 1
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise KytheraValidationError("Invalid JSON array in response body")
+                # Incomplete element: wait until it has doubled before retrying,
+                # which keeps re-parsing of large elements linear overall
+                self._retry_at = 2 * len(self._buffer) - self._pos
+                break
+
+            if type(item) in (int, float):
+                # A number is only complete once a delimiter follows it, as the
+                # next chunk may still extend it ("1" of "12", "1." of "1.5")
+                stop = end
+                while stop < len(self._buffer) and self._buffer[stop] in _NUMBER_CHARS:
+                    stop += 1
+                if stop >= len(self._buffer) and not final:
+                    self._retry_at = len(self._buffer) + 1
+                    break
+                if stop != end:
+                    raise KytheraValidationError("Invalid JSON array in response body")
+
+            items.append(item)
+            self._pos = end
+            self._retry_at = 0
+            self._expect_separator = True
+            self._after_comma = False
+
+        # Drop consumed text so memory stays bounded by one element
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            if self._retry_at:
+                self._retry_at -= self._pos
+            self._pos = 0
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a JSON array from an iterable of byte chunks."""
+    parser = JsonArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield the elements of a JSON array from an async iterable of byte chunks."""
+    parser = JsonArrayParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
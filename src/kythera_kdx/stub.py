@@ -0,0 +1,216 @@
+"""
+Local stand-in for the KDX API, for offline benchmarks.
+
+StubServer serves every path of an OpenAPI document (by default the
+``openapi-v1.2.json`` packaged with kythera_kdx) with synthetic JSON arrays of a
+configurable number of rows, generated from the response schemas by
+kythera_kdx.synthetic.SyntheticData. It is plugged
+into a client through an httpx.MockTransport, so calls go through the full
+request path (auth flow, rate limiter, retries, metrics, decoding) without
+network access:
+
+    server = StubServer(rows=50_000)
+    kdx = stub_client(server)
+    kdx.trades.get_trades_df()
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Pattern, Tuple, Type, TypeVar, Union
+
+import httpx
+
+from .codec import get_json_codec
+from .rate_limit import compile_path_template
+from .synthetic import SyntheticData, load_default_spec
+
+ClientT = TypeVar("ClientT")
+
+
+class StubServer:
+    """
+    Serves synthetic responses for the paths of an OpenAPI document.
+
+    Payloads are generated once per path template and row count, then reused,
+    so repeated calls measure the client rather than the generator.
+
+    Example:
+        server = StubServer(rows=10_000, rows_by_path={"/v1/prices/price-types": 5})
+        kdx = stub_client(server)
+        prices = kdx.prices.get_all_prices_df(date(2024, 1, 2), "CLOSE")
+        server.get_stats()["bytes"]
+    """
+
+    def __init__(
+        self,
+        spec: Union[str, Path, Dict[str, Any], None] = None,
+        rows: int = 1000,
+        rows_by_path: Optional[Dict[str, int]] = None,
+        latency: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            spec: OpenAPI document, as a path or an already loaded dictionary;
+                the packaged openapi-v1.2.json when omitted
+            rows: Rows in each response
+            rows_by_path: Row counts for specific path templates, e.g.
+                ``{"/v1/prices/{instrumentId}": 1}``
+            latency: Seconds each response is delayed by
+            seed: Seed of the synthetic rows
+        """
+        if spec is None:
+            spec = load_default_spec()
+        if not isinstance(spec, dict):
+            with open(spec, "rb") as f:
+                spec = json.load(f)
+        self.spec: Dict[str, Any] = spec
+        self.rows = rows
+        self.rows_by_path = dict(rows_by_path or {})
+        self.latency = latency
+        self.data = SyntheticData(spec, seed=seed)
+        self._codec = get_json_codec()
+        self._routes = self._compile_routes()
+        self._payloads: Dict[Tuple[str, str, int], bytes] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._bytes = 0
+
+    def _compile_routes(self) -> List[Tuple[str, str, Pattern[str], Optional[Dict[str, Any]]]]:
+        routes = []
+        for template, operations in self.spec.get("paths", {}).items():
+            for method, operation in operations.items():
+                content = operation.get("responses", {}).get("200", {}).get("content", {})
+                media = content.get("application/json") or next(iter(content.values()), {})
+                routes.append(
+                    (method.upper(), template, compile_path_template(template), media.get("schema"))
+                )
+        # Literal paths such as /v1/prices/price-types win over templates
+        routes.sort(key=lambda route: "{" in route[1])
+        return routes
+
+    @property
+    def paths(self) -> List[Tuple[str, str]]:
+        """(method, path template) of every route served."""
+        return [(method, template) for method, template, _, _ in self._routes]
+
+    def _match(self, method: str, path: str) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        for route_method, template, pattern, schema in self._routes:
+            if route_method == method and pattern.match(path):
+                return template, schema
+        return None
+
+    def payload(self, method: str, path: str) -> Optional[bytes]:
+        """Body served for a request, or None when no route matches."""
+        match = self._match(method, path)
+        if match is None:
+            return None
+        template, schema = match
+        rows = self.rows_by_path.get(template, self.rows)
+        key = (method, template, rows)
+        body = self._payloads.get(key)
+        if body is None:
+            body = self._codec.dumps(self.records(schema, rows))
+            with self._lock:
+                body = self._payloads.setdefault(key, body)
+        return body
+
+    def records(self, schema: Optional[Dict[str, Any]], rows: int) -> List[Any]:
+        """Generate rows for a response schema (an object or an array of objects)."""
+        if schema is None:
+            return []
+        if schema.get("type") == "array":
+            if "items" not in schema:
+                return []
+            schema = schema["items"]
+        return self.data.records(schema, rows)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request (the handler of the sync transport)."""
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request without blocking the event loop."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(request)
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        body = self.payload(request.method, request.url.path)
+        if body is None:
+            body = self._codec.dumps(
+                {"title": "Not Found", "status": 404, "detail": request.url.path}
+            )
+            status = 404
+        else:
+            status = 200
+        with self._lock:
+            self._requests += 1
+            self._bytes += len(body)
+        return httpx.Response(
+            status, content=body, headers={"Content-Type": "application/json"}
+        )
+
+    def transport(self, asynchronous: bool = False) -> httpx.MockTransport:
+        """Transport serving this stub, for the sync client or (asynchronous=True) the async one."""
+        return httpx.MockTransport(self.handle_async if asynchronous else self.handle)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get serving counters.
+
+        Returns:
+            Dictionary with the number of requests answered and body bytes sent
+        """
+        with self._lock:
+            return {"requests": self._requests, "bytes": self._bytes}
+
+
+def stub_client(
+    server: Optional[StubServer] = None, client_class: Optional[Type[ClientT]] = None, **kwargs: Any
+) -> ClientT:
+    """
+    Create a client talking to a StubServer, without Azure AD.
+
+    Args:
+        server: Stub to serve the requests; one with the default spec when omitted
+        client_class: KytheraKdx (default), AsyncKytheraKdx or an authenticated
+            client class
+        **kwargs: Other client options, e.g. ``metrics=False``
+
+    Returns:
+        Client with a placeholder static access token
+    """
+    from .aio.authenticated_client import AsyncAuthenticatedClient
+
+    server = server if server is not None else StubServer()
+    asynchronous = client_class is not None and issubclass(
+        client_class, AsyncAuthenticatedClient
+    )
+    kwargs.setdefault("transport", server.transport(asynchronous=asynchronous))
+    return offline_client(client_class, **kwargs)
+
+
+def offline_client(client_class: Optional[Type[ClientT]] = None, **kwargs: Any) -> ClientT:
+    """
+    Create a client for a local transport (a stub or a replayed archive).
+
+    Azure AD is never contacted: the client sends a placeholder static access
+    token.
+
+    Args:
+        client_class: KytheraKdx (default), AsyncKytheraKdx or an authenticated
+            client class
+        **kwargs: Client options, including the ``transport``
+    """
+    from .kythera_kdx import KytheraKdx
+
+    cls: Any = client_class if client_class is not None else KytheraKdx
+    kwargs.setdefault("base_url", "https://kdx.stub")
+    kwargs.setdefault("access_token", "stub-token")
+    return cls(client_id="stub-client", tenant_id="stub-tenant", **kwargs)
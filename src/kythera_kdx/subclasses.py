@@ -1,24 +1,29 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from datetime import date
+import httpx
 import pandas as pd
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import SubclassNavDto, SubclassDto
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class SubclassesClient:
     """Client for Subclasses endpoints."""
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
-    def get_subclass_navs_raw(
+    def _fetch_subclass_navs(
         self,
         date: Optional[date] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[Dict[str, Any]]:
-        """
-        GET /v1/subclasses/navs
-        Fetches subclass NAVs for a given date or range (raw JSON).
-        """
+    ) -> httpx.Response:
         params = {}
         if date:
             params["date"] = date.isoformat()
@@ -26,8 +31,20 @@ class SubclassesClient:
             params["start-date"] = start_date.isoformat()
         if end_date:
             params["end-date"] = end_date.isoformat()
-        response = self._client.get("/v1/subclasses/navs", params=params)
-        return response.json()
+        return self._client.get("/v1/subclasses/navs", params=params)
+
+    def get_subclass_navs_raw(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        GET /v1/subclasses/navs
+        Fetches subclass NAVs for a given date or range (raw JSON).
+        """
+        response = self._fetch_subclass_navs(date, start_date, end_date)
+        return decode_json(response, self._client)
 
     def get_subclass_navs(
         self,
@@ -39,8 +56,8 @@ class SubclassesClient:
         GET /v1/subclasses/navs
         Fetches subclass NAVs for a given date or range (typed models).
         """
-        data = self.get_subclass_navs_raw(date, start_date, end_date)
-        return [SubclassNavDto(**item) for item in data]
+        response = self._fetch_subclass_navs(date, start_date, end_date)
+        return decode_models(response, SubclassNavDto, self._client)
 
     def get_subclass_navs_df(
         self,
@@ -53,27 +70,43 @@ class SubclassesClient:
         Fetches subclass NAVs for a given date or range (DataFrame).
         """
         data = self.get_subclass_navs_raw(date, start_date, end_date)
-        return pd.DataFrame(data)
+        return build_frame(data, SubclassNavDto, self._client, "/v1/subclasses/navs")
 
-    def get_subclasses_raw(self, include_characteristics: bool = False, enabled_only: bool = True) -> List[Dict[str, Any]]:
+    def get_subclass_navs_arrow(
+        self,
+        date: Optional[date] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> "pa.Table":
         """
-        GET /v1/subclasses
-        Fetches all subclasses (raw JSON).
+        GET /v1/subclasses/navs
+        Fetches subclass NAVs for a given date or range (Arrow Table).
         """
+        data = self.get_subclass_navs_raw(date, start_date, end_date)
+        return build_table(data, SubclassNavDto, self._client, "/v1/subclasses/navs")
+
+    def _fetch_subclasses(self, include_characteristics: bool = False, enabled_only: bool = True) -> httpx.Response:
         params = {
             "include-characteristics": include_characteristics,
             "enabled-only": enabled_only,
         }
-        response = self._client.get("/v1/subclasses", params=params)
-        return response.json()
+        return self._client.get("/v1/subclasses", params=params)
+
+    def get_subclasses_raw(self, include_characteristics: bool = False, enabled_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        GET /v1/subclasses
+        Fetches all subclasses (raw JSON).
+        """
+        response = self._fetch_subclasses(include_characteristics, enabled_only)
+        return decode_json(response, self._client)
 
     def get_subclasses(self, include_characteristics: bool = False, enabled_only: bool = True) -> List[SubclassDto]:
         """
         GET /v1/subclasses
         Fetches all subclasses (typed models).
         """
-        data = self.get_subclasses_raw(include_characteristics, enabled_only)
-        return [SubclassDto(**item) for item in data]
+        response = self._fetch_subclasses(include_characteristics, enabled_only)
+        return decode_models(response, SubclassDto, self._client)
 
     def get_subclasses_df(self, include_characteristics: bool = False, enabled_only: bool = True) -> pd.DataFrame:
         """
@@ -81,4 +114,12 @@ class SubclassesClient:
         Fetches all subclasses (DataFrame).
         """
         data = self.get_subclasses_raw(include_characteristics, enabled_only)
-        return pd.DataFrame(data)
+        return build_frame(data, SubclassDto, self._client, "/v1/subclasses")
+
+    def get_subclasses_arrow(self, include_characteristics: bool = False, enabled_only: bool = True) -> "pa.Table":
+        """
+        GET /v1/subclasses
+        Fetches all subclasses (Arrow Table).
+        """
+        data = self.get_subclasses_raw(include_characteristics, enabled_only)
+        return build_table(data, SubclassDto, self._client, "/v1/subclasses")
@@ -0,0 +1,339 @@
+"""
+Seeded synthetic KDX data for load and scale testing.
+
+SyntheticData walks the component schemas of an OpenAPI document (falling back
+to the models_v1 DTOs for schemas the document leaves empty) and generates
+rows shaped like the API responses, at any volume:
+
+- Output is deterministic: a row depends only on the seed and its position,
+  not on how the rows are chunked or how many are generated.
+- Fields come in entities sharing one draw per row, so ``fundId`` and
+  ``fundName`` stay consistent (fund 12 is always "Fund 12") and the same
+  instrument has the same id and name across trades, positions and prices.
+- Entity cardinalities follow a configurable Zipf-like skew, like real books
+  where a few funds and instruments dominate.
+
+Rows are generated with numpy in fixed-size blocks and can be streamed to disk
+as a JSON array with write_json().
+"""
+
+import datetime
+import functools
+import gzip
+import importlib.resources
+import json
+import re
+import typing
+import zlib
+from pathlib import Path
+from typing import Optional, Dict, Any, BinaryIO, Iterator, List, Tuple, Type, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+from . import models_v1
+from .codec import get_json_codec
+
+# OpenAPI document shipped as package data
+DEFAULT_SPEC = "openapi-v1.2.json"
+
+# Distinct values per entity (the field name without its Id/Name suffix)
+DEFAULT_CARDINALITIES: Dict[str, int] = {
+    "fund": 60,
+    "baseFund": 60,
+    "fundFamily": 8,
+    "portfolio": 400,
+    "account": 150,
+    "instrument": 25_000,
+    "instrumentGroup": 300,
+    "issuer": 2_000,
+    "riskFactor": 5_000,
+    "currency": 30,
+    "country": 60,
+    "counterparty": 120,
+    "custodian": 15,
+    "trader": 40,
+    "dealer": 60,
+    "settleDealer": 60,
+    "tag": 20,
+    "mesa": 12,
+    "type": 10,
+    "source": 10,
+    "status": 5,
+    "tradeState": 6,
+    "tradeSource": 8,
+}
+DEFAULT_CARDINALITY = 100
+
+Field = Tuple[str, str, Optional[str], Optional[List[Any]]]
+Schema = Union[str, Dict[str, Any], Type[BaseModel]]
+
+
+@functools.lru_cache(maxsize=None)
+def _default_spec_bytes() -> bytes:
+    if hasattr(importlib.resources, "files"):
+        return importlib.resources.files(__package__).joinpath(DEFAULT_SPEC).read_bytes()
+    return importlib.resources.read_binary(__package__, DEFAULT_SPEC)  # Python 3.8
+
+
+def load_default_spec() -> Dict[str, Any]:
+    """The OpenAPI document packaged with kythera_kdx (DEFAULT_SPEC)."""
+    return json.loads(_default_spec_bytes())
+
+
+class SyntheticData:
+    """
+    Generator of synthetic rows for KDX schemas.
+
+    Example:
+        data = SyntheticData(seed=7, cardinalities={"fund": 25})
+        trades = data.records("TradeDto", 1_000)
+        data.write_json("IntradayPnlEntryDto", 5_000_000, "pnl.json.gz")
+    """
+
+    def __init__(
+        self,
+        spec: Union[str, Path, Dict[str, Any], None] = None,
+        seed: int = 0,
+        start_date: datetime.date = datetime.date(2024, 1, 1),
+        days: int = 365,
+        cardinalities: Optional[Dict[str, int]] = None,
+        skew: float = 1.1,
+        block_size: int = 4096,
+    ):
+        """
+        Args:
+            spec: OpenAPI document, as a path or an already loaded dictionary;
+                the packaged DEFAULT_SPEC when omitted
+            seed: Seed of every generated value
+            start_date: First date of date fields
+            days: Number of days date fields are spread over
+            cardinalities: Distinct values per entity (e.g. ``{"instrument":
+                5000}``), overriding DEFAULT_CARDINALITIES
+            skew: Zipf exponent of entity frequencies; 0 draws them uniformly
+            block_size: Rows generated per numpy batch; part of the seed, so
+                changing it changes the data
+        """
+        if spec is None:
+            spec = load_default_spec()
+        if not isinstance(spec, dict):
+            with open(spec, "rb") as f:
+                spec = json.load(f)
+        self.spec: Dict[str, Any] = spec
+        self.seed = seed
+        self.start_date = start_date
+        self.days = days
+        self.cardinalities = {**DEFAULT_CARDINALITIES, **(cardinalities or {})}
+        self.skew = skew
+        self.block_size = block_size
+        self._codec = get_json_codec()
+        self._dates = np.array(
+            [(start_date + datetime.timedelta(days=day)).isoformat() for day in range(days)],
+            dtype=object,
+        )
+
+    def fields(self, schema: Schema) -> List[Field]:
+        """
+        (name, type, format, enum) of the fields of a schema.
+
+        Args:
+            schema: Component schema name (e.g. ``"TradeDto"``), schema
+                dictionary (possibly a ``$ref``) or models_v1 class
+
+        Raises:
+            KeyError: When the schema is unknown
+        """
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            return _model_fields(schema)
+        name = None
+        if isinstance(schema, str):
+            name, schema = schema, {"$ref": f"#/components/schemas/{schema}"}
+        while "$ref" in schema:
+            name = schema["$ref"].rsplit("/", 1)[-1]
+            schema = self.spec.get("components", {}).get("schemas", {}).get(name, {})
+        properties = schema.get("properties")
+        if properties:
+            return [self._field(field, child) for field, child in properties.items()]
+        model = getattr(models_v1, name, None) if name else None
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            return _model_fields(model)
+        if name is not None and name not in self.spec.get("components", {}).get("schemas", {}):
+            raise KeyError(f"Unknown schema {name!r}")
+        return []
+
+    def _field(self, name: str, schema: Dict[str, Any]) -> Field:
+        nested = "$ref" in schema or schema.get("type") in ("object", "array")
+        if "$ref" in schema:
+            ref = schema["$ref"].rsplit("/", 1)[-1]
+            target = self.spec.get("components", {}).get("schemas", {}).get(ref, {})
+            if "enum" in target:
+                return name, target.get("type", "string"), None, target["enum"]
+        if nested:
+            return name, schema.get("type") or "object", None, None
+        return name, schema.get("type", "string"), schema.get("format"), schema.get("enum")
+
+    def iter_blocks(self, schema: Schema, rows: int, start: int = 0) -> Iterator[List[Dict[str, Any]]]:
+        """Generate rows start to start + rows - 1, in lists of at most block_size rows."""
+        fields = self.fields(schema)
+        end = start + rows
+        block = start // self.block_size
+        while block * self.block_size < end:
+            first = block * self.block_size
+            records = self._block(fields, block)
+            yield records[max(0, start - first) : end - first]
+            block += 1
+
+    def records(self, schema: Schema, rows: int, start: int = 0) -> List[Dict[str, Any]]:
+        """Generate rows start to start + rows - 1 of a schema."""
+        result: List[Dict[str, Any]] = []
+        for block in self.iter_blocks(schema, rows, start):
+            result.extend(block)
+        return result
+
+    def write_json(self, schema: Schema, rows: int, path: Union[str, Path]) -> int:
+        """
+        Stream rows of a schema to a file as one JSON array.
+
+        Memory use is bounded by one block whatever the number of rows. Paths
+        ending in ``.gz`` are gzip-compressed.
+
+        Returns:
+            Number of bytes of JSON written (before compression)
+        """
+        if str(path).endswith(".gz"):
+            with gzip.open(path, "wb", compresslevel=6) as f:
+                return self.dump_json(schema, rows, f)  # type: ignore[arg-type]
+        with open(path, "wb") as f:
+            return self.dump_json(schema, rows, f)
+
+    def dump_json(self, schema: Schema, rows: int, f: BinaryIO) -> int:
+        """Write rows of a schema to a binary file object as one JSON array."""
+        written = f.write(b"[")
+        separator = b""
+        for block in self.iter_blocks(schema, rows):
+            if block:
+                written += f.write(separator + self._codec.dumps(block)[1:-1])
+                separator = b","
+        return written + f.write(b"]")
+
+    def _rng(self, block: int, key: str) -> np.random.Generator:
+        return np.random.default_rng([self.seed, block, zlib.crc32(key.encode())])
+
+    def _block(self, fields: List[Field], block: int) -> List[Dict[str, Any]]:
+        size = self.block_size
+        first = block * size
+        draws: Dict[str, np.ndarray] = {}
+        columns: List[List[Any]] = []
+        for name, kind, fmt, enum in fields:
+            rng = self._rng(block, name)
+            if enum:
+                values = np.array(enum, dtype=object)
+                columns.append(values[rng.integers(0, len(values), size)].tolist())
+            elif kind == "integer":
+                if name == "id":
+                    columns.append(list(range(first + 1, first + size + 1)))
+                elif name.endswith("Id"):
+                    entity = name[:-2]
+                    columns.append((self._draw(draws, entity, block) + 1).tolist())
+                else:
+                    columns.append(rng.integers(0, 1000, size).tolist())
+            elif kind == "number":
+                columns.append(_numbers(rng, name, size).tolist())
+            elif kind == "boolean":
+                columns.append((rng.random(size) < 0.5).tolist())
+            elif fmt == "date":
+                columns.append(self._dates[rng.integers(0, self.days, size)].tolist())
+            elif fmt == "date-time":
+                seconds = rng.integers(0, self.days * 86400, size)
+                start = np.datetime64(self.start_date, "s")
+                columns.append(np.datetime_as_string(start + seconds).tolist())
+            elif fmt == "time":
+                columns.append(_times()[rng.integers(0, 86400, size)].tolist())
+            elif kind == "string":
+                entity = name[:-4] if name.endswith("Name") and len(name) > 4 else name
+                labels = self._labels(entity)
+                columns.append(labels[self._draw(draws, entity, block)].tolist())
+            elif kind == "array":
+                columns.append([[] for _ in range(size)])
+            else:
+                columns.append([None] * size)
+        names = [name for name, _, _, _ in fields]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def _draw(self, draws: Dict[str, np.ndarray], entity: str, block: int) -> np.ndarray:
+        """Entity indices of a block, shared by the Id and Name fields of an entity."""
+        indices = draws.get(entity)
+        if indices is None:
+            cdf = _cdf(self.cardinalities.get(entity, DEFAULT_CARDINALITY), self.skew)
+            uniform = self._rng(block, f"entity:{entity}").random(self.block_size)
+            indices = draws[entity] = np.searchsorted(cdf, uniform, side="right")
+        return indices
+
+    def _labels(self, entity: str) -> np.ndarray:
+        return _labels(entity, self.cardinalities.get(entity, DEFAULT_CARDINALITY))
+
+
+@functools.lru_cache(maxsize=None)
+def _cdf(cardinality: int, skew: float) -> np.ndarray:
+    weights = 1.0 / np.arange(1, cardinality + 1) ** skew
+    cdf = np.cumsum(weights)
+    cdf /= cdf[-1]
+    cdf[-1] = 1.0
+    return cdf[:-1]
+
+
+@functools.lru_cache(maxsize=None)
+def _labels(entity: str, cardinality: int) -> np.ndarray:
+    words = re.sub(r"(?<!^)(?=[A-Z])", " ", entity).title()
+    width = len(str(cardinality))
+    return np.array(
+        [f"{words} {index + 1:0{width}d}" for index in range(cardinality)], dtype=object
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _times() -> np.ndarray:
+    return np.array(
+        [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(86400)],
+        dtype=object,
+    )
+
+
+def _numbers(rng: np.random.Generator, name: str, size: int) -> np.ndarray:
+    lowered = name.lower()
+    if "price" in lowered or "nav" in lowered or lowered.startswith("fx"):
+        return np.round(rng.lognormal(np.log(100.0), 0.6, size), 4)
+    if "quantity" in lowered or "notional" in lowered:
+        return np.round(rng.normal(0.0, 1e5, size), 2)
+    if "pnl" in lowered:
+        return np.round(rng.normal(0.0, 5e4, size), 2)
+    return np.round(rng.normal(0.0, 1.0, size), 6)
+
+
+def _model_fields(model: Type[BaseModel]) -> List[Field]:
+    fields = []
+    for name, info in model.model_fields.items():
+        annotation = info.annotation
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if typing.get_origin(annotation) is Union and len(args) == 1:
+            annotation = args[0]
+        origin = typing.get_origin(annotation)
+        if annotation is bool:
+            fields.append((name, "boolean", None, None))
+        elif annotation is int:
+            fields.append((name, "integer", None, None))
+        elif annotation is float:
+            fields.append((name, "number", None, None))
+        elif annotation is datetime.datetime:
+            fields.append((name, "string", "date-time", None))
+        elif annotation is datetime.date:
+            fields.append((name, "string", "date", None))
+        elif annotation is datetime.time:
+            fields.append((name, "string", "time", None))
+        elif annotation is str:
+            fields.append((name, "string", None, None))
+        elif origin in (list, List):
+            fields.append((name, "array", None, None))
+        else:
+            fields.append((name, "object", None, None))
+    return fields
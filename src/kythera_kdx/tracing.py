@@ -0,0 +1,171 @@
+"""
+Tracing hooks for the Kythera clients.
+
+Every public sub-client call (e.g. ``PricesClient.get_all_prices_df``) runs in
+a span, with child spans for token acquisition, each HTTP attempt, JSON
+decoding, model validation and DataFrame/Arrow construction. Spans carry the
+endpoint, query parameters, status code, response size and row count as
+attributes.
+
+The default Tracer does nothing and is skipped on the hot paths.
+OpenTelemetryTracer reports the spans through the OpenTelemetry API, so KDX
+calls show up in existing distributed traces; opentelemetry-api is an optional
+dependency (the ``otel`` extra). Other backends can subclass Tracer.
+"""
+
+import functools
+import inspect
+from typing import Any, Callable, ContextManager, Dict, Optional, TypeVar
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - optional dependency
+    otel_trace = None  # type: ignore
+
+ClientT = TypeVar("ClientT", bound=type)
+
+
+class Span:
+    """No-op span; the interface spans returned by a Tracer provide."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute (str, bool, int or float) to the span."""
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NOOP_SPAN = Span()
+
+
+class Tracer:
+    """
+    No-op tracer used when tracing is not configured.
+
+    Subclasses set ``enabled = True`` and return from start_span a context
+    manager that yields an object with a ``set_attribute(key, value)`` method,
+    ends the span on exit and records exceptions raised inside it.
+    """
+
+    enabled = False
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        """Start a span, child of the current one, ended when the context exits."""
+        return _NOOP_SPAN
+
+
+NOOP_TRACER = Tracer()
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Tracer reporting spans through the OpenTelemetry API.
+
+    Example:
+        from opentelemetry import trace
+
+        kdx = KytheraKdx(tracer=OpenTelemetryTracer())
+        with trace.get_tracer(__name__).start_as_current_span("refresh-risk"):
+            kdx.prices.get_all_prices_df(date.today(), "CLOSE")
+    """
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None, tracer_provider: Any = None):
+        """
+        Args:
+            tracer: OpenTelemetry tracer to use; one named ``kythera_kdx`` is
+                obtained from tracer_provider (or the global provider) when omitted
+            tracer_provider: OpenTelemetry TracerProvider to get the tracer from
+
+        Raises:
+            ImportError: When opentelemetry-api is not installed
+        """
+        if tracer is None:
+            if otel_trace is None:
+                raise ImportError(
+                    "opentelemetry-api is required for OpenTelemetryTracer; "
+                    'install it with pip install "kythera-kdx[otel]"'
+                )
+            tracer = otel_trace.get_tracer("kythera_kdx", tracer_provider=tracer_provider)
+        self._tracer = tracer
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        if attributes:
+            attributes = {k: v for k, v in attributes.items() if v is not None}
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+def client_tracer(client: Any) -> Tracer:
+    """The tracer of a client, or the no-op tracer when it has none."""
+    tracer = getattr(client, "tracer", None)
+    return tracer if isinstance(tracer, Tracer) else NOOP_TRACER
+
+
+def params_attribute(params: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Query parameters as a span attribute value."""
+    if not params:
+        return None
+    return "&".join(f"{key}={value}" for key, value in params.items())
+
+
+def _set_rows(span: Any, result: Any) -> None:
+    if isinstance(result, (str, bytes, dict)):
+        return
+    try:
+        span.set_attribute("kythera.rows", len(result))
+    except TypeError:
+        pass
+
+
+def _traced_method(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def traced_async(self: Any, *args: Any, **kwargs: Any) -> Any:
+            tracer = client_tracer(self._client)
+            if not tracer.enabled:
+                return await method(self, *args, **kwargs)
+            with tracer.start_span(name) as span:
+                result = await method(self, *args, **kwargs)
+                _set_rows(span, result)
+                return result
+
+        return traced_async
+
+    @functools.wraps(method)
+    def traced_sync(self: Any, *args: Any, **kwargs: Any) -> Any:
+        tracer = client_tracer(self._client)
+        if not tracer.enabled:
+            return method(self, *args, **kwargs)
+        with tracer.start_span(name) as span:
+            result = method(self, *args, **kwargs)
+            _set_rows(span, result)
+            return result
+
+    return traced_sync
+
+
+def traced(cls: ClientT) -> ClientT:
+    """
+    Class decorator running the public methods of a sub-client in spans.
+
+    Spans are named after the class and method (``PricesClient.get_all_prices``).
+    Streaming ``iter_*`` generators are left alone: their requests are traced
+    by the HTTP spans only.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        if inspect.isgeneratorfunction(value) or inspect.isasyncgenfunction(value):
+            continue
+        setattr(cls, attr, _traced_method(f"{cls.__name__}.{attr}", value))
+    return cls
+
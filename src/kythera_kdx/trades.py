@@ -1,15 +1,34 @@
 from datetime import date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, TYPE_CHECKING
 
+import httpx
 import pandas as pd
 
 from .authenticated_client import AuthenticatedClient
+from .codec import decode_json, decode_models, model_factory
+from .arrow import build_table
+from .frames import build_frame
 from .models_v1 import TradeDto, TradeFeeDto, TradeInternalDto
+from .streaming import iter_json_array
+from .tracing import traced
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+@traced
 class TradesClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
 
+    def _fetch_trades(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> httpx.Response:
+        params: dict = {}
+        if effective_date:
+            params["effectiveDate"] = effective_date.isoformat()
+        return self._client.get("/v1/trades", params=params)
+
     def get_trades_raw(
         self,
         effective_date: Optional[date] = None,
@@ -18,11 +37,8 @@ class TradesClient:
         GET /v1/trades
         Fetches all trades for a given effective date and returns raw JSON data.
         """
-        params: dict = {}
-        if effective_date:
-            params["effectiveDate"] = effective_date.isoformat()
-        response = self._client.get("/v1/trades", params=params)
-        return response.json()
+        response = self._fetch_trades(effective_date)
+        return decode_json(response, self._client)
 
     def get_trades(
         self,
@@ -32,8 +48,8 @@ class TradesClient:
         GET /v1/trades
         Fetches all trades for a given effective date and returns typed models.
         """
-        data = self.get_trades_raw(effective_date)
-        return [TradeDto(**item) for item in data]
+        response = self._fetch_trades(effective_date)
+        return decode_models(response, TradeDto, self._client)
 
     def get_trades_df(
         self,
@@ -44,24 +60,65 @@ class TradesClient:
         Fetches all trades for a given effective date and returns a pandas DataFrame.
         """
         data = self.get_trades_raw(effective_date)
-        return pd.DataFrame(data)
+        return build_frame(data, TradeDto, self._client, "/v1/trades")
+
+    def get_trades_arrow(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> "pa.Table":
+        """
+        GET /v1/trades
+        Fetches all trades for a given effective date and returns a pyarrow Table.
+        """
+        data = self.get_trades_raw(effective_date)
+        return build_table(data, TradeDto, self._client, "/v1/trades")
+
+    def iter_trades_raw(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        GET /v1/trades
+        Streams trades for a given effective date as raw JSON data, decoding the response
+        incrementally so memory is bounded by a single record.
+        """
+        params: dict = {}
+        if effective_date:
+            params["effectiveDate"] = effective_date.isoformat()
+        with self._client.stream("GET", "/v1/trades", params=params) as response:
+            yield from iter_json_array(response.iter_bytes())
+
+    def iter_trades(
+        self,
+        effective_date: Optional[date] = None,
+    ) -> Iterator[TradeDto]:
+        """
+        GET /v1/trades
+        Streams trades for a given effective date as typed models.
+        """
+        build = model_factory(TradeDto, self._client)
+        for item in self.iter_trades_raw(effective_date):
+            yield build(item)
+
+    def _fetch_trade_fees(self, effective_date: date) -> httpx.Response:
+        params = {"effective-date": effective_date.isoformat()}
+        return self._client.get("/v1/trades/fees", params=params)
 
     def get_trade_fees_raw(self, effective_date: date) -> List[Dict[str, Any]]:
         """
         GET /v1/trades/fees
         Fetches trade fees for the provided effective date (raw JSON).
         """
-        params = {"effective-date": effective_date.isoformat()}
-        response = self._client.get("/v1/trades/fees", params=params)
-        return response.json()
+        response = self._fetch_trade_fees(effective_date)
+        return decode_json(response, self._client)
 
     def get_trade_fees(self, effective_date: date) -> List[TradeFeeDto]:
         """
         GET /v1/trades/fees
         Fetches trade fees for the provided effective date (typed models).
         """
-        data = self.get_trade_fees_raw(effective_date)
-        return [TradeFeeDto(**item) for item in data]
+        response = self._fetch_trade_fees(effective_date)
+        return decode_models(response, TradeFeeDto, self._client)
 
     def get_trade_fees_df(self, effective_date: date) -> pd.DataFrame:
         """
@@ -69,24 +126,35 @@ class TradesClient:
         Fetches trade fees for the provided effective date (DataFrame).
         """
         data = self.get_trade_fees_raw(effective_date)
-        return pd.DataFrame(data)
+        return build_frame(data, TradeFeeDto, self._client, "/v1/trades/fees")
+
+    def get_trade_fees_arrow(self, effective_date: date) -> "pa.Table":
+        """
+        GET /v1/trades/fees
+        Fetches trade fees for the provided effective date (Arrow Table).
+        """
+        data = self.get_trade_fees_raw(effective_date)
+        return build_table(data, TradeFeeDto, self._client, "/v1/trades/fees")
+
+    def _fetch_trade_internals(self, effective_date: date) -> httpx.Response:
+        params = {"effective-date": effective_date.isoformat()}
+        return self._client.get("/v1/trades/internals", params=params)
 
     def get_trade_internals_raw(self, effective_date: date) -> List[Dict[str, Any]]:
         """
         GET /v1/trades/internals
         Fetches internal trades for the provided effective date (raw JSON).
         """
-        params = {"effective-date": effective_date.isoformat()}
-        response = self._client.get("/v1/trades/internals", params=params)
-        return response.json()
+        response = self._fetch_trade_internals(effective_date)
+        return decode_json(response, self._client)
 
     def get_trade_internals(self, effective_date: date) -> List[TradeInternalDto]:
         """
         GET /v1/trades/internals
         Fetches internal trades for the provided effective date (typed models).
         """
-        data = self.get_trade_internals_raw(effective_date)
-        return [TradeInternalDto(**item) for item in data]
+        response = self._fetch_trade_internals(effective_date)
+        return decode_models(response, TradeInternalDto, self._client)
 
     def get_trade_internals_df(self, effective_date: date) -> pd.DataFrame:
         """
@@ -94,4 +162,12 @@ class TradesClient:
         Fetches internal trades for the provided effective date (DataFrame).
         """
         data = self.get_trade_internals_raw(effective_date)
-        return pd.DataFrame(data)
+        return build_frame(data, TradeInternalDto, self._client, "/v1/trades/internals")
+
+    def get_trade_internals_arrow(self, effective_date: date) -> "pa.Table":
+        """
+        GET /v1/trades/internals
+        Fetches internal trades for the provided effective date (Arrow Table).
+        """
+        data = self.get_trade_internals_raw(effective_date)
+        return build_table(data, TradeInternalDto, self._client, "/v1/trades/internals")
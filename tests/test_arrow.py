@@ -0,0 +1,96 @@
+"""
+Tests for the Arrow table builder used by the *_arrow methods.
+"""
+
+import asyncio
+import datetime
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from kythera_kdx import AsyncKytheraKdx, KytheraKdx
+from kythera_kdx.arrow import build_table
+from kythera_kdx.models_v1 import InstrumentDto, PositionDto
+
+POSITIONS = [
+    {"id": 1, "isOpen": True, "positionDate": "2024-01-02", "fundName": "Alpha",
+     "instrumentName": "PETR4", "quantity": 10.5},
+    {"id": None, "isOpen": None, "positionDate": None, "fundName": "Alpha",
+     "instrumentName": "PETR4", "quantity": None},
+    {"id": 3, "isOpen": False, "positionDate": "2024-01-03T00:00:00",
+     "fundName": "Alpha", "instrumentName": "VALE3", "quantity": 1.0},
+]
+
+
+def test_schema_is_derived_from_the_model():
+    table = build_table(POSITIONS, PositionDto)
+
+    assert table.column_names == list(POSITIONS[0])
+    assert table.schema.field("id").type == pa.int64()
+    assert table.schema.field("isOpen").type == pa.bool_()
+    assert table.schema.field("positionDate").type == pa.date32()
+    assert table.schema.field("quantity").type == pa.float64()
+    assert pa.types.is_dictionary(table.schema.field("fundName").type)
+    assert table.column("id").to_pylist() == [1, None, 3]
+    assert table.column("positionDate").to_pylist() == [
+        datetime.date(2024, 1, 2), None, datetime.date(2024, 1, 3)
+    ]
+    assert table.column("fundName").to_pylist() == ["Alpha"] * 3
+
+
+def test_unexpected_values_and_unknown_keys_are_inferred():
+    rows = [{"quantity": "n/a", "extra": 1}, {"quantity": "1.0", "other": [1, 2]}]
+    table = build_table(rows, PositionDto)
+
+    assert table.column_names == ["quantity", "extra", "other"]
+    assert table.column("quantity").to_pylist() == ["n/a", "1.0"]
+    assert table.column("extra").to_pylist() == [1, None]
+    assert table.column("other").to_pylist() == [None, [1, 2]]
+
+
+def test_nested_values_become_arrow_lists():
+    rows = [{"id": 1, "issuers": [{"a": 1}]}, {"id": 2, "issuers": [{"a": 3}, {"a": 4}]}]
+    table = build_table(rows, InstrumentDto)
+    assert table.column("issuers").to_pylist()[1] == [{"a": 3}, {"a": 4}]
+
+
+def test_empty_records_produce_the_model_schema():
+    table = build_table([], PositionDto)
+    assert table.num_rows == 0
+    assert table.column_names == list(PositionDto.model_fields)
+    assert table.schema.field("quantity").type == pa.float64()
+
+
+def _kdx(cls):
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = cls(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=POSITIONS)),
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_arrow_methods_build_tables():
+    table = _kdx(KytheraKdx).positions.get_positions_arrow()
+
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 3
+    assert table.schema.field("positionDate").type == pa.date32()
+
+
+def test_async_arrow_methods_build_tables():
+    async def run():
+        async with _kdx(AsyncKytheraKdx) as kdx:
+            return await kdx.positions.get_positions_arrow()
+
+    table = asyncio.run(run())
+    assert table.column("id").to_pylist() == [1, None, 3]
@@ -0,0 +1,83 @@
+"""
+Tests for the asynchronous AsyncKytheraKdx client.
+"""
+
+import asyncio
+import time
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pandas as pd
+
+from kythera_kdx import AsyncKytheraKdx
+from kythera_kdx.models_v1 import PositionDto, PriceDto
+
+
+def _make_client(handler) -> AsyncKytheraKdx:
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = AsyncKytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_gather_sub_client_calls():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers["Authorization"]))
+        if request.url.path == "/v1/positions":
+            return httpx.Response(200, json=[{"id": 1, "fundName": "F1"}])
+        if request.url.path == "/v1/prices":
+            assert request.url.params["priceDate"] == "2025-08-18"
+            return httpx.Response(200, json=[{"instrumentId": 7, "price": 1.5}])
+        return httpx.Response(404, json={})
+
+    async def run():
+        async with _make_client(handler) as kdx:
+            return await asyncio.gather(
+                kdx.positions.get_positions(),
+                kdx.prices.get_all_prices(date(2025, 8, 18), "CLOSE"),
+                kdx.prices.get_all_prices_df(date(2025, 8, 18), "CLOSE"),
+            )
+
+    positions, prices, prices_df = asyncio.run(run())
+
+    assert isinstance(positions[0], PositionDto) and positions[0].fundName == "F1"
+    assert isinstance(prices[0], PriceDto) and prices[0].price == 1.5
+    assert isinstance(prices_df, pd.DataFrame) and prices_df.shape[0] == 1
+    assert len(seen) == 3
+    assert all(auth == "Bearer test-token" for _, auth in seen)
+
+
+def test_refreshes_token_once_for_concurrent_tasks():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[])
+
+    kdx = _make_client(handler)
+    kdx._cached_token = None
+    kdx._token_expires_at = None
+
+    def fake_acquire(force_refresh: bool = False) -> str:
+        calls.append(force_refresh)
+        time.sleep(0.05)
+        kdx._cached_token = "fresh-token"
+        kdx._token_expires_at = time.time() + 3600
+        return "fresh-token"
+
+    async def run():
+        with patch.object(kdx, "_get_access_token", side_effect=fake_acquire):
+            await asyncio.gather(*(kdx.trades.get_trades_raw() for _ in range(5)))
+        await kdx.aclose()
+
+    asyncio.run(run())
+    assert calls == [False]
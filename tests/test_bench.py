@@ -0,0 +1,127 @@
+"""
+Tests for the kdx-bench concurrency sweep.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+import kythera_kdx
+from kythera_kdx.bench import LoadTest, format_table, main, workload_calls
+from kythera_kdx.replay import RecordingTransport
+from kythera_kdx.stub import StubServer, stub_client
+
+
+@pytest.fixture(scope="module")
+def server():
+    return StubServer(rows=10, rows_by_path={"/v1/prices/{instrumentId}": 1}, latency=0.01)
+
+
+def test_workload_calls():
+    calls = workload_calls(["prices-by-date:5", "prices-by-instrument:3"], date(2024, 6, 30))
+
+    assert [call[2][0] for call in calls[:5]] == [
+        date(2024, 6, 24),
+        date(2024, 6, 25),
+        date(2024, 6, 26),
+        date(2024, 6, 27),
+        date(2024, 6, 28),
+    ]
+    assert calls[5:] == [
+        ("prices", "get_prices_by_instrument", (instrument_id, date(2024, 6, 30), "CLOSE"))
+        for instrument_id in (1, 2, 3)
+    ]
+    with pytest.raises(ValueError):
+        workload_calls(["nothing:3"], date(2024, 6, 30))
+
+
+def test_http2_is_rejected_on_local_transports(server):
+    with pytest.raises(ValueError):
+        LoadTest([], server=server, client_options={"http2": True})
+    with pytest.raises(SystemExit):
+        main(["--http2"])
+
+
+def test_sweep_runs_every_mode_and_level(server):
+    calls = workload_calls(["prices-by-date:8", "prices-by-instrument:8"], date(2024, 6, 28))
+    test = LoadTest(calls, variant="df", server=server)
+
+    results = test.sweep(["sync", "threads", "async"], [1, 8])
+
+    assert [(r["mode"], r["concurrency"]) for r in results] == [
+        ("sync", 1),
+        ("threads", 1),
+        ("threads", 8),
+        ("async", 1),
+        ("async", 8),
+    ]
+    for result in results:
+        assert result["requests"] == 16 and result["errors"] == 0
+        assert result["rows"] == 8 * 10 + 8 * 1
+        assert result["bytes"] > 0
+    # 16 calls of 10ms each: concurrency should beat one at a time
+    assert results[2]["wall_seconds"] < results[1]["wall_seconds"] / 2
+    assert results[4]["wall_seconds"] < results[3]["wall_seconds"] / 2
+    assert len(format_table(results).splitlines()) == 6
+
+
+def test_replayed_archive_and_cli(server, tmp_path, capsys):
+    archive = tmp_path / "run.zip"
+    calls = workload_calls(["prices-by-date:4"], date(2024, 6, 28))
+    recorder = RecordingTransport(archive, transport=server.transport())
+    with stub_client(server, transport=recorder) as kdx:
+        for _, method, args in calls:
+            getattr(kdx.prices, method + "_raw")(*args)
+
+    output = tmp_path / "results.json"
+    main(
+        [
+            "--replay", str(archive),
+            "--workload", "prices-by-date:5",
+            "--date", "2024-06-28",
+            "--modes", "threads,async",
+            "--concurrency", "2",
+            "--json", str(output),
+        ]
+    )
+
+    results = json.loads(output.read_text())
+    assert [(r["mode"], r["requests"], r["errors"]) for r in results] == [
+        ("threads", 5, 1),
+        ("async", 5, 1),
+    ]
+    assert capsys.readouterr().out.splitlines()[0].startswith("mode")
+
+
+def test_cli_runs_from_an_installed_package(tmp_path):
+    # Only the package directory, as installed from a wheel: no repository root
+    site = tmp_path / "site"
+    shutil.copytree(
+        Path(kythera_kdx.__file__).parent,
+        site / "kythera_kdx",
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    script = (
+        "import kythera_kdx, sys; from kythera_kdx.bench import main; "
+        "assert kythera_kdx.__file__.startswith(sys.argv[1]); "
+        "main(['--workload', 'prices-by-date:2', '--modes', 'sync', '--rows', '5', "
+        "'--latency', '0'])"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script, str(site)],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(site)},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.splitlines()[1].split()[:4] == ["sync", "1", "2", "0"]
@@ -0,0 +1,226 @@
+"""
+Tests for the in-memory response cache.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+
+from kythera_kdx import AsyncKytheraKdx, JsonCodec, KytheraKdx, ResponseCache
+
+CALENDARS = [
+    {"id": 1, "name": "B3", "description": "Sao Paulo", "holidays": []},
+    {"id": 2, "name": "NYSE", "description": "New York", "holidays": []},
+]
+
+
+def _response(body=b"[]", **kwargs) -> httpx.Response:
+    return httpx.Response(200, content=body, **kwargs)
+
+
+def _kdx(cls, handler, cache):
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = cls(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            response_cache=cache,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def _counting_handler(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json=CALENDARS)
+
+    return handler
+
+
+def test_reference_endpoints_are_served_from_cache():
+    calls = []
+    cache = ResponseCache()
+    kdx = _kdx(KytheraKdx, _counting_handler(calls), cache)
+
+    first = kdx.globals.get_calendars()
+    second = kdx.globals.get_calendars_df()
+    kdx.positions.get_positions_raw()
+    kdx.positions.get_positions_raw()
+
+    assert [c.name for c in first] == ["B3", "NYSE"]
+    assert second["name"].tolist() == ["B3", "NYSE"]
+    assert calls == ["/v1/globals/calendars", "/v1/positions", "/v1/positions"]
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_params_are_part_of_the_key():
+    cache = ResponseCache(ttls={"/v1/prices/{instrumentId}": 60})
+    assert cache.store("GET", "/v1/prices/1", {"b": 2, "a": 1}, _response())
+    assert cache.lookup("GET", "/v1/prices/1", {"a": 1, "b": 2}) is not None
+    assert cache.lookup("GET", "/v1/prices/1", {"a": 1}) is None
+    assert cache.lookup("GET", "/v1/prices/2", {"a": 1, "b": 2}) is None
+    assert not cache.store("POST", "/v1/prices/1", None, _response())
+
+
+def test_entries_expire():
+    cache = ResponseCache(ttls={"/v1/portfolios": 60})
+    cache.store("GET", "/v1/portfolios", None, _response())
+    with patch("kythera_kdx.cache.time.monotonic", return_value=time.monotonic() + 61):
+        assert cache.lookup("GET", "/v1/portfolios") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResponseCache(default_ttl=60, max_entries=2, max_bytes=10)
+    cache.store("GET", "/a", None, _response(b"1234"))
+    cache.store("GET", "/b", None, _response(b"1234"))
+    cache.lookup("GET", "/a")
+    cache.store("GET", "/c", None, _response(b"1234"))
+
+    assert cache.lookup("GET", "/b") is None
+    assert cache.lookup("GET", "/a") is not None
+    assert not cache.store("GET", "/d", None, _response(b"x" * 11))
+
+    cache.store("GET", "/d", None, _response(b"12345678"))
+    stats = cache.get_stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 8
+    assert stats["evictions"] == 3
+
+
+def test_errors_and_no_store_responses_are_not_cached():
+    cache = ResponseCache(default_ttl=60)
+    assert not cache.store("GET", "/a", None, httpx.Response(404, content=b"{}"))
+    assert not cache.store(
+        "GET", "/a", None, _response(headers={"Cache-Control": "private, no-store"})
+    )
+
+
+def test_invalidate_by_path_template():
+    cache = ResponseCache(default_ttl=60)
+    for path in ("/v1/prices/1", "/v1/prices/2", "/v1/portfolios"):
+        cache.store("GET", path, None, _response())
+
+    assert cache.invalidate("/v1/prices/{instrumentId}") == 2
+    assert cache.lookup("GET", "/v1/portfolios") is not None
+    assert cache.invalidate() == 1
+    assert cache.get_stats()["bytes"] == 0
+
+
+def test_async_client_uses_the_cache():
+    calls = []
+    cache = ResponseCache()
+
+    async def run():
+        async with _kdx(AsyncKytheraKdx, _counting_handler(calls), cache) as kdx:
+            await kdx.globals.get_calendars_raw()
+            return await kdx.globals.get_calendars_raw()
+
+    assert asyncio.run(run()) == CALENDARS
+    assert calls == ["/v1/globals/calendars"]
+
+
+class _CountingCodec(JsonCodec):
+    def __init__(self):
+        self.loads_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+
+def _etag_handler(calls, body):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=body, headers={"ETag": '"v1"'})
+
+    return handler
+
+
+def test_revalidated_endpoints_reuse_the_decoded_body_on_304():
+    calls = []
+    codec = _CountingCodec()
+    cache = ResponseCache()
+    kdx = _kdx(KytheraKdx, _etag_handler(calls, [{"id": 1, "name": "PETR4"}]), cache)
+    kdx.json_codec = codec
+
+    first = kdx.instruments.get_instruments_raw()
+    second = kdx.instruments.get_instruments_df()
+    third = kdx.instruments.get_instruments_raw()
+
+    assert first == third == [{"id": 1, "name": "PETR4"}] and first is not third
+    assert second["name"].tolist() == ["PETR4"]
+    assert "if-none-match" not in calls[0]
+    assert [c.get("if-none-match") for c in calls[1:]] == ['"v1"', '"v1"']
+    # Decoded once: neither 304 decodes the body again
+    assert codec.loads_calls == 1
+    assert cache.get_stats()["revalidated"] == 2
+
+
+def test_cached_results_are_not_shared_between_calls():
+    cache = ResponseCache()
+    kdx = _kdx(KytheraKdx, _counting_handler([]), cache)
+
+    first = kdx.globals.get_calendars_raw()
+    first[0]["name"] = "mutated"
+    first.append({"id": 3})
+
+    assert kdx.globals.get_calendars_raw() == CALENDARS
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_expired_entries_are_revalidated_with_last_modified():
+    modified = "Wed, 01 May 2024 10:00:00 GMT"
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers.get("If-Modified-Since"))
+        if request.headers.get("If-Modified-Since") == modified:
+            return httpx.Response(304)
+        return httpx.Response(200, json=CALENDARS, headers={"Last-Modified": modified})
+
+    cache = ResponseCache(ttls={"/v1/globals/calendars": 60})
+    kdx = _kdx(KytheraKdx, handler, cache)
+
+    kdx.globals.get_calendars_raw()
+    kdx.globals.get_calendars_raw()
+    with patch("kythera_kdx.cache.time.monotonic", return_value=time.monotonic() + 61):
+        assert kdx.globals.get_calendars_raw() == CALENDARS
+    # Fresh again for another TTL after the 304
+    kdx.globals.get_calendars_raw()
+
+    assert calls == [None, modified]
+
+
+def test_changed_resources_replace_the_cached_body():
+    versions = iter([("v1", [1]), ("v2", [2])])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        etag, body = next(versions)
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    kdx = _kdx(KytheraKdx, handler, ResponseCache())
+    assert kdx.risk_factors.get_risk_factors_raw() == [1]
+    assert kdx.risk_factors.get_risk_factors_raw() == [2]
+
+
+def test_async_revalidation():
+    calls = []
+
+    async def run():
+        handler = _etag_handler(calls, [{"id": 1}])
+        async with _kdx(AsyncKytheraKdx, handler, ResponseCache()) as kdx:
+            await kdx.instruments.get_instruments_raw()
+            return await kdx.instruments.get_instruments_raw()
+
+    assert asyncio.run(run()) == [{"id": 1}]
+    assert calls[1]["if-none-match"] == '"v1"'
@@ -0,0 +1,183 @@
+"""
+Tests for the per-endpoint circuit breaker.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kythera_kdx import (
+    AsyncKytheraKdx,
+    CircuitBreaker,
+    KytheraKdx,
+    RateLimiter,
+    RetryPolicy,
+)
+from kythera_kdx.exceptions import KytheraAPIError, KytheraCircuitOpenError
+
+POSITIONS = [{"id": 1, "fundName": "Alpha", "quantity": 10.0}]
+
+
+def _kdx(cls, handler, breaker, rate_limiter=None):
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = cls(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(max_retries=0),
+            circuit_breaker=breaker,
+            rate_limiter=rate_limiter,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def _fail(breaker, path, times):
+    for _ in range(times):
+        with breaker.attempt(path) as attempt:
+            attempt.completed(503)
+
+
+def test_opens_on_failure_rate_and_fails_fast():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503, json={"error": "unavailable"})
+
+    breaker = CircuitBreaker(window_size=4, min_calls=4, open_seconds=60)
+    kdx = _kdx(KytheraKdx, handler, breaker)
+
+    for _ in range(4):
+        with pytest.raises(KytheraAPIError):
+            kdx.positions.get_positions_raw()
+    with pytest.raises(KytheraCircuitOpenError) as exc_info:
+        kdx.positions.get_positions_raw()
+
+    assert len(calls) == 4
+    assert exc_info.value.endpoint == "/v1/positions"
+    assert 0 < exc_info.value.retry_after <= 60
+    assert breaker.get_state("/v1/positions") == "open"
+    assert breaker.get_state("/v1/trades") == "closed"
+    stats = breaker.get_stats()["/v1/positions"]
+    assert (stats["rejected"], stats["times_opened"]) == (1, 1)
+
+
+def test_client_errors_do_not_open_the_circuit():
+    breaker = CircuitBreaker(window_size=2, min_calls=2)
+    for _ in range(5):
+        with breaker.attempt("/v1/instruments/1") as attempt:
+            attempt.completed(404)
+
+    assert breaker.get_state("/v1/instruments/1") == "closed"
+
+
+def test_slow_calls_open_the_circuit():
+    breaker = CircuitBreaker(slow_call_seconds=0.01, window_size=2, min_calls=2)
+    for _ in range(2):
+        with breaker.attempt("/v1/pnl") as attempt:
+            time.sleep(0.02)
+            attempt.completed(200)
+
+    assert breaker.get_state("/v1/pnl") == "open"
+
+
+def test_rate_limiter_wait_is_not_a_slow_call():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=POSITIONS)
+
+    breaker = CircuitBreaker(slow_call_seconds=0.2, window_size=2, min_calls=2)
+    # The second request waits about 0.33s for a token before it is sent
+    limiter = RateLimiter(requests_per_second=3, burst=1)
+    kdx = _kdx(KytheraKdx, handler, breaker, rate_limiter=limiter)
+
+    for _ in range(2):
+        kdx.positions.get_positions_raw()
+
+    assert limiter.get_stats()["wait_seconds"] >= 0.3
+    assert breaker.get_state("/v1/positions") == "closed"
+
+
+def test_paths_share_the_circuit_of_their_template():
+    breaker = CircuitBreaker(
+        window_size=2, min_calls=2, endpoints=["/v1/prices/{instrumentId}"]
+    )
+    _fail(breaker, "/v1/prices/1", 1)
+    _fail(breaker, "/v1/prices/2?priceDate=2024-01-02", 1)
+
+    assert breaker.get_state("/v1/prices/3") == "open"
+    assert breaker.get_state("/v1/prices/{instrumentId}") == "open"
+    assert list(breaker.get_stats()) == ["/v1/prices/{instrumentId}"]
+
+
+def test_half_open_trials_close_or_reopen_the_circuit():
+    breaker = CircuitBreaker(window_size=2, min_calls=2, open_seconds=0.02, half_open_calls=2)
+    _fail(breaker, "/v1/trades", 2)
+    time.sleep(0.03)
+    assert breaker.get_state("/v1/trades") == "half_open"
+
+    # A failed trial reopens the circuit
+    _fail(breaker, "/v1/trades", 1)
+    assert breaker.get_state("/v1/trades") == "open"
+
+    time.sleep(0.03)
+    with breaker.attempt("/v1/trades") as first, breaker.attempt("/v1/trades") as second:
+        # Only half_open_calls trial requests at a time
+        with pytest.raises(KytheraCircuitOpenError):
+            with breaker.attempt("/v1/trades"):
+                pass
+        first.completed(200)
+        second.completed(200)
+
+    assert breaker.get_state("/v1/trades") == "closed"
+
+
+def test_serves_last_known_good_while_open():
+    status = [200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status[0], json=POSITIONS)
+
+    breaker = CircuitBreaker(window_size=3, min_calls=3, serve_last_known_good=True)
+    kdx = _kdx(KytheraKdx, handler, breaker)
+
+    assert kdx.positions.get_positions_raw() == POSITIONS
+    status[0] = 500
+    for _ in range(2):
+        with pytest.raises(KytheraAPIError):
+            kdx.positions.get_positions_raw()
+
+    assert breaker.get_state("/v1/positions") == "open"
+    assert kdx.positions.get_positions()[0].fundName == "Alpha"
+    # No known good response for other parameters
+    with pytest.raises(KytheraCircuitOpenError):
+        kdx.positions.get_positions_raw(is_open=False)
+
+
+def test_async_client_fails_fast():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    breaker = CircuitBreaker(window_size=3, min_calls=3)
+
+    async def run():
+        async with _kdx(AsyncKytheraKdx, handler, breaker) as kdx:
+            for _ in range(3):
+                with pytest.raises(Exception):
+                    await kdx.positions.get_positions_raw()
+            with pytest.raises(KytheraCircuitOpenError):
+                await kdx.positions.get_positions_raw()
+
+    asyncio.run(run())
+
+    assert len(calls) == 3
+    assert breaker.get_state("/v1/positions") == "open"
@@ -0,0 +1,177 @@
+"""
+Tests for single-flight coalescing of identical concurrent GET requests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kythera_kdx import AsyncKytheraKdx, JsonCodec, KytheraKdx
+from kythera_kdx.coalesce import RequestCoalescer
+from kythera_kdx.exceptions import KytheraAPIError
+
+POSITIONS = [{"id": 1, "fundName": "Alpha", "quantity": 10.0}]
+
+
+class _CountingCodec(JsonCodec):
+    def __init__(self):
+        self.loads_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+
+def _kdx(cls, handler, **kwargs):
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = cls(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            coalesce_requests=True,
+            **kwargs,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_concurrent_identical_gets_share_one_call_and_one_decode():
+    calls = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        release.wait(5)
+        return httpx.Response(200, json=POSITIONS)
+
+    codec = _CountingCodec()
+    kdx = _kdx(KytheraKdx, handler, json_codec=codec)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(kdx.positions.get_positions_raw) for _ in range(8)]
+        while kdx.coalescer.get_stats()["coalesced"] < 7:
+            time.sleep(0.005)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result == POSITIONS for result in results)
+    # One decode, and each caller gets its own copy of the rows
+    assert codec.loads_calls == 1
+    assert len({id(result) for result in results}) == 8
+    assert len({id(result[0]) for result in results}) == 8
+    assert kdx.coalescer.get_stats() == {"requests": 8, "coalesced": 7, "in_flight": 0}
+
+
+def test_different_params_are_not_coalesced():
+    calls = []
+    kdx = _kdx(KytheraKdx, lambda request: calls.append(1) or httpx.Response(200, json=[]))
+
+    kdx.positions.get_positions_raw(is_open=True)
+    kdx.positions.get_positions_raw(is_open=False)
+    kdx.positions.get_positions_raw(is_open=True)
+
+    assert len(calls) == 3
+    assert kdx.coalescer.get_stats()["coalesced"] == 0
+
+
+def test_errors_reach_every_waiter():
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    release = threading.Event()
+
+    def send():
+        started.set()
+        release.wait(5)
+        raise KytheraAPIError("boom", status_code=500)
+
+    def wait_for_leader():
+        started.wait(5)
+        return coalescer.do("key", lambda: pytest.fail("waiter must not send"))
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(coalescer.do, "key", send)
+        waiter = pool.submit(wait_for_leader)
+        while coalescer.get_stats()["coalesced"] < 1:
+            time.sleep(0.005)
+        release.set()
+        for future in (leader, waiter):
+            with pytest.raises(KytheraAPIError):
+                future.result()
+
+    assert coalescer.get_stats()["in_flight"] == 0
+
+
+def test_async_tasks_share_one_call():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=POSITIONS)
+
+    async def run():
+        async with _kdx(AsyncKytheraKdx, handler) as kdx:
+            results = await asyncio.gather(
+                kdx.positions.get_positions_df(),
+                kdx.positions.get_positions(),
+                kdx.positions.get_positions_raw(),
+            )
+            return results, kdx.coalescer.get_stats()
+
+    (frame, models, raw), stats = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert frame["fundName"].tolist() == ["Alpha"]
+    assert models[0].quantity == 10.0
+    assert raw == POSITIONS
+    assert stats["coalesced"] == 2
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_call():
+    async def run():
+        coalescer = RequestCoalescer()
+
+        async def send():
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=[1])
+
+        first = asyncio.ensure_future(coalescer.do_async("key", send))
+        second = asyncio.ensure_future(coalescer.do_async("key", send))
+        await asyncio.sleep(0)
+        first.cancel()
+        return (await second).json()
+
+    assert asyncio.run(run()) == [1]
+
+
+def test_shared_call_is_cancelled_once_every_caller_is_cancelled():
+    async def run():
+        coalescer = RequestCoalescer()
+        cancelled = asyncio.Event()
+
+        async def send():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [
+            asyncio.ensure_future(coalescer.do_async("key", send)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        return coalescer.get_stats()["in_flight"]
+
+    assert asyncio.run(run()) == 0
@@ -0,0 +1,192 @@
+"""
+Tests for the pluggable JSON codecs.
+"""
+
+import time
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from kythera_kdx import JsonCodec, KytheraKdx
+from pydantic import ValidationError
+
+from kythera_kdx.codec import (
+    decode_json,
+    decode_models,
+    get_json_codec,
+    orjson,
+    trusted_builder,
+)
+from kythera_kdx.models_v1 import (
+    FundFamilyRelationDto,
+    InstrumentCashFlowDto,
+    OverrideInstrumentPriceRequest,
+    PositionDto,
+)
+
+BACKENDS = ["json"] + (["orjson"] if orjson is not None else [])
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_codecs_round_trip_and_agree(name):
+    codec = get_json_codec(name)
+    payload = [{"id": 1, "name": "é", "date": date(2024, 1, 2), "px": Decimal("1.5")}]
+
+    encoded = codec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == [
+        {"id": 1, "name": "é", "date": "2024-01-02", "px": "1.5"}
+    ]
+    with pytest.raises(ValueError):
+        codec.loads(b"[1,")
+
+
+def test_get_json_codec_resolution():
+    custom = JsonCodec()
+    assert get_json_codec(custom) is custom
+    assert get_json_codec("json").name == "json"
+    assert get_json_codec().name in {"orjson", "msgspec", "json"}
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")
+
+
+def test_decode_json_decodes_each_call_separately():
+    response = httpx.Response(200, json=[{"id": 1}])
+
+    first = decode_json(response, Mock())
+    second = decode_json(response, Mock())
+
+    assert first == second == [{"id": 1}]
+    assert first is not second
+
+
+def test_decode_models_validates_bytes_like_per_item_construction():
+    rows = [
+        {"positionDate": "2024-01-02", "fundName": "F1", "quantity": "10"},
+        {"positionDate": None, "fundName": "F2"},
+    ]
+    response = httpx.Response(200, json=rows)
+
+    models = decode_models(response, PositionDto)
+
+    assert models == [PositionDto(**row) for row in rows]
+    assert models[0].positionDate == date(2024, 1, 2)
+
+
+def test_decode_models_raises_validation_error():
+    response = httpx.Response(200, json=[{"positionDate": "not-a-date"}])
+    with pytest.raises(ValidationError):
+        decode_models(response, PositionDto)
+
+
+def test_decode_models_with_a_mocked_client():
+    response = httpx.Response(200, json=[{"fundName": "F1"}])
+    assert decode_models(response, PositionDto, Mock()) == [PositionDto(fundName="F1")]
+
+
+def _make_client(handler, **kwargs) -> KytheraKdx:
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = KytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_client_uses_codec_for_requests_and_responses():
+    codec = JsonCodec()
+    codec.loads = Mock(wraps=codec.loads)
+    captured = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            captured["body"] = request.content
+            captured["content_type"] = request.headers["Content-Type"]
+            return httpx.Response(204)
+        return httpx.Response(200, content=b'[{"id": 7}]')
+
+    kdx = _make_client(handler, json_codec=codec)
+
+    assert kdx.funds.get_funds_raw() == [{"id": 7}]
+    codec.loads.assert_called_once()
+
+    kdx.prices.post_prices(
+        [OverrideInstrumentPriceRequest(instrumentId=1, price=10.5, rate=0.1)]
+    )
+    assert captured["content_type"] == "application/json"
+    assert captured["body"] == b'[{"instrumentId":1,"price":10.5,"rate":0.1}]'
+
+
+def test_validate_false_builds_equivalent_models_without_validation():
+    rows = [
+        {
+            "id": 1,
+            "name": "Bond",
+            "groupName": "Fixed Income",
+            "issuers": [{"issuerId": 3, "name": "Issuer", "description": "",
+                         "tinNumber": "1", "country": "BR"}],
+            "cashFlows": None,
+        }
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=rows)
+
+    validated = _make_client(handler).instruments.get_instruments()
+    trusted = _make_client(handler, validate=False).instruments.get_instruments()
+
+    assert trusted[0].model_dump() == validated[0].model_dump()
+    assert type(trusted[0].issuers[0]) is type(validated[0].issuers[0])
+
+
+def test_validate_false_skips_validation_and_converts_dates():
+    rows = [{"positionDate": "2024-01-02", "quantity": "not-a-number"}]
+    kdx = _make_client(lambda request: httpx.Response(200, json=rows), validate=False)
+
+    position = kdx.positions.get_positions()[0]
+
+    assert position.positionDate == date(2024, 1, 2)
+    assert position.quantity == "not-a-number"
+    assert next(kdx.positions.iter_positions()).positionDate == date(2024, 1, 2)
+
+
+def test_trusted_builder_drops_unknown_keys_when_required_fields_are_missing():
+    # One unknown key and one missing required field: as many keys as the model
+    item = {"fundName": "Alpha", "navMultiplier": 1.0, "extra": "x"}
+
+    relation = trusted_builder(FundFamilyRelationDto)(item)
+
+    assert "extra" not in relation.__dict__
+    assert relation.__dict__ == FundFamilyRelationDto.model_construct(**item).__dict__
+
+
+def test_trusted_builder_adopts_complete_rows_and_keeps_fields_set_mutable():
+    row = {name: None for name in PositionDto.model_fields}
+    row["positionDate"] = "2024-01-02"
+
+    position = trusted_builder(PositionDto)(row)
+    position.quantity = 5
+
+    assert position.__dict__ is row
+    assert position.positionDate == date(2024, 1, 2)
+    assert position.model_fields_set == set(PositionDto.model_fields)
+
+
+def test_trusted_builder_with_copy_leaves_the_item_untouched():
+    item = {name: None for name in InstrumentCashFlowDto.model_fields}
+    item.update(cashFlowType="Coupon", settleDate="2024-01-02")
+
+    cash_flow = trusted_builder(InstrumentCashFlowDto, copy=True)(item)
+
+    assert cash_flow.settleDate == date(2024, 1, 2)
+    assert item["settleDate"] == "2024-01-02"
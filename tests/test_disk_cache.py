@@ -0,0 +1,170 @@
+"""
+Tests for the persistent on-disk cache of historical data.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import httpx
+
+from kythera_kdx import AsyncKytheraKdx, DiskCache, KytheraKdx, ResponseCache
+
+PRICES = [{"date": "2024-03-28", "instrumentName": "PETR4", "price": 38.5}]
+PAST = date.today() - timedelta(days=10)
+TODAY = date.today()
+
+
+def _response(body=b"[1, 2, 3]") -> httpx.Response:
+    return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+
+def test_only_closed_dates_are_immutable(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+
+    assert cache.is_immutable("/v1/prices", {"priceDate": PAST.isoformat()})
+    assert cache.is_immutable("/v1/prices/42", {"priceDate": PAST.isoformat()})
+    assert not cache.is_immutable("/v1/prices", {"priceDate": TODAY.isoformat()})
+    assert not cache.is_immutable("/v1/prices/price-types", {})
+    assert not cache.is_immutable("/v1/positions", {"positionDate": PAST.isoformat()})
+    assert cache.is_immutable(
+        "/v1/funds/navs", {"startDate": PAST.isoformat(), "endDate": PAST.isoformat()}
+    )
+    # An open-ended range runs up to today
+    assert not cache.is_immutable("/v1/funds/navs", {"startDate": PAST.isoformat()})
+    assert not cache.is_immutable(
+        "/v1/indexes/values",
+        {"from-date": PAST.isoformat(), "to-date": TODAY.isoformat()},
+    )
+    assert not cache.is_immutable("/v1/risk-factor-values", {"valuation-date": "n/a"})
+
+
+def test_responses_persist_across_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    params = {"priceDate": PAST.isoformat(), "priceTypeName": "CLOSE"}
+    cache = DiskCache(path)
+    assert cache.store("GET", "/v1/prices", params, _response(), scope="https://a")
+    cache.close()
+
+    cache = DiskCache(path)
+    response = cache.lookup("GET", "/v1/prices", dict(reversed(params.items())), scope="https://a")
+    assert response is not None
+    assert response.json() == [1, 2, 3]
+    assert response.headers["Content-Type"] == "application/json"
+    response.raise_for_status()
+    assert cache.lookup("GET", "/v1/prices", params, scope="https://b") is None
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    body = bytes(range(256)) * 4  # incompressible enough
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), max_bytes=2500, compression_level=0)
+    dates = [(PAST - timedelta(days=i)).isoformat() for i in range(3)]
+
+    cache.store("GET", "/v1/prices", {"priceDate": dates[0]}, _response(body))
+    cache.store("GET", "/v1/prices", {"priceDate": dates[1]}, _response(body))
+    time.sleep(0.01)
+    cache.lookup("GET", "/v1/prices", {"priceDate": dates[0]})
+    cache.store("GET", "/v1/prices", {"priceDate": dates[2]}, _response(body))
+
+    assert cache.lookup("GET", "/v1/prices", {"priceDate": dates[1]}) is None
+    assert cache.lookup("GET", "/v1/prices", {"priceDate": dates[0]}) is not None
+    stats = cache.get_stats()
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+
+
+def test_invalidate_by_template(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    params = {"priceDate": PAST.isoformat()}
+    cache.store("GET", "/v1/prices/1", params, _response())
+    cache.store("GET", "/v1/prices", params, _response())
+
+    assert cache.invalidate("/v1/prices/{instrumentId}") == 1
+    assert cache.invalidate() == 1
+
+
+def test_client_serves_historical_prices_from_disk(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json=PRICES)
+
+    disk_cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    memory_cache = ResponseCache(ttls={})
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = KytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            response_cache=memory_cache,
+            disk_cache=disk_cache,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+
+    first = kdx.prices.get_all_prices(PAST, "CLOSE")
+    second = kdx.prices.get_all_prices_df(PAST, "CLOSE")
+    kdx.prices.get_all_prices_raw(TODAY, "CLOSE")
+    kdx.prices.get_all_prices_raw(TODAY, "CLOSE")
+
+    assert first[0].price == 38.5
+    assert second["instrumentName"].tolist() == ["PETR4"]
+    assert len(calls) == 3
+    assert disk_cache.get_stats()["entries"] == 1
+
+
+class ThreadRecordingDiskCache(DiskCache):
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def lookup(self, *args, **kwargs):
+        self.threads.append(threading.current_thread())
+        return super().lookup(*args, **kwargs)
+
+    def store(self, *args, **kwargs):
+        self.threads.append(threading.current_thread())
+        return super().store(*args, **kwargs)
+
+
+def test_async_client_uses_disk_off_the_event_loop(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json=PRICES)
+
+    disk_cache = ThreadRecordingDiskCache(str(tmp_path / "cache.sqlite"))
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = AsyncKytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            disk_cache=disk_cache,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+
+    async def run():
+        async with kdx:
+            first = await kdx.prices.get_all_prices_raw(PAST, "CLOSE")
+            second = await kdx.prices.get_all_prices_raw(PAST, "CLOSE")
+            # Not historical: the disk cache is skipped without leaving the loop
+            await kdx.prices.get_all_prices_raw(TODAY, "CLOSE")
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second == PRICES
+    assert len(calls) == 2
+    # lookup (miss), store, lookup (hit), all on executor threads
+    assert len(disk_cache.threads) == 3
+    assert threading.main_thread() not in disk_cache.threads
+    assert disk_cache.get_stats()["hits"] == 1
@@ -6,6 +6,7 @@ from kythera_kdx.exceptions import (
     KytheraError,
     KytheraAPIError,
     KytheraAuthError,
+    KytheraCircuitOpenError,
     KytheraConnectionError,
     KytheraTimeoutError
 )
@@ -49,3 +50,13 @@ class TestExceptions:
         error = KytheraTimeoutError("Request timed out")
         assert str(error) == "Request timed out"
         assert isinstance(error, KytheraError)
+
+    def test_circuit_open_error(self):
+        """Test KytheraCircuitOpenError with endpoint and retry delay."""
+        error = KytheraCircuitOpenError(
+            "Circuit open", endpoint="/v1/prices/{instrumentId}", retry_after=12.5
+        )
+        assert str(error) == "Circuit open"
+        assert error.endpoint == "/v1/prices/{instrumentId}"
+        assert error.retry_after == 12.5
+        assert isinstance(error, KytheraError)
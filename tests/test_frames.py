@@ -0,0 +1,113 @@
+"""
+Tests for the schema-driven DataFrame builder used by the *_df methods.
+"""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from kythera_kdx import KytheraKdx
+from kythera_kdx.frames import build_frame
+from kythera_kdx.models_v1 import InstrumentDto, PositionDto
+
+POSITIONS = [
+    {"id": 1, "isOpen": True, "positionDate": "2024-01-02", "fundName": "Alpha",
+     "instrumentName": "PETR4", "quantity": 10.5},
+    {"id": None, "isOpen": None, "positionDate": None, "fundName": "Alpha",
+     "instrumentName": "PETR4", "quantity": None},
+    {"id": 3, "isOpen": False, "positionDate": "2024-01-03", "fundName": "Alpha",
+     "instrumentName": "VALE3", "quantity": 1.0},
+]
+
+
+def test_dtypes_are_derived_from_the_model():
+    df = build_frame(POSITIONS, PositionDto)
+
+    assert df["id"].dtype == "Int64"
+    assert df["id"].isna().tolist() == [False, True, False]
+    assert df["isOpen"].dtype == "boolean"
+    assert pd.api.types.is_datetime64_dtype(df["positionDate"])
+    assert df["positionDate"].iloc[0] == pd.Timestamp("2024-01-02")
+    assert pd.isna(df["positionDate"].iloc[1])
+    assert df["quantity"].dtype == np.float64
+    assert np.isnan(df["quantity"].iloc[1])
+    assert isinstance(df["fundName"].dtype, pd.CategoricalDtype)
+    assert list(df.columns) == list(POSITIONS[0])
+
+
+def test_unique_strings_are_not_categorical():
+    rows = [{"fundName": f"Fund {i}"} for i in range(10)]
+    df = build_frame(rows, PositionDto)
+    assert not isinstance(df["fundName"].dtype, pd.CategoricalDtype)
+    assert df["fundName"].tolist() == [row["fundName"] for row in rows]
+
+
+def test_heterogeneous_records_and_unknown_keys():
+    rows = [{"id": 1, "extra": "x"}, {"quantity": 2.0, "other": [1, 2]}]
+    df = build_frame(rows, PositionDto)
+
+    assert list(df.columns) == ["id", "extra", "quantity", "other"]
+    assert df["id"].dtype == "Int64"
+    assert df["other"].iloc[1] == [1, 2]
+
+
+def test_nested_list_values_stay_in_one_column():
+    rows = [{"id": 1, "issuers": [{"a": 1}, {"a": 2}]}, {"id": 2, "issuers": [{"a": 3}, {"a": 4}]}]
+    df = build_frame(rows, InstrumentDto)
+    assert df.shape == (2, 2)
+    assert df["issuers"].iloc[1] == [{"a": 3}, {"a": 4}]
+
+
+def test_records_without_keys():
+    assert build_frame([{}, {}]).empty
+    df = build_frame([{}, {"id": 1}], PositionDto)
+    assert df["id"].tolist()[1] == 1
+
+
+def test_integer_and_boolean_columns_without_missing_values():
+    rows = [{"id": 1, "isOpen": True}, {"id": 2, "isOpen": False}]
+    df = build_frame(rows, PositionDto)
+
+    assert df["id"].dtype == "Int64"
+    assert df["id"].tolist() == [1, 2]
+    assert df["isOpen"].dtype == "boolean"
+    assert df["isOpen"].tolist() == [True, False]
+    assert not df["id"].isna().any()
+    # Non-integral numbers are not truncated into the Int64 column
+    assert build_frame([{"id": 1.5}], PositionDto)["id"].tolist() == [1.5]
+
+
+def test_unexpected_values_fall_back_to_inference():
+    df = build_frame([{"quantity": "n/a"}, {"quantity": "1.0"}], PositionDto)
+    assert df["quantity"].tolist() == ["n/a", "1.0"]
+    # Unparseable dates are kept as they are, never silently turned into NaT
+    df = build_frame([{"positionDate": "2024-01-02"}, {"positionDate": "soon"}], PositionDto)
+    assert df["positionDate"].tolist() == ["2024-01-02", "soon"]
+
+
+def test_empty_records_produce_typed_model_columns():
+    df = build_frame([], PositionDto)
+    assert df.empty
+    assert list(df.columns) == list(PositionDto.model_fields)
+    assert df["quantity"].dtype == np.float64
+
+
+def test_df_methods_use_the_builder():
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = KytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=POSITIONS)),
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+
+    df = kdx.positions.get_positions_df()
+
+    assert df["id"].dtype == "Int64"
+    assert pd.api.types.is_datetime64_dtype(df["positionDate"])
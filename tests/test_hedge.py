@@ -0,0 +1,167 @@
+"""
+Tests for hedged GET requests.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+
+from kythera_kdx import AsyncKytheraKdx, HedgePolicy, KytheraKdx
+
+PNL = [{"fundName": "Alpha", "pnl": 1.5}]
+
+
+def _kdx(cls, handler, policy):
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = cls(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            hedge_policy=policy,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_slow_request_is_hedged_and_fastest_response_wins():
+    calls = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls.append(request.url.path)
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.5)
+            return httpx.Response(200, json=[{"fundName": "slow"}])
+        return httpx.Response(200, json=PNL)
+
+    policy = HedgePolicy(delay=0.02, budget_ratio=1.0)
+    kdx = _kdx(KytheraKdx, handler, policy)
+
+    started = time.monotonic()
+    assert kdx.get("/v1/pnl/intraday").json() == PNL
+    assert time.monotonic() - started < 0.4
+    assert calls == ["/v1/pnl/intraday", "/v1/pnl/intraday"]
+    stats = policy.get_stats()
+    assert (stats["requests"], stats["hedges"], stats["hedge_wins"]) == (1, 1, 1)
+
+
+def test_fast_requests_and_other_methods_are_not_hedged():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(200, json=PNL)
+
+    policy = HedgePolicy(delay=0.5, budget_ratio=1.0)
+    kdx = _kdx(KytheraKdx, handler, policy)
+
+    kdx.get("/v1/pnl/intraday")
+    kdx.post("/v1/trades", data={"id": 1})
+
+    assert calls == ["GET", "POST"]
+    assert policy.get_stats()["hedges"] == 0
+
+
+def test_budget_caps_hedges_to_a_fraction_of_requests():
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.02)
+        return httpx.Response(200, json=PNL)
+
+    policy = HedgePolicy(delay=0.001, budget_ratio=0.25)
+    kdx = _kdx(KytheraKdx, handler, policy)
+
+    for _ in range(8):
+        kdx.get("/v1/pnl/intraday")
+
+    stats = policy.get_stats()
+    assert stats["hedges"] == 2
+    assert stats["budget_rejections"] == 6
+
+
+def test_losing_response_is_closed():
+    responses = []
+
+    def send():
+        # Unread body, so that closing it is observable
+        response = httpx.Response(200, stream=httpx.ByteStream(b"[]"))
+        responses.append(response)
+        if len(responses) == 1:
+            time.sleep(0.2)
+        return response
+
+    policy = HedgePolicy(delay=0.02, budget_ratio=1.0)
+
+    winner = policy.run("/v1/pnl/intraday", send)
+
+    assert winner is responses[1] and not winner.is_closed
+    time.sleep(0.3)
+    assert responses[0].is_closed
+
+
+def test_delay_follows_endpoint_latency_percentile():
+    policy = HedgePolicy(
+        percentile=0.9, min_samples=10, initial_delay=2.0, endpoints=["/v1/prices/{instrumentId}"]
+    )
+    key = policy.endpoint_key("GET", "/v1/prices/42")
+
+    assert key == "/v1/prices/{instrumentId}"
+    assert policy.endpoint_key("GET", "/v1/trades") is None
+    assert policy.endpoint_key("POST", "/v1/prices/42") is None
+    assert policy.delay_for(key) == 2.0
+    for latency in range(1, 11):
+        policy._record_latency(key, latency / 100)
+    assert policy.delay_for(key) == 0.1
+
+
+def test_hedge_is_used_when_the_first_attempt_fails():
+    calls = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls.append(1)
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.1)
+            return httpx.Response(400, json={"error": "bad"})
+        time.sleep(0.2)
+        return httpx.Response(200, json=PNL)
+
+    policy = HedgePolicy(delay=0.02, budget_ratio=1.0)
+    kdx = _kdx(KytheraKdx, handler, policy)
+
+    assert kdx.get("/v1/pnl/intraday").json() == PNL
+
+
+def test_async_hedge_cancels_the_slow_attempt():
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if not cancelled:
+            cancelled.append(False)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled[0] = True
+                raise
+        return httpx.Response(200, json=PNL)
+
+    policy = HedgePolicy(delay=0.02, budget_ratio=1.0)
+
+    async def run():
+        async with _kdx(AsyncKytheraKdx, handler, policy) as kdx:
+            rows = await kdx.pnl.get_intraday_pnl_raw()
+            await asyncio.sleep(0)
+            return rows
+
+    assert asyncio.run(run()) == PNL
+    assert cancelled == [True]
+    assert policy.get_stats()["hedge_wins"] == 1
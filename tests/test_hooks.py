@@ -0,0 +1,195 @@
+"""
+Tests for request lifecycle event hooks.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kythera_kdx import AsyncKytheraKdx, EventHooks, KytheraKdx, RetryPolicy
+
+TRADES = [
+    {"id": 1, "fundName": "Alpha", "quantity": 10.0},
+    {"id": 2, "fundName": "Beta", "quantity": -5.0},
+]
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def hooks(self):
+        return EventHooks(
+            **{
+                event: (lambda payload, event=event: self.events.append((event, payload)))
+                for event in (
+                    "on_request_start",
+                    "on_response_headers",
+                    "on_response_complete",
+                    "on_retry",
+                    "on_token_refresh",
+                    "on_decode_complete",
+                )
+            }
+        )
+
+    def names(self):
+        return [event for event, _ in self.events]
+
+    def payloads(self, name):
+        return [payload for event, payload in self.events if event == name]
+
+
+def _kdx(cls, hooks, handler=None, **kwargs):
+    handler = handler or (lambda request: httpx.Response(200, json=TRADES))
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = cls(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            event_hooks=hooks,
+            **kwargs,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_request_lifecycle_events_in_order():
+    recorder = Recorder()
+    kdx = _kdx(KytheraKdx, recorder.hooks())
+
+    kdx.trades.get_trades_df()
+
+    assert recorder.names() == [
+        "on_request_start",
+        "on_response_headers",
+        "on_response_complete",
+        "on_decode_complete",
+        "on_decode_complete",
+    ]
+    (start,) = recorder.payloads("on_request_start")
+    assert start["method"] == "GET"
+    assert start["endpoint"] == "/v1/trades"
+    assert start["url"] == "https://test.api.com/v1/trades"
+    (headers,) = recorder.payloads("on_response_headers")
+    assert headers["status_code"] == 200
+    assert headers["ttfb"] >= 0
+    (complete,) = recorder.payloads("on_response_complete")
+    assert complete["bytes"] == len(httpx.Response(200, json=TRADES).content)
+    assert complete["elapsed"] == pytest.approx(complete["ttfb"] + complete["download"])
+    decoded, frame = recorder.payloads("on_decode_complete")
+    assert (decoded["kind"], decoded["rows"]) == ("json", 2)
+    assert (frame["kind"], frame["rows"], frame["endpoint"]) == ("frame", 2, "/v1/trades")
+
+
+def test_model_validation_reports_the_model():
+    recorder = Recorder()
+    kdx = _kdx(KytheraKdx, recorder.hooks())
+
+    trades = kdx.trades.get_trades()
+
+    (validated,) = recorder.payloads("on_decode_complete")
+    assert validated["kind"] == "models"
+    assert validated["model"] is type(trades[0])
+    assert validated["rows"] == 2
+
+
+@patch("kythera_kdx.authenticated_client.time.sleep")
+def test_retries_are_reported(mock_sleep):
+    responses = iter([httpx.Response(503), httpx.Response(200, json=TRADES)])
+    recorder = Recorder()
+    kdx = _kdx(
+        KytheraKdx,
+        recorder.hooks(),
+        lambda request: next(responses),
+        retry_policy=RetryPolicy(max_retries=2),
+    )
+
+    kdx.get("/v1/trades")
+
+    (retry,) = recorder.payloads("on_retry")
+    assert retry["retry"] == 1
+    assert retry["reason"] == "503"
+    assert retry["status_code"] == 503
+    assert retry["delay"] == mock_sleep.call_args[0][0]
+    assert [p["status_code"] for p in recorder.payloads("on_response_complete")] == [503, 200]
+
+
+def test_token_refresh_is_reported():
+    recorder = Recorder()
+    kdx = _kdx(KytheraKdx, recorder.hooks())
+    kdx._cached_token = None
+
+    with patch.object(kdx, "_get_access_token", return_value="new-token"):
+        kdx.get("/v1/trades")
+
+    (refresh,) = recorder.payloads("on_token_refresh")
+    assert refresh["force_refresh"] is False
+    assert refresh["background"] is False
+    assert refresh["error"] is None
+    assert refresh["elapsed"] >= 0
+
+
+def test_streamed_response_completes_when_closed():
+    body = httpx.Response(200, json=TRADES).content
+    recorder = Recorder()
+    kdx = _kdx(
+        KytheraKdx,
+        recorder.hooks(),
+        lambda request: httpx.Response(200, stream=httpx.ByteStream(body)),
+    )
+
+    rows = list(kdx.trades.iter_trades_raw())
+
+    assert len(rows) == 2
+    assert recorder.names() == [
+        "on_request_start",
+        "on_response_headers",
+        "on_response_complete",
+    ]
+    (complete,) = recorder.payloads("on_response_complete")
+    assert complete["bytes"] == len(body)
+
+
+def test_failing_callback_does_not_break_the_request():
+    def boom(payload):
+        raise RuntimeError("broken hook")
+
+    kdx = _kdx(KytheraKdx, EventHooks(on_request_start=boom))
+
+    assert kdx.get("/v1/trades").status_code == 200
+
+
+def test_add_and_remove_callbacks():
+    hooks = EventHooks()
+    seen = []
+    hooks.add("on_retry", seen.append)
+    hooks.emit("on_retry", {"retry": 1})
+    hooks.remove("on_retry", seen.append)
+    hooks.emit("on_retry", {"retry": 2})
+
+    assert seen == [{"retry": 1}]
+    with pytest.raises(ValueError):
+        hooks.add("on_finish", seen.append)
+
+
+def test_async_client_emits_events():
+    recorder = Recorder()
+    kdx = _kdx(AsyncKytheraKdx, recorder.hooks())
+
+    asyncio.run(kdx.trades.get_trades_arrow())
+
+    assert recorder.names() == [
+        "on_request_start",
+        "on_response_headers",
+        "on_response_complete",
+        "on_decode_complete",
+        "on_decode_complete",
+    ]
+    assert recorder.payloads("on_decode_complete")[1]["kind"] == "table"
@@ -0,0 +1,68 @@
+"""
+Tests for connection pool and shared HTTP client configuration.
+"""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kythera_kdx import KytheraKdx
+
+
+def _make_client(**kwargs) -> KytheraKdx:
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = KytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            **kwargs,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_pool_options_are_applied():
+    timeout = httpx.Timeout(10.0, connect=2.0, pool=1.0)
+    limits = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+    kdx = _make_client(timeout=timeout, limits=limits)
+
+    assert kdx.session.timeout == timeout
+    options = kdx._http_client_options()
+    assert options["limits"] is limits
+    assert options["http2"] is False
+    kdx.close()
+
+
+def test_shared_http_client_is_reused_and_not_closed():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["X-Api-Key"])
+        return httpx.Response(200, json=[])
+
+    shared = httpx.Client(transport=httpx.MockTransport(handler))
+    kdx_a = _make_client(http_client=shared, x_api_key="key-a")
+    kdx_b = _make_client(http_client=shared, x_api_key="key-b")
+
+    assert kdx_a.session is kdx_b.session is shared
+    kdx_a.positions.get_positions_raw()
+    kdx_b.positions.get_positions_raw()
+    # Auth headers are sent per request, never stored on the shared client
+    assert seen == ["key-a", "key-b"]
+    assert "X-Api-Key" not in shared.headers
+
+    kdx_a.close()
+    assert not shared.is_closed
+    shared.close()
+
+
+def test_http_client_and_transport_are_exclusive():
+    with pytest.raises(ValueError):
+        _make_client(
+            http_client=httpx.Client(),
+            transport=httpx.MockTransport(lambda r: httpx.Response(200)),
+        )
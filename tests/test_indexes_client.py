@@ -1,4 +1,5 @@
 from unittest.mock import Mock
+import httpx
 import pandas as pd
 from datetime import date
 
@@ -11,9 +12,7 @@ def test_get_index_values_query_params_and_shapes():
         {"indexName": "IDX1", "sessionDate": "2025-08-18", "value": 123.45},
         {"indexName": "IDX2", "sessionDate": "2025-08-18", "value": 67.89},
     ]
-    mock_resp = Mock()
-    mock_resp.json.return_value = sample
-    mock_client.get.return_value = mock_resp
+    mock_client.get.return_value = httpx.Response(200, json=sample)
 
     client = IndexesClient(mock_client)
 
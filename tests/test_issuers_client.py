@@ -1,4 +1,5 @@
 from unittest.mock import Mock
+import httpx
 import pandas as pd
 
 from src.kythera_kdx.issuers import IssuersClient
@@ -22,9 +23,7 @@ def test_get_issuers_endpoints_and_params():
             "parentIssuerName": "Parent B",
         },
     ]
-    mock_resp = Mock()
-    mock_resp.json.return_value = sample
-    mock_client.get.return_value = mock_resp
+    mock_client.get.return_value = httpx.Response(200, json=sample)
 
     client = IssuersClient(mock_client)
 
@@ -58,9 +57,7 @@ def test_get_issuer_parameters():
             "parentIssuerName": "Parent A",
         }
     ]
-    mock_resp = Mock()
-    mock_resp.json.return_value = sample_params
-    mock_client.get.return_value = mock_resp
+    mock_client.get.return_value = httpx.Response(200, json=sample_params)
 
     client = IssuersClient(mock_client)
 
@@ -0,0 +1,151 @@
+"""
+Tests for per-endpoint request and conversion metrics.
+"""
+
+import asyncio
+import time
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+
+from kythera_kdx import AsyncKytheraKdx, ClientMetrics, KytheraKdx, prometheus_text
+from kythera_kdx.metrics import Histogram
+
+TRADES = [
+    {"id": 1, "fundName": "Alpha", "quantity": 10.0},
+    {"id": 2, "fundName": "Beta", "quantity": -5.0},
+]
+PRICES = [{"date": "2024-03-28", "instrumentName": "PETR4", "price": 38.5}]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.startswith("/v1/prices"):
+        return httpx.Response(200, json=PRICES)
+    return httpx.Response(200, json=TRADES)
+
+
+def _kdx(cls, handler=_handler, **kwargs):
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = cls(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_records_network_decode_validation_and_frame_metrics():
+    kdx = _kdx(KytheraKdx)
+
+    kdx.trades.get_trades_df()
+    kdx.trades.get_trades()
+    kdx.trades.get_trades_arrow()
+
+    trades = kdx.metrics.snapshot()["/v1/trades"]
+    assert trades["requests"] == {200: 3}
+    assert trades["ttfb_seconds"]["count"] == 3
+    assert trades["download_seconds"]["count"] == 3
+    body_size = len(httpx.Response(200, json=TRADES).content)
+    assert trades["response_bytes"]["sum"] == 3 * body_size
+    assert trades["decode_seconds"]["count"] == 2
+    assert trades["validation_seconds"]["count"] == 1
+    assert trades["frame_seconds"]["count"] == 1
+    assert trades["table_seconds"]["count"] == 1
+    assert trades["rows"]["sum"] == 6
+
+
+def test_paths_are_reported_under_their_template():
+    kdx = _kdx(KytheraKdx)
+
+    kdx.prices.get_prices_by_instrument_raw(1, date(2024, 3, 28), "CLOSE")
+    kdx.prices.get_prices_by_instrument_df(2, date(2024, 3, 28), "CLOSE")
+
+    snapshot = kdx.metrics.snapshot()
+    assert list(snapshot) == ["/v1/prices/{instrumentId}"]
+    assert snapshot["/v1/prices/{instrumentId}"]["requests"] == {200: 2}
+    assert snapshot["/v1/prices/{instrumentId}"]["frame_seconds"]["count"] == 1
+
+
+def test_frame_metrics_share_the_request_path():
+    relations = [{"fundFamilyName": "Macro", "fundName": "Alpha"}]
+    kdx = _kdx(KytheraKdx, handler=lambda request: httpx.Response(200, json=relations))
+
+    kdx.funds.get_fund_family_relations_df()
+    kdx.funds.get_fund_family_relations_arrow()
+
+    snapshot = kdx.metrics.snapshot()
+    assert list(snapshot) == ["/v1/fund-families-relations"]
+    assert snapshot["/v1/fund-families-relations"]["requests"] == {200: 2}
+    assert snapshot["/v1/fund-families-relations"]["frame_seconds"]["count"] == 1
+
+
+def test_metrics_can_be_disabled_or_shared():
+    assert _kdx(KytheraKdx, metrics=False).metrics is None
+
+    shared = ClientMetrics()
+    first = _kdx(KytheraKdx, metrics=shared)
+    second = _kdx(KytheraKdx, metrics=shared)
+    first.trades.get_trades_raw()
+    second.trades.get_trades_raw()
+
+    assert shared.snapshot()["/v1/trades"]["requests"] == {200: 2}
+    shared.reset()
+    assert shared.snapshot() == {}
+
+
+def test_error_statuses_are_counted():
+    kdx = _kdx(KytheraKdx, handler=lambda request: httpx.Response(404, json={}))
+
+    try:
+        kdx.trades.get_trades_raw()
+    except Exception:
+        pass
+
+    assert kdx.metrics.snapshot()["/v1/trades"]["requests"] == {404: 1}
+
+
+def test_async_client_records_metrics():
+    async def run():
+        async with _kdx(AsyncKytheraKdx) as kdx:
+            await kdx.trades.get_trades_df()
+            return kdx.metrics.snapshot()
+
+    trades = asyncio.run(run())["/v1/trades"]
+    assert trades["requests"] == {200: 1}
+    assert trades["frame_seconds"]["count"] == 1
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram((1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {1.0: 1, 2.0: 3, 4.0: 4}
+    assert snapshot["max"] == 3.0
+    assert histogram.quantile(0.5) == 1.5
+    assert histogram.quantile(1.0) == 3.0
+
+
+def test_prometheus_text_exposition():
+    metrics = ClientMetrics()
+    metrics.observe_response("/v1/trades", 200, 0.02, 0.004, 2048)
+    metrics.observe("/v1/trades", "rows", 150)
+
+    text = prometheus_text(metrics)
+
+    assert '# TYPE kythera_kdx_requests_total counter' in text
+    assert 'kythera_kdx_requests_total{endpoint="/v1/trades",status="200"} 1' in text
+    assert '# TYPE kythera_kdx_ttfb_seconds histogram' in text
+    assert 'kythera_kdx_ttfb_seconds_bucket{endpoint="/v1/trades",le="0.01"} 0' in text
+    assert 'kythera_kdx_ttfb_seconds_bucket{endpoint="/v1/trades",le="0.025"} 1' in text
+    assert 'kythera_kdx_ttfb_seconds_bucket{endpoint="/v1/trades",le="+Inf"} 1' in text
+    assert 'kythera_kdx_rows_sum{endpoint="/v1/trades"} 150' in text
+    assert "kythera_kdx_decode_seconds" not in text
+    assert text.endswith("\n")
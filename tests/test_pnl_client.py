@@ -6,6 +6,7 @@ Test script to verify the revised PnlClient implementation.
 from src.kythera_kdx.pnl import PnlClient
 from src.kythera_kdx.models_v1 import IntradayPnlEntryDto
 from unittest.mock import Mock
+import httpx
 import pandas as pd
 import math
 
@@ -37,9 +38,7 @@ def test_pnl_client():
     ]
     
     # Mock the response
-    mock_response = Mock()
-    mock_response.json.return_value = sample_data
-    mock_client.get.return_value = mock_response
+    mock_client.get.return_value = httpx.Response(200, json=sample_data)
     
     # Create PnlClient instance
     pnl_client = PnlClient(mock_client)
@@ -91,9 +90,7 @@ def test_pnl_explain_params_and_shapes():
         {"id": 1, "pnl": 10.5, "explainDetails": {"fundName": "F1"}},
         {"id": 2, "pnl": -2.0, "explainDetails": {"fundName": "F2"}},
     ]
-    mock_resp = Mock()
-    mock_resp.json.return_value = payload
-    mock_client.get.return_value = mock_resp
+    mock_client.get.return_value = httpx.Response(200, json=payload)
 
     pnl_client = PnlClient(mock_client)
 
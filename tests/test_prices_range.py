@@ -0,0 +1,179 @@
+"""
+Tests for the concurrent date-range price methods.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import date
+
+import httpx
+import pytest
+
+from kythera_kdx import AsyncKytheraKdx, DateRangeResult, KytheraAPIError
+from kythera_kdx.fanout import business_days, fetch_dates, fetch_dates_async
+from kythera_kdx.models_v1 import PriceDto
+from kythera_kdx.prices import _dated
+from kythera_kdx.stub import offline_client
+
+FAILING_DATE = "2024-01-04"
+
+
+class PricesServer:
+    """Two prices per date, a 500 on FAILING_DATE, tracking requests in flight."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.dates = []
+
+    def _body(self, request):
+        day = request.url.params["priceDate"]
+        with self.lock:
+            self.dates.append(day)
+        if day == FAILING_DATE:
+            return httpx.Response(500, json={"title": "Boom", "status": 500})
+        return httpx.Response(
+            200,
+            json=[
+                {"date": day, "instrumentId": 2, "instrumentName": "B", "price": 2.0},
+                {"instrumentId": 1, "instrumentName": "A", "price": 1.0},
+            ],
+        )
+
+    def handle(self, request):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return self._body(request)
+
+    async def handle_async(self, request):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return self._body(request)
+
+
+def test_business_days():
+    assert business_days(date(2024, 1, 5), date(2024, 1, 9)) == [
+        date(2024, 1, 5),
+        date(2024, 1, 8),
+        date(2024, 1, 9),
+    ]
+    assert business_days(date(2024, 1, 5), date(2024, 1, 9), [date(2024, 1, 8)]) == [
+        date(2024, 1, 5),
+        date(2024, 1, 9),
+    ]
+
+
+def test_any_exception_is_a_failure_but_cancellation_propagates():
+    days = [date(2024, 1, 2), date(2024, 1, 3)]
+
+    def fetch(day):
+        if day == days[1]:
+            raise ValueError("bad payload")
+        return [day]
+
+    for max_concurrency in (1, 2):
+        results, failures = fetch_dates(fetch, days, max_concurrency)
+        assert results == {days[0]: [days[0]]}
+        assert isinstance(failures[days[1]], ValueError)
+
+    async def cancelled(day):
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(fetch_dates_async(cancelled, days, 2))
+
+
+def test_dated_copies_records():
+    record = {"instrumentId": 1, "price": 1.0}
+    price = PriceDto(instrumentId=1, price=1.0)
+
+    dated = _dated([record, price], date(2024, 1, 2))
+
+    assert dated[0]["date"] == "2024-01-02" and "date" not in record
+    assert dated[1].date == date(2024, 1, 2) and price.date is None
+
+
+def test_raw_range_skips_weekends_and_reports_failures():
+    server = PricesServer()
+    kdx = offline_client(transport=httpx.MockTransport(server.handle))
+
+    result = kdx.prices.get_prices_range_raw(
+        date(2024, 1, 1), date(2024, 1, 14), "CLOSE", max_concurrency=3
+    )
+
+    assert isinstance(result, DateRangeResult)
+    assert len(result.dates) == 10
+    assert sorted(server.dates) == [day.isoformat() for day in result.dates]
+    assert server.max_in_flight == 3
+    assert list(result.failures) == [date(2024, 1, 4)]
+    assert isinstance(result.failures[date(2024, 1, 4)], KytheraAPIError)
+    assert not result.ok
+    assert len(result.data) == 18
+    # Date order, with missing dates filled from the request
+    assert [row["date"] for row in result.data[:4]] == ["2024-01-01"] * 2 + ["2024-01-02"] * 2
+    with pytest.raises(KytheraAPIError):
+        result.raise_for_failures()
+
+
+def test_typed_range():
+    server = PricesServer()
+    kdx = offline_client(transport=httpx.MockTransport(server.handle))
+
+    result = kdx.prices.get_prices_range(date(2024, 1, 1), date(2024, 1, 3), "CLOSE")
+
+    assert result.ok
+    assert all(isinstance(price, PriceDto) for price in result.data)
+    assert [price.date for price in result.data[:2]] == [date(2024, 1, 1)] * 2
+
+
+def test_df_range_is_indexed_by_date_and_instrument():
+    server = PricesServer()
+    kdx = offline_client(transport=httpx.MockTransport(server.handle))
+
+    result = kdx.prices.get_prices_range_df(date(2024, 1, 2), date(2024, 1, 5), "CLOSE")
+
+    frame = result.data
+    assert list(frame.index.names) == ["date", "instrumentId"]
+    assert frame.index.is_monotonic_increasing
+    assert len(frame) == 6
+    assert frame.loc[("2024-01-05", 1), "price"] == 1.0
+    assert list(result.failures) == [date(2024, 1, 4)]
+
+
+def test_arrow_range_is_sorted():
+    pytest.importorskip("pyarrow")
+    server = PricesServer()
+    kdx = offline_client(transport=httpx.MockTransport(server.handle))
+
+    result = kdx.prices.get_prices_range_arrow(date(2024, 1, 2), date(2024, 1, 3), "CLOSE")
+
+    assert result.data.column("instrumentId").to_pylist() == [1, 2, 1, 2]
+
+
+def test_async_range():
+    server = PricesServer()
+
+    async def run():
+        kdx = offline_client(
+            AsyncKytheraKdx, transport=httpx.MockTransport(server.handle_async)
+        )
+        async with kdx:
+            return await kdx.prices.get_prices_range_df(
+                date(2024, 1, 1), date(2024, 1, 12), "CLOSE", max_concurrency=4
+            )
+
+    result = asyncio.run(run())
+
+    assert server.max_in_flight == 4
+    assert len(result.data) == 18
+    assert list(result.failures) == [date(2024, 1, 4)]
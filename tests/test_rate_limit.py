@@ -0,0 +1,141 @@
+"""
+Tests for the client-side rate limiter.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+
+from kythera_kdx import AsyncKytheraKdx, KytheraKdx, RateLimiter
+from kythera_kdx.rate_limit import TokenBucket, compile_path_template
+
+
+def _authenticate(kdx):
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_path_template_matching():
+    pattern = compile_path_template("/v1/prices/{instrumentId}")
+    assert pattern.match("/v1/prices/123")
+    assert not pattern.match("/v1/prices")
+    assert not pattern.match("/v1/prices/price-types/extra")
+
+
+def test_token_bucket_spaces_requests():
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.reserve() == 0.0
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+
+
+def test_concurrency_cap_shared_across_threads():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return httpx.Response(200, json=[])
+
+    limiter = RateLimiter(
+        max_concurrency=4,
+        endpoint_limits={"/v1/prices/{instrumentId}": RateLimiter(max_concurrency=2)},
+    )
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = _authenticate(
+            KytheraKdx(
+                client_id="test-client",
+                client_secret="test-secret",
+                transport=httpx.MockTransport(handler),
+                rate_limiter=limiter,
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: kdx.get(f"/v1/prices/{i}"), range(8)))
+
+    assert state["peak"] == 2
+    stats = limiter.get_stats()
+    assert stats["acquired"] == 8
+    assert stats["endpoints"]["/v1/prices/{instrumentId}"]["acquired"] == 8
+    assert stats["in_flight"] == 0
+
+
+def test_throttled_endpoint_does_not_hold_shared_slots():
+    sent = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent[request.url.path] = time.monotonic()
+        return httpx.Response(200, json=[])
+
+    limiter = RateLimiter(
+        max_concurrency=1,
+        endpoint_limits={
+            "/v1/prices/{instrumentId}": RateLimiter(requests_per_second=5, burst=1)
+        },
+    )
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = _authenticate(
+            KytheraKdx(
+                client_id="test-client",
+                client_secret="test-secret",
+                transport=httpx.MockTransport(handler),
+                rate_limiter=limiter,
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        prices = [pool.submit(kdx.get, f"/v1/prices/{i}") for i in range(3)]
+        time.sleep(0.05)
+        started = time.monotonic()
+        pool.submit(kdx.get, "/v1/trades").result()
+        [future.result() for future in prices]
+
+    # The trades request is not stuck behind price requests waiting for tokens
+    assert sent["/v1/trades"] - started < 0.1
+    assert max(sent.values()) - started > 0.2
+    stats = limiter.get_stats()
+    assert stats["endpoints"]["/v1/prices/{instrumentId}"]["delayed"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_async_client_honors_limiter():
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return httpx.Response(200, json=[])
+
+    limiter = RateLimiter(requests_per_second=200, burst=2, max_concurrency=3)
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = _authenticate(
+            AsyncKytheraKdx(
+                client_id="test-client",
+                client_secret="test-secret",
+                transport=httpx.MockTransport(handler),
+                rate_limiter=limiter,
+            )
+        )
+
+    async def run():
+        async with kdx:
+            await asyncio.gather(*(kdx.trades.get_trades_raw() for _ in range(10)))
+
+    asyncio.run(run())
+    assert state["peak"] <= 3
+    stats = limiter.get_stats()
+    assert stats["acquired"] == 10
+    assert stats["delayed"] > 0
@@ -0,0 +1,95 @@
+"""
+Tests for the record/replay transports.
+"""
+
+import asyncio
+import time
+import zipfile
+from datetime import date
+
+import pytest
+
+from kythera_kdx import AsyncKytheraKdx, KytheraAPIError
+from kythera_kdx.replay import RecordingTransport, ReplayTransport, replay_client
+from kythera_kdx.stub import StubServer, offline_client
+
+
+@pytest.fixture(scope="module")
+def server():
+    return StubServer(rows=20, latency=0.02)
+
+
+@pytest.fixture
+def archive(server, tmp_path):
+    path = tmp_path / "run.zip"
+    recorder = RecordingTransport(path, transport=server.transport())
+    with offline_client(transport=recorder) as kdx:
+        kdx.trades.get_trades_raw(date(2024, 1, 2))
+        kdx.trades.get_trades_raw(date(2024, 1, 2))
+        kdx.prices.get_all_prices_raw(date(2024, 1, 2), "CLOSE")
+        list(kdx.positions.iter_positions_raw())
+    return path
+
+
+def test_archive_holds_entries_and_deduplicated_bodies(archive):
+    with zipfile.ZipFile(archive) as zf:
+        names = zf.namelist()
+        contents = b"".join(zf.read(name) for name in names)
+
+    assert len([name for name in names if name.startswith("entries/")]) == 4
+    assert len([name for name in names if name.startswith("bodies/")]) == 3
+    assert b"stub-token" not in contents
+
+
+def test_replay_serves_the_recorded_responses(server, archive):
+    kdx = replay_client(archive)
+
+    trades = kdx.trades.get_trades_df(date(2024, 1, 2))
+    prices = kdx.prices.get_all_prices_raw(date(2024, 1, 2), "CLOSE")
+    positions = list(kdx.positions.iter_positions())
+
+    assert len(trades) == len(prices) == len(positions) == 20
+    assert prices == server.data.records("PriceDto", 20)
+
+
+def test_unrecorded_requests_are_not_found(archive):
+    transport = ReplayTransport(archive)
+    kdx = offline_client(transport=transport)
+
+    with pytest.raises(KytheraAPIError) as excinfo:
+        kdx.trades.get_trades_raw(date(2030, 1, 1))
+
+    assert excinfo.value.status_code == 404
+    assert transport.get_stats() == {"entries": 4, "misses": 1}
+
+
+def test_replay_can_simulate_the_recorded_latency(archive):
+    fast = replay_client(archive)
+    slow = replay_client(archive, simulate_latency=True)
+    faster = replay_client(archive, simulate_latency=True, speed=4.0)
+
+    def elapsed(kdx):
+        started = time.perf_counter()
+        kdx.prices.get_all_prices_raw(date(2024, 1, 2), "CLOSE")
+        return time.perf_counter() - started
+
+    assert elapsed(fast) < 0.02 <= elapsed(slow)
+    assert elapsed(faster) < elapsed(slow)
+
+
+def test_async_record_and_replay(server, tmp_path):
+    path = tmp_path / "async.zip"
+
+    async def record():
+        recorder = RecordingTransport(
+            path, async_transport=server.transport(asynchronous=True)
+        )
+        async with offline_client(AsyncKytheraKdx, transport=recorder) as kdx:
+            await kdx.funds.get_funds_raw()
+
+    async def replay():
+        kdx = replay_client(path, AsyncKytheraKdx)
+        return await kdx.funds.get_funds_df()
+
+    asyncio.run(record())
+    assert len(asyncio.run(replay())) == 20
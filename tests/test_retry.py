@@ -0,0 +1,112 @@
+"""
+Tests for the retry policy used by _make_request.
+"""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kythera_kdx import KytheraKdx, RetryPolicy
+from kythera_kdx.exceptions import KytheraAPIError, KytheraConnectionError
+from kythera_kdx.retry import parse_retry_after
+
+
+def _make_client(handler, **kwargs) -> KytheraKdx:
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = KytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def _sequence(*responses):
+    items = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = items.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return handler
+
+
+@patch("kythera_kdx.authenticated_client.time.sleep")
+def test_retries_transient_status_then_succeeds(mock_sleep):
+    kdx = _make_client(
+        _sequence(httpx.Response(503), httpx.Response(200, json=[{"id": 1}]))
+    )
+
+    assert kdx.positions.get_positions_raw() == [{"id": 1}]
+    stats = kdx.get_retry_stats()
+    assert stats["retries"] == 1
+    assert stats["retries_by_reason"] == {"503": 1}
+    mock_sleep.assert_called_once()
+
+
+@patch("kythera_kdx.authenticated_client.time.sleep")
+def test_honors_retry_after(mock_sleep):
+    kdx = _make_client(
+        _sequence(
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json=[]),
+        )
+    )
+
+    kdx.get("/v1/trades")
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch("kythera_kdx.authenticated_client.time.sleep")
+def test_post_only_retried_when_not_sent(mock_sleep):
+    kdx = _make_client(_sequence(httpx.Response(503)))
+    with pytest.raises(KytheraAPIError):
+        kdx.post("/v1/prices", data=[])
+
+    kdx = _make_client(
+        _sequence(httpx.ConnectError("reset"), httpx.Response(200, json=[]))
+    )
+    kdx.post("/v1/prices", data=[])
+    assert kdx.get_retry_stats()["retries_by_reason"] == {"ConnectError": 1}
+
+
+@patch("kythera_kdx.authenticated_client.time.sleep")
+def test_gives_up_after_max_retries(mock_sleep):
+    kdx = _make_client(
+        _sequence(*[httpx.ConnectError("down")] * 3),
+        retry_policy=RetryPolicy(max_retries=2),
+    )
+
+    with pytest.raises(KytheraConnectionError):
+        kdx.get("/v1/trades")
+    stats = kdx.get_retry_stats()
+    assert stats["retries"] == 2
+    assert stats["exhausted"] == 1
+
+
+@patch("kythera_kdx.authenticated_client.time.sleep")
+def test_client_budget_limits_retries(mock_sleep):
+    kdx = _make_client(
+        _sequence(httpx.Response(503)),
+        retry_policy=RetryPolicy(budget_ratio=0.0, budget_min_retries=0),
+    )
+
+    with pytest.raises(KytheraAPIError):
+        kdx.get("/v1/trades")
+    assert kdx.get_retry_stats()["budget_rejections"] == 1
+    mock_sleep.assert_not_called()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -1,4 +1,5 @@
 from unittest.mock import Mock
+import httpx
 import pandas as pd
 from datetime import date
 
@@ -12,8 +13,7 @@ def test_get_risk_factor_parameters_and_values():
     params_payload = [
         {"name": "RF Param 1", "description": "desc", "parameterType": "STRING"}
     ]
-    mock_resp_params = Mock()
-    mock_resp_params.json.return_value = params_payload
+    mock_resp_params = httpx.Response(200, json=params_payload)
 
     # values
     values_payload = [
@@ -24,8 +24,7 @@ def test_get_risk_factor_parameters_and_values():
             "value": 0.123,
         }
     ]
-    mock_resp_values = Mock()
-    mock_resp_values.json.return_value = values_payload
+    mock_resp_values = httpx.Response(200, json=values_payload)
 
     # get calls should return params first then values
     mock_client.get.side_effect = [mock_resp_params, mock_resp_values]
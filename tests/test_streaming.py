@@ -0,0 +1,141 @@
+"""
+Tests for incremental JSON array decoding and the iter_* streaming methods.
+"""
+
+import asyncio
+import json
+import time
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kythera_kdx import AsyncKytheraKdx, KytheraKdx
+from kythera_kdx.exceptions import KytheraValidationError
+from kythera_kdx.models_v1 import TradeDto
+from kythera_kdx.streaming import JsonArrayParser, iter_json_array
+
+PAYLOAD = [
+    {"id": 1, "fundName": "Fund é", "nested": {"values": [1, 2, 3]}},
+    {"id": 2, "fundName": "Fund, \"quoted\" ]", "nested": {}},
+    12345,
+    "text",
+    None,
+    True,
+    [],
+]
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_iter_json_array_handles_any_chunking(size):
+    data = json.dumps(PAYLOAD, ensure_ascii=False, indent=1).encode("utf-8")
+    assert list(iter_json_array(_chunks(data, size))) == PAYLOAD
+
+
+def test_empty_array():
+    assert list(iter_json_array([b" [ ", b"] "])) == []
+
+
+def test_parser_yields_items_before_end_of_stream():
+    parser = JsonArrayParser()
+    assert parser.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b': 2}]') == [{"id": 2}]
+    assert parser.close() == []
+
+
+def test_numbers_split_at_every_offset():
+    data = b'[1,{"a":1},2e3,-0.5,{"b":[10,2.5E-1]},123456,7.25,-8]'
+    expected = json.loads(data)
+    for offset in range(len(data) + 1):
+        chunks = [data[:offset], data[offset:]]
+        assert list(iter_json_array(chunks)) == expected, offset
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b"[1.", b"5]"], [1.5]),
+        ([b"[1.5", b"e2]"], [150.0]),
+        ([b'[{"a":1},2', b"e3]"], [{"a": 1}, 2000.0]),
+    ],
+)
+def test_number_continued_in_next_chunk(chunks, expected):
+    assert list(iter_json_array(chunks)) == expected
+
+
+def test_parser_waits_for_a_delimiter_after_a_number():
+    parser = JsonArrayParser()
+    assert parser.feed(b"[1, 23") == [1]
+    assert parser.feed(b"4") == []
+    assert parser.feed(b" ") == [234]
+    assert parser.feed(b"]") == []
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"id": 1}',
+        b'[{"id": 1}',
+        b'[{"id": 1} {"id": 2}]',
+        b"[1,,2]",
+        b'[{"id": }]',
+        b"[1,]",
+        b'[{"id": 1}, ]',
+        b"[1.]",
+        b"[1",
+    ],
+)
+def test_invalid_payloads_raise(data):
+    with pytest.raises(KytheraValidationError):
+        list(iter_json_array(_chunks(data, 3)))
+
+
+def _trades_handler(request: httpx.Request) -> httpx.Response:
+    assert request.url.path == "/v1/trades"
+    assert request.url.params["effectiveDate"] == "2024-01-02"
+    body = json.dumps([{"id": i, "fundName": f"F{i}"} for i in range(50)]).encode()
+    return httpx.Response(200, stream=httpx.ByteStream(body))
+
+
+def test_iter_trades_streams_typed_models():
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = KytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(_trades_handler),
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+
+    trades = list(kdx.trades.iter_trades(date(2024, 1, 2)))
+
+    assert len(trades) == 50
+    assert isinstance(trades[0], TradeDto)
+    assert trades[49].id == 49
+
+
+def test_async_iter_trades_raw():
+    async def run():
+        with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+            kdx = AsyncKytheraKdx(
+                base_url="https://test.api.com",
+                client_id="test-client",
+                client_secret="test-secret",
+                tenant_id="test-tenant",
+                transport=httpx.MockTransport(_trades_handler),
+            )
+        kdx._cached_token = "test-token"
+        kdx._token_expires_at = time.time() + 3600
+        async with kdx:
+            return [item async for item in kdx.trades.iter_trades_raw(date(2024, 1, 2))]
+
+    items = asyncio.run(run())
+    assert [item["id"] for item in items] == list(range(50))
@@ -0,0 +1,72 @@
+"""
+Tests for the offline KDX stub server.
+"""
+
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from kythera_kdx import AsyncKytheraKdx, KytheraAPIError
+from kythera_kdx.stub import StubServer, stub_client
+
+
+@pytest.fixture(scope="module")
+def server():
+    return StubServer(rows=5)
+
+
+def test_serves_every_path_of_the_spec(server):
+    assert len(server.paths) == sum(
+        len(operations) for operations in server.spec["paths"].values()
+    )
+    transport = server.transport()
+    with httpx.Client(transport=transport, base_url="https://kdx.stub") as client:
+        for method, template in server.paths:
+            path = template.replace("{instrumentId}", "42")
+            response = client.request(method, path)
+            assert response.status_code == 200, path
+            assert isinstance(response.json(), list)
+
+
+def test_rows_follow_the_response_schema(server):
+    (trade,) = server.records({"$ref": "#/components/schemas/TradeDto"}, 1)
+    assert set(trade) == set(server.spec["components"]["schemas"]["TradeDto"]["properties"])
+    assert trade["id"] == 1
+    assert isinstance(trade["quantity"], float)
+
+
+def test_literal_paths_win_over_templates():
+    server = StubServer(rows=3, rows_by_path={"/v1/prices/price-types": 1})
+    kdx = stub_client(server)
+
+    assert len(kdx.prices.get_price_types_raw()) == 1
+    assert len(kdx.prices.get_prices_by_instrument_raw(7, date(2024, 1, 2), "CLOSE")) == 3
+
+
+def test_unknown_paths_are_not_found(server):
+    kdx = stub_client(server)
+    with pytest.raises(KytheraAPIError) as excinfo:
+        kdx.get("/v1/unknown")
+    assert excinfo.value.status_code == 404
+
+
+def test_clients_decode_stub_payloads(server):
+    kdx = stub_client(server)
+
+    trades = kdx.trades.get_trades()
+    frame = kdx.positions.get_positions_df()
+
+    assert len(trades) == 5
+    assert trades[0].fundName == f"Fund {trades[0].fundId:02d}"
+    assert len(frame) == 5
+    assert server.get_stats()["requests"] >= 2
+
+
+def test_async_client(server):
+    kdx = stub_client(server, AsyncKytheraKdx)
+
+    table = asyncio.run(kdx.trades.get_trades_arrow())
+
+    assert table.num_rows == 5
@@ -0,0 +1,73 @@
+"""
+Tests for the synthetic data generator.
+"""
+
+import gzip
+import json
+from collections import Counter
+
+import pytest
+
+from kythera_kdx.models_v1 import InstrumentEventDto, TradeDto
+from kythera_kdx.synthetic import SyntheticData
+
+
+@pytest.fixture(scope="module")
+def data():
+    return SyntheticData(seed=3, block_size=64)
+
+
+def test_rows_are_deterministic_and_independent_of_chunking(data):
+    rows = data.records("TradeDto", 200)
+
+    assert rows == SyntheticData(seed=3, block_size=64).records("TradeDto", 200)
+    assert data.records("TradeDto", 50, start=100) == rows[100:150]
+    assert rows != SyntheticData(seed=4, block_size=64).records("TradeDto", 200)
+
+
+def test_rows_validate_against_the_models(data):
+    trades = [TradeDto.model_validate(row) for row in data.records("TradeDto", 100)]
+
+    assert [trade.id for trade in trades] == list(range(1, 101))
+    assert trades[0].tradeDate is not None
+
+
+def test_entity_ids_and_names_are_consistent(data):
+    rows = data.records("TradeDto", 500)
+
+    for row in rows:
+        assert row["fundName"] == f"Fund {row['fundId']:02d}"
+        assert row["instrumentName"] == f"Instrument {row['instrumentId']:05d}"
+
+
+def test_cardinalities_and_skew():
+    data = SyntheticData(seed=1, cardinalities={"fund": 5})
+    funds = Counter(row["fundName"] for row in data.records("PositionDto", 5000))
+
+    assert len(funds) == 5
+    (top, top_count), *_ = funds.most_common()
+    assert top == "Fund 1"
+    assert top_count > funds["Fund 5"] * 2
+
+    uniform = SyntheticData(seed=1, cardinalities={"fund": 5}, skew=0)
+    counts = Counter(row["fundName"] for row in uniform.records("PositionDto", 5000))
+    assert max(counts.values()) < 1.2 * min(counts.values())
+
+
+def test_undescribed_schemas_use_the_models(data):
+    (event,) = data.records("InstrumentEventDto", 1)
+
+    assert set(event) == set(InstrumentEventDto.model_fields)
+    with pytest.raises(KeyError):
+        data.records("NoSuchDto", 1)
+
+
+def test_write_json_streams_one_array(data, tmp_path):
+    path = tmp_path / "trades.json.gz"
+
+    size = data.write_json(TradeDto, 150, path)
+
+    with gzip.open(path, "rb") as f:
+        body = f.read()
+    assert len(body) == size
+    assert json.loads(body) == data.records(TradeDto, 150)
@@ -0,0 +1,123 @@
+"""
+Tests for single-flight and background token refresh through KytheraAuth.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kythera_kdx import KytheraAuthError, KytheraKdx
+
+
+def _make_client(handler) -> KytheraKdx:
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        return KytheraKdx(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+        )
+
+
+def _fake_acquire(kdx, calls, token="fresh-token", delay=0.05):
+    def acquire(force_refresh: bool = False) -> str:
+        calls.append(force_refresh)
+        time.sleep(delay)
+        kdx._cached_token = token
+        kdx._token_expires_at = time.time() + 3600
+        return token
+
+    return acquire
+
+
+def test_concurrent_threads_acquire_token_once():
+    seen = []
+    kdx = _make_client(
+        lambda request: seen.append(request.headers["Authorization"])
+        or httpx.Response(200, json=[])
+    )
+    calls = []
+
+    with patch.object(kdx, "_get_access_token", side_effect=_fake_acquire(kdx, calls)):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: kdx.positions.get_positions_raw(), range(8)))
+
+    assert calls == [False]
+    assert seen == ["Bearer fresh-token"] * 8
+
+
+def test_concurrent_401s_share_one_refresh():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers["Authorization"] == "Bearer old-token":
+            return httpx.Response(401)
+        return httpx.Response(200, json=[])
+
+    kdx = _make_client(handler)
+    kdx._cached_token = "old-token"
+    kdx._token_expires_at = time.time() + 3600
+    calls = []
+
+    with patch.object(kdx, "_get_access_token", side_effect=_fake_acquire(kdx, calls)):
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(lambda _: kdx.trades.get_trades_raw(), range(6)))
+
+    assert calls == [True]
+
+
+def test_background_refresh_before_expiry_buffer():
+    seen = []
+    kdx = _make_client(
+        lambda request: seen.append(request.headers["Authorization"])
+        or httpx.Response(200, json=[])
+    )
+    kdx._cached_token = "old-token"
+    # Inside the refresh-ahead window but outside the 5 minute expiry buffer
+    kdx._token_expires_at = time.time() + 400
+    calls = []
+    refreshed = threading.Event()
+    acquire = _fake_acquire(kdx, calls, delay=0.0)
+
+    def acquire_and_signal(force_refresh: bool = False) -> str:
+        token = acquire(force_refresh)
+        refreshed.set()
+        return token
+
+    with patch.object(kdx, "_get_access_token", side_effect=acquire_and_signal):
+        kdx.trades.get_trades_raw()
+        assert refreshed.wait(2)
+        kdx.trades.get_trades_raw()
+
+    # The first request did not wait for the refresh
+    assert seen == ["Bearer old-token", "Bearer fresh-token"]
+    assert calls == [True]
+
+
+def test_static_access_token_bypasses_msal():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(401 if len(seen) > 1 else 200, json=[])
+
+    with patch(
+        "kythera_kdx.authenticated_client.ConfidentialClientApplication",
+        side_effect=AssertionError("MSAL must not be used"),
+    ):
+        kdx = KytheraKdx(
+            base_url="https://test.api.com",
+            client_secret="unused",
+            access_token="static-token",
+            transport=httpx.MockTransport(handler),
+        )
+
+    kdx.trades.get_trades_raw()
+    with pytest.raises(KytheraAuthError):
+        kdx.trades.get_trades_raw()
+
+    assert seen == ["Bearer static-token", "Bearer static-token"]
+    assert kdx.get_token_info()["auth_type"] == "static_token"
@@ -0,0 +1,182 @@
+"""
+Tests for tracing hooks.
+"""
+
+import asyncio
+import contextvars
+import time
+from datetime import date
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from kythera_kdx import AsyncKytheraKdx, KytheraKdx
+from kythera_kdx import tracing
+from kythera_kdx.tracing import NOOP_TRACER, OpenTelemetryTracer, Tracer
+
+TRADES = [
+    {"id": 1, "fundName": "Alpha", "quantity": 10.0},
+    {"id": 2, "fundName": "Beta", "quantity": -5.0},
+]
+
+
+class _Span:
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class RecordingTracer(Tracer):
+    enabled = True
+
+    def __init__(self):
+        self.spans = []
+        self._current = contextvars.ContextVar("span", default=None)
+
+    @contextmanager
+    def start_span(self, name, attributes=None):
+        span = _Span(name, attributes, self._current.get())
+        self.spans.append(span)
+        token = self._current.set(span)
+        try:
+            yield span
+        finally:
+            self._current.reset(token)
+
+    def named(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+def _kdx(cls, tracer, handler=None):
+    handler = handler or (lambda request: httpx.Response(200, json=TRADES))
+    with patch("kythera_kdx.authenticated_client.ConfidentialClientApplication"):
+        kdx = cls(
+            base_url="https://test.api.com",
+            client_id="test-client",
+            client_secret="test-secret",
+            tenant_id="test-tenant",
+            transport=httpx.MockTransport(handler),
+            tracer=tracer,
+        )
+    kdx._cached_token = "test-token"
+    kdx._token_expires_at = time.time() + 3600
+    return kdx
+
+
+def test_sub_client_call_has_http_decode_and_frame_child_spans():
+    tracer = RecordingTracer()
+    kdx = _kdx(KytheraKdx, tracer)
+
+    frame = kdx.trades.get_trades_df(effective_date=None)
+
+    (call,) = tracer.named("TradesClient.get_trades_df")
+    assert call.parent is None
+    assert call.attributes["kythera.rows"] == len(frame) == 2
+    (http,) = tracer.named("HTTP GET")
+    assert http.attributes["kythera.endpoint"] == "/v1/trades"
+    assert http.attributes["http.response.status_code"] == 200
+    assert http.attributes["http.response.body.size"] > 0
+    (decode,) = tracer.named("kythera.decode")
+    assert decode.attributes["kythera.rows"] == 2
+    (build,) = tracer.named("kythera.build_frame")
+    assert build.parent is call
+    assert build.attributes["kythera.model"] == "TradeDto"
+    # get_trades_df fetches through get_trades_raw
+    (raw,) = tracer.named("TradesClient.get_trades_raw")
+    assert raw.parent is call and http.parent is raw and decode.parent is raw
+
+
+def test_validation_span_and_params_attribute():
+    tracer = RecordingTracer()
+    kdx = _kdx(KytheraKdx, tracer)
+
+    kdx.trades.get_trades(effective_date=date(2024, 3, 28))
+
+    (http,) = tracer.named("HTTP GET")
+    assert http.attributes["kythera.params"] == "effectiveDate=2024-03-28"
+    (validate,) = tracer.named("kythera.validate")
+    assert validate.attributes["kythera.model"] == "TradeDto"
+    assert validate.attributes["kythera.rows"] == 2
+
+
+def test_token_acquisition_has_an_auth_span():
+    tracer = RecordingTracer()
+    kdx = _kdx(KytheraKdx, tracer)
+    kdx._cached_token = None
+
+    with patch.object(kdx, "_get_access_token", return_value="new-token") as acquire:
+        kdx.trades.get_trades_raw()
+
+    acquire.assert_called_once()
+    (auth,) = tracer.named("kythera.auth")
+    assert auth.attributes == {"kythera.auth.force_refresh": False}
+    assert auth.parent is tracer.named("HTTP GET")[0]
+
+
+def test_async_spans_nest_under_the_call():
+    tracer = RecordingTracer()
+
+    async def run():
+        async with _kdx(AsyncKytheraKdx, tracer) as kdx:
+            return await kdx.trades.get_trades_arrow()
+
+    table = asyncio.run(run())
+
+    (call,) = tracer.named("AsyncTradesClient.get_trades_arrow")
+    assert call.attributes["kythera.rows"] == table.num_rows == 2
+    (build,) = tracer.named("kythera.build_table")
+    assert build.parent is call
+
+
+def test_default_tracer_is_a_no_op():
+    kdx = _kdx(KytheraKdx, None)
+
+    assert kdx.tracer is NOOP_TRACER
+    assert not kdx.tracer.enabled
+    with kdx.tracer.start_span("anything") as span:
+        span.set_attribute("key", "value")
+    assert kdx.trades.get_trades_raw() == TRADES
+
+
+def test_no_op_tracer_skips_span_attributes():
+    with patch(
+        "kythera_kdx.authenticated_client.params_attribute",
+        side_effect=AssertionError("span attributes built with tracing off"),
+    ):
+        assert _kdx(KytheraKdx, None).get("/v1/trades", {"isOpen": True}).json() == TRADES
+
+        async def run():
+            async with _kdx(AsyncKytheraKdx, None) as kdx:
+                return (await kdx.get("/v1/trades", {"isOpen": True})).json()
+
+        assert asyncio.run(run()) == TRADES
+
+
+def test_opentelemetry_tracer_requires_the_api(monkeypatch):
+    monkeypatch.setattr(tracing, "otel_trace", None)
+
+    with pytest.raises(ImportError, match="kythera-kdx\\[otel\\]"):
+        OpenTelemetryTracer()
+
+
+def test_opentelemetry_tracer_wraps_a_tracer():
+    calls = []
+
+    class _OtelTracer:
+        @contextmanager
+        def start_as_current_span(self, name, attributes=None):
+            calls.append((name, attributes))
+            yield _Span(name, attributes, None)
+
+    tracer = OpenTelemetryTracer(tracer=_OtelTracer())
+    attributes = {"kythera.endpoint": "/v1/trades", "kythera.params": None}
+    with tracer.start_span("HTTP GET", attributes):
+        pass
+
+    assert calls == [("HTTP GET", {"kythera.endpoint": "/v1/trades"})]